@@ -71,7 +71,7 @@ async def test_api_vector_store():
         logger.info("Testing _ensure_loaded method...")
         try:
             await vector_store._ensure_loaded()
-            logger.info(f"After _ensure_loaded: {len(vector_store.vectors)} vectors, {len(vector_store.documents)} documents")
+            logger.info(f"After _ensure_loaded: {await vector_store.get_vector_store_size()} vectors")
         except Exception as e:
             logger.error(f"Error in _ensure_loaded: {e}", exc_info=True)
 
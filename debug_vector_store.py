@@ -37,7 +37,7 @@ async def test_vector_store():
         # Test loading
         if hasattr(api_vector_store, '_ensure_loaded'):
             await api_vector_store._ensure_loaded()
-            print(f"Load attempted: {api_vector_store._load_attempted}")
+            print(f"Load attempted: {api_vector_store._loaded}")
 
         # Check size
         size = await api_vector_store.get_vector_store_size()
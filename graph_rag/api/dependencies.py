@@ -149,14 +149,20 @@ def get_cache_service(settings: Settings = Depends(get_settings)) -> CacheServic
     if "cache_service" not in _singletons:
         logger.info(f"Creating CacheService instance (type: {settings.cache_type})")
         if settings.cache_type == "memory":
-            _singletons["cache_service"] = MemoryCache()
+            _singletons["cache_service"] = MemoryCache(
+                max_entries=settings.cache_max_entries,
+                max_bytes=settings.cache_max_bytes,
+            )
         # elif settings.cache_type == "redis":
         #     _cache_service_instance = RedisCache(host=settings.redis_host, port=settings.redis_port)
         else:
             logger.warning(
                 f"Unsupported cache type '{settings.cache_type}', falling back to MemoryCache."
             )
-            _singletons["cache_service"] = MemoryCache()
+            _singletons["cache_service"] = MemoryCache(
+                max_entries=settings.cache_max_entries,
+                max_bytes=settings.cache_max_bytes,
+            )
     return _singletons["cache_service"]
 
 
@@ -266,7 +272,9 @@ def create_llm_service(settings: Settings) -> LLMService:  # Added factory funct
                 model=settings.llm_model_name,
                 timeout=settings.llm_timeout,
                 temperature=settings.llm_temperature,
-                max_tokens=settings.llm_max_tokens if settings.llm_max_tokens > 0 else None
+                max_tokens=settings.llm_max_tokens if settings.llm_max_tokens > 0 else None,
+                max_connections=settings.ollama_max_connections,
+                embed_batch_size=settings.ollama_embed_batch_size,
             )
 
         elif llm_type == "mock":
@@ -383,7 +391,11 @@ def create_entity_extractor(settings: Settings) -> EntityExtractor:
     extractor_type = settings.entity_extractor_type.lower()
     logger.info(f"Creating EntityExtractor instance of type: {extractor_type}")
     if extractor_type == "spacy":
-        instance = SpacyEntityExtractor(model_name=settings.entity_extractor_model)
+        instance = SpacyEntityExtractor(
+            model_name=settings.entity_extractor_model,
+            batch_size=settings.entity_extractor_batch_size,
+            n_process=settings.entity_extractor_processes,
+        )
     elif extractor_type == "mock":
         instance = MockEntityExtractor()
     else:
@@ -565,6 +577,7 @@ def create_ingestion_service(
         embedding_service=embedding_service,
         # Removed chunk_splitter=chunk_splitter,
         vector_store=vector_store,  # Pass vector_store argument
+        graph_write_batch_size=get_settings().ingestion_graph_batch_size,
     )
 
 
@@ -801,7 +814,17 @@ async def get_temporal_tracker() -> Any:
     from graph_rag.core.temporal_tracker import TemporalTracker
 
     if "temporal_tracker" not in _singletons:
-        _singletons["temporal_tracker"] = TemporalTracker()
+        settings = get_settings()
+        try:
+            embedding_service = create_embedding_service(settings)
+        except Exception as e:
+            logger.warning(f"TemporalTracker running without embeddings: {e}")
+            embedding_service = None
+        _singletons["temporal_tracker"] = TemporalTracker(
+            embedding_service=embedding_service,
+            storage_path=settings.temporal_tracker_path,
+            similarity_threshold=settings.temporal_tracker_similarity_threshold,
+        )
         logger.debug("Created TemporalTracker instance")
 
     return _singletons["temporal_tracker"]
@@ -186,6 +186,7 @@ async def lifespan(app: FastAPI):
     app.state.kg_builder = None
     app.state.graph_rag_engine = None
     app.state.ingestion_service = None
+    app.state.ingestion_queue = None
     embedding_service = None  # Initialize embedding_service variable
 
     # 1. Initialize Graph Repository (lazy-connect via mgclient when used)
@@ -280,7 +281,9 @@ async def lifespan(app: FastAPI):
         try:
             if current_settings.entity_extractor_type.lower() == "spacy":
                 app.state.entity_extractor = SpacyEntityExtractor(
-                    model_name=current_settings.entity_extractor_model
+                    model_name=current_settings.entity_extractor_model,
+                    batch_size=current_settings.entity_extractor_batch_size,
+                    n_process=current_settings.entity_extractor_processes,
                 )
                 logger.info(
                     f"LIFESPAN: Initialized SpacyEntityExtractor with model '{current_settings.entity_extractor_model}'."
@@ -452,6 +455,7 @@ async def lifespan(app: FastAPI):
                 graph_store=app.state.graph_repository,
                 embedding_service=embedding_service,  # Use the initialized instance
                 vector_store=app.state.vector_store,
+                graph_write_batch_size=current_settings.ingestion_graph_batch_size,
             )
             logger.info("LIFESPAN: Initialized IngestionService.")
         except Exception as e:
@@ -464,6 +468,30 @@ async def lifespan(app: FastAPI):
     else:
         logger.info("LIFESPAN: Ingestion Service already initialized.")
 
+    # 8b. Start the durable ingestion job queue (falls back to background tasks if unavailable)
+    if getattr(current_settings, "ingestion_queue_enabled", False):
+        try:
+            from graph_rag.services.ingestion_queue import IngestionJobQueue
+
+            queue = IngestionJobQueue(
+                ingestion_service=app.state.ingestion_service,
+                db_path=current_settings.get_ingestion_queue_path(),
+                workers=current_settings.ingestion_workers,
+                max_depth=current_settings.ingestion_queue_max_depth,
+                max_attempts=current_settings.ingestion_job_max_attempts,
+                retry_after_seconds=current_settings.ingestion_retry_after_seconds,
+                retry_backoff_seconds=current_settings.ingestion_retry_backoff_seconds,
+                embedding_batch_size=current_settings.ingestion_embedding_batch_size,
+                embedding_batch_window_ms=current_settings.ingestion_embedding_batch_window_ms,
+            )
+            await queue.start()
+            app.state.ingestion_queue = queue
+            logger.info("LIFESPAN: Ingestion job queue started.")
+        except Exception as e:
+            logger.warning(
+                f"Failed to start ingestion job queue: {e}; using in-process background tasks"
+            )
+
     # 9. Initialize PostgreSQL Session Factories (Epic 20 Phase 1)
     logger.info("LIFESPAN: Initializing PostgreSQL session factories...")
     try:
@@ -570,6 +598,17 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"LIFESPAN SHUTDOWN: Error stopping monitoring: {e}", exc_info=True)
 
+    # Stop ingestion workers; unfinished jobs stay queued for the next start
+    if getattr(app.state, "ingestion_queue", None):
+        try:
+            await app.state.ingestion_queue.stop()
+            logger.info("LIFESPAN SHUTDOWN: Ingestion job queue stopped.")
+        except Exception as e:
+            logger.error(
+                f"LIFESPAN SHUTDOWN: Error stopping ingestion job queue: {e}",
+                exc_info=True,
+            )
+
     # Stop maintenance scheduler
     if hasattr(app.state, "maintenance_scheduler") and app.state.maintenance_scheduler:
         try:
@@ -601,6 +640,29 @@ async def lifespan(app: FastAPI):
                 exc_info=True,
             )
 
+    engine = getattr(app.state, "graph_rag_engine", None)
+    llm_service = getattr(engine, "_llm_service", None)
+    if llm_service is not None and hasattr(llm_service, "close"):
+        try:
+            await llm_service.close()
+            logger.info("LIFESPAN SHUTDOWN: LLM service HTTP session closed.")
+        except Exception as e:
+            logger.error(
+                f"LIFESPAN SHUTDOWN: Error closing LLM service: {e}",
+                exc_info=True,
+            )
+
+    extractor = getattr(app.state, "entity_extractor", None)
+    if extractor is not None and hasattr(extractor, "close"):
+        try:
+            extractor.close()
+            logger.info("LIFESPAN SHUTDOWN: Entity extractor closed.")
+        except Exception as e:
+            logger.error(
+                f"LIFESPAN SHUTDOWN: Error closing entity extractor: {e}",
+                exc_info=True,
+            )
+
     # Shutdown PostgreSQL engines (Epic 20)
     for engine_name in ["core_engine", "business_engine", "analytics_engine"]:
         if hasattr(app.state, engine_name) and getattr(app.state, engine_name):
@@ -623,6 +685,7 @@ async def lifespan(app: FastAPI):
     app.state.neo4j_driver = None
     app.state.settings = None
     app.state.ingestion_service = None
+    app.state.ingestion_queue = None
     app.state.maintenance_scheduler = None
     app.state.unified_platform = None
     app.state.core_db = None
@@ -26,6 +26,13 @@ class IngestRequest(BaseModel):
         True,
         description="Replace previously ingested content for the same document_id if present.",
     )
+    skip_unchanged: bool = Field(
+        True,
+        description=(
+            "When replacing, skip a document whose content and metadata are unchanged and "
+            "keep unchanged chunks. Set to false to force a full re-ingestion."
+        ),
+    )
 
 
 class IngestResponse(BaseModel):
@@ -152,6 +159,13 @@ class AskRequest(BaseModel):
     blend_keyword_weight: float = Field(
         0.0, ge=0.0, description="Weight for keyword scores in hybrid retrieval."
     )
+    hybrid_fusion: str = Field(
+        "weighted",
+        description=(
+            "How hybrid retrieval fuses vector and keyword results: 'weighted' (raw scores), "
+            "'minmax' (normalized scores) or 'rrf' (reciprocal-rank fusion)."
+        ),
+    )
     rerank: bool = Field(
         False, description="Enable lightweight reranking of top results."
     )
@@ -161,6 +175,12 @@ class AskRequest(BaseModel):
         le=1.0,
         description="Maximal Marginal Relevance lambda (0..1). 0=diversity, 1=relevance.",
     )
+    mmr_candidates: int | None = Field(
+        None,
+        ge=1,
+        le=1000,
+        description="Candidate pool size MMR selects from (defaults to 4*k).",
+    )
     no_answer_min_score: float = Field(
         0.0,
         ge=0.0,
@@ -320,6 +340,13 @@ class EnhancedAskRequest(BaseModel):
     blend_keyword_weight: float = Field(
         0.0, ge=0.0, description="Weight for keyword scores in hybrid retrieval."
     )
+    hybrid_fusion: str = Field(
+        "weighted",
+        description=(
+            "How hybrid retrieval fuses vector and keyword results: 'weighted' (raw scores), "
+            "'minmax' (normalized scores) or 'rrf' (reciprocal-rank fusion)."
+        ),
+    )
     rerank: bool = Field(
         False, description="Enable lightweight reranking of top results."
     )
@@ -329,6 +356,12 @@ class EnhancedAskRequest(BaseModel):
         le=1.0,
         description="Maximal Marginal Relevance lambda (0..1). 0=diversity, 1=relevance.",
     )
+    mmr_candidates: int | None = Field(
+        None,
+        ge=1,
+        le=1000,
+        description="Candidate pool size MMR selects from (defaults to 4*k).",
+    )
     no_answer_min_score: float = Field(
         0.0,
         ge=0.0,
@@ -2,103 +2,164 @@
 
 import asyncio
 import hashlib
+import heapq
 import json
 import logging
 import time
+from collections import OrderedDict, deque
 from collections.abc import Callable
+from dataclasses import dataclass
 from functools import wraps
 from typing import Any
 
+from graph_rag.observability.histogram import LatencyHistogram
+
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class _CacheEntry:
+    value: Any
+    expires_at: float
+    namespace: str | None
+
+
 class SimpleCache:
-    """Simple in-memory cache with TTL support."""
+    """In-memory LRU cache with TTL support.
 
-    def __init__(self, default_ttl: float = 300.0, max_size: int = 1000):
-        self.cache: dict[str, dict[str, Any]] = {}
+    Entries live in an ``OrderedDict`` kept in recency order, so lookups,
+    inserts and LRU eviction are O(1). Expiry is lazy: an expired entry is
+    dropped when read, and a heap of expiry times is swept at most once per
+    ``sweep_interval`` seconds. Keys may be grouped into namespaces, which
+    have their own hit/miss counters and can be cleared on their own.
+    """
+
+    def __init__(
+        self,
+        default_ttl: float = 300.0,
+        max_size: int = 1000,
+        sweep_interval: float = 1.0,
+    ):
+        self.cache: OrderedDict[tuple[str | None, str], _CacheEntry] = OrderedDict()
         self.default_ttl = default_ttl
         self.max_size = max_size
-
-    def _is_expired(self, entry: dict[str, Any]) -> bool:
-        """Check if cache entry is expired."""
-        return time.time() > entry["expires_at"]
-
-    def _cleanup_expired(self):
-        """Remove expired entries."""
-        current_time = time.time()
-        expired_keys = [
-            key for key, entry in self.cache.items()
-            if current_time > entry["expires_at"]
-        ]
-        for key in expired_keys:
-            del self.cache[key]
-
-    def _evict_if_full(self):
-        """Evict oldest entries if cache is full."""
-        if len(self.cache) >= self.max_size:
-            # Remove 10% of oldest entries
-            entries_to_remove = max(1, int(self.max_size * 0.1))
-            sorted_entries = sorted(
-                self.cache.items(),
-                key=lambda x: x[1]["created_at"]
-            )
-            for key, _ in sorted_entries[:entries_to_remove]:
-                del self.cache[key]
-
-    def get(self, key: str) -> Any | None:
+        self.sweep_interval = sweep_interval
+        # (expires_at, full key) per set(); pairs for replaced entries are skipped
+        self._expiry_heap: list[tuple[float, tuple[str | None, str]]] = []
+        self._next_sweep = 0.0
+        self._namespace_keys: dict[str, set[str]] = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._namespace_stats: dict[str, dict[str, int]] = {}
+
+    def _count(self, namespace: str | None, counter: str) -> None:
+        if namespace is not None:
+            stats = self._namespace_stats.setdefault(namespace, {"hits": 0, "misses": 0})
+            stats[counter] += 1
+
+    def _remove(self, full_key: tuple[str | None, str]) -> _CacheEntry | None:
+        entry = self.cache.pop(full_key, None)
+        if entry is not None and entry.namespace is not None:
+            keys = self._namespace_keys.get(entry.namespace)
+            if keys is not None:
+                keys.discard(full_key[1])
+        return entry
+
+    def _sweep_expired(self, now: float) -> None:
+        """Drop expired entries from the head of the expiry heap."""
+        if now < self._next_sweep:
+            return
+        self._next_sweep = now + self.sweep_interval
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            expires_at, full_key = heapq.heappop(heap)
+            entry = self.cache.get(full_key)
+            if entry is not None and entry.expires_at == expires_at:
+                self._remove(full_key)
+                self._expirations += 1
+        # Rebuild when stale pairs dominate so the heap stays O(entries)
+        if len(heap) > 2 * len(self.cache) + 64:
+            self._expiry_heap = [(e.expires_at, k) for k, e in self.cache.items()]
+            heapq.heapify(self._expiry_heap)
+
+    def get(self, key: str, namespace: str | None = None) -> Any | None:
         """Get value from cache."""
-        self._cleanup_expired()
-
-        if key in self.cache:
-            entry = self.cache[key]
-            if not self._is_expired(entry):
-                entry["access_count"] += 1
-                entry["last_accessed"] = time.time()
-                return entry["value"]
-            else:
-                del self.cache[key]
+        now = time.monotonic()
+        self._sweep_expired(now)
+
+        full_key = (namespace, key)
+        entry = self.cache.get(full_key)
+        if entry is not None and entry.expires_at <= now:
+            self._remove(full_key)
+            self._expirations += 1
+            entry = None
+        if entry is None:
+            self._misses += 1
+            self._count(namespace, "misses")
+            return None
 
-        return None
+        self.cache.move_to_end(full_key)
+        self._hits += 1
+        self._count(namespace, "hits")
+        return entry.value
 
-    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+    def set(
+        self, key: str, value: Any, ttl: float | None = None, namespace: str | None = None
+    ) -> None:
         """Set value in cache."""
-        self._cleanup_expired()
-        self._evict_if_full()
+        now = time.monotonic()
+        self._sweep_expired(now)
 
         ttl = ttl or self.default_ttl
-        current_time = time.time()
-
-        self.cache[key] = {
-            "value": value,
-            "created_at": current_time,
-            "last_accessed": current_time,
-            "expires_at": current_time + ttl,
-            "access_count": 1
-        }
-
-    def delete(self, key: str) -> bool:
+        full_key = (namespace, key)
+        self._remove(full_key)
+        entry = _CacheEntry(value=value, expires_at=now + ttl, namespace=namespace)
+        self.cache[full_key] = entry
+        heapq.heappush(self._expiry_heap, (entry.expires_at, full_key))
+        if namespace is not None:
+            self._namespace_keys.setdefault(namespace, set()).add(key)
+
+        # Evict least recently used entries beyond capacity
+        while len(self.cache) > self.max_size:
+            evicted_key = next(iter(self.cache))
+            self._remove(evicted_key)
+            self._evictions += 1
+
+    def delete(self, key: str, namespace: str | None = None) -> bool:
         """Delete key from cache."""
-        if key in self.cache:
-            del self.cache[key]
-            return True
-        return False
-
-    def clear(self) -> None:
-        """Clear all cache entries."""
-        self.cache.clear()
+        return self._remove((namespace, key)) is not None
+
+    def clear(self, namespace: str | None = None) -> None:
+        """Clear all cache entries, or only those of ``namespace``."""
+        if namespace is None:
+            self.cache.clear()
+            self._expiry_heap.clear()
+            self._namespace_keys.clear()
+            return
+        for key in list(self._namespace_keys.pop(namespace, ())):
+            self.cache.pop((namespace, key), None)
 
     def stats(self) -> dict[str, Any]:
         """Get cache statistics."""
-        self._cleanup_expired()
-
-        total_access_count = sum(entry["access_count"] for entry in self.cache.values())
-
+        total = self._hits + self._misses
         return {
             "size": len(self.cache),
             "max_size": self.max_size,
-            "total_accesses": total_access_count,
-            "hit_rate": None  # Would need to track misses to calculate
+            "total_accesses": total,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / total if total else 0.0,
+            "evictions": self._evictions,
+            "expirations": self._expirations,
+            "namespaces": {
+                name: {
+                    **counts,
+                    "size": len(self._namespace_keys.get(name, ())),
+                }
+                for name, counts in self._namespace_stats.items()
+            },
         }
 
 
@@ -120,56 +181,60 @@ def cache_key(*args, **kwargs) -> str:
 def cached(
     ttl: float = 300.0,
     key_func: Callable | None = None,
-    cache_instance: SimpleCache | None = None
+    cache_instance: SimpleCache | None = None,
+    namespace: str | None = None,
 ):
-    """Cache decorator for functions."""
+    """Cache decorator for functions.
+
+    With ``namespace`` the function's entries are counted and cleared
+    separately, e.g. ``clear_cache(namespace)``.
+    """
 
     def decorator(func: Callable):
         cache = cache_instance or _global_cache
 
+        def make_key(*args, **kwargs) -> str:
+            if key_func:
+                return f"{func.__name__}:{key_func(*args, **kwargs)}"
+            return f"{func.__name__}:{cache_key(*args, **kwargs)}"
+
         if asyncio.iscoroutinefunction(func):
             @wraps(func)
             async def async_wrapper(*args, **kwargs):
-                # Generate cache key
-                if key_func:
-                    key = f"{func.__name__}:{key_func(*args, **kwargs)}"
-                else:
-                    key = f"{func.__name__}:{cache_key(*args, **kwargs)}"
+                key = make_key(*args, **kwargs)
 
                 # Try to get from cache
-                cached_result = cache.get(key)
+                cached_result = cache.get(key, namespace)
                 if cached_result is not None:
                     logger.debug(f"Cache hit for {func.__name__}")
                     return cached_result
 
                 # Execute function and cache result
                 result = await func(*args, **kwargs)
-                cache.set(key, result, ttl)
+                cache.set(key, result, ttl, namespace)
                 logger.debug(f"Cache miss for {func.__name__}, result cached")
                 return result
 
+            async_wrapper.cache_namespace = namespace
             return async_wrapper
         else:
             @wraps(func)
             def sync_wrapper(*args, **kwargs):
-                # Generate cache key
-                if key_func:
-                    key = f"{func.__name__}:{key_func(*args, **kwargs)}"
-                else:
-                    key = f"{func.__name__}:{cache_key(*args, **kwargs)}"
+                key = make_key(*args, **kwargs)
 
                 # Try to get from cache
-                cached_result = cache.get(key)
+                cached_result = cache.get(key, namespace)
                 if cached_result is not None:
                     logger.debug(f"Cache hit for {func.__name__}")
                     return cached_result
 
                 # Execute function and cache result
                 result = func(*args, **kwargs)
-                cache.set(key, result, ttl)
+                cache.set(key, result, ttl, namespace)
                 logger.debug(f"Cache miss for {func.__name__}, result cached")
                 return result
 
+            sync_wrapper.cache_namespace = namespace
             return sync_wrapper
 
     return decorator
@@ -299,7 +364,7 @@ class PerformanceMonitor:
                 "error_count": 0,
                 "min_duration": float("inf"),
                 "max_duration": 0.0,
-                "recent_durations": [],
+                "durations": LatencyHistogram(),
                 "metadata": {}
             }
 
@@ -314,18 +379,14 @@ class PerformanceMonitor:
         else:
             stat["error_count"] += 1
 
-        # Keep recent durations for calculating percentiles
-        stat["recent_durations"].append(duration)
-        if len(stat["recent_durations"]) > 100:
-            stat["recent_durations"] = stat["recent_durations"][-100:]
+        # Every duration feeds the fixed-size percentile histogram
+        stat["durations"].record(duration)
 
         # Store metadata
         for key, value in metadata.items():
             if key not in stat["metadata"]:
-                stat["metadata"][key] = []
+                stat["metadata"][key] = deque(maxlen=10)
             stat["metadata"][key].append(value)
-            if len(stat["metadata"][key]) > 10:
-                stat["metadata"][key] = stat["metadata"][key][-10:]
 
     def get_stats(self, func_name: str) -> dict[str, Any] | None:
         """Get statistics for a function."""
@@ -333,7 +394,7 @@ class PerformanceMonitor:
             return None
 
         stat = self.stats[func_name]
-        recent_durations = sorted(stat["recent_durations"])
+        durations: LatencyHistogram = stat["durations"]
 
         result = {
             "total_calls": stat["total_calls"],
@@ -343,14 +404,11 @@ class PerformanceMonitor:
             "max_duration": stat["max_duration"],
         }
 
-        # Calculate percentiles if we have recent data
-        if recent_durations:
-            n = len(recent_durations)
+        # Percentiles over every recorded call
+        if durations.count:
             result.update({
-                "p50_duration": recent_durations[int(n * 0.5)],
-                "p90_duration": recent_durations[int(n * 0.9)],
-                "p95_duration": recent_durations[int(n * 0.95)],
-                "p99_duration": recent_durations[int(n * 0.99)] if n > 10 else recent_durations[-1]
+                f"{name}_duration": value
+                for name, value in durations.percentiles().items()
             })
 
         return result
@@ -359,6 +417,10 @@ class PerformanceMonitor:
         """Get statistics for all monitored functions."""
         return {name: self.get_stats(name) for name in self.stats.keys()}
 
+    def get_histogram_snapshots(self) -> dict[str, dict[str, Any]]:
+        """Mergeable duration histograms per function (see ``LatencyHistogram``)."""
+        return {name: stat["durations"].snapshot() for name, stat in self.stats.items()}
+
 
 # Global performance monitor
 _global_monitor = PerformanceMonitor()
@@ -426,9 +488,9 @@ def get_cache_stats() -> dict[str, Any]:
     return _global_cache.stats()
 
 
-def clear_cache() -> None:
+def clear_cache(namespace: str | None = None) -> None:
     """Clear global cache."""
-    _global_cache.clear()
+    _global_cache.clear(namespace)
 
 
 def get_performance_stats() -> dict[str, Any]:
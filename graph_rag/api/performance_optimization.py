@@ -14,6 +14,7 @@ from graph_rag.observability import (
     LogContext,
     get_component_logger,
 )
+from graph_rag.observability.histogram import LatencyHistogram
 
 # Use structured logger for performance optimization
 logger = get_component_logger(ComponentType.MONITORING, "performance_optimization")
@@ -89,7 +90,8 @@ class AdvancedPerformanceMonitor:
     def __init__(self, max_history: int = 1000):
         self.max_history = max_history
         self.query_history: deque = deque(maxlen=max_history)
-        self.operation_stats: dict[str, list[float]] = defaultdict(list)
+        # Streaming duration histograms (ms) per query type; fixed memory per type
+        self.operation_stats: dict[str, LatencyHistogram] = defaultdict(LatencyHistogram)
         self.memory_tracker = MemoryTracker()
         self.slow_query_threshold_ms = 2000.0
         self.slow_queries: deque = deque(maxlen=100)
@@ -159,7 +161,7 @@ class AdvancedPerformanceMonitor:
 
         # Record metrics
         self.query_history.append(metrics)
-        self.operation_stats[context["query_type"]].append(total_duration_ms)
+        self.operation_stats[context["query_type"]].record(total_duration_ms)
 
         # Track slow queries
         if total_duration_ms > self.slow_query_threshold_ms:
@@ -206,17 +208,9 @@ class AdvancedPerformanceMonitor:
             return None
 
         durations = self.operation_stats[operation_type]
-        if not durations:
+        if not durations.count:
             return None
 
-        durations_sorted = sorted(durations)
-        n = len(durations_sorted)
-
-        # Calculate percentiles
-        p50_idx = int(n * 0.5)
-        p95_idx = int(n * 0.95)
-        p99_idx = int(n * 0.99)
-
         # Get recent queries for this operation type
         recent_queries = [
             q for q in self.query_history
@@ -241,14 +235,14 @@ class AdvancedPerformanceMonitor:
 
         profile = PerformanceProfile(
             operation_type=operation_type,
-            avg_duration_ms=sum(durations) / len(durations),
-            min_duration_ms=min(durations),
-            max_duration_ms=max(durations),
-            p50_duration_ms=durations_sorted[p50_idx],
-            p95_duration_ms=durations_sorted[p95_idx],
-            p99_duration_ms=durations_sorted[p99_idx],
+            avg_duration_ms=durations.mean,
+            min_duration_ms=durations.min,
+            max_duration_ms=durations.max,
+            p50_duration_ms=durations.quantile(0.5),
+            p95_duration_ms=durations.quantile(0.95),
+            p99_duration_ms=durations.quantile(0.99),
             operations_per_second=ops_per_second,
-            total_operations=len(durations),
+            total_operations=durations.count,
             avg_memory_usage_mb=avg_memory,
             avg_cpu_percent=0.0,  # Would need CPU tracking
             cache_hit_rate=cache_hit_rate,
@@ -259,6 +253,15 @@ class AdvancedPerformanceMonitor:
 
         return profile
 
+    def get_histogram_snapshots(self) -> dict[str, dict[str, Any]]:
+        """Mergeable duration histograms (ms) per operation type."""
+        return {op_type: hist.snapshot() for op_type, hist in self.operation_stats.items()}
+
+    def merge_histogram_snapshots(self, snapshots: dict[str, dict[str, Any]]) -> None:
+        """Folds histograms exported by another worker into this monitor."""
+        for op_type, snapshot in snapshots.items():
+            self.operation_stats[op_type].merge(LatencyHistogram.from_snapshot(snapshot))
+
     def get_slow_queries(self, limit: int = 10) -> list[QueryPerformanceMetrics]:
         """Get recent slow queries."""
         return list(self.slow_queries)[-limit:]
@@ -12,9 +12,11 @@ This router consolidates:
 - Epic 7 Sales Automation CRM (from epic7_sales_automation.py)
 """
 
+import asyncio
 import inspect
 import json
 import logging
+import time
 import uuid
 from collections.abc import Callable
 from datetime import datetime
@@ -68,8 +70,14 @@ from graph_rag.core.interfaces import (
     SearchResultData,
     VectorStore,
 )
+from graph_rag.core.query_embedding_cache import get_query_embedding_cache
 from graph_rag.domain.models import Entity
 from graph_rag.services.ingestion import IngestionService
+from graph_rag.services.ingestion_queue import (
+    IngestionJob,
+    IngestionJobStatus,
+    IngestionQueueFullError,
+)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -371,6 +379,7 @@ async def process_document_with_service(
     ingestion_service: IngestionService,
     generate_embeddings: bool = True,
     replace_existing: bool = True,
+    skip_unchanged: bool = True,
 ):
     """Background task to process a document using the IngestionService."""
     logger.info(f"DEBUG: process_document_with_service called for doc {document_id}")
@@ -386,6 +395,7 @@ async def process_document_with_service(
             metadata=metadata,
             generate_embeddings=generate_embeddings,
             replace_existing=replace_existing,
+            skip_unchanged=skip_unchanged,
         )
         logger.info(f"DEBUG: Document {document_id} processed successfully.")
     except Exception as e:
@@ -636,11 +646,17 @@ def create_core_business_operations_router() -> APIRouter:
         tags=["Document Ingestion"]
     )
     async def ingest_document(
+        request: Request,
         background_tasks: BackgroundTasks,
         payload: IngestRequest = Body(...),
         ingestion_service: IngestionService = Depends(_state_get_ingestion_service),
     ):
-        """Asynchronous endpoint to ingest a document."""
+        """Asynchronous endpoint to ingest a document.
+
+        With the durable job queue running, the document is queued (per-tenant
+        via ``X-Tenant-ID``) and ``task_id`` is the job ID to poll at
+        ``/ingestion/jobs/{task_id}``; a full queue answers 429 with Retry-After.
+        """
         request_id = str(uuid.uuid4())
         logger.info(f"[Req ID: {request_id}] Received ingestion request.")
 
@@ -658,7 +674,37 @@ def create_core_business_operations_router() -> APIRouter:
         doc_id = payload.document_id or f"doc-{uuid.uuid4()}"
         logger.debug(f"[Req ID: {request_id}] Using document ID: {doc_id}")
 
-        # Always schedule background task
+        queue = getattr(request.app.state, "ingestion_queue", None)
+        if queue is not None:
+            tenant_id = request.headers.get("x-tenant-id", "default")
+            try:
+                job = await queue.submit(
+                    document_id=doc_id,
+                    content=payload.content,
+                    metadata=payload.metadata or {},
+                    tenant_id=tenant_id,
+                    generate_embeddings=payload.generate_embeddings,
+                    replace_existing=payload.replace_existing,
+                    skip_unchanged=payload.skip_unchanged,
+                )
+            except IngestionQueueFullError as e:
+                logger.warning(f"[Req ID: {request_id}] Ingestion rejected: {e}")
+                raise HTTPException(
+                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                    detail=str(e),
+                    headers={"Retry-After": str(queue.retry_after_seconds)},
+                ) from e
+            logger.info(
+                f"[Req ID: {request_id}] Queued ingestion job {job.job_id} for document {doc_id} (tenant={tenant_id})."
+            )
+            return IngestResponse(
+                message="Document ingestion queued.",
+                document_id=doc_id,
+                task_id=job.job_id,
+                status=job.status.value,
+            )
+
+        # No job queue: process in-process after the response
         logger.info(
             f"[Req ID: {request_id}] Scheduling background ingestion task for document {doc_id}."
         )
@@ -670,6 +716,7 @@ def create_core_business_operations_router() -> APIRouter:
             ingestion_service=ingestion_service,
             generate_embeddings=payload.generate_embeddings,
             replace_existing=payload.replace_existing,
+            skip_unchanged=payload.skip_unchanged,
         )
 
         return IngestResponse(
@@ -679,6 +726,57 @@ def create_core_business_operations_router() -> APIRouter:
             status="processing",
         )
 
+    def _get_ingestion_queue(request: Request):
+        queue = getattr(request.app.state, "ingestion_queue", None)
+        if queue is None:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Ingestion job queue is not enabled.",
+            )
+        return queue
+
+    @router.get(
+        "/ingestion/jobs/{job_id}",
+        response_model=IngestionJob,
+        summary="Get Ingestion Job Status",
+        description="Returns the status, current stage and progress of a queued ingestion job.",
+        tags=["Document Ingestion"]
+    )
+    async def get_ingestion_job(job_id: str, request: Request):
+        job = await _get_ingestion_queue(request).get_job(job_id)
+        if job is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Ingestion job {job_id} not found.",
+            )
+        return job
+
+    @router.get(
+        "/ingestion/jobs",
+        response_model=list[IngestionJob],
+        summary="List Ingestion Jobs",
+        description="Lists recent ingestion jobs, newest first.",
+        tags=["Document Ingestion"]
+    )
+    async def list_ingestion_jobs(
+        request: Request,
+        job_status: Annotated[IngestionJobStatus | None, Query(alias="status")] = None,
+        tenant_id: str | None = None,
+        limit: Annotated[int, Query(ge=1, le=1000)] = 100,
+    ):
+        return await _get_ingestion_queue(request).list_jobs(
+            tenant_id=tenant_id, status=job_status, limit=limit
+        )
+
+    @router.get(
+        "/ingestion/queue",
+        summary="Ingestion Queue Statistics",
+        description="Queue depth, job counts by status, worker count and embedding batching statistics.",
+        tags=["Document Ingestion"]
+    )
+    async def get_ingestion_queue_stats(request: Request) -> dict[str, Any]:
+        return await _get_ingestion_queue(request).stats()
+
     # ===============================
     # SEARCH & RETRIEVAL ENDPOINTS
     # ===============================
@@ -1000,112 +1098,117 @@ def create_core_business_operations_router() -> APIRouter:
 
     @router.post(
         "/search/batch",
-        response_model=list[schemas.SearchQueryResponse],
+        response_model=list[schemas.SearchBatchQueryResponse],
         summary="Batch Search Processing",
-        description="Process multiple search queries in a single request.",
+        description=(
+            "Retrieve results for multiple search queries in a single request. "
+            "Queries of the same search type are embedded and scored together; "
+            "LLM answers are generated only when requested."
+        ),
         tags=["Search & Retrieval"]
     )
     async def batch_search(
         request: schemas.SearchBatchQueryRequest,
         engine: Annotated[GraphRAGEngine, Depends(get_graph_rag_engine)],
         response: Response,
-        graph_store=Depends(get_graph_repository),
-    ) -> list[schemas.SearchQueryResponse]:
-        """Process multiple search queries in a single batch request."""
+    ) -> list[schemas.SearchBatchQueryResponse]:
+        """Process multiple search queries as one batched retrieval."""
         logger.info(
             f"Received batch search request with {len(request.queries)} queries"
         )
-
-        results = []
-        any_failed = False
-        for query_request in request.queries:
-            status_code = status.HTTP_200_OK
-            error_detail = None
-            query_response = None
+        start = time.perf_counter()
+        queries = request.queries
+        hits: list[list[SearchResultData]] = [[] for _ in queries]
+        errors: list[schemas.ErrorDetail | None] = [None] * len(queries)
+
+        # One batched retrieval per search type, at the largest requested limit
+        by_type: dict[str, list[int]] = {}
+        for i, query_request in enumerate(queries):
+            by_type.setdefault(query_request.search_type, []).append(i)
+        for search_type, indices in by_type.items():
             try:
-                # Use the engine's query method for each query in the batch
-                query_result: QueryResult = await engine.query(
-                    query_text=query_request.query,
+                batch_hits = await engine.batch_search(
+                    [queries[i].query for i in indices],
                     config={
-                        "k": query_request.limit,
-                        "search_type": query_request.search_type,
-                        "include_graph": False,  # Default for batch endpoint
+                        "k": max(queries[i].limit for i in indices),
+                        "search_type": search_type,
                     },
                 )
-
-                # Transform the query results into the expected response format
-                response_results = []
-                for chunk in query_result.relevant_chunks:
-                    # Create schema objects from chunk data
-                    chunk_schema = schemas.ChunkResultSchema(
-                        id=chunk.id, text=chunk.text, document_id=chunk.document_id
-                    )
-
-                    # Create search result with score from the chunk
-                    search_result = schemas.SearchResultSchema(
-                        chunk=chunk_schema,
-                        score=chunk.score if hasattr(chunk, "score") else 0.0,
-                        document=None,  # Document details not included in batch responses
-                    )
-                    response_results.append(search_result)
-
-                # Create the response for this query
-                query_response = schemas.SearchQueryResponse(
-                    query=query_request.query,
-                    search_type=query_request.search_type,
-                    results=response_results,
-                    llm_response=query_result.llm_response,
-                    graph_context=query_result.graph_context
-                    if isinstance(query_result.graph_context, str)
-                    else "",
-                )
-
+                for i, query_hits in zip(indices, batch_hits, strict=True):
+                    hits[i] = query_hits[: queries[i].limit]
             except Exception as e:
                 logger.error(
-                    f"Error processing query '{query_request.query}': {e}",
+                    f"Batch {search_type} search over {len(indices)} queries failed: {e}",
                     exc_info=True,
                 )
-                # Add a failed response for this query and mark partial failure
-                any_failed = True
-                status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
-                error_detail = schemas.ErrorDetail(
-                    message=str(e), type=type(e).__name__
+                for i in indices:
+                    errors[i] = schemas.ErrorDetail(message=str(e), type=type(e).__name__)
+
+        answers: list[str | None] = [None] * len(queries)
+        if request.generate_answers:
+            semaphore = asyncio.Semaphore(request.answer_concurrency)
+
+            async def answer(i: int) -> None:
+                query_request = queries[i]
+                async with semaphore:
+                    try:
+                        answers[i] = await engine.answer_query(
+                            query_request.query,
+                            {
+                                "k": query_request.limit,
+                                "search_type": query_request.search_type,
+                                "include_graph": False,
+                            },
+                            _retrieved_chunks_data=hits[i],
+                        )
+                    except Exception as e:
+                        logger.error(
+                            f"Answer generation failed for '{query_request.query}': {e}",
+                            exc_info=True,
+                        )
+                        answers[i] = ""
+                        errors[i] = schemas.ErrorDetail(message=str(e), type=type(e).__name__)
+
+            await asyncio.gather(*(answer(i) for i, err in enumerate(errors) if err is None))
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        results = []
+        for i, query_request in enumerate(queries):
+            response_results = [
+                schemas.SearchResultSchema(
+                    chunk=schemas.ChunkResultSchema(
+                        id=hit.chunk.id,
+                        text=hit.chunk.text,
+                        document_id=hit.chunk.document_id,
+                    ),
+                    score=hit.score if hit.score is not None else 0.0,
+                    document=None,  # Document details not included in batch responses
                 )
-                # Create a failed response object
-                query_response = schemas.SearchQueryResponse(
+                for hit in hits[i]
+                if hit and hit.chunk
+            ]
+            results.append(
+                schemas.SearchBatchQueryResponse(
                     query=query_request.query,
                     search_type=query_request.search_type,
-                    results=[],
-                    llm_response="",
-                    graph_context="",
-                )
-
-            # Add status_code and error to the response object
-            if query_response:
-                query_response.status_code = status_code
-                query_response.error = error_detail
-                results.append(query_response)
-            else:
-                # Handle unexpected case where query_response is None
-                logger.error(
-                    f"Unexpected error: query_response is None for query '{query_request.query}'"
-                )
-                results.append(
-                    schemas.SearchQueryResponse(
-                        query=query_request.query,
-                        search_type=query_request.search_type,
-                        results=[],
-                        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                        error=schemas.ErrorDetail(
-                            message="Internal server error: Failed to generate response."
-                        ),
-                    )
+                    results=response_results,
+                    total_results=len(response_results),
+                    processing_time_ms=elapsed_ms,
+                    llm_response=answers[i],
+                    status_code=(
+                        status.HTTP_200_OK
+                        if errors[i] is None
+                        else status.HTTP_500_INTERNAL_SERVER_ERROR
+                    ),
+                    error=errors[i],
                 )
-                any_failed = True
+            )
 
-        logger.info(f"Batch search completed with {len(results)} results")
+        logger.info(
+            f"Batch search completed with {len(results)} results in {elapsed_ms:.1f}ms"
+        )
         # If any query failed, use 207 Multi-Status
-        if any_failed:
+        if any(err is not None for err in errors):
             response.status_code = status.HTTP_207_MULTI_STATUS
         return results
 
@@ -1472,8 +1575,10 @@ def create_core_business_operations_router() -> APIRouter:
                 "search_type": ask_request.search_type,
                 "blend_vector_weight": ask_request.blend_vector_weight,
                 "blend_keyword_weight": ask_request.blend_keyword_weight,
+                "hybrid_fusion": ask_request.hybrid_fusion,
                 "rerank": ask_request.rerank,
                 "mmr_lambda": ask_request.mmr_lambda,
+                "mmr_candidates": ask_request.mmr_candidates,
                 "no_answer_min_score": ask_request.no_answer_min_score,
                 "style": ask_request.style,
                 "conversation_id": ask_request.conversation_id,
@@ -1569,6 +1674,31 @@ def create_core_business_operations_router() -> APIRouter:
             return embedding_service.get_cache_stats()
         return {"message": "Embedding cache not available for this service"}
 
+    @router.get(
+        "/cache/queries/stats",
+        summary="Get query embedding cache statistics",
+        description="Retrieve metrics for the query embedding cache shared by all search entry points",
+        tags=["Performance Monitoring"],
+        response_model=dict,
+    )
+    async def get_query_embedding_cache_stats():
+        """
+        Get query embedding cache statistics.
+
+        Query embeddings are cached separately from document embeddings, so
+        ingestion does not evict hot queries.
+
+        Returns:
+            Dictionary with cache metrics:
+            - hits: Number of cache hits
+            - misses: Number of cache misses
+            - hit_rate: Fraction of lookups served from the cache
+            - evictions: Entries evicted to stay within capacity
+            - size: Current cached entries
+            - maxsize: Maximum cache capacity
+        """
+        return get_query_embedding_cache().stats()
+
     @router.get(
         "/cache/entities/stats",
         summary="Get entity extraction cache statistics",
@@ -1637,6 +1767,7 @@ def create_core_business_operations_router() -> APIRouter:
 
         return {
             "embedding_cache": embedding_stats,
+            "query_embedding_cache": get_query_embedding_cache().stats(),
             "entity_cache": entity_stats,
             "optimization_impact": {
                 "embedding_cache": "30% faster batch ingestion, ~90% reduction for cached texts",
@@ -16,6 +16,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel, Field
 
 from graph_rag.config import Settings, get_settings
+from graph_rag.observability.histogram import LatencyHistogram
 
 logger = logging.getLogger(__name__)
 
@@ -224,6 +225,50 @@ async def system_metrics() -> SystemMetrics:
         )
 
 
+def _latency_summary(snapshots: dict[str, dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    summary = {}
+    for name, snapshot in snapshots.items():
+        histogram = LatencyHistogram.from_snapshot(snapshot)
+        summary[name] = {
+            "count": histogram.count,
+            "mean": histogram.mean,
+            "min": snapshot["min"],
+            "max": snapshot["max"],
+            **histogram.percentiles(),
+        }
+    return summary
+
+
+@router.get(
+    "/metrics/latency",
+    summary="Latency percentiles",
+    description="Returns streaming latency percentiles per monitored function and query type",
+)
+async def latency_metrics(include_histograms: bool = False) -> dict[str, Any]:
+    """
+    Get latency percentiles from the in-process performance monitors.
+
+    Function durations are in seconds, query durations in milliseconds. With
+    ``include_histograms`` the raw histogram snapshots are returned as well,
+    so results from several workers can be merged by the caller.
+    """
+    from graph_rag.api.performance import _global_monitor
+    from graph_rag.api.performance_optimization import get_performance_monitor
+
+    function_snapshots = _global_monitor.get_histogram_snapshots()
+    query_snapshots = get_performance_monitor().get_histogram_snapshots()
+    result: dict[str, Any] = {
+        "functions": _latency_summary(function_snapshots),
+        "queries": _latency_summary(query_snapshots),
+    }
+    if include_histograms:
+        result["histograms"] = {
+            "functions": function_snapshots,
+            "queries": query_snapshots,
+        }
+    return result
+
+
 @router.get(
     "/info",
     response_model=ApplicationInfo,
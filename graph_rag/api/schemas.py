@@ -65,8 +65,15 @@ class ErrorDetail(BaseModel):
 
 class SearchBatchQueryRequest(BaseModel):
     queries: list[SearchQueryRequest] = Field(
-        ..., min_length=1, max_length=10
-    )  # Require at least one query, cap at 10
+        ..., min_length=1, max_length=100
+    )  # Require at least one query, cap at 100
+    generate_answers: bool = Field(
+        False,
+        description="Also generate an LLM answer per query from its retrieved chunks.",
+    )
+    answer_concurrency: int = Field(
+        4, ge=1, le=32, description="Maximum concurrent LLM calls when generating answers."
+    )
 
 
 # --- Update Schemas ---
@@ -209,6 +216,13 @@ class SearchQueryResponse(BaseModel):
     processing_time_ms: float
 
 
+class SearchBatchQueryResponse(SearchQueryResponse):
+    """Per-query entry of a batch search response."""
+    llm_response: str | None = None
+    status_code: int = 200
+    error: ErrorDetail | None = None
+
+
 class QueryResponse(BaseModel):
     """Response schema for unified query operations."""
     query: str
@@ -60,6 +60,7 @@ async def process_and_store_document(
     metadata: dict | None = None,
     enable_embeddings: bool = False,
     replace_existing: bool = True,
+    skip_unchanged: bool = True,
 ) -> None:
     """
     Process and store a document, extract entities, and build graph links.
@@ -131,6 +132,7 @@ async def process_and_store_document(
                 metadata=meta_with_id,
                 generate_embeddings=enable_embeddings,
                 replace_existing=replace_existing,
+                skip_unchanged=skip_unchanged,
             )
         except Exception as e:
             handle_ingestion_error(e, document_id, "document_ingestion")
@@ -266,6 +268,8 @@ async def process_files_with_batch(
     replace_existing: bool,
     metadata_parser: Callable[[Path], dict[str, Any]],
     as_json: bool = False,
+    workers: int = 4,
+    skip_unchanged: bool = True,
 ) -> tuple[int, int, list[dict[str, Any]] | None]:
     """
     Process multiple files using batch processing for better performance.
@@ -300,6 +304,7 @@ async def process_files_with_batch(
             graph_store=repo,
             embedding_service=embedding_service,
             vector_store=vector_store,
+            graph_write_batch_size=settings.ingestion_graph_batch_size,
         )
 
         # Configure batch processing with progress reporting
@@ -309,6 +314,9 @@ async def process_files_with_batch(
         batch_config = BatchConfig(
             batch_size=batch_size,
             progress_callback=progress_callback,
+            ingest_workers=workers,
+            embedding_batch_size=settings.ingestion_embedding_batch_size,
+            skip_unchanged=skip_unchanged,
         )
 
         # Create incremental ingestion service
@@ -338,6 +346,7 @@ async def process_files_with_batch(
                     if file_result.success:
                         item["document_id"] = file_result.document_id
                         item["num_chunks"] = file_result.chunk_count
+                        item["skipped"] = file_result.skipped
                         item["processing_time"] = file_result.processing_time
                     else:
                         item["error"] = file_result.error
@@ -386,6 +395,14 @@ async def ingest(
             "before adding new ones (idempotent)."
         ),
     ),
+    force: bool = typer.Option(
+        False,
+        "--force",
+        help=(
+            "Re-ingest documents even when their content and metadata are unchanged "
+            "(skips the fingerprint check)."
+        ),
+    ),
     include: list[str] = typer.Option(
         None,
         "--include",
@@ -420,6 +437,12 @@ async def ingest(
         "--batch/--no-batch",
         help="Force batch processing on/off. Auto-enabled for 100+ files if not specified",
     ),
+    workers: int = typer.Option(
+        4,
+        "--workers",
+        min=1,
+        help="Documents ingested concurrently in batch mode (embedding calls are shared across them)",
+    ),
 ) -> None:
     """
     Ingest a document into the graph database.
@@ -714,6 +737,7 @@ async def ingest(
                     merged_meta,
                     enable_embeddings=embeddings,
                     replace_existing=replace,
+                    skip_unchanged=not force,
                 )
             except TypeError:
                 res = await process_and_store_document(tmp_file, merged_meta)
@@ -773,7 +797,10 @@ async def ingest(
             )
 
             if should_use_batch:
-                logger.info(f"Using batch processing for {len(candidates)} files (batch_size={batch_size})")
+                logger.info(
+                    f"Using batch processing for {len(candidates)} files "
+                    f"(batch_size={batch_size}, workers={workers})"
+                )
 
                 # Define metadata parser function
                 def metadata_parser(path: Path) -> dict[str, Any]:
@@ -788,6 +815,8 @@ async def ingest(
                     replace_existing=replace,
                     metadata_parser=metadata_parser,
                     as_json=as_json,
+                    workers=workers,
+                    skip_unchanged=not force,
                 )
                 processed_count = succeeded + failed
             else:
@@ -806,6 +835,7 @@ async def ingest(
                                 merged_meta,
                                 enable_embeddings=embeddings,
                                 replace_existing=replace,
+                                skip_unchanged=not force,
                             )
                         except TypeError:
                             res = await process_and_store_document(path, merged_meta)
@@ -892,6 +922,7 @@ async def ingest(
                     merged_meta,
                     enable_embeddings=embeddings,
                     replace_existing=replace,
+                    skip_unchanged=not force,
                 )
             except TypeError:
                 res = await process_and_store_document(file_path, merged_meta)
@@ -935,6 +966,14 @@ def ingest_command(
             "before adding new ones (idempotent)."
         ),
     ),
+    force: bool = typer.Option(
+        False,
+        "--force",
+        help=(
+            "Re-ingest documents even when their content and metadata are unchanged "
+            "(skips the fingerprint check)."
+        ),
+    ),
     include: list[str] = typer.Option(
         None,
         "--include",
@@ -969,6 +1008,12 @@ def ingest_command(
         "--batch/--no-batch",
         help="Force batch processing on/off. Auto-enabled for 100+ files if not specified",
     ),
+    workers: int = typer.Option(
+        4,
+        "--workers",
+        min=1,
+        help="Documents ingested concurrently in batch mode (embedding calls are shared across them)",
+    ),
 ) -> None:
     """Wrapper function to run the async ingest command with options."""
     safe_async_run(
@@ -979,6 +1024,7 @@ def ingest_command(
             meta_file=meta_file,
             embeddings=embeddings,
             replace=replace,
+            force=force,
             include=include,
             exclude=exclude,
             dry_run=dry_run,
@@ -987,6 +1033,7 @@ def ingest_command(
             json_summary=json_summary,
             batch_size=batch_size,
             use_batch_processing=use_batch_processing,
+            workers=workers,
         ),
         "ingest"
     )
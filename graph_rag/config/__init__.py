@@ -74,6 +74,18 @@ class Settings(BaseSettings):
     memgraph_retry_delay: int = Field(
         2, ge=1, description="Delay in seconds between Memgraph retries."
     )
+    memgraph_pool_size: int = Field(
+        8, ge=1, description="Maximum pooled Memgraph connections (and query worker threads)."
+    )
+    memgraph_pool_max_lifetime: float = Field(
+        3600.0, gt=0, description="Seconds after which a pooled Memgraph connection is recycled."
+    )
+    memgraph_pool_acquire_timeout: float = Field(
+        30.0, gt=0, description="Seconds to wait for a free pooled Memgraph connection."
+    )
+    memgraph_pool_health_check_after: float = Field(
+        30.0, ge=0, description="Idle seconds after which a pooled connection is health-checked before reuse."
+    )
 
     # --- Vector Store Settings ---
     vector_store_type: str = Field(
@@ -93,6 +105,17 @@ class Settings(BaseSettings):
         description="Sentence-transformer model for the vector store. Default: all-MiniLM-L6-v2",
     )
 
+    temporal_tracker_path: str | None = Field(
+        None,
+        description="Directory where TemporalTracker persists idea evolutions. None keeps them in memory only.",
+    )
+    temporal_tracker_similarity_threshold: float = Field(
+        0.85,
+        ge=0.0,
+        le=1.0,
+        description="Cosine similarity at which a concept joins an existing idea evolution.",
+    )
+
     # --- FAISS Optimization Settings ---
     use_optimized_faiss: bool = Field(
         True,
@@ -140,6 +163,16 @@ class Settings(BaseSettings):
         "en_core_web_sm",
         description="Identifier for the entity extraction model (e.g., spaCy model name). Default: en_core_web_sm",
     )
+    entity_extractor_batch_size: int = Field(
+        64,
+        ge=1,
+        description="Number of texts per nlp.pipe batch during entity extraction.",
+    )
+    entity_extractor_processes: int = Field(
+        1,
+        ge=1,
+        description="Worker processes used by nlp.pipe for entity extraction (1 = in-process).",
+    )
     # embedding_model: str = Field("mock", description="Identifier for the text embedding model/service.") # This might be redundant now
     # relationship_extractor_model: Optional[str] = Field(None, ...)
 
@@ -164,6 +197,16 @@ class Settings(BaseSettings):
         "http://localhost:11434",
         description="Base URL for Ollama server (if using Ollama). Default: http://localhost:11434",
     )
+    ollama_max_connections: int = Field(
+        16,
+        ge=1,
+        description="Keep-alive connections pooled per OllamaService. Default: 16",
+    )
+    ollama_embed_batch_size: int = Field(
+        64,
+        ge=1,
+        description="Texts sent per Ollama /api/embed request by embed_texts. Default: 64",
+    )
     llm_model_name: str = Field(
         "gpt-4o-mini",
         description="Model name for the LLM service. Default: gpt-4o-mini",
@@ -245,6 +288,14 @@ class Settings(BaseSettings):
     cache_search_ttl: int = Field(
         600, description="TTL for search result cache in seconds."
     )
+    cache_max_entries: int = Field(
+        10_000, ge=1, description="Maximum number of entries held by the in-memory cache."
+    )
+    cache_max_bytes: int = Field(
+        128 * 1024 * 1024,
+        ge=1,
+        description="Approximate memory budget in bytes for in-memory cache values.",
+    )
 
     # --- Document Processor Settings ---
     chunk_splitter_type: str = Field(
@@ -261,6 +312,56 @@ class Settings(BaseSettings):
         ge=0,
         description="Number of tokens to overlap between chunks during ingestion.",
     )
+    ingestion_graph_batch_size: int = Field(
+        500,
+        ge=1,
+        description="Rows per UNWIND statement when bulk-writing a document's chunks, entities and relationships.",
+    )
+
+    # --- Ingestion Queue Settings ---
+    ingestion_queue_enabled: bool = Field(
+        False,
+        description=(
+            "Run /ingestion/documents through the durable job queue instead of in-process "
+            "background tasks. Accepted documents then report status 'queued'. Default: False"
+        ),
+    )
+    ingestion_queue_path: str | None = Field(
+        None,
+        description=(
+            "SQLite database holding queued ingestion jobs; share it between API processes. "
+            "None places ingestion_jobs.sqlite3 next to vector_store_path."
+        ),
+    )
+    ingestion_workers: int = Field(
+        2, ge=1, description="Number of concurrent ingestion workers per API process."
+    )
+    ingestion_queue_max_depth: int = Field(
+        1000,
+        ge=1,
+        description="Queued plus running jobs above which new ingestion requests get HTTP 429.",
+    )
+    ingestion_job_max_attempts: int = Field(
+        3, ge=1, description="Attempts per ingestion job before it is marked failed."
+    )
+    ingestion_retry_after_seconds: int = Field(
+        5, ge=1, description="Retry-After value returned when the ingestion queue is full."
+    )
+    ingestion_retry_backoff_seconds: float = Field(
+        5.0,
+        ge=0.0,
+        description="Delay before retrying a failed ingestion job; doubles with each further attempt.",
+    )
+    ingestion_embedding_batch_size: int = Field(
+        256,
+        ge=1,
+        description="Maximum texts per embedding call shared by concurrent ingestion workers (1 disables batching).",
+    )
+    ingestion_embedding_batch_window_ms: float = Field(
+        10.0,
+        ge=0.0,
+        description="How long ingestion workers wait for other embedding requests to join a batch.",
+    )
 
     # --- Retrieval/RAG Settings ---
     graph_context_max_tokens: int = Field(
@@ -268,6 +369,35 @@ class Settings(BaseSettings):
         ge=100,
         description="Maximum number of tokens for the context retrieved from the graph.",
     )
+    reranker_model_name: str = Field(
+        "cross-encoder/ms-marco-MiniLM-L-6-v2",
+        description="Cross-encoder model used when rerank=true.",
+    )
+    reranker_max_batch_size: int = Field(
+        64,
+        ge=1,
+        description="Maximum (query, passage) pairs scored in one cross-encoder forward pass.",
+    )
+    reranker_max_wait_ms: float = Field(
+        5.0,
+        ge=0.0,
+        description="How long to wait for concurrent rerank requests to join a batch.",
+    )
+    reranker_workers: int = Field(
+        1,
+        ge=1,
+        description="Threads running cross-encoder inference.",
+    )
+    reranker_cache_size: int = Field(
+        10_000,
+        ge=0,
+        description="Cached cross-encoder scores, keyed by query and chunk.",
+    )
+    query_embedding_cache_size: int = Field(
+        4096,
+        ge=0,
+        description="Query embeddings cached across search entry points, separate from document embeddings (0 disables).",
+    )
 
     # --- Feature Flags ---
     enable_keyword_streaming: bool = Field(
@@ -571,6 +701,13 @@ class Settings(BaseSettings):
 
         return self
 
+    def get_ingestion_queue_path(self) -> str:
+        """Path of the ingestion job database, defaulting to the vector store's data directory."""
+        if self.ingestion_queue_path:
+            return os.path.expanduser(self.ingestion_queue_path)
+        data_dir = os.path.dirname(os.path.expanduser(self.vector_store_path).rstrip(os.sep))
+        return os.path.join(data_dir, "ingestion_jobs.sqlite3")
+
     def get_memgraph_uri(self) -> str:
         """Constructs the Memgraph connection URI from the individual settings."""
         protocol = "bolt+s" if self.memgraph_use_ssl else "bolt"
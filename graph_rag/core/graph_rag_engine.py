@@ -25,6 +25,7 @@ from graph_rag.core.interfaces import (
     SearchResultData,
     VectorStore,
 )
+from graph_rag.core.query_embedding_cache import encode_texts, get_query_embedding_cache
 
 # Remove incorrect/unused service imports that cause ModuleNotFound errors
 # from graph_rag.services.chunking import ChunkingService
@@ -48,9 +49,10 @@ from graph_rag.observability import (
 )
 from graph_rag.services.answer_validation import AnswerValidator, ValidationLevel
 from graph_rag.services.citation import CitationService, CitationStyle
+from graph_rag.services.diversify import MMRDiversifier
 from graph_rag.services.memory import ContextManager
 from graph_rag.services.prompt_optimization import PromptOptimizer
-from graph_rag.services.rerank import CrossEncoderReranker
+from graph_rag.services.rerank import get_cross_encoder_reranker
 from graph_rag.services.search import (
     SearchResult,
 )  # Import SearchResult model too
@@ -111,7 +113,7 @@ class SimpleGraphRAGEngine(GraphRAGEngine):
         self._graph_store = graph_store
         self._vector_store = vector_store
         self._entity_extractor = entity_extractor  # Store the extractor
-        self._reranker = CrossEncoderReranker()
+        self._reranker = get_cross_encoder_reranker()
         self._context_manager = context_manager
         self._citation_service = CitationService(citation_style)
         self._answer_validator = AnswerValidator(validation_level)
@@ -329,7 +331,7 @@ class SimpleGraphRAGEngine(GraphRAGEngine):
             operation="context_retrieval",
             metadata={
                 "query_length": len(query_text),
-                "config": config or {},
+                "config": {k: v for k, v in (config or {}).items() if k != "query_vector"},
             }
         )
         logger.info("Starting context retrieval", retrieval_context, query=query_text[:100])
@@ -352,13 +354,21 @@ class SimpleGraphRAGEngine(GraphRAGEngine):
             logger.info(f"SimpleGraphRAGEngine: Search type: {search_type}")
             blend_keyword_weight = float(config.get("blend_keyword_weight", 0.0))
             no_answer_min_score = float(config.get("no_answer_min_score", 0.0))
+            # A caller that already embedded the query passes it through so the
+            # vector store does not embed the same text again.
+            query_vector = config.get("query_vector")
+            vector_kwargs = {"query_vector": query_vector} if query_vector is not None else {}
+            # MMR picks k out of a larger candidate pool, so retrieval over-fetches
+            mmr_lambda = float(config.get("mmr_lambda", 0.0))
+            use_mmr = 0.0 < mmr_lambda <= 1.0
+            pool_k = max(k, int(config.get("mmr_candidates") or k * 4)) if use_mmr else k
 
             if search_type == "vector":
                 # Vector-only search
                 logger.info("SimpleGraphRAGEngine: Using vector-only search")
                 logger.info(f"SimpleGraphRAGEngine: Calling vector store search with query: '{query_text}'")
                 logger.info(f"SimpleGraphRAGEngine: Vector store type: {type(self._vector_store).__name__}")
-                retrieved = await self._vector_store.search(query_text, top_k=k, search_type="vector")
+                retrieved = await self._vector_store.search(query_text, top_k=pool_k, search_type="vector", **vector_kwargs)
                 logger.info(f"SimpleGraphRAGEngine: Vector store search returned {len(retrieved)} results")
                 if retrieved:
                     logger.info(f"SimpleGraphRAGEngine: First result score: {retrieved[0].score}")
@@ -367,68 +377,37 @@ class SimpleGraphRAGEngine(GraphRAGEngine):
             elif search_type == "keyword":
                 # Keyword-only search
                 logger.debug("Using keyword-only search")
-                retrieved = await self._vector_store.search(query_text, top_k=k, search_type="keyword")
+                retrieved = await self._vector_store.search(query_text, top_k=pool_k, search_type="keyword")
                 retrieved_chunks_full = retrieved
 
             elif search_type == "hybrid":
-                # Hybrid search: blend vector and keyword results
-                logger.debug(f"Using hybrid search with blend_keyword_weight={blend_keyword_weight}")
-
-                # Get results from both search types
-                results_vector = await self._vector_store.search(query_text, top_k=k, search_type="vector")
-                results_keyword = await self._vector_store.search(query_text, top_k=k, search_type="keyword")
-
-                # Convert to dict by chunk id for blending
-                vec_scores = {r.chunk.id: r.score for r in results_vector if r and r.chunk}
-                kw_scores = {r.chunk.id: r.score for r in results_keyword if r and r.chunk}
-
-                # Combine all chunks from both searches
-                combined: dict[str, SearchResultData] = {}
-                for r in results_vector:
-                    if r and r.chunk:
-                        combined[r.chunk.id] = r
-                for r in results_keyword:
-                    if r and r.chunk:
-                        combined.setdefault(r.chunk.id, r)
-
-                # Recompute blended scores: (1-blend_keyword_weight) * vector + blend_keyword_weight * keyword
-                alpha = 1.0 - blend_keyword_weight  # vector weight
-                beta = blend_keyword_weight  # keyword weight
-
-                blended: list[SearchResultData] = []
-                for rid, item in combined.items():
-                    vs = vec_scores.get(rid, 0.0)
-                    ks = kw_scores.get(rid, 0.0)
-                    score = alpha * vs + beta * ks
-
-                    chunk = item.chunk
-                    meta = dict(chunk.metadata or {})
-                    meta["score_vector"] = vs
-                    meta["score_keyword"] = ks
-                    meta["score_blended"] = score
-
-                    blended.append(
-                        SearchResultData(
-                            chunk=ChunkData(
-                                id=chunk.id,
-                                text=chunk.text,
-                                document_id=chunk.document_id,
-                                metadata=meta,
-                                embedding=chunk.embedding,
-                                score=score,
-                            ),
-                            score=score,
-                        )
-                    )
+                # Hybrid search: fuse vector and keyword results
+                fusion = str(config.get("hybrid_fusion", "weighted")).lower()
+                fetch_k = max(pool_k, int(config.get("hybrid_fetch_k", k * 3)))
+                logger.debug(
+                    f"Using hybrid search with fusion={fusion}, fetch_k={fetch_k}, "
+                    f"blend_keyword_weight={blend_keyword_weight}"
+                )
 
-                # Sort by blended score
-                blended.sort(key=lambda r: r.score, reverse=True)
-                retrieved_chunks_full = blended[:k]
+                # Run both legs concurrently so latency is max(leg), not the sum;
+                # each leg over-fetches so fusion sees more than the final k.
+                results_vector, results_keyword = await asyncio.gather(
+                    self._vector_store.search(query_text, top_k=fetch_k, search_type="vector", **vector_kwargs),
+                    self._vector_store.search(query_text, top_k=fetch_k, search_type="keyword"),
+                )
+                retrieved_chunks_full = self._fuse_hybrid_results(
+                    results_vector,
+                    results_keyword,
+                    k=pool_k,
+                    fusion=fusion,
+                    keyword_weight=blend_keyword_weight,
+                    rrf_k=int(config.get("rrf_k", 60)),
+                )
 
             else:
                 # Fallback to vector search for unknown search types
                 logger.warning(f"Unknown search_type '{search_type}', falling back to vector search")
-                retrieved = await self._vector_store.search(query_text, top_k=k, search_type="vector")
+                retrieved = await self._vector_store.search(query_text, top_k=pool_k, search_type="vector", **vector_kwargs)
                 retrieved_chunks_full = retrieved
 
             # Apply no-answer threshold check
@@ -457,50 +436,14 @@ class SimpleGraphRAGEngine(GraphRAGEngine):
                 # Optional rerank via cross-encoder
                 if bool(config.get("rerank", False)):
                     retrieved_chunks_full = await self._reranker.rerank(
-                        query_text, retrieved_chunks_full, k
+                        query_text, retrieved_chunks_full, pool_k
                     )
-                # MMR diversification over the texts
-                mmr_lambda = float(config.get("mmr_lambda", 0.0))
-                if 0.0 < mmr_lambda <= 1.0 and len(retrieved_chunks_full) > 2:
-                    selected: list[SearchResultData] = []
-                    candidates = retrieved_chunks_full.copy()
-                    # Greedy MMR on cosine similarity of embeddings; fallback to text overlap if no embeddings
-                    def _sim(a: SearchResultData, b: SearchResultData) -> float:
-                        try:
-                            ea = a.chunk.embedding or []
-                            eb = b.chunk.embedding or []
-                            if ea and eb and len(ea) == len(eb):
-                                import numpy as _np
-
-                                va = _np.array(ea)
-                                vb = _np.array(eb)
-                                norm = float(_np.linalg.norm(va) * _np.linalg.norm(vb)) or 1.0
-                                return float(va.dot(vb) / norm)
-                            # Fallback to Jaccard on tokens
-                            sa = set((a.chunk.text or "").lower().split())
-                            sb = set((b.chunk.text or "").lower().split())
-                            inter = len(sa & sb)
-                            union = len(sa | sb) or 1
-                            return inter / union
-                        except Exception:
-                            return 0.0
-
-                    while candidates and len(selected) < k:
-                        if not selected:
-                            best = max(candidates, key=lambda r: r.score)
-                            selected.append(best)
-                            candidates.remove(best)
-                        else:
-                            # For each candidate, compute mmr = lambda*relevance - (1-lambda)*max_sim(selected)
-                            scored: list[tuple[float, SearchResultData]] = []
-                            for c in candidates:
-                                max_sim = max((_sim(c, s) for s in selected), default=0.0)
-                                mmr = mmr_lambda * c.score - (1.0 - mmr_lambda) * max_sim
-                                scored.append((mmr, c))
-                            best = max(scored, key=lambda t: t[0])[1]
-                            selected.append(best)
-                            candidates.remove(best)
-                    retrieved_chunks_full = selected
+                # MMR diversification over the over-fetched candidate pool; small
+                # pools are still trimmed to k
+                if use_mmr:
+                    retrieved_chunks_full = MMRDiversifier(
+                        lambda_mult=mmr_lambda, candidate_pool_size=pool_k
+                    ).diversify(retrieved_chunks_full, k)
 
             # 3. Graph Retrieval (if requested and chunks were found)
             if include_graph and retrieved_chunks_full:
@@ -706,6 +649,87 @@ class SimpleGraphRAGEngine(GraphRAGEngine):
             # Return an empty or error state
             return retrieved_chunks_full, None  # Indicate failure or no context
 
+    @staticmethod
+    def _fuse_hybrid_results(
+        results_vector: list[SearchResultData],
+        results_keyword: list[SearchResultData],
+        k: int,
+        fusion: str = "weighted",
+        keyword_weight: float = 0.0,
+        rrf_k: int = 60,
+    ) -> list[SearchResultData]:
+        """Fuses vector and keyword hits into a single ranking of at most k results.
+
+        Fusion modes:
+            weighted: (1 - w) * cosine + w * BM25 on raw scores (original behaviour)
+            minmax: the same blend after min-max normalizing each leg to [0, 1]
+            rrf: reciprocal-rank fusion, sum of 1 / (rrf_k + rank) over both legs
+        """
+        if fusion not in {"weighted", "minmax", "rrf"}:
+            logger.warning(f"Unknown hybrid_fusion '{fusion}', using weighted")
+            fusion = "weighted"
+
+        def leg_scores(results: list[SearchResultData]) -> dict[str, float]:
+            scores = {r.chunk.id: float(r.score or 0.0) for r in results if r and r.chunk}
+            if fusion == "rrf":
+                # Ranks are positions in the score-ordered leg, starting at 1
+                ordered = sorted(scores, key=scores.get, reverse=True)
+                return {cid: 1.0 / (rrf_k + rank) for rank, cid in enumerate(ordered, 1)}
+            if fusion == "minmax" and scores:
+                lo, hi = min(scores.values()), max(scores.values())
+                span = hi - lo
+                return {cid: (s - lo) / span if span > 0 else 1.0 for cid, s in scores.items()}
+            return scores
+
+        vec_raw = {r.chunk.id: r.score for r in results_vector if r and r.chunk}
+        kw_raw = {r.chunk.id: r.score for r in results_keyword if r and r.chunk}
+        vec_scores = leg_scores(results_vector)
+        kw_scores = leg_scores(results_keyword)
+
+        # Combine all chunks from both searches
+        combined: dict[str, SearchResultData] = {}
+        for r in results_vector:
+            if r and r.chunk:
+                combined[r.chunk.id] = r
+        for r in results_keyword:
+            if r and r.chunk:
+                combined.setdefault(r.chunk.id, r)
+
+        if fusion == "rrf":
+            alpha = beta = 1.0
+        else:
+            beta = keyword_weight  # keyword weight
+            alpha = 1.0 - keyword_weight  # vector weight
+
+        blended: list[SearchResultData] = []
+        for rid, item in combined.items():
+            score = alpha * vec_scores.get(rid, 0.0) + beta * kw_scores.get(rid, 0.0)
+
+            chunk = item.chunk
+            meta = dict(chunk.metadata or {})
+            meta["score_vector"] = vec_raw.get(rid, 0.0)
+            meta["score_keyword"] = kw_raw.get(rid, 0.0)
+            meta["score_blended"] = score
+            meta["fusion"] = fusion
+
+            blended.append(
+                SearchResultData(
+                    chunk=ChunkData(
+                        id=chunk.id,
+                        text=chunk.text,
+                        document_id=chunk.document_id,
+                        metadata=meta,
+                        embedding=chunk.embedding,
+                        score=score,
+                    ),
+                    score=score,
+                )
+            )
+
+        # Sort by fused score
+        blended.sort(key=lambda r: r.score, reverse=True)
+        return blended[:k]
+
     async def retrieve_context(
         self, query: str, search_type: str = "vector", limit: int = 5
     ) -> list[SearchResultData]:
@@ -720,6 +744,75 @@ class SimpleGraphRAGEngine(GraphRAGEngine):
         retrieved_chunks, _ = await self._retrieve_and_build_context(query, config)
         return retrieved_chunks
 
+    async def batch_search(
+        self, query_texts: list[str], config: dict[str, Any] | None = None
+    ) -> list[list[SearchResultData]]:
+        """Retrieval-only search for many queries at once. Does not call LLM.
+
+        Vector legs embed all queries with one ``encode`` call (through the
+        shared query-embedding cache) and score them with one batched
+        similarity search when the vector store provides
+        ``batch_search_similar_chunks``. Keyword legs run concurrently, and
+        hybrid fuses both legs per query. Returns one list per query.
+
+        Config keys: ``k``, ``search_type`` and the hybrid options accepted
+        by ``query``.
+        """
+        if not query_texts:
+            return []
+        config = config or {}
+        k = int(config.get("k", 3))
+        search_type = str(config.get("search_type", "vector")).lower()
+
+        if search_type == "keyword":
+            return await self._batch_keyword_search(query_texts, k)
+        if search_type != "hybrid":
+            return await self._batch_vector_search(query_texts, k)
+
+        fetch_k = max(k, int(config.get("hybrid_fetch_k", k * 3)))
+        vector_results, keyword_results = await asyncio.gather(
+            self._batch_vector_search(query_texts, fetch_k),
+            self._batch_keyword_search(query_texts, fetch_k),
+        )
+        fusion = str(config.get("hybrid_fusion", "weighted")).lower()
+        return [
+            self._fuse_hybrid_results(
+                vector_hits,
+                keyword_hits,
+                k=k,
+                fusion=fusion,
+                keyword_weight=float(config.get("blend_keyword_weight", 0.0)),
+                rrf_k=int(config.get("rrf_k", 60)),
+            )
+            for vector_hits, keyword_hits in zip(vector_results, keyword_results, strict=True)
+        ]
+
+    async def _batch_keyword_search(
+        self, query_texts: list[str], k: int
+    ) -> list[list[SearchResultData]]:
+        results = await asyncio.gather(
+            *(self._vector_store.search(q, top_k=k, search_type="keyword") for q in query_texts)
+        )
+        return list(results)
+
+    async def _batch_vector_search(
+        self, query_texts: list[str], k: int
+    ) -> list[list[SearchResultData]]:
+        embedding_service = getattr(self._vector_store, "embedding_service", None)
+        batch_search = getattr(self._vector_store, "batch_search_similar_chunks", None)
+        if embedding_service is None or batch_search is None:
+            results = await asyncio.gather(
+                *(self._vector_store.search(q, top_k=k, search_type="vector") for q in query_texts)
+            )
+            return list(results)
+
+        query_vectors = await get_query_embedding_cache().get_or_embed_many(
+            embedding_service,
+            query_texts,
+            lambda texts: encode_texts(embedding_service, texts),
+        )
+        return await batch_search(query_vectors, limit=k)
+
     async def stream_context(
         self, query: str, search_type: str = "vector", limit: int = 5
     ) -> AsyncGenerator[SearchResultData, None]:
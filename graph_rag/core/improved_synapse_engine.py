@@ -32,7 +32,7 @@ from graph_rag.services.citation import CitationService, CitationStyle
 from graph_rag.services.experiment_consolidator import SynapseExperimentConsolidator
 from graph_rag.services.memory import ContextManager
 from graph_rag.services.prompt_optimization import PromptOptimizer
-from graph_rag.services.rerank import CrossEncoderReranker
+from graph_rag.services.rerank import get_cross_encoder_reranker
 
 logger = get_component_logger(ComponentType.ENGINE, "improved_synapse_engine")
 settings = get_settings()
@@ -130,7 +130,7 @@ class ImprovedSynapseEngine(GraphRAGEngine):
         self._graph_store = graph_store
         self._entity_extractor = entity_extractor
         self._llm_service = llm_service
-        self._reranker = CrossEncoderReranker()
+        self._reranker = get_cross_encoder_reranker()
         self._context_manager = context_manager
         self._citation_service = CitationService(citation_style)
         self._answer_validator = AnswerValidator(validation_level)
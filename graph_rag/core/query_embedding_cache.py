@@ -0,0 +1,174 @@
+"""Process-wide cache of query embeddings shared by all search entry points.
+
+Document embeddings are cached (if at all) inside the embedding service,
+where bulk ingestion churns through entries. Query embeddings live in this
+separate tier, so hot queries are not evicted by ingestion. Entries are keyed
+by model name and normalized query text and stored as read-only float32
+arrays.
+"""
+
+import asyncio
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def embedding_model_name(embedding_service: Any) -> str | None:
+    """Name of the model behind ``embedding_service``, or None if unknown.
+
+    Services without a string model name are not cached, since two such
+    services could embed the same text differently.
+    """
+    for attr in ("model_name", "_model_name"):
+        name = getattr(embedding_service, attr, None)
+        if isinstance(name, str) and name:
+            return name
+    return None
+
+
+class QueryEmbeddingCache:
+    """Thread-safe LRU of query embeddings keyed by (model name, normalized text)."""
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple[str, str], np.ndarray] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def _normalize_text(text: str) -> str:
+        return " ".join(text.lower().split())
+
+    def get(self, model_name: str, text: str) -> np.ndarray | None:
+        key = (model_name, self._normalize_text(text))
+        with self._lock:
+            vector = self._entries.get(key)
+            if vector is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return vector
+
+    def set(self, model_name: str, text: str, embedding: Any) -> None:
+        if self.maxsize <= 0:
+            return
+        vector = np.asarray(embedding, dtype=np.float32)
+        vector.setflags(write=False)
+        key = (model_name, self._normalize_text(text))
+        with self._lock:
+            self._entries[key] = vector
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    async def get_or_embed(
+        self,
+        embedding_service: Any,
+        text: str,
+        embed: Callable[[str], Awaitable[Any]],
+    ) -> list[float] | None:
+        """Cached embedding of ``text``, computing it with ``embed`` on a miss."""
+        model_name = embedding_model_name(embedding_service)
+        if model_name is None or self.maxsize <= 0:
+            return await embed(text)
+        cached = self.get(model_name, text)
+        if cached is not None:
+            return cached.tolist()
+        embedding = await embed(text)
+        if embedding is not None and len(embedding) > 0:
+            self.set(model_name, text, embedding)
+        return embedding
+
+    async def get_or_embed_many(
+        self,
+        embedding_service: Any,
+        texts: list[str],
+        embed_many: Callable[[list[str]], Awaitable[list[Any]]],
+    ) -> list[Any]:
+        """Cached embeddings of ``texts``, computing all misses with one ``embed_many`` call.
+
+        Texts that normalize to the same key are embedded once.
+        """
+        model_name = embedding_model_name(embedding_service)
+        use_cache = model_name is not None and self.maxsize > 0
+        positions: dict[str, list[int]] = {}
+        for i, text in enumerate(texts):
+            key = self._normalize_text(text) if use_cache else text
+            positions.setdefault(key, []).append(i)
+
+        out: list[Any] = [None] * len(texts)
+        pending: list[str] = []
+        for key, indices in positions.items():
+            cached = self.get(model_name, key) if use_cache else None
+            if cached is None:
+                pending.append(key)
+                continue
+            embedding = cached.tolist()
+            for i in indices:
+                out[i] = embedding
+        if not pending:
+            return out
+
+        embeddings = await embed_many([texts[positions[key][0]] for key in pending])
+        if len(embeddings) != len(pending):
+            raise ValueError(
+                f"Expected {len(pending)} query embeddings, got {len(embeddings)}"
+            )
+        for key, embedding in zip(pending, embeddings, strict=True):
+            if use_cache and embedding is not None and len(embedding) > 0:
+                self.set(model_name, key, embedding)
+            for i in positions[key]:
+                out[i] = embedding
+        return out
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / total if total else 0.0,
+                "evictions": self._evictions,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+
+async def encode_texts(embedding_service: Any, texts: list[str]) -> list[Any]:
+    """Embeds ``texts`` with a single ``encode`` call (sync or async services)."""
+    encode = embedding_service.encode
+    if asyncio.iscoroutinefunction(encode):
+        embeddings = await encode(list(texts))
+    else:
+        loop = asyncio.get_running_loop()
+        embeddings = await loop.run_in_executor(None, encode, list(texts))
+    return list(embeddings)
+
+
+_shared_cache: QueryEmbeddingCache | None = None
+
+
+def get_query_embedding_cache() -> QueryEmbeddingCache:
+    """Process-wide query embedding cache, sized from settings."""
+    global _shared_cache
+    if _shared_cache is None:
+        from graph_rag.config import get_settings
+
+        _shared_cache = QueryEmbeddingCache(
+            maxsize=get_settings().query_embedding_cache_size
+        )
+    return _shared_cache
@@ -1,15 +1,45 @@
 """Temporal tracking system for idea evolution and cross-platform correlation."""
 
+import asyncio
+import json
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
+from pathlib import Path
 from typing import Any
 
+import numpy as np
+
 from graph_rag.core.concept_extractor import ConceptualEntity
+from graph_rag.core.interfaces import EmbeddingService
 
 logger = logging.getLogger(__name__)
 
+_faiss = None
+
+# Words too common to say which candidate is the likeliest match
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from how in is it of on or the to vs what why with".split()
+)
+# Words shared by more versions than this carry no weight when ranking candidates
+_MAX_POSTING_ROWS = 256
+# Nearest embedding neighbors that are also checked lexically
+_EMBEDDING_CANDIDATES = 8
+
+
+def _get_faiss():
+    """Lazy load FAISS; returns None when it is not installed."""
+    global _faiss
+    if _faiss is None:
+        try:
+            import faiss  # type: ignore
+        except ImportError:
+            _faiss = False
+        else:
+            _faiss = faiss
+    return _faiss or None
+
 
 class IdeaStage(Enum):
     """Stages of idea development."""
@@ -80,12 +110,103 @@ class IdeaEvolution:
         return platform_times
 
 
-class TemporalTracker:
-    """Tracks idea evolution and cross-platform correlation."""
+class ConceptEmbeddingIndex:
+    """Nearest-neighbor index over normalized concept embeddings.
+
+    Uses a FAISS HNSW graph (inner product) when FAISS is installed and a
+    contiguous float32 matrix otherwise. Rows are numbered in insertion order.
+    """
+
+    def __init__(self, dimension: int, hnsw_m: int = 32):
+        self.dimension = dimension
+        self.size = 0
+        faiss = _get_faiss()
+        self._index = (
+            faiss.IndexHNSWFlat(dimension, hnsw_m, faiss.METRIC_INNER_PRODUCT)
+            if faiss is not None
+            else None
+        )
+        self._matrix = np.empty((0, dimension), dtype=np.float32)
+
+    @staticmethod
+    def _normalize(vector: list[float] | np.ndarray) -> np.ndarray:
+        array = np.asarray(vector, dtype=np.float32).reshape(1, -1)
+        norm = float(np.linalg.norm(array))
+        return array / norm if norm > 0 else array
+
+    def add(self, vector: list[float] | np.ndarray) -> int:
+        """Adds one embedding and returns its row number."""
+        row = self._normalize(vector)
+        if self._index is not None:
+            self._index.add(row)
+        else:
+            if self.size == len(self._matrix):
+                grown = np.empty((max(16, 2 * self.size), self.dimension), dtype=np.float32)
+                grown[: self.size] = self._matrix[: self.size]
+                self._matrix = grown
+            self._matrix[self.size] = row[0]
+        self.size += 1
+        return self.size - 1
+
+    def search(self, vector: list[float] | np.ndarray, k: int = 5) -> list[tuple[int, float]]:
+        """Returns up to ``k`` (row, cosine similarity) pairs, best first."""
+        if self.size == 0:
+            return []
+        k = min(k, self.size)
+        query = self._normalize(vector)
+        if self._index is not None:
+            scores, rows = self._index.search(query, k)
+            return [(int(r), float(s)) for r, s in zip(rows[0], scores[0], strict=True) if r >= 0]
+        scores = self._matrix[: self.size] @ query[0]
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(int(r), float(scores[r])) for r in top]
 
-    def __init__(self):
+
+class TemporalTracker:
+    """Tracks idea evolution and cross-platform correlation.
+
+    Matching a new concept against existing ones goes through indices instead
+    of a scan over every tracked version:
+
+    - an exact (case-insensitive) name index
+    - an embedding index, when an ``embedding_service`` is given; it is
+      queried first and its nearest neighbors are lexical candidates too
+    - an index of name words (stopwords and very common words excluded)
+      that narrows the candidates for the lexical similarity checks
+
+    With a ``storage_path`` every tracked version is appended to
+    ``versions.jsonl`` (including its embedding) off the event loop, and the
+    evolutions and indices are restored from it on start-up without
+    re-matching.
+    """
+
+    def __init__(
+        self,
+        embedding_service: EmbeddingService | None = None,
+        storage_path: str | Path | None = None,
+        similarity_threshold: float = 0.85,
+    ):
         self.idea_evolutions: dict[str, IdeaEvolution] = {}
         self.concept_to_evolution: dict[str, str] = {}  # Maps concept ID to evolution ID
+        self.embedding_service = embedding_service
+        self.similarity_threshold = similarity_threshold
+
+        # Candidate lookup indices; rows refer to self._indexed_versions
+        self._indexed_versions: list[tuple[ConceptualEntity, str]] = []
+        self._name_index: dict[str, str] = {}  # lowercased name -> evolution ID
+        self._word_index: dict[str, set[int]] = {}  # name/text word -> version rows
+        self._embedding_index: ConceptEmbeddingIndex | None = None
+        self._embedding_rows: list[int] = []  # embedding index row -> version row
+
+        self.storage_path = Path(storage_path) if storage_path else None
+        if self.storage_path is not None:
+            self.storage_path.mkdir(parents=True, exist_ok=True)
+            self._log_path = self.storage_path / "versions.jsonl"
+            # Records waiting to be written; one writer drains them in order
+            self._pending_records: list[str] = []
+            self._log_lock = asyncio.Lock()
+            self._load()
 
     async def track_concept(self, concept: ConceptualEntity, content_metadata: dict[str, Any]) -> str:
         """Track a new concept or version of an existing concept."""
@@ -101,9 +222,27 @@ class TemporalTracker:
         )
 
         # Check if this is a new version of an existing idea
-        evolution_id = await self._find_or_create_evolution(temporal_concept)
+        embedding = await self._embed_concept(concept)
+        evolution_id = await self._find_or_create_evolution(temporal_concept, embedding)
 
-        # Add to evolution
+        evolution = self._add_version(evolution_id, temporal_concept, embedding)
+
+        # Link to predecessors if applicable
+        await self._link_to_predecessors(temporal_concept, evolution)
+
+        if self.storage_path is not None:
+            await self._append_version(evolution_id, temporal_concept, embedding)
+
+        return evolution_id
+
+    def _add_version(
+        self,
+        evolution_id: str,
+        temporal_concept: TemporalConcept,
+        embedding: list[float] | None,
+    ) -> IdeaEvolution:
+        """Adds a version to its evolution and to the lookup indices."""
+        concept = temporal_concept.concept
         if evolution_id not in self.idea_evolutions:
             self.idea_evolutions[evolution_id] = IdeaEvolution(core_idea_id=evolution_id)
 
@@ -113,24 +252,152 @@ class TemporalTracker:
         # Update mapping
         self.concept_to_evolution[concept.id] = evolution_id
 
-        # Link to predecessors if applicable
-        await self._link_to_predecessors(temporal_concept, evolution)
-
-        return evolution_id
-
-    async def _find_or_create_evolution(self, temporal_concept: TemporalConcept) -> str:
+        row = len(self._indexed_versions)
+        self._indexed_versions.append((concept, evolution_id))
+        self._name_index.setdefault(concept.name.lower(), evolution_id)
+        for word in self._concept_words(concept):
+            self._word_index.setdefault(word, set()).add(row)
+        if embedding is not None:
+            if self._embedding_index is None:
+                self._embedding_index = ConceptEmbeddingIndex(len(embedding))
+            if len(embedding) == self._embedding_index.dimension:
+                self._embedding_index.add(embedding)
+                self._embedding_rows.append(row)
+        return evolution
+
+    async def _embed_concept(self, concept: ConceptualEntity) -> list[float] | None:
+        """Embeds the concept text with the embedding service, if configured."""
+        if self.embedding_service is None:
+            return None
+        try:
+            return list(await self.embedding_service.generate_embedding(concept.text or concept.name))
+        except Exception as e:
+            logger.warning(f"Failed to embed concept {concept.id}: {e}")
+            return None
+
+    @staticmethod
+    def _concept_words(concept: ConceptualEntity) -> set[str]:
+        return set(concept.name.lower().split()) | set((concept.text or "").lower().split())
+
+    async def _find_or_create_evolution(
+        self, temporal_concept: TemporalConcept, embedding: list[float] | None = None
+    ) -> str:
         """Find existing evolution or create new one."""
         concept = temporal_concept.concept
 
-        # Look for similar concepts in existing evolutions
-        for evolution_id, evolution in self.idea_evolutions.items():
-            for existing_version in evolution.concept_versions:
-                if self._concepts_are_similar(concept, existing_version.concept):
-                    return evolution_id
+        # Exact name match
+        evolution_id = self._name_index.get(concept.name.lower())
+        if evolution_id is not None:
+            return evolution_id
+
+        # Semantic match through the embedding index; near neighbors that miss
+        # the threshold still get the lexical checks below
+        candidates: set[int] = set()
+        if embedding is not None and self._embedding_index is not None:
+            if len(embedding) == self._embedding_index.dimension:
+                neighbors = self._embedding_index.search(embedding, k=_EMBEDDING_CANDIDATES)
+                for index_row, score in neighbors:
+                    row = self._embedding_rows[index_row]
+                    if score >= self.similarity_threshold:
+                        return self._indexed_versions[row][1]
+                    candidates.add(row)
+
+        # Lexical checks only need versions sharing a name or text word. Every such
+        # version stays a candidate; distinctive shared words decide which are checked
+        # first, so a match is usually found after a few comparisons
+        weights: dict[int, float] = dict.fromkeys(candidates, 0.0)
+        for word in self._concept_words(concept):
+            rows = self._word_index.get(word)
+            if not rows:
+                continue
+            common = word in _STOPWORDS or len(rows) > _MAX_POSTING_ROWS
+            weight = 0.0 if common else 1.0 / len(rows)
+            for row in rows:
+                weights[row] = weights.get(row, 0.0) + weight
+        for row in sorted(weights, key=lambda row: (row not in candidates, -weights[row], row)):
+            existing_concept, evolution_id = self._indexed_versions[row]
+            if self._concepts_are_similar(concept, existing_concept):
+                return evolution_id
 
         # Create new evolution ID
         return f"evolution_{concept.name.lower().replace(' ', '_')}_{temporal_concept.timestamp.isoformat()}"
 
+    async def _append_version(
+        self,
+        evolution_id: str,
+        temporal_concept: TemporalConcept,
+        embedding: list[float] | None,
+    ) -> None:
+        """Appends one tracked version to the on-disk log.
+
+        Records queued while a write is running are flushed together by the
+        next writer, so the log keeps tracking order.
+        """
+        record = {
+            "evolution_id": evolution_id,
+            "concept": temporal_concept.concept.model_dump(mode="json"),
+            "stage": temporal_concept.stage.value,
+            "platform": temporal_concept.platform.value,
+            "timestamp": temporal_concept.timestamp.isoformat(),
+            "content_id": temporal_concept.content_id,
+            "predecessor_id": temporal_concept.predecessor_id,
+            "engagement_metrics": temporal_concept.engagement_metrics,
+            "content_snippet": temporal_concept.content_snippet,
+            "embedding": embedding,
+        }
+        self._pending_records.append(json.dumps(record) + "\n")
+        async with self._log_lock:
+            if not self._pending_records:
+                return  # Written by an earlier caller's flush
+            lines, self._pending_records = self._pending_records, []
+            await asyncio.get_running_loop().run_in_executor(None, self._write_records, lines)
+
+    def _write_records(self, lines: list[str]) -> None:
+        with self._log_path.open("a", encoding="utf-8") as f:
+            f.write("".join(lines))
+
+    def _load(self) -> None:
+        """Restores evolutions and indices from the version log."""
+        if not self._log_path.exists():
+            return
+        committed = 0
+        with self._log_path.open("rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # Partial record from an interrupted append
+                try:
+                    record = json.loads(line)
+                    temporal_concept = TemporalConcept(
+                        concept=ConceptualEntity.model_validate(record["concept"]),
+                        stage=IdeaStage(record["stage"]),
+                        platform=ContentPlatform(record["platform"]),
+                        timestamp=datetime.fromisoformat(record["timestamp"]),
+                        content_id=record["content_id"],
+                        predecessor_id=record.get("predecessor_id"),
+                        engagement_metrics=record.get("engagement_metrics", {}),
+                        content_snippet=record.get("content_snippet", ""),
+                    )
+                except (ValueError, KeyError) as e:
+                    logger.warning(f"Skipping unreadable record in {self._log_path}: {e}")
+                    committed += len(line)
+                    continue
+                evolution = self._add_version(
+                    record["evolution_id"], temporal_concept, record.get("embedding")
+                )
+                if temporal_concept.predecessor_id:
+                    for version in evolution.concept_versions:
+                        if version.concept.id == temporal_concept.predecessor_id:
+                            version.successor_ids.append(temporal_concept.concept.id)
+                            break
+                committed += len(line)
+        if committed < self._log_path.stat().st_size:
+            with self._log_path.open("r+b") as f:
+                f.truncate(committed)
+        logger.info(
+            f"Loaded {len(self._indexed_versions)} concept versions in "
+            f"{len(self.idea_evolutions)} evolutions from {self._log_path}"
+        )
+
     def _concepts_are_similar(self, concept1: ConceptualEntity, concept2: ConceptualEntity) -> bool:
         """Determine if two concepts represent the same idea."""
         # Simple similarity check - can be enhanced with embeddings
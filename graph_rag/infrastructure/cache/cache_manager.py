@@ -1,96 +1,236 @@
 """Cache manager for coordinated cache operations and invalidation."""
 
 import logging
-import re
+import time
+from collections.abc import Iterable
+from fnmatch import fnmatchcase
 from typing import Any
 
-from .memory_cache import MemoryCache
+from .memory_cache import DEFAULT_MAX_ENTRIES, MemoryCache
 from .protocols import CacheService
 
 logger = logging.getLogger(__name__)
 
+# Namespaces whose entries depend on the whole corpus (any ingest can change
+# them), so document updates bump their generation instead of tracking tags.
+CORPUS_NAMESPACES = ("search", "vector_search")
 
-class CacheManager:
-    """High-level cache manager with pattern-based invalidation."""
+# Namespaces whose untagged entries are dropped for a document or node when
+# its ID appears in the key (the pre-tagging ``graph:*<id>*`` rule).
+DOCUMENT_KEY_NAMESPACES = ("graph", "embedding")
+NODE_KEY_NAMESPACES = ("graph",)
+
+
+def document_tag(document_id: str) -> str:
+    """Tag for entries derived from a document."""
+    return f"document:{document_id}"
+
+
+def node_tag(node_id: str) -> str:
+    """Tag for entries derived from a graph node."""
+    return f"node:{node_id}"
+
+
+def _discard(index: dict[str, set[str]], name: str, key: str) -> None:
+    """Removes ``key`` from ``index[name]``, dropping the entry once empty."""
+    keys = index.get(name)
+    if keys is not None:
+        keys.discard(key)
+        if not keys:
+            del index[name]
 
-    def __init__(self, cache_service: CacheService | None = None):
+
+class CacheManager:
+    """High-level cache manager with tag and namespace-generation invalidation.
+
+    Entries can be registered under tags at ``set`` time (for example
+    ``document_tag(doc_id)``); every key is also tagged implicitly by its first
+    two ``:``-separated segments, so ``graph_search:<node>:...`` keys can be
+    dropped by node without a scan. Invalidating a tag deletes exactly the keys
+    registered under it through the plain ``CacheService`` interface, so it
+    works the same for any backend. Untagged ``graph:``/``embedding:`` entries
+    are still invalidated for a document (and untagged ``graph:`` entries for a
+    node) whose ID appears in their key; only the untagged keys of those
+    namespaces are checked.
+
+    Each namespace (the key segment before the first ``:``) also has a
+    generation counter that is folded into the stored key; bumping it makes
+    every existing entry in the namespace unreachable in O(1), and the
+    backend's TTL/LRU reclaims them.
+
+    At most ``max_tracked_keys`` keys are tracked (by default the backend's
+    ``max_entries``); setting one more deletes the least recently set key from
+    the backend as well, so no cached entry escapes invalidation.
+    """
+
+    def __init__(
+        self,
+        cache_service: CacheService | None = None,
+        corpus_namespaces: Iterable[str] = CORPUS_NAMESPACES,
+        max_tracked_keys: int | None = None,
+    ):
         self._cache = cache_service or MemoryCache()
+        self._corpus_namespaces = tuple(corpus_namespaces)
+        self._max_tracked_keys = max(
+            1, max_tracked_keys or getattr(self._cache, "max_entries", DEFAULT_MAX_ENTRIES)
+        )
+        self._generations: dict[str, int] = {}
+        # key -> (tags, expires_at) in set order; tag -> keys
+        self._key_index: dict[str, tuple[frozenset[str], float | None]] = {}
+        self._tag_index: dict[str, set[str]] = {}
+        # namespace -> keys; namespace -> keys set without explicit tags
+        self._namespace_keys: dict[str, set[str]] = {}
+        self._untagged: dict[str, set[str]] = {}
+        self._prune_at = 1024
         logger.info(f"CacheManager initialized with {type(self._cache).__name__}")
 
     async def get(self, key: str) -> Any:
         """Get value from cache."""
-        return await self._cache.get(key)
-
-    async def set(self, key: str, value: Any, ttl: int | None = None) -> None:
-        """Set value in cache."""
-        await self._cache.set(key, value, ttl)
+        return await self._cache.get(self._storage_key(key))
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: int | None = None,
+        tags: Iterable[str] | None = None,
+    ) -> None:
+        """Set value in cache, registering it under ``tags`` for invalidation."""
+        await self._cache.set(self._storage_key(key), value, ttl)
+        self._untrack(key)
+        all_tags = frozenset(tags or ()) | {self._prefix_tag(key)}
+        expires_at = time.monotonic() + ttl if ttl else None
+        self._key_index[key] = (all_tags, expires_at)
+        for tag in all_tags:
+            self._tag_index.setdefault(tag, set()).add(key)
+        namespace = self._namespace(key)
+        self._namespace_keys.setdefault(namespace, set()).add(key)
+        if not tags:
+            self._untagged.setdefault(namespace, set()).add(key)
+        if len(self._key_index) >= self._prune_at:
+            self._prune_expired()
+        while len(self._key_index) > self._max_tracked_keys:
+            await self.delete(next(iter(self._key_index)))
 
     async def delete(self, key: str) -> None:
         """Delete specific key from cache."""
-        await self._cache.delete(key)
+        await self._cache.delete(self._storage_key(key))
+        self._untrack(key)
 
     async def clear(self) -> None:
         """Clear entire cache."""
         await self._cache.clear()
+        self._key_index.clear()
+        self._tag_index.clear()
+        self._namespace_keys.clear()
+        self._untagged.clear()
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """Invalidate every key registered under any of ``tags``.
+
+        Returns:
+            Number of keys invalidated
+        """
+        keys: set[str] = set()
+        for tag in tags:
+            keys.update(self._tag_index.get(tag, ()))
+        for key in keys:
+            await self.delete(key)
+        return len(keys)
+
+    def bump_namespace(self, namespace: str) -> int:
+        """Invalidate all entries in ``namespace`` by advancing its generation."""
+        generation = self._generations.get(namespace, 0) + 1
+        self._generations[namespace] = generation
+        # The old entries can no longer be reached or invalidated by key
+        for key in list(self._namespace_keys.get(namespace, ())):
+            self._untrack(key)
+        logger.debug(f"Cache namespace '{namespace}' advanced to generation {generation}")
+        return generation
 
     async def invalidate_pattern(self, pattern: str) -> int:
         """Invalidate all keys matching a pattern.
 
+        Matches against keys set through this manager, so it works for any
+        backend. Prefer ``invalidate_tags`` where the affected entries are
+        known up front; this walks every tracked key.
+
         Args:
             pattern: Pattern with * wildcards (e.g., "graph:node123*")
 
         Returns:
             Number of keys invalidated
         """
-        # Convert wildcard pattern to regex
-        regex_pattern = pattern.replace("*", ".*")
-        regex = re.compile(f"^{regex_pattern}$")
-
-        # Get all keys and filter by pattern
-        # Note: This is a simplified implementation for MemoryCache
-        # For Redis, you'd use SCAN with MATCH pattern
-        invalidated_count = 0
-
-        if hasattr(self._cache, '_cache'):  # MemoryCache implementation
-            keys_to_delete = []
-            for key in self._cache._cache.keys():
-                if regex.match(key):
-                    keys_to_delete.append(key)
+        keys_to_delete = [key for key in self._key_index if fnmatchcase(key, pattern)]
+        for key in keys_to_delete:
+            await self.delete(key)
 
-            for key in keys_to_delete:
-                await self._cache.delete(key)
-                invalidated_count += 1
-
-        logger.info(f"Invalidated {invalidated_count} keys matching pattern: {pattern}")
-        return invalidated_count
+        logger.info(f"Invalidated {len(keys_to_delete)} keys matching pattern: {pattern}")
+        return len(keys_to_delete)
 
     async def invalidate_for_document(self, document_id: str) -> None:
         """Invalidate all cache entries related to a document."""
-        patterns = [
-            f"graph:*{document_id}*",
-            f"search:*{document_id}*",
-            f"embedding:*{document_id}*",
-            f"vector_search:*{document_id}*"
-        ]
-
-        total_invalidated = 0
-        for pattern in patterns:
-            count = await self.invalidate_pattern(pattern)
-            total_invalidated += count
+        keys = set(self._tag_index.get(document_tag(document_id), ()))
+        keys.update(self._untagged_keys_mentioning(DOCUMENT_KEY_NAMESPACES, document_id))
+        for key in keys:
+            await self.delete(key)
+        total_invalidated = len(keys)
+        for namespace in self._corpus_namespaces:
+            self.bump_namespace(namespace)
 
         logger.info(f"Invalidated {total_invalidated} cache entries for document: {document_id}")
 
     async def invalidate_for_node(self, node_id: str) -> None:
         """Invalidate all cache entries related to a graph node."""
-        patterns = [
-            f"graph:*{node_id}*",
-            f"graph_search:{node_id}:*",
-            f"graph_neighbors:{node_id}:*"
-        ]
-
-        total_invalidated = 0
-        for pattern in patterns:
-            count = await self.invalidate_pattern(pattern)
-            total_invalidated += count
+        keys: set[str] = set()
+        for tag in (node_tag(node_id), f"graph_search:{node_id}", f"graph_neighbors:{node_id}"):
+            keys.update(self._tag_index.get(tag, ()))
+        keys.update(self._untagged_keys_mentioning(NODE_KEY_NAMESPACES, node_id))
+        for key in keys:
+            await self.delete(key)
+        total_invalidated = len(keys)
 
         logger.info(f"Invalidated {total_invalidated} cache entries for node: {node_id}")
+
+    def _untagged_keys_mentioning(self, namespaces: Iterable[str], item_id: str) -> list[str]:
+        """Untagged keys of ``namespaces`` with ``item_id`` after the namespace."""
+        return [
+            key
+            for namespace in namespaces
+            for key in self._untagged.get(namespace, ())
+            if item_id in key.partition(":")[2]
+        ]
+
+    def _storage_key(self, key: str) -> str:
+        generation = self._generations.get(self._namespace(key), 0)
+        return f"{key}#g{generation}" if generation else key
+
+    @staticmethod
+    def _namespace(key: str) -> str:
+        return key.split(":", 1)[0]
+
+    @staticmethod
+    def _prefix_tag(key: str) -> str:
+        return ":".join(key.split(":", 2)[:2])
+
+    def _untrack(self, key: str) -> None:
+        tracked = self._key_index.pop(key, None)
+        if tracked is None:
+            return
+        for tag in tracked[0]:
+            _discard(self._tag_index, tag, key)
+        namespace = self._namespace(key)
+        _discard(self._namespace_keys, namespace, key)
+        _discard(self._untagged, namespace, key)
+
+    def _prune_expired(self) -> None:
+        """Forget index entries whose TTL has passed; amortized over inserts."""
+        now = time.monotonic()
+        expired = [
+            key
+            for key, (_, expires_at) in self._key_index.items()
+            if expires_at is not None and expires_at <= now
+        ]
+        for key in expired:
+            self._untrack(key)
+        self._prune_at = max(1024, 2 * len(self._key_index))
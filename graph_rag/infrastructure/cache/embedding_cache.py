@@ -12,8 +12,10 @@ logger = logging.getLogger(__name__)
 class EmbeddingCache:
     """Specialized cache for embedding vectors."""
 
-    def __init__(self, cache_service=None):
-        self._query_cache = QueryCache(cache_service)
+    def __init__(self, cache_service=None, stale_ttl: int = 0, negative_ttl: int = 0):
+        self._query_cache = QueryCache(
+            cache_service, stale_ttl=stale_ttl, negative_ttl=negative_ttl
+        )
         logger.info("EmbeddingCache initialized")
 
     async def get_or_compute(
@@ -1,67 +1,194 @@
-import asyncio
+import heapq
 import logging
+import sys
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import Any
 
+from graph_rag.observability.metrics import (
+    record_cache_access,
+    record_cache_eviction,
+    update_cache_size,
+)
+
 from .protocols import CacheService  # Import the protocol
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_ENTRIES = 10_000
+DEFAULT_MAX_BYTES = 128 * 1024 * 1024
+DEFAULT_SWEEP_INTERVAL = 1.0
+
+
+def _approximate_size(value: Any, _depth: int = 0) -> int:
+    """Rough deep size of a cached value in bytes.
+
+    Walks common containers a few levels deep; arrays report their buffer size.
+    This is an estimate for capacity accounting, not an exact measurement.
+    """
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    size = sys.getsizeof(value)
+    if _depth >= 3:
+        return size
+    if isinstance(value, dict):
+        size += sum(
+            _approximate_size(k, _depth + 1) + _approximate_size(v, _depth + 1)
+            for k, v in value.items()
+        )
+    elif isinstance(value, list | tuple | set | frozenset):
+        size += sum(_approximate_size(v, _depth + 1) for v in value)
+    elif hasattr(value, "__dict__"):
+        size += _approximate_size(vars(value), _depth + 1)
+    return size
+
+
+@dataclass
+class _Entry:
+    value: Any
+    expires_at: float | None
+    size: int
+
 
 # Basic in-memory cache implementation
 class MemoryCache(CacheService):
-    def __init__(self):
-        self._cache: dict[str, Any] = {}
-        self._ttl: dict[str, asyncio.TimerHandle | None] = {}
-        logger.info("MemoryCache initialized.")
+    """Bounded in-memory LRU cache with lazy TTL expiry.
+
+    Capacity is limited by entry count and by approximate value size; the
+    least recently used entries are evicted first. Expired entries are dropped
+    when read, and a single expiry heap is swept at most once per
+    ``sweep_interval`` seconds from regular cache calls, so no per-key timers
+    are scheduled on the event loop.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        sweep_interval: float = DEFAULT_SWEEP_INTERVAL,
+        name: str = "memory",
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sweep_interval = sweep_interval
+        self.name = name
+        self._cache: OrderedDict[str, _Entry] = OrderedDict()
+        # (expires_at, key) for every entry with a TTL; stale pairs are skipped
+        self._expiry_heap: list[tuple[float, str]] = []
+        self._next_sweep = 0.0
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        logger.info(
+            f"MemoryCache initialized (max_entries={max_entries}, max_bytes={max_bytes})."
+        )
 
     async def get(self, key: str) -> Any | None:
-        if key in self._cache:
-            logger.debug(f"Cache HIT for key: {key}")
-            return self._cache[key]
-        else:
+        now = time.monotonic()
+        self._maybe_sweep(now)
+        entry = self._cache.get(key)
+        if entry is not None and entry.expires_at is not None and entry.expires_at <= now:
+            self._remove(key)
+            self._expirations += 1
+            record_cache_eviction(self.name, "expired")
+            entry = None
+        if entry is None:
             logger.debug(f"Cache MISS for key: {key}")
+            self._misses += 1
+            record_cache_access(self.name, hit=False)
             return None
+        logger.debug(f"Cache HIT for key: {key}")
+        self._cache.move_to_end(key)
+        self._hits += 1
+        record_cache_access(self.name, hit=True)
+        return entry.value
 
     async def set(self, key: str, value: Any, ttl: int | None = None) -> None:
         logger.debug(f"Cache SET for key: {key} with ttl={ttl}")
-        self._cache[key] = value
-        # Cancel existing timer if any
-        if self._ttl.get(key):
-            self._ttl[key].cancel()
-            self._ttl[key] = None
-
-        if ttl is not None and ttl > 0:
-            loop = asyncio.get_running_loop()
-            timer = loop.call_later(ttl, self._expire_key, key)
-            self._ttl[key] = timer
-        else:
-            self._ttl[key] = None  # No TTL or indefinite
-
-    def _expire_key(self, key: str) -> None:
-        """Internal callback to remove an expired key."""
-        if key in self._cache:
-            logger.info(f"Cache key expired and removed: {key}")
-            del self._cache[key]
-            if key in self._ttl:
-                del self._ttl[key]
+        now = time.monotonic()
+        self._maybe_sweep(now)
+        size = _approximate_size(value)
+        if size > self.max_bytes:
+            logger.debug(f"Value for key {key} ({size} bytes) exceeds cache capacity; not cached")
+            self._remove(key)
+            return
+
+        expires_at = now + ttl if ttl is not None and ttl > 0 else None
+        self._remove(key)
+        self._cache[key] = _Entry(value, expires_at, size)
+        self._bytes += size
+        if expires_at is not None:
+            heapq.heappush(self._expiry_heap, (expires_at, key))
+        self._evict_to_capacity()
 
     async def delete(self, key: str) -> None:
         logger.debug(f"Cache DELETE for key: {key}")
-        if key in self._cache:
-            del self._cache[key]
-        if self._ttl.get(key):
-            self._ttl[key].cancel()
-            del self._ttl[key]
+        self._remove(key)
 
     async def clear(self) -> None:
         logger.info("Clearing entire MemoryCache.")
-        for key in list(self._ttl.keys()):  # Iterate over copy
-            if self._ttl[key]:
-                self._ttl[key].cancel()
         self._cache.clear()
-        self._ttl.clear()
+        self._expiry_heap.clear()
+        self._bytes = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Return hit/miss/eviction counters and current occupancy."""
+        total = self._hits + self._misses
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / total if total else 0.0,
+            "evictions": self._evictions,
+            "expirations": self._expirations,
+            "entries": len(self._cache),
+            "size_bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+        }
 
-    # Optional: Add methods for size, keys, etc. if needed
+    def _remove(self, key: str) -> None:
+        entry = self._cache.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
 
+    def _evict_to_capacity(self) -> None:
+        evicted = 0
+        while self._cache and (
+            len(self._cache) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            _, entry = self._cache.popitem(last=False)
+            self._bytes -= entry.size
+            evicted += 1
+        if evicted:
+            self._evictions += evicted
+            record_cache_eviction(self.name, "capacity", evicted)
 
-# </rewritten_file>
+    def _maybe_sweep(self, now: float) -> None:
+        """Drop expired entries from the expiry heap, at most once per interval."""
+        if now < self._next_sweep:
+            return
+        self._next_sweep = now + self.sweep_interval
+        heap = self._expiry_heap
+        expired = 0
+        while heap and heap[0][0] <= now:
+            expires_at, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+            # Skip pairs left behind by a later set() or delete() of the key
+            if entry is not None and entry.expires_at == expires_at:
+                self._remove(key)
+                expired += 1
+        # Rebuild when stale pairs dominate so the heap stays O(entries)
+        if len(heap) > 2 * len(self._cache) + 64:
+            self._expiry_heap = [
+                (e.expires_at, k) for k, e in self._cache.items() if e.expires_at is not None
+            ]
+            heapq.heapify(self._expiry_heap)
+        if expired:
+            logger.debug(f"Expired {expired} cache entries")
+            self._expirations += expired
+            record_cache_eviction(self.name, "expired", expired)
+        update_cache_size(self.name, len(self._cache), self._bytes)
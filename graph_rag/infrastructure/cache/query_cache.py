@@ -4,7 +4,10 @@ import asyncio
 import hashlib
 import json
 import logging
+import math
+import time
 from collections.abc import Callable
+from dataclasses import dataclass
 from typing import Any
 
 from .memory_cache import MemoryCache
@@ -13,11 +16,35 @@ from .protocols import CacheService
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class _CachedResult:
+    """Cache envelope recording when a stored result stops being fresh."""
+
+    value: Any
+    fresh_until: float
+    negative: bool = False
+
+
 class QueryCache:
-    """High-level cache for query results with automatic key generation."""
+    """High-level cache for query results with automatic key generation.
+
+    Concurrent misses for the same key share one computation (single-flight).
+    With ``stale_ttl`` set, an expired result is still served for that many
+    seconds while a single background refresh recomputes it. With
+    ``negative_ttl`` set, ``None`` results are cached for that long so misses
+    for absent data are not recomputed on every request.
+    """
 
-    def __init__(self, cache_service: CacheService | None = None):
+    def __init__(
+        self,
+        cache_service: CacheService | None = None,
+        stale_ttl: int = 0,
+        negative_ttl: int = 0,
+    ):
         self._cache = cache_service or MemoryCache()
+        self.stale_ttl = stale_ttl
+        self.negative_ttl = negative_ttl
+        self._inflight: dict[str, asyncio.Task] = {}
         logger.info(f"QueryCache initialized with {type(self._cache).__name__}")
 
     async def get_or_compute(
@@ -26,35 +53,115 @@ class QueryCache:
         compute_func: Callable,
         *args,
         ttl: int = 300,
+        stale_ttl: int | None = None,
+        negative_ttl: int | None = None,
         **kwargs
     ) -> Any:
         """Get result from cache or compute and store it."""
-        # Try to get from cache first
-        cached_result = await self._cache.get(cache_key)
-        if cached_result is not None:
-            logger.debug(f"Cache HIT for key: {cache_key}")
-            return cached_result
-
-        # Cache miss - compute the result
+        stale_ttl = self.stale_ttl if stale_ttl is None else stale_ttl
+        negative_ttl = self.negative_ttl if negative_ttl is None else negative_ttl
+
+        cached = await self._cache.get(cache_key)
+        if cached is not None:
+            if not isinstance(cached, _CachedResult):
+                # Written directly to the backing cache without an envelope
+                logger.debug(f"Cache HIT for key: {cache_key}")
+                return cached
+            if time.time() < cached.fresh_until:
+                logger.debug(f"Cache HIT for key: {cache_key}")
+                return cached.value
+            # Only stale entries outlive fresh_until in the backing cache
+            logger.debug(f"Cache STALE for key: {cache_key}, refreshing in background")
+            self._start_compute(
+                cache_key, compute_func, args, kwargs, ttl, stale_ttl, negative_ttl
+            )
+            return cached.value
+
+        # Cache miss - join the in-flight computation or start one
+        task = self._start_compute(
+            cache_key, compute_func, args, kwargs, ttl, stale_ttl, negative_ttl
+        )
+        # Shield so a cancelled caller does not cancel the shared computation
+        return await asyncio.shield(task)
+
+    def _start_compute(
+        self,
+        cache_key: str,
+        compute_func: Callable,
+        args: tuple,
+        kwargs: dict,
+        ttl: int,
+        stale_ttl: int,
+        negative_ttl: int,
+    ) -> asyncio.Task:
+        task = self._inflight.get(cache_key)
+        if task is not None:
+            logger.debug(f"Joining in-flight computation for key: {cache_key}")
+            return task
         logger.debug(f"Cache MISS for key: {cache_key}, computing...")
+        task = asyncio.ensure_future(
+            self._compute_and_store(
+                cache_key, compute_func, args, kwargs, ttl, stale_ttl, negative_ttl
+            )
+        )
+        self._inflight[cache_key] = task
+        task.add_done_callback(lambda t: self._finish_compute(cache_key, t))
+        return task
+
+    def _finish_compute(self, cache_key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(cache_key) is task:
+            del self._inflight[cache_key]
+        # Retrieve the exception so background refresh failures are not
+        # reported as "never retrieved"; foreground awaiters still see it.
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Computation for cache key {cache_key} failed: {task.exception()}")
+
+    async def _compute_and_store(
+        self,
+        cache_key: str,
+        compute_func: Callable,
+        args: tuple,
+        kwargs: dict,
+        ttl: int,
+        stale_ttl: int,
+        negative_ttl: int,
+    ) -> Any:
         if asyncio.iscoroutinefunction(compute_func):
             result = await compute_func(*args, **kwargs)
         else:
             result = compute_func(*args, **kwargs)
 
-        # Store in cache
-        await self._cache.set(cache_key, result, ttl=ttl)
+        if self._inflight.get(cache_key) is not asyncio.current_task():
+            # Invalidated while computing; do not store a possibly outdated result
+            return result
+
+        if result is None:
+            if negative_ttl > 0:
+                await self._cache.set(
+                    cache_key,
+                    _CachedResult(None, time.time() + negative_ttl, negative=True),
+                    ttl=negative_ttl,
+                )
+                logger.debug(f"Cached negative result for key: {cache_key}")
+            return None
+
+        await self._cache.set(
+            cache_key,
+            _CachedResult(result, time.time() + ttl if ttl else math.inf),
+            ttl=ttl + stale_ttl if ttl else None,
+        )
         logger.debug(f"Cached result for key: {cache_key}")
-
         return result
 
     async def invalidate(self, cache_key: str) -> None:
         """Remove a specific key from cache."""
+        self._inflight.pop(cache_key, None)
         await self._cache.delete(cache_key)
         logger.debug(f"Invalidated cache key: {cache_key}")
 
     async def clear(self) -> None:
         """Clear entire cache."""
+        self._inflight.clear()
         await self._cache.clear()
         logger.info("Cleared entire query cache")
 
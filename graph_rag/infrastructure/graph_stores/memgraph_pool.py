@@ -0,0 +1,184 @@
+"""Bounded, thread-safe connection pool for synchronous mgclient connections.
+
+mgclient connections are blocking and not safe to share between threads, so
+the repository runs each query on an executor thread with a connection
+checked out from this pool for the duration of that query.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from graph_rag.observability.metrics import record_pool_checkout, update_pool_size
+
+logger = logging.getLogger(__name__)
+
+
+class PoolTimeoutError(ConnectionError):
+    """Raised when no pooled connection becomes available in time."""
+
+
+class PoolClosedError(ConnectionError):
+    """Raised when checking out from a pool that has been closed."""
+
+
+@dataclass
+class PooledConnection:
+    """A pooled connection with the bookkeeping needed for recycling."""
+
+    connection: Any
+    created_at: float
+    last_used: float
+
+
+class ConnectionPool:
+    """Checkout/checkin pool of at most ``max_size`` connections.
+
+    Connections older than ``max_lifetime`` seconds are closed on checkin or
+    checkout, and connections idle for longer than ``health_check_after``
+    seconds are validated with ``health_check`` before being handed out.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        max_size: int = 8,
+        max_lifetime: float = 3600.0,
+        health_check_after: float = 30.0,
+        health_check: Callable[[Any], None] | None = None,
+        name: str = "memgraph",
+    ):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self._factory = factory
+        self.max_size = max_size
+        self.max_lifetime = max_lifetime
+        self.health_check_after = health_check_after
+        self._health_check = health_check
+        self.name = name
+        self._idle: deque[PooledConnection] = deque()
+        self._in_use = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._created = 0
+        self._discarded = 0
+        self._checkouts = 0
+        self._waits = 0
+
+    def acquire(self, timeout: float | None = None) -> PooledConnection:
+        """Check out a connection, opening one if the pool has spare capacity."""
+        start = time.monotonic()
+        deadline = None if timeout is None else start + timeout
+        with self._cond:
+            pooled = None
+            while True:
+                if self._closed:
+                    raise PoolClosedError(f"Connection pool '{self.name}' is closed")
+                if self._idle:
+                    # LIFO keeps a small hot set and lets surplus connections age out
+                    pooled = self._idle.pop()
+                    break
+                if self._in_use < self.max_size:
+                    break
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise PoolTimeoutError(
+                        f"Timed out after {timeout}s waiting for a connection from pool '{self.name}'"
+                    )
+                self._waits += 1
+                self._cond.wait(remaining)
+            # Reserve the slot before doing any I/O outside the lock
+            self._in_use += 1
+
+        try:
+            if pooled is not None and not self._is_reusable(pooled):
+                self._close_quietly(pooled)
+                pooled = None
+            if pooled is None:
+                connection = self._factory()
+                now = time.monotonic()
+                pooled = PooledConnection(connection, created_at=now, last_used=now)
+                with self._cond:
+                    self._created += 1
+        except BaseException:
+            self._release_slot()
+            raise
+
+        pooled.last_used = time.monotonic()
+        with self._cond:
+            self._checkouts += 1
+            in_use, idle = self._in_use, len(self._idle)
+        record_pool_checkout(self.name, pooled.last_used - start, in_use, idle)
+        return pooled
+
+    def release(self, pooled: PooledConnection, discard: bool = False) -> None:
+        """Return a connection; ``discard`` closes it instead (e.g. after an error)."""
+        expired = time.monotonic() - pooled.created_at > self.max_lifetime
+        with self._cond:
+            keep = not (discard or expired or self._closed)
+            if keep:
+                pooled.last_used = time.monotonic()
+                self._idle.append(pooled)
+            self._in_use -= 1
+            in_use, idle = self._in_use, len(self._idle)
+            self._cond.notify()
+        if not keep:
+            self._close_quietly(pooled)
+        update_pool_size(self.name, in_use, idle)
+
+    def close(self) -> None:
+        """Close idle connections; in-use ones are closed when released."""
+        with self._cond:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._cond.notify_all()
+        for pooled in idle:
+            self._close_quietly(pooled)
+        update_pool_size(self.name, self._in_use, 0)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def stats(self) -> dict[str, Any]:
+        """Return current occupancy and lifetime counters."""
+        with self._cond:
+            return {
+                "max_size": self.max_size,
+                "in_use": self._in_use,
+                "idle": len(self._idle),
+                "created": self._created,
+                "discarded": self._discarded,
+                "checkouts": self._checkouts,
+                "waits": self._waits,
+            }
+
+    def _is_reusable(self, pooled: PooledConnection) -> bool:
+        now = time.monotonic()
+        if now - pooled.created_at > self.max_lifetime:
+            return False
+        if self._health_check is not None and now - pooled.last_used > self.health_check_after:
+            try:
+                self._health_check(pooled.connection)
+            except Exception as e:
+                logger.warning(f"Discarding pooled connection that failed health check: {e}")
+                return False
+        return True
+
+    def _release_slot(self) -> None:
+        with self._cond:
+            self._in_use -= 1
+            self._cond.notify()
+
+    def _close_quietly(self, pooled: PooledConnection) -> None:
+        with self._cond:
+            self._discarded += 1
+        try:
+            pooled.connection.close()
+        except Exception as e:
+            logger.debug(f"Error closing pooled connection: {e}")
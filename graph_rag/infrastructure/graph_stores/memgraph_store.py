@@ -3,6 +3,7 @@
 import asyncio
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timezone
 from typing import Any
 
@@ -26,6 +27,7 @@ from graph_rag.config import Settings, get_settings
 from graph_rag.core.graph_store import GraphStore
 from graph_rag.core.interfaces import GraphRepository  # Import GraphRepository protocol
 from graph_rag.domain.models import Chunk, Document, Entity, Node, Relationship
+from graph_rag.infrastructure.graph_stores.memgraph_pool import ConnectionPool
 
 # Initialize settings
 settings = get_settings()
@@ -87,6 +89,18 @@ class MemgraphConnectionConfig(BaseSettings):  # Inherit from BaseSettings
     retry_delay: int = Field(
         2, ge=1, description="Delay in seconds between Memgraph retries."
     )
+    pool_size: int = Field(
+        8, ge=1, description="Maximum pooled connections (and query worker threads)."
+    )
+    pool_max_lifetime: float = Field(
+        3600.0, gt=0, description="Seconds after which a pooled connection is recycled."
+    )
+    pool_acquire_timeout: float = Field(
+        30.0, gt=0, description="Seconds to wait for a free pooled connection."
+    )
+    pool_health_check_after: float = Field(
+        30.0, ge=0, description="Idle seconds after which a pooled connection is health-checked."
+    )
 
     def __init__(self, settings_obj: Settings | None = None, **kwargs):
         """
@@ -104,6 +118,10 @@ class MemgraphConnectionConfig(BaseSettings):  # Inherit from BaseSettings
                 use_ssl=settings_obj.memgraph_use_ssl,
                 max_retries=settings_obj.memgraph_max_retries,
                 retry_delay=settings_obj.memgraph_retry_delay,
+                pool_size=settings_obj.memgraph_pool_size,
+                pool_max_lifetime=settings_obj.memgraph_pool_max_lifetime,
+                pool_acquire_timeout=settings_obj.memgraph_pool_acquire_timeout,
+                pool_health_check_after=settings_obj.memgraph_pool_health_check_after,
                 **kwargs,  # Pass through any other kwargs for BaseSettings
             )
         else:
@@ -124,47 +142,76 @@ class MemgraphGraphRepository(GraphStore, GraphRepository):
             # Ensure we get a Settings instance if None is passed
             settings_obj = get_settings()
         self.config = MemgraphConnectionConfig(settings_obj=settings_obj)
-        self._connection: mgclient.Connection | None = (
-            None  # Added connection attribute
-        )
-        # mgclient uses synchronous connect, connection pooling is handled internally or needs manual management
-        # We don't store a persistent driver/connection object here in this sync implementation
+        # mgclient connections are synchronous and not thread-safe; queries run
+        # on a dedicated executor sized to a bounded checkout/checkin pool.
+        # Both are created lazily so constructing the repository does no I/O.
+        self._pool: ConnectionPool | None = None
+        self._executor: ThreadPoolExecutor | None = None
         logger.info(
             f"MemgraphGraphRepository initialized for {self.config.host}:{self.config.port}"
         )
 
+    def _ensure_pool(self) -> ConnectionPool:
+        if self._pool is None or self._pool.closed:
+            self._pool = ConnectionPool(
+                self._get_connection,
+                max_size=self.config.pool_size,
+                max_lifetime=self.config.pool_max_lifetime,
+                health_check_after=self.config.pool_health_check_after,
+                health_check=self._check_connection,
+                name="memgraph",
+            )
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.config.pool_size, thread_name_prefix="memgraph"
+            )
+        return self._pool
+
     async def connect(self):
-        """Establishes and stores a connection for reuse."""
-        # Assume connection is None or needs re-establishing if connect is called
-        # Rely on mgclient to raise errors if operations are attempted on a closed connection
-        if self._connection is None:
-            loop = asyncio.get_running_loop()
-            try:
-                self._connection = await loop.run_in_executor(
-                    None, self._get_connection
-                )
-                logger.info("Persistent connection established.")
-            except Exception as e:
-                logger.error(
-                    f"Failed to establish persistent connection: {e}", exc_info=True
-                )
-                self._connection = None  # Ensure it's None on failure
-                raise  # Re-raise the connection error
+        """Creates the connection pool and verifies connectivity with one connection."""
+        pool = self._ensure_pool()
+        loop = asyncio.get_running_loop()
+        try:
+            pooled = await loop.run_in_executor(
+                self._executor, pool.acquire, self.config.pool_acquire_timeout
+            )
+            pool.release(pooled)
+            logger.info(
+                f"Memgraph connection pool ready (max_size={self.config.pool_size})."
+            )
+        except Exception as e:
+            logger.error(f"Failed to establish Memgraph connection: {e}", exc_info=True)
+            raise  # Re-raise the connection error
 
     async def close(self):
-        """Closes the stored connection if it exists."""
-        # Directly attempt to close if connection exists
-        if self._connection:
-            loop = asyncio.get_running_loop()
+        """Closes pooled connections and shuts down the query executor."""
+        pool, executor = self._pool, self._executor
+        self._pool = None
+        self._executor = None
+        if pool is not None:
             try:
-                await loop.run_in_executor(None, self._connection.close)
-                logger.info("Persistent connection closed.")
+                pool.close()
+                logger.info("Memgraph connection pool closed.")
             except Exception as e:
-                logger.error(
-                    f"Failed to close persistent connection: {e}", exc_info=True
-                )
-            finally:
-                self._connection = None
+                logger.error(f"Failed to close connection pool: {e}", exc_info=True)
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def pool_stats(self) -> dict[str, Any]:
+        """Returns connection pool occupancy and counters (empty before first use)."""
+        return self._pool.stats() if self._pool is not None else {}
+
+    @staticmethod
+    def _check_connection(conn: "mgclient.Connection") -> None:
+        """Raises if ``conn`` can no longer run a trivial query."""
+        if conn.status == mgclient.CONN_STATUS_BAD:
+            raise ConnectionError("connection is in a bad state")
+        cursor = conn.cursor()
+        try:
+            cursor.execute("RETURN 1")
+            cursor.fetchall()
+            conn.commit()
+        finally:
+            cursor.close()
 
     @retry(
         stop=stop_after_attempt(_MAX_RETRIES),
@@ -210,103 +257,62 @@ class MemgraphGraphRepository(GraphStore, GraphRepository):
     async def execute_query(
         self, query: str, params: dict[str, Any] | None = None
     ) -> list[dict[str, Any]]:
-        """Executes a Cypher query and returns results.
-        Uses the existing connection if available, otherwise creates a temporary one.
-        """
+        """Executes a Cypher query on a pooled connection and returns results."""
+        pool = self._ensure_pool()
         loop = asyncio.get_running_loop()
-        conn_to_use: mgclient.Connection | None = None
-        cursor: mgclient.Cursor | None = None
-        is_temporary_connection = False
+        return await loop.run_in_executor(
+            self._executor, self._execute_query_sync, pool, query, params
+        )
 
+    def _execute_query_sync(
+        self, pool: ConnectionPool, query: str, params: dict[str, Any] | None
+    ) -> list[dict[str, Any]]:
+        """Runs one query start to finish on a checked-out connection (executor thread)."""
+        pooled = pool.acquire(timeout=self.config.pool_acquire_timeout)
+        conn = pooled.connection
+        cursor: mgclient.Cursor | None = None
+        discard = False
         try:
-            # Use existing connection if available
-            if self._connection:
-                conn_to_use = self._connection
-                logger.debug("Using existing persistent connection for query.")
-            else:
-                # Create a temporary connection for this query
-                conn_to_use = await loop.run_in_executor(None, self._get_connection)
-                is_temporary_connection = True
-                logger.debug("Created temporary connection for query.")
-
-            if not conn_to_use:  # Safety check
-                raise ConnectionError("Failed to get a database connection.")
-
-            cursor = conn_to_use.cursor()
+            cursor = conn.cursor()
             logger.debug(f"Executing query: {query} with params: {params}")
-            await loop.run_in_executor(None, cursor.execute, query, params or {})
+            cursor.execute(query, params or {})
 
             column_names = (
                 [desc.name for desc in cursor.description] if cursor.description else []
             )
-            results_raw = await loop.run_in_executor(None, cursor.fetchall)
-            logger.debug(
-                f"Raw results type: {type(results_raw)}, Content: {results_raw}"
-            )
-            dict_results = []
-            for row in results_raw:
-                try:
-                    logger.debug(f"Processing row type: {type(row)}, Content: {row}")
-                    dict_results.append(dict(zip(column_names, row, strict=False)))
-                except TypeError as te:
-                    logger.error(
-                        f"TypeError processing row: {row}. Error: {te}", exc_info=True
-                    )
-                    raise
+            dict_results = [
+                dict(zip(column_names, row, strict=False)) for row in cursor.fetchall()
+            ]
 
             # Restore automatic commit
-            await loop.run_in_executor(None, conn_to_use.commit)
+            conn.commit()
             logger.debug(
-                f"Query executed and committed successfully, {len(dict_results)} results fetched. Temp: {is_temporary_connection}"
+                f"Query executed and committed successfully, {len(dict_results)} results fetched."
             )
-
             return dict_results
-        except (mgclient.Error, ConnectionError) as e:
-            logger.error(
-                f"Error executing query: {query} | Params: {params} | Error: {e}",
-                exc_info=True,
-            )
-            # Only attempt rollback on the connection we actually used
-            if conn_to_use:
-                try:
-                    await loop.run_in_executor(
-                        None, conn_to_use.rollback
-                    )  # Rollback on error
-                except Exception as rb_exc:
-                    logger.error(
-                        f"Failed to rollback transaction: {rb_exc}", exc_info=True
-                    )
-            raise  # Re-raise the original error
         except Exception as e:
-            logger.error(f"Unexpected error during query execution: {e}", exc_info=True)
-            # Check if conn_to_use is not None before attempting rollback
-            if conn_to_use:
-                try:
-                    await loop.run_in_executor(None, conn_to_use.rollback)
-                except Exception as rb_exc:
-                    logger.error(
-                        f"Failed to rollback transaction: {rb_exc}", exc_info=True
-                    )
-            raise
+            if isinstance(e, mgclient.Error | ConnectionError):
+                logger.error(
+                    f"Error executing query: {query} | Params: {params} | Error: {e}",
+                    exc_info=True,
+                )
+            else:
+                logger.error(f"Unexpected error during query execution: {e}", exc_info=True)
+            try:
+                conn.rollback()
+            except Exception as rb_exc:
+                logger.error(f"Failed to rollback transaction: {rb_exc}", exc_info=True)
+                discard = True
+            if getattr(conn, "status", None) == mgclient.CONN_STATUS_BAD:
+                discard = True
+            raise  # Re-raise the original error
         finally:
-            # Close cursor always
-            if cursor:
+            if cursor is not None:
                 try:
-                    await loop.run_in_executor(None, cursor.close)  # Close cursor
+                    cursor.close()
                 except Exception as c_exc:
                     logger.error(f"Failed to close cursor: {c_exc}", exc_info=True)
-            # Only close the connection if it was temporary
-            if is_temporary_connection and conn_to_use:
-                try:
-                    await loop.run_in_executor(
-                        None, conn_to_use.close
-                    )  # Close temporary connection
-                    logger.debug("Temporary connection closed.")
-                except Exception as conn_exc:
-                    logger.error(
-                        f"Failed to close temporary connection: {conn_exc}",
-                        exc_info=True,
-                    )
+            pool.release(pooled, discard=discard)
 
     async def add_document(self, document: Document):
         """Adds a document node to the graph."""
@@ -327,6 +333,8 @@ class MemgraphGraphRepository(GraphStore, GraphRepository):
             else {},  # Pass metadata as a map parameter
             "created_at": created_at_dt,
             "updated_at": updated_at_dt,
+            "content_hash": document.properties.get("content_hash"),
+            "metadata_hash": document.properties.get("metadata_hash"),
         }
 
         # Use individual property assignments in SET clauses
@@ -341,6 +349,8 @@ class MemgraphGraphRepository(GraphStore, GraphRepository):
             d.content = $content,
             d.metadata = $metadata,
             d.updated_at = $updated_at
+        SET d.content_hash = $content_hash,
+            d.metadata_hash = $metadata_hash
         """
 
         try:
@@ -418,6 +428,7 @@ class MemgraphGraphRepository(GraphStore, GraphRepository):
                     id=doc_id,
                     content=doc_properties.get("content"),
                     metadata=metadata,
+                    properties=self._fingerprint_properties(doc_properties),
                     created_at=created_at,
                     updated_at=updated_at,
                 ))
@@ -431,6 +442,15 @@ class MemgraphGraphRepository(GraphStore, GraphRepository):
         logger.debug(f"Retrieved {len(documents)} documents out of {len(document_ids)} requested")
         return documents
 
+    @staticmethod
+    def _fingerprint_properties(node_properties: dict[str, Any]) -> dict[str, Any]:
+        """Content fingerprints stored on a node, used to skip unchanged re-ingestion."""
+        return {
+            key: node_properties[key]
+            for key in ("content_hash", "metadata_hash")
+            if node_properties.get(key) is not None
+        }
+
     async def get_document_by_id(self, document_id: str) -> Document | None:
         """Retrieves a document by its ID, returning a Document object or None."""
         logger.debug(f"Attempting to retrieve document with ID: {document_id}")
@@ -511,6 +531,7 @@ class MemgraphGraphRepository(GraphStore, GraphRepository):
                 id=doc_properties.get("id"),
                 content=doc_properties.get("content"),  # Ensure content is retrieved
                 metadata=metadata,  # Use the processed metadata
+                properties=self._fingerprint_properties(doc_properties),
                 created_at=created_at,
                 updated_at=updated_at,
             )
@@ -582,6 +603,7 @@ class MemgraphGraphRepository(GraphStore, GraphRepository):
             c.embedding = $embedding,
             c.metadata = $metadata,
             c.updated_at = $updated_at
+        SET c.content_hash = $content_hash
         WITH c
         MATCH (d:Document {id: $document_id})
         WHERE d IS NOT NULL  // Ensure the document node exists
@@ -600,6 +622,7 @@ class MemgraphGraphRepository(GraphStore, GraphRepository):
             "text": chunk.text,
             "embedding": chunk.embedding,  # Pass embedding list directly (or None)
             "metadata": metadata_param,  # Use the guaranteed dict
+            "content_hash": (getattr(chunk, "properties", None) or {}).get("content_hash"),
             "created_at": created_at_dt,
             "updated_at": updated_at_dt,
         }
@@ -1146,6 +1169,189 @@ class MemgraphGraphRepository(GraphStore, GraphRepository):
             f"Bulk processed {len(entities)} entities and {len(relationships)} relationships"
         )
 
+    async def execute_batch(
+        self, statements: list[tuple[str, dict[str, Any]]]
+    ) -> None:
+        """Executes several write statements in a single transaction."""
+        if not statements:
+            return
+        pool = self._ensure_pool()
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            self._executor, self._execute_batch_sync, pool, statements
+        )
+
+    def _execute_batch_sync(
+        self, pool: ConnectionPool, statements: list[tuple[str, dict[str, Any]]]
+    ) -> None:
+        pooled = pool.acquire(timeout=self.config.pool_acquire_timeout)
+        conn = pooled.connection
+        cursor = conn.cursor()
+        discard = False
+        try:
+            for query, params in statements:
+                cursor.execute(query, params)
+                cursor.fetchall()
+            conn.commit()
+        except Exception as e:
+            logger.error(
+                f"Batch of {len(statements)} statements failed, rolling back: {e}",
+                exc_info=True,
+            )
+            try:
+                conn.rollback()
+            except Exception as rb_exc:
+                logger.error(f"Failed to rollback transaction: {rb_exc}", exc_info=True)
+                discard = True
+            if getattr(conn, "status", None) == mgclient.CONN_STATUS_BAD:
+                discard = True
+            raise
+        finally:
+            try:
+                cursor.close()
+            except Exception as c_exc:
+                logger.error(f"Failed to close cursor: {c_exc}", exc_info=True)
+            pool.release(pooled, discard=discard)
+
+    async def add_graph_batch(
+        self,
+        chunks: list[Chunk],
+        entities: list[Entity],
+        relationships: list[Relationship],
+        batch_size: int = 500,
+    ) -> None:
+        """Upserts chunks (with their CONTAINS edges), entities and relationships.
+
+        Rows are grouped by label/relationship type and written with one
+        parameterized UNWIND statement per group and ``batch_size`` rows, all
+        in a single transaction. Chunks are written first, then entities,
+        then relationships, so edges can match both endpoints.
+        """
+        statements = (
+            self._chunk_batch_statements(chunks, batch_size)
+            + self._node_batch_statements(entities, batch_size)
+            + self._relationship_batch_statements(relationships, batch_size)
+        )
+        await self.execute_batch(statements)
+        logger.debug(
+            f"Bulk wrote {len(chunks)} chunks, {len(entities)} entities and "
+            f"{len(relationships)} relationships in {len(statements)} statements"
+        )
+
+    @staticmethod
+    def _batched(rows: list[dict[str, Any]], batch_size: int):
+        step = max(1, batch_size)
+        for i in range(0, len(rows), step):
+            yield rows[i : i + step]
+
+    def _chunk_batch_statements(
+        self, chunks: list[Chunk], batch_size: int
+    ) -> list[tuple[str, dict[str, Any]]]:
+        now = datetime.now(timezone.utc)
+        rows = []
+        for chunk in chunks:
+            created_at = chunk.created_at or now
+            if isinstance(created_at, datetime) and created_at.tzinfo is None:
+                created_at = created_at.replace(tzinfo=timezone.utc)
+            rows.append(
+                {
+                    "id": chunk.id,
+                    "document_id": chunk.document_id,
+                    "text": chunk.text,
+                    "embedding": getattr(chunk, "embedding", None),
+                    "metadata": getattr(chunk, "metadata", None) or {},
+                    "content_hash": (getattr(chunk, "properties", None) or {}).get("content_hash"),
+                    "created_at": created_at,
+                }
+            )
+        query = """
+        UNWIND $rows AS row
+        MERGE (c:Chunk {id: row.id})
+        ON CREATE SET
+            c.document_id = row.document_id,
+            c.created_at = row.created_at
+        SET c.text = row.text,
+            c.embedding = row.embedding,
+            c.metadata = row.metadata,
+            c.content_hash = row.content_hash,
+            c.updated_at = $updated_at
+        WITH c, row
+        MATCH (d:Document {id: row.document_id})
+        MERGE (d)-[:CONTAINS]->(c)
+        """
+        return [
+            (query, {"rows": batch, "updated_at": now})
+            for batch in self._batched(rows, batch_size)
+        ]
+
+    def _node_batch_statements(
+        self, nodes: list[Node], batch_size: int
+    ) -> list[tuple[str, dict[str, Any]]]:
+        now = datetime.now(timezone.utc)
+        rows_by_label: dict[str, list[dict[str, Any]]] = {}
+        for node in nodes:
+            # Same property layout as add_node
+            props = node.model_dump(
+                exclude={"id", "created_at", "updated_at", "properties"},
+                exclude_none=True,
+            )
+            if node.properties:
+                props.update(node.properties)
+            props["updated_at"] = now
+            created_at = node.created_at or now
+            if isinstance(created_at, datetime) and created_at.tzinfo is None:
+                created_at = created_at.replace(tzinfo=timezone.utc)
+            label = node.type or "UnknownNode"
+            rows_by_label.setdefault(label, []).append(
+                {"id": node.id, "props": props, "created_at": created_at}
+            )
+        statements = []
+        for label, rows in rows_by_label.items():
+            query = f"""
+            UNWIND $rows AS row
+            MERGE (n:{escape_cypher_string(label)} {{id: row.id}})
+            ON CREATE SET n = row.props, n.created_at = row.created_at, n.id = row.id
+            ON MATCH SET n += row.props
+            """
+            statements.extend(
+                (query, {"rows": batch}) for batch in self._batched(rows, batch_size)
+            )
+        return statements
+
+    def _relationship_batch_statements(
+        self, relationships: list[Relationship], batch_size: int
+    ) -> list[tuple[str, dict[str, Any]]]:
+        now = datetime.now(timezone.utc)
+        rows_by_type: dict[str, list[dict[str, Any]]] = {}
+        for rel in relationships:
+            props = rel.properties.copy() if rel.properties else {}
+            props["updated_at"] = now
+            props["id"] = rel.id
+            created_at = rel.created_at
+            if isinstance(created_at, datetime) and created_at.tzinfo is None:
+                created_at = created_at.replace(tzinfo=timezone.utc)
+            rows_by_type.setdefault(rel.type or "UnknownRelationship", []).append(
+                {
+                    "source_id": rel.source_id,
+                    "target_id": rel.target_id,
+                    "props": props,
+                    "created_at": created_at,
+                }
+            )
+        statements = []
+        for rel_type, rows in rows_by_type.items():
+            query = f"""
+            UNWIND $rows AS row
+            MATCH (source {{id: row.source_id}}), (target {{id: row.target_id}})
+            MERGE (source)-[r:{escape_cypher_string(rel_type)}]->(target)
+            ON CREATE SET r = row.props, r.created_at = row.created_at
+            ON MATCH SET r += row.props
+            """
+            statements.extend(
+                (query, {"rows": batch}) for batch in self._batched(rows, batch_size)
+            )
+        return statements
+
     async def get_entity_by_id(self, entity_id: str) -> Entity | None:
         """Retrieves a single entity by its unique ID with error handling."""
         try:
@@ -0,0 +1,140 @@
+"""
+Incremental inverted index for Okapi BM25 keyword search.
+
+Postings map each term to ``{doc: term frequency}`` and document lengths are
+kept alongside, so adding or removing a chunk only touches that chunk's
+terms and a query only walks the postings of its own terms. Query terms are
+scored in decreasing order of their maximum possible contribution; once the
+current k-th best score exceeds what the remaining terms could add, documents
+not already in the candidate set are skipped (MaxScore-style pruning).
+"""
+
+import heapq
+import math
+import re
+from collections import Counter
+from collections.abc import Hashable, Iterable
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase alphanumeric tokenization shared by indexing and querying."""
+    return _TOKEN_RE.findall((text or "").lower())
+
+
+class BM25Index:
+    """Okapi BM25 over an incrementally maintained inverted index."""
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.clear()
+
+    def clear(self) -> None:
+        self._postings: dict[str, dict[int, int]] = {}
+        self._doc_terms: dict[int, dict[str, int]] = {}
+        self._doc_len: dict[int, int] = {}
+        self._total_len = 0
+        self._key_to_doc: dict[Hashable, int] = {}
+        self._doc_to_key: dict[int, Hashable] = {}
+        self._next_doc = 0
+
+    def __len__(self) -> int:
+        return len(self._doc_len)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._key_to_doc
+
+    @property
+    def vocabulary_size(self) -> int:
+        return len(self._postings)
+
+    @property
+    def avgdl(self) -> float:
+        return self._total_len / len(self._doc_len) if self._doc_len else 0.0
+
+    def add(self, key: Hashable, text: str) -> None:
+        """Indexes ``text`` under ``key``, replacing any previous text for it."""
+        if key in self._key_to_doc:
+            self.remove(key)
+        doc = self._next_doc
+        self._next_doc += 1
+        terms = Counter(tokenize(text))
+        for term, tf in terms.items():
+            self._postings.setdefault(term, {})[doc] = tf
+        length = sum(terms.values())
+        self._doc_terms[doc] = dict(terms)
+        self._doc_len[doc] = length
+        self._total_len += length
+        self._key_to_doc[key] = doc
+        self._doc_to_key[doc] = key
+
+    def add_many(self, items: Iterable[tuple[Hashable, str]]) -> None:
+        for key, text in items:
+            self.add(key, text)
+
+    def remove(self, key: Hashable) -> bool:
+        """Removes ``key`` from the index. Returns False if it was not indexed."""
+        doc = self._key_to_doc.pop(key, None)
+        if doc is None:
+            return False
+        del self._doc_to_key[doc]
+        for term in self._doc_terms.pop(doc):
+            postings = self._postings[term]
+            del postings[doc]
+            if not postings:
+                del self._postings[term]
+        self._total_len -= self._doc_len.pop(doc)
+        return True
+
+    def search(self, query: str, k: int = 5) -> list[tuple[Hashable, float]]:
+        """Returns up to ``k`` (key, score) pairs with positive score, best first."""
+        if k <= 0 or not self._doc_len:
+            return []
+        query_terms = Counter(t for t in tokenize(query) if t in self._postings)
+        if not query_terms:
+            return []
+
+        n_docs = len(self._doc_len)
+        avgdl = self.avgdl or 1.0
+        k1, b = self.k1, self.b
+        doc_len = self._doc_len
+
+        # (weight, upper bound, postings) per distinct query term; repeated
+        # query terms count once per occurrence, as in a plain token loop.
+        weighted: list[tuple[float, float, dict[int, int]]] = []
+        for term, qtf in query_terms.items():
+            postings = self._postings[term]
+            df = len(postings)
+            idf = math.log(1.0 + max(0.0, (n_docs - df + 0.5) / (df + 0.5)))
+            weight = idf * qtf
+            weighted.append((weight, weight * (k1 + 1.0), postings))
+        weighted.sort(key=lambda t: t[1], reverse=True)
+
+        # remaining[i] = best score any document can still gain from terms i..end
+        remaining = [0.0] * (len(weighted) + 1)
+        for i in range(len(weighted) - 1, -1, -1):
+            remaining[i] = remaining[i + 1] + weighted[i][1]
+
+        scores: dict[int, float] = {}
+        for i, (weight, _, postings) in enumerate(weighted):
+            essential = True
+            if len(scores) >= k:
+                kth_best = heapq.nlargest(k, scores.values())[-1]
+                essential = kth_best <= remaining[i]
+            if essential:
+                docs = postings.items()
+            else:
+                # New documents can no longer reach the top k; only
+                # refine the scores of existing candidates.
+                if len(scores) < len(postings):
+                    docs = ((d, postings[d]) for d in scores if d in postings)
+                else:
+                    docs = ((d, tf) for d, tf in postings.items() if d in scores)
+            for doc, tf in docs:
+                norm = k1 * (1.0 - b + b * (doc_len[doc] / avgdl))
+                scores[doc] = scores.get(doc, 0.0) + weight * (tf * (k1 + 1.0)) / (tf + norm)
+
+        top = heapq.nlargest(k, scores.items(), key=lambda t: t[1])
+        return [(self._doc_to_key[doc], score) for doc, score in top if score > 0.0]
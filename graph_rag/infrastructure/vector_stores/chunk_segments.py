@@ -0,0 +1,274 @@
+"""Append-only on-disk storage for chunk rows and their embeddings.
+
+A store directory holds one generation of segment files plus a small
+``manifest.json`` that records how many rows and bytes of each file are
+committed:
+
+- ``embeddings.<gen>.f32``: row-major float32 matrix, memory-mapped on load
+- ``records.<gen>.jsonl``: one JSON record (document_id, text, metadata) per row
+- ``offsets.<gen>.u64``: (byte offset, length) of each record, so single rows
+  can be read without parsing the whole file
+- ``ids.<gen>.jsonl``: JSON-encoded chunk id per row
+- ``tombstones.<gen>.txt``: deleted row numbers, one per line
+
+Appends and deletes only write the new bytes and then atomically replace the
+manifest, so their cost is proportional to the batch, not the store. Bytes
+past the committed sizes (from an interrupted append) are truncated on load.
+``compact`` rewrites the live rows into the next generation and drops the
+old files.
+
+Another process can follow the log with ``refresh``, which re-reads the
+manifest and returns only the rows and tombstones committed since the last
+``open``/``refresh``. Coordinating writers (e.g. with a file lock) is up to
+the caller.
+"""
+
+import json
+import logging
+import os
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 3
+_FILES = ("embeddings", "records", "offsets", "ids", "tombstones")
+_SUFFIXES = {
+    "embeddings": "f32",
+    "records": "jsonl",
+    "offsets": "u64",
+    "ids": "jsonl",
+    "tombstones": "txt",
+}
+
+
+class ChunkSegmentLog:
+    """Append-only chunk log with memory-mapped embeddings and tombstones."""
+
+    def __init__(self, base_path: Path, dimension: int, fsync: bool = True):
+        self.base_path = Path(base_path)
+        self.base_path.mkdir(parents=True, exist_ok=True)
+        self.manifest_path = self.base_path / "manifest.json"
+        self.dimension = int(dimension)
+        self.fsync = fsync
+        self.generation = 0
+        self.rows = 0
+        self.commits = 0
+        self._sizes = dict.fromkeys(_FILES, 0)
+
+    # --- manifest ---
+    def exists(self) -> bool:
+        return self.manifest_path.exists()
+
+    def _path(self, kind: str, generation: int | None = None) -> Path:
+        gen = self.generation if generation is None else generation
+        return self.base_path / f"{kind}.{gen}.{_SUFFIXES[kind]}"
+
+    def _write_manifest(self) -> None:
+        self.commits += 1
+        tmp = self.manifest_path.with_suffix(".json.tmp")
+        tmp.write_text(
+            json.dumps(
+                {
+                    "version": FORMAT_VERSION,
+                    "dimension": self.dimension,
+                    "generation": self.generation,
+                    "commits": self.commits,
+                    "rows": self.rows,
+                    "sizes": self._sizes,
+                }
+            )
+        )
+        tmp.replace(self.manifest_path)
+
+    def _apply_manifest(self, manifest: dict[str, Any]) -> None:
+        self.dimension = int(manifest["dimension"])
+        self.generation = int(manifest["generation"])
+        self.commits = int(manifest.get("commits", 0))
+        self.rows = int(manifest["rows"])
+        self._sizes = {k: int(manifest["sizes"].get(k, 0)) for k in _FILES}
+
+    def open(self) -> tuple[list[str], np.ndarray, set[int]]:
+        """Load the committed state: chunk ids, embeddings (memory-mapped) and deleted rows."""
+        if self.exists():
+            self._apply_manifest(json.loads(self.manifest_path.read_text()))
+        for kind in _FILES:
+            path = self._path(kind)
+            committed = self._sizes[kind]
+            if not path.exists():
+                path.touch()
+            if path.stat().st_size != committed:
+                # Drop bytes from an append that never reached the manifest
+                with open(path, "r+b") as f:
+                    f.truncate(committed)
+        if not self.exists():
+            self._write_manifest()
+
+        with open(self._path("ids"), encoding="utf-8") as f:
+            ids = [json.loads(line) for line in f]
+        deleted = self._read_tombstones()
+        return ids, self.embeddings(), deleted
+
+    def embeddings(self) -> np.ndarray:
+        """Committed embeddings as an ``(rows, dimension)`` float32 array."""
+        if self.rows == 0:
+            return np.zeros((0, self.dimension), dtype=np.float32)
+        return np.memmap(
+            self._path("embeddings"),
+            dtype=np.float32,
+            mode="r",
+            shape=(self.rows, self.dimension),
+        )
+
+    def _read_tombstones(self, start: int = 0) -> set[int]:
+        with open(self._path("tombstones"), "rb") as f:
+            f.seek(start)
+            data = f.read(self._sizes["tombstones"] - start)
+        return {int(line) for line in data.split() if line}
+
+    def refresh(self) -> tuple[bool, range, list[str], set[int]]:
+        """Pick up commits made through another handle since the last open/refresh.
+
+        Returns ``(reopen, new_rows, new_ids, new_tombstones)``. ``reopen`` means
+        the log was compacted or destroyed elsewhere, so row numbers changed and
+        the caller must ``open()`` it again.
+        """
+        try:
+            manifest = json.loads(self.manifest_path.read_text())
+        except FileNotFoundError:
+            return True, range(0), [], set()
+        if int(manifest["generation"]) != self.generation:
+            return True, range(0), [], set()
+        old_rows, old_sizes = self.rows, dict(self._sizes)
+        self._apply_manifest(manifest)
+        with open(self._path("ids"), "rb") as f:
+            f.seek(old_sizes["ids"])
+            data = f.read(self._sizes["ids"] - old_sizes["ids"])
+        new_ids = [json.loads(line) for line in data.split(b"\n") if line]
+        new_tombstones = self._read_tombstones(old_sizes["tombstones"])
+        return False, range(old_rows, self.rows), new_ids, new_tombstones
+
+    # --- writes ---
+    def _append(self, kind: str, data: bytes) -> None:
+        if not data:
+            return
+        with open(self._path(kind), "ab") as f:
+            f.write(data)
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+        self._sizes[kind] += len(data)
+
+    def append(
+        self,
+        chunk_ids: Sequence[str],
+        records: Sequence[dict[str, Any]],
+        embeddings: np.ndarray,
+    ) -> range:
+        """Append rows and commit them. Returns the new row numbers."""
+        n = len(chunk_ids)
+        if n == 0:
+            return range(self.rows, self.rows)
+        matrix = np.ascontiguousarray(embeddings, dtype=np.float32)
+        if matrix.shape != (n, self.dimension):
+            raise ValueError(
+                f"Expected embeddings of shape ({n}, {self.dimension}), got {matrix.shape}"
+            )
+
+        encoded = [
+            (json.dumps(r, ensure_ascii=False) + "\n").encode("utf-8") for r in records
+        ]
+        offsets = np.empty((n, 2), dtype=np.uint64)
+        position = self._sizes["records"]
+        for i, blob in enumerate(encoded):
+            offsets[i] = (position, len(blob))
+            position += len(blob)
+
+        self._append("embeddings", matrix.tobytes())
+        self._append("records", b"".join(encoded))
+        self._append("offsets", offsets.tobytes())
+        self._append(
+            "ids", "".join(json.dumps(cid) + "\n" for cid in chunk_ids).encode("utf-8")
+        )
+        start = self.rows
+        self.rows += n
+        self._write_manifest()
+        return range(start, self.rows)
+
+    def delete_rows(self, rows: Iterable[int]) -> None:
+        """Tombstone rows; they stay on disk until the next compaction."""
+        data = "".join(f"{int(r)}\n" for r in rows).encode("utf-8")
+        if data:
+            self._append("tombstones", data)
+            self._write_manifest()
+
+    def read_records(self, rows: Sequence[int]) -> list[dict[str, Any]]:
+        """Read the records for the given rows without loading the whole file."""
+        if not rows:
+            return []
+        offsets = np.memmap(
+            self._path("offsets"), dtype=np.uint64, mode="r", shape=(self.rows, 2)
+        )
+        out = []
+        with open(self._path("records"), "rb") as f:
+            for row in rows:
+                start, length = (int(v) for v in offsets[row])
+                f.seek(start)
+                out.append(json.loads(f.read(length)))
+        return out
+
+    def read_record_range(self, rows: range) -> list[dict[str, Any]]:
+        """Read the records of a contiguous row range with a single read."""
+        if len(rows) == 0:
+            return []
+        offsets = np.memmap(
+            self._path("offsets"), dtype=np.uint64, mode="r", shape=(self.rows, 2)
+        )
+        start = int(offsets[rows.start][0])
+        end = int(offsets[rows.stop - 1][0] + offsets[rows.stop - 1][1])
+        del offsets
+        with open(self._path("records"), "rb") as f:
+            f.seek(start)
+            data = f.read(end - start)
+        return [json.loads(line) for line in data.split(b"\n") if line]
+
+    def compact(self, keep_rows: Sequence[int], chunk_ids: Sequence[str]) -> None:
+        """Rewrite ``keep_rows`` (with their ``chunk_ids``) into a fresh generation."""
+        old_generation = self.generation
+        embeddings = self.embeddings()
+        records = self.read_records(keep_rows)
+        kept = (
+            np.asarray(embeddings[list(keep_rows)], dtype=np.float32)
+            if len(keep_rows)
+            else np.zeros((0, self.dimension), dtype=np.float32)
+        )
+        del embeddings  # release the memory map before the files are removed
+
+        self.generation = old_generation + 1
+        self.rows = 0
+        self._sizes = dict.fromkeys(_FILES, 0)
+        for kind in _FILES:
+            self._path(kind).write_bytes(b"")
+        if len(keep_rows):
+            # append() commits the manifest, which switches readers to the new generation
+            self.append(chunk_ids, records, kept)
+        else:
+            self._write_manifest()
+        for kind in _FILES:
+            self._path(kind, old_generation).unlink(missing_ok=True)
+        logger.info(
+            f"Compacted chunk segments to generation {self.generation} ({self.rows} rows)"
+        )
+
+    def destroy(self) -> None:
+        """Remove all segment files and the manifest."""
+        for kind in _FILES:
+            self._path(kind).unlink(missing_ok=True)
+        self.manifest_path.unlink(missing_ok=True)
+        self.generation = 0
+        self.rows = 0
+        self.commits = 0
+        self._sizes = dict.fromkeys(_FILES, 0)
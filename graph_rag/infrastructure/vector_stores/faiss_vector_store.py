@@ -7,6 +7,8 @@ from typing import Any
 import numpy as np
 
 from graph_rag.core.interfaces import ChunkData, EmbeddingService, SearchResultData, VectorStore
+from graph_rag.core.query_embedding_cache import get_query_embedding_cache
+from graph_rag.infrastructure.vector_stores.chunk_segments import ChunkSegmentLog
 
 logger = logging.getLogger(__name__)
 
@@ -39,86 +41,124 @@ def _normalize(vectors: np.ndarray) -> np.ndarray:
 class FaissVectorStore(VectorStore):
     """Persistent FAISS-based vector store using cosine similarity (via inner product on normalized vectors).
 
-    Persists:
-    - FAISS index file: index.faiss
-    - Metadata sidecar: meta.json (maps row -> ChunkData minimal fields)
+    Chunks are persisted in append-only segments (see ``ChunkSegmentLog``):
+    embeddings in a memory-mapped float32 file, text/metadata in an
+    offset-indexed record file. Adding a batch only appends that batch, and
+    startup rebuilds the flat index straight from the mapped embeddings.
+    Deletes are tombstoned and filtered at query time until the deleted share
+    reaches ``compaction_ratio``, at which point the segments are compacted.
+    Stores written in the older ``meta.json`` format are migrated on load.
     """
 
-    def __init__(self, path: str, embedding_dimension: int, embedding_service: EmbeddingService | None = None):
+    def __init__(
+        self,
+        path: str,
+        embedding_dimension: int,
+        embedding_service: EmbeddingService | None = None,
+        compaction_ratio: float = 0.25,
+    ):
         self.base_path = Path(os.path.expanduser(path))
         _ensure_dir(self.base_path)
+        # Legacy single-file format, read only for migration
         self.index_path = self.base_path / "index.faiss"
         self.meta_path = self.base_path / "meta.json"
         self.embedding_dimension = int(embedding_dimension)
         self.embedding_service = embedding_service
+        self.compaction_ratio = compaction_ratio
 
         self.index = _get_faiss().IndexFlatIP(self.embedding_dimension)
-        self._rows: list[dict[str, Any]] = []
+        self._segments = ChunkSegmentLog(self.base_path, self.embedding_dimension)
+        self._ids: list[str] = []
+        self._deleted: set[int] = set()
         self._row_by_chunk_id: dict[str, int] = {}
 
         self._load()
 
     # --- persistence ---
     def _load(self) -> None:
-        if self.index_path.exists():
-            logger.info(f"Loading FAISS index from {self.index_path}")
-            self.index = _get_faiss().read_index(str(self.index_path))
-            try:
-                # Align embedding dimension with loaded index
-                self.embedding_dimension = int(self.index.d)
-            except Exception:
-                pass
-        if self.meta_path.exists():
-            try:
-                data = json.loads(self.meta_path.read_text())
-                version = int(data.get("version", 1))
-                if version < 2:
-                    logger.warning(
-                        "FAISS meta version %s detected; embeddings may be missing. "
-                        "Consider re-ingesting or running maintenance to upgrade.",
-                        version,
-                    )
-                self._rows = data.get("rows", [])
-                self._row_by_chunk_id = {
-                    r["chunk_id"]: i for i, r in enumerate(self._rows)
-                }
-            except Exception as e:
-                logger.error(f"Failed to load FAISS metadata: {e}")
-                self._rows = []
-                self._row_by_chunk_id = {}
-
-    def _save(self) -> None:
-        # Write index atomically
-        tmp_index = self.index_path.with_suffix(".faiss.tmp")
-        _get_faiss().write_index(self.index, str(tmp_index))
-        tmp_index.replace(self.index_path)
-        # Write metadata
-        tmp_meta = self.meta_path.with_suffix(".json.tmp")
-        tmp_meta.write_text(json.dumps({"version": 2, "rows": self._rows}))
-        tmp_meta.replace(self.meta_path)
-
-    def _rebuild_from_rows(self) -> None:
-        """Rebuild FAISS index from current rows using persisted embeddings.
-
-        Skips legacy rows that do not include an embedding.
-        """
-        self.index = _get_faiss().IndexFlatIP(self.embedding_dimension)
-        if not self._rows:
+        if not self._segments.exists() and self.meta_path.exists():
+            self._migrate_legacy()
             return
-        reb_vectors: list[list[float]] = []
-        for r in self._rows:
+        self._ids, embeddings, self._deleted = self._segments.open()
+        self.embedding_dimension = self._segments.dimension
+        self._reset_index(embeddings)
+        if self._ids:
+            logger.info(
+                f"Loaded {len(self._ids) - len(self._deleted)} FAISS rows from segments in {self.base_path}"
+            )
+
+    def _reset_index(self, embeddings: np.ndarray) -> None:
+        """Rebuild the in-memory index and id map from the committed rows."""
+        self.index = _get_faiss().IndexFlatIP(self.embedding_dimension)
+        if len(embeddings):
+            self.index.add(_normalize(np.asarray(embeddings, dtype=np.float32)))
+        self._row_by_chunk_id = {
+            chunk_id: row
+            for row, chunk_id in enumerate(self._ids)
+            if row not in self._deleted
+        }
+
+    def _migrate_legacy(self) -> None:
+        """Convert a ``meta.json``/``index.faiss`` store into segments."""
+        try:
+            data = json.loads(self.meta_path.read_text())
+        except Exception as e:
+            logger.error(f"Failed to load FAISS metadata: {e}")
+            data = {}
+        rows = data.get("rows", [])
+        if int(data.get("version", 1)) < 2:
+            logger.warning(
+                "FAISS meta version %s detected; embeddings may be missing. "
+                "Consider re-ingesting or running maintenance to upgrade.",
+                data.get("version", 1),
+            )
+        usable = []
+        for r in rows:
             emb = r.get("embedding")
             if isinstance(emb, list) and len(emb) == self.embedding_dimension:
-                reb_vectors.append(emb)
+                usable.append(r)
             else:
                 logger.warning(
-                    "Row %s missing embedding for FAISS rebuild; skipping.",
+                    "Row %s missing embedding for FAISS migration; skipping.",
                     r.get("chunk_id"),
                 )
-        if reb_vectors:
-            vec = np.array(reb_vectors, dtype=np.float32)
-            vec = _normalize(vec)
-            self.index.add(vec)
+        self._segments.open()
+        if usable:
+            self._segments.append(
+                [r["chunk_id"] for r in usable],
+                [self._record(r.get("document_id", ""), r.get("text", ""), r.get("metadata")) for r in usable],
+                np.array([r["embedding"] for r in usable], dtype=np.float32),
+            )
+        # Later duplicates of a chunk id supersede earlier rows
+        last_row = {r["chunk_id"]: i for i, r in enumerate(usable)}
+        superseded = [i for i, r in enumerate(usable) if last_row[r["chunk_id"]] != i]
+        self._segments.delete_rows(superseded)
+        self.meta_path.unlink(missing_ok=True)
+        self.index_path.unlink(missing_ok=True)
+        logger.info(f"Migrated {len(usable)} FAISS rows from meta.json to segment storage")
+        self._ids, embeddings, self._deleted = self._segments.open()
+        self._reset_index(embeddings)
+
+    @staticmethod
+    def _record(document_id: str, text: str, metadata: dict[str, Any] | None) -> dict[str, Any]:
+        return {"document_id": document_id, "text": text, "metadata": metadata or {}}
+
+    def _compact(self) -> None:
+        keep = [row for row in range(len(self._ids)) if row not in self._deleted]
+        kept_ids = [self._ids[row] for row in keep]
+        self._segments.compact(keep, kept_ids)
+        self._ids, embeddings, self._deleted = self._segments.open()
+        self._reset_index(embeddings)
+
+    def _chunk_for_row(self, row: int, record: dict[str, Any], score: float) -> ChunkData:
+        return ChunkData(
+            id=self._ids[row],
+            text=record.get("text", ""),
+            document_id=record.get("document_id", ""),
+            embedding=None,
+            metadata=record.get("metadata", {}),
+            score=score,
+        )
 
     # --- VectorStore API ---
     async def add_chunks(self, chunks: list[ChunkData]) -> None:  # type: ignore[override]
@@ -126,67 +166,83 @@ class FaissVectorStore(VectorStore):
             return
         # Expect embeddings present on chunks; caller ensures generation
         vectors: list[list[float]] = []
-        new_rows: list[dict[str, Any]] = []
+        ids: list[str] = []
+        records: list[dict[str, Any]] = []
         for ch in chunks:
             if ch.embedding is None:
                 logger.warning(
                     f"Skipping chunk {ch.id} without embedding for FAISS store"
                 )
                 continue
-            if ch.id in self._row_by_chunk_id:
-                # FAISS IndexFlat doesn't support in-place update; naive strategy: append new and keep last
-                logger.warning(
-                    f"Duplicate chunk id {ch.id} detected; appending new embedding"
-                )
             vectors.append(ch.embedding)
-            new_rows.append(
-                {
-                    "chunk_id": ch.id,
-                    "document_id": ch.document_id,
-                    "text": ch.text,
-                    "metadata": ch.metadata or {},
-                    # Persist original (unnormalized) embedding for rebuilds
-                    "embedding": ch.embedding,
-                }
-            )
+            ids.append(ch.id)
+            records.append(self._record(ch.document_id, ch.text, ch.metadata))
         if not vectors:
             return
         vec = np.array(vectors, dtype=np.float32)
-        vec = _normalize(vec)
-        self.index.add(vec)
-        start = len(self._rows)
-        self._rows.extend(new_rows)
-        for offset, row in enumerate(new_rows):
-            self._row_by_chunk_id[row["chunk_id"]] = start + offset
-        self._save()
+        # Persist original (unnormalized) embeddings for rebuilds
+        new_rows = self._segments.append(ids, records, vec)
+        self.index.add(_normalize(vec))
+        self._ids.extend(ids)
+
+        superseded = []
+        for row, chunk_id in zip(new_rows, ids, strict=True):
+            previous = self._row_by_chunk_id.get(chunk_id)
+            if previous is not None:
+                # FAISS IndexFlat doesn't support in-place update: keep the latest row
+                logger.warning(
+                    f"Duplicate chunk id {chunk_id} detected; replacing previous embedding"
+                )
+                superseded.append(previous)
+            self._row_by_chunk_id[chunk_id] = row
+        if superseded:
+            self._segments.delete_rows(superseded)
+            self._deleted.update(superseded)
 
     async def search_similar_chunks(  # type: ignore[override]
         self, query_vector: list[float], limit: int = 10, threshold: float | None = None
     ) -> list[SearchResultData]:
-        if self.index.ntotal == 0:
-            return []
-        q = np.array([query_vector], dtype=np.float32)
+        results = await self.batch_search_similar_chunks([query_vector], limit, threshold)
+        return results[0]
+
+    async def batch_search_similar_chunks(
+        self,
+        query_vectors: list[list[float]],
+        limit: int = 10,
+        threshold: float | None = None,
+    ) -> list[list[SearchResultData]]:
+        """Searches all query vectors with a single ``index.search`` call."""
+        if self.index.ntotal == 0 or not query_vectors:
+            return [[] for _ in query_vectors]
+        q = np.array(query_vectors, dtype=np.float32)
         q = _normalize(q)
-        scores, idxs = self.index.search(q, k=max(1, limit))
-        results: list[SearchResultData] = []
-        for score, idx in zip(scores[0].tolist(), idxs[0].tolist(), strict=False):
-            if idx < 0 or idx >= len(self._rows):
-                continue
-            if threshold is not None and score < threshold:
-                continue
-            row = self._rows[idx]
+        # Over-fetch so tombstoned rows can be dropped without losing results
+        k = min(self.index.ntotal, max(1, limit) + len(self._deleted))
+        scores, idxs = self.index.search(q, k=k)
+        all_hits: list[list[tuple[int, float]]] = []
+        for row_scores, row_idxs in zip(scores.tolist(), idxs.tolist(), strict=True):
+            hits: list[tuple[int, float]] = []
+            for score, idx in zip(row_scores, row_idxs, strict=False):
+                if idx < 0 or idx >= len(self._ids) or idx in self._deleted:
+                    continue
+                if threshold is not None and score < threshold:
+                    continue
+                hits.append((idx, float(score)))
+                if len(hits) >= limit:
+                    break
+            all_hits.append(hits)
+        # One pass over the records file for the whole batch
+        records = self._segments.read_records([row for hits in all_hits for row, _ in hits])
+        results: list[list[SearchResultData]] = []
+        offset = 0
+        for hits in all_hits:
+            batch_records = records[offset : offset + len(hits)]
+            offset += len(hits)
             results.append(
-                SearchResultData(
-                    chunk=ChunkData(
-                        id=row["chunk_id"],
-                        text=row.get("text", ""),
-                        document_id=row.get("document_id", ""),
-                        embedding=None,
-                        metadata=row.get("metadata", {}),
-                        score=float(score),
-                    ),
-                    score=float(score),
-                )
+                [
+                    SearchResultData(chunk=self._chunk_for_row(row, record, score), score=score)
+                    for (row, score), record in zip(hits, batch_records, strict=True)
+                ]
             )
         return results
 
@@ -194,41 +250,46 @@ class FaissVectorStore(VectorStore):
         row_idx = self._row_by_chunk_id.get(chunk_id)
         if row_idx is None:
             return None
-        row = self._rows[row_idx]
-        return ChunkData(
-            id=row["chunk_id"],
-            text=row.get("text", ""),
-            document_id=row.get("document_id", ""),
-            embedding=None,
-            metadata=row.get("metadata", {}),
-            score=0.0,
-        )
+        record = self._segments.read_records([row_idx])[0]
+        return self._chunk_for_row(row_idx, record, 0.0)
 
     async def delete_chunks(self, chunk_ids: list[str]) -> None:  # type: ignore[override]
-        # Rebuild by filtering rows and re-adding remaining embeddings.
         if not chunk_ids:
             return
-        to_delete = set(chunk_ids)
-        keep_rows = [r for r in self._rows if r.get("chunk_id") not in to_delete]
-        self._rows = keep_rows
-        self._row_by_chunk_id = {r["chunk_id"]: i for i, r in enumerate(self._rows)}
-
-        # Rebuild FAISS index from persisted embeddings
-        self._rebuild_from_rows()
-        self._save()
+        rows = [
+            row
+            for row in (self._row_by_chunk_id.pop(cid, None) for cid in set(chunk_ids))
+            if row is not None
+        ]
+        if not rows:
+            return
+        self._segments.delete_rows(rows)
+        self._deleted.update(rows)
+        if len(self._deleted) > self.compaction_ratio * len(self._ids):
+            self._compact()
 
     async def delete_store(self) -> None:  # type: ignore[override]
         if self.index_path.exists():
             self.index_path.unlink()
         if self.meta_path.exists():
             self.meta_path.unlink()
+        self._segments.destroy()
+        self._segments = ChunkSegmentLog(self.base_path, self.embedding_dimension)
         self.index = _get_faiss().IndexFlatIP(self.embedding_dimension)
-        self._rows = []
+        self._ids = []
+        self._deleted = set()
         self._row_by_chunk_id = {}
 
+    async def get_vector_store_size(self) -> int:
+        return len(self._row_by_chunk_id)
+
     # --- Convenience methods for API compatibility ---
     async def search(
-        self, query_text: str, top_k: int = 5, search_type: str = "vector"
+        self,
+        query_text: str,
+        top_k: int = 5,
+        search_type: str = "vector",
+        query_vector: list[float] | None = None,
     ) -> list[SearchResultData]:
         """
         Convenience method that matches SimpleVectorStore's interface.
@@ -239,6 +300,7 @@ class FaissVectorStore(VectorStore):
             query_text: The search query text
             top_k: Number of results to return
             search_type: Search type (only "vector" is supported)
+            query_vector: Optional precomputed query embedding; skips embedding
 
         Returns:
             List of SearchResultData objects
@@ -247,13 +309,20 @@ class FaissVectorStore(VectorStore):
             logger.warning(f"FaissVectorStore only supports vector search, got: {search_type}")
             return []
 
+        if query_vector is not None:
+            return await self.search_similar_chunks(
+                query_vector=query_vector, limit=top_k, threshold=None
+            )
+
         if not self.embedding_service:
             logger.error("No embedding service available for text-to-vector conversion")
             return []
 
         try:
             # Generate embedding for the query text
-            query_embedding = await self.embedding_service.generate_embedding(query_text)
+            query_embedding = await get_query_embedding_cache().get_or_embed(
+                self.embedding_service, query_text, self.embedding_service.generate_embedding
+            )
             if not query_embedding:
                 logger.error(f"Failed to generate embedding for query: '{query_text}'")
                 return []
@@ -272,14 +341,14 @@ class FaissVectorStore(VectorStore):
     async def stats(self) -> dict[str, Any]:
         """Return basic statistics about the FAISS store."""
         return {
-            "vectors": int(self.index.ntotal),
-            "rows": int(len(self._rows)),
+            "vectors": int(len(self._row_by_chunk_id)),
+            "rows": int(len(self._ids)),
+            "deleted_rows": int(len(self._deleted)),
             "dimension": int(self.embedding_dimension),
-            "index_path": str(self.index_path),
-            "meta_path": str(self.meta_path),
+            "segment_generation": int(self._segments.generation),
+            "manifest_path": str(self._segments.manifest_path),
         }
 
     async def rebuild_index(self) -> None:
-        """Force a rebuild of the FAISS index from persisted embeddings."""
-        self._rebuild_from_rows()
-        self._save()
+        """Compact segments and rebuild the FAISS index from persisted embeddings."""
+        self._compact()
@@ -26,6 +26,7 @@ import faiss  # type: ignore
 import numpy as np
 
 from graph_rag.core.interfaces import ChunkData, EmbeddingService, SearchResultData, VectorStore
+from graph_rag.core.query_embedding_cache import get_query_embedding_cache
 
 logger = logging.getLogger(__name__)
 
@@ -598,24 +599,27 @@ class OptimizedFaissVectorStore(VectorStore):
         self,
         query_text: str,
         top_k: int = 5,
-        search_type: str = "vector"
+        search_type: str = "vector",
+        query_vector: list[float] | None = None,
     ) -> list[SearchResultData]:
-        """Text-based search with embedding generation."""
+        """Text-based search with embedding generation (skipped if query_vector is given)."""
         if search_type.lower() != "vector":
             logger.warning(f"Only vector search supported, got: {search_type}")
             return []
 
+        if query_vector is not None:
+            return await self.search_similar_chunks(
+                query_vector=query_vector, limit=top_k, threshold=None
+            )
+
         if not self.embedding_service:
             logger.error("No embedding service available")
             return []
 
         try:
-            # Generate embedding
-            if hasattr(self.embedding_service, "encode_query"):
-                query_embedding = await self.embedding_service.encode_query(query_text)
-            else:
-                embeddings = await self.embedding_service.encode([query_text])
-                query_embedding = embeddings[0] if embeddings else None
+            query_embedding = await get_query_embedding_cache().get_or_embed(
+                self.embedding_service, query_text, self._compute_query_embedding
+            )
 
             if not query_embedding:
                 logger.error(f"Failed to generate embedding for: '{query_text}'")
@@ -631,6 +635,12 @@ class OptimizedFaissVectorStore(VectorStore):
             logger.error(f"Search error for '{query_text}': {e}", exc_info=True)
             return []
 
+    async def _compute_query_embedding(self, query_text: str) -> list[float] | None:
+        if hasattr(self.embedding_service, "encode_query"):
+            return await self.embedding_service.encode_query(query_text)
+        embeddings = await self.embedding_service.encode([query_text])
+        return embeddings[0] if embeddings else None
+
     async def stats(self) -> dict[str, Any]:
         """Get detailed performance statistics."""
         stats = {
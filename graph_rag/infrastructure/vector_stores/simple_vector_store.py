@@ -1,23 +1,10 @@
 import asyncio
 import logging
-import os
 from typing import Any
 
 import numpy as np
 from starlette.concurrency import run_in_threadpool
 
-# Use lightweight implementation in hot coverage mode to avoid scipy import issues
-if os.getenv("SKIP_SPACY_IMPORT") == "1":
-    def cosine_similarity(X, Y=None):
-        """Lightweight cosine similarity implementation using only numpy."""
-        if Y is None:
-            Y = X
-        X_norm = X / np.linalg.norm(X, axis=1, keepdims=True)
-        Y_norm = Y / np.linalg.norm(Y, axis=1, keepdims=True)
-        return np.dot(X_norm, Y_norm.T)
-else:
-    from sklearn.metrics.pairwise import cosine_similarity
-
 # Corrected import path for ChunkData and VectorStore protocol
 from graph_rag.core.interfaces import (
     ChunkData,
@@ -25,6 +12,8 @@ from graph_rag.core.interfaces import (
     SearchResultData,
     VectorStore,
 )
+from graph_rag.core.query_embedding_cache import get_query_embedding_cache
+from graph_rag.infrastructure.vector_stores.bm25_index import BM25Index
 
 # We still need Chunk model for internal representation maybe? Let's keep it for now
 # Or maybe ChunkData is enough. Review if Chunk is actually used.
@@ -32,22 +21,47 @@ from graph_rag.core.interfaces import (
 logger = logging.getLogger(__name__)
 
 
+# Initial row capacity of the embedding matrix; grows by doubling.
+_INITIAL_CAPACITY = 1024
+# Deleted rows are only tombstoned; the matrix is compacted once they exceed
+# this fraction of its rows.
+_COMPACTION_RATIO = 0.25
+
+
 class SimpleVectorStore(VectorStore):
-    """A simple in-memory vector store implementation."""
+    """A simple in-memory vector store implementation.
+
+    Embeddings live in a single preallocated float32 matrix whose rows are
+    L2-normalized on ingest, so a query is one matrix-vector product followed
+    by an O(N) ``argpartition`` top-k selection. The matrix grows by doubling.
+    Deletes tombstone rows in an alive mask that searches filter on; the dead
+    rows are compacted away in one pass once they pass ``_COMPACTION_RATIO``
+    of the matrix, so deleting is amortized O(1) per row.
+    """
 
     def __init__(self, embedding_service: EmbeddingService):
         self.embedding_service = embedding_service
         self.dimension = embedding_service.get_embedding_dimension()
-        self.vectors: list[np.ndarray] = []
+        # Row i of _matrix[:_size] is the unit-length embedding of chunk_ids[i];
+        # _norms[i] keeps the original length so raw embeddings can be returned.
+        # Rows with _alive[i] False are deleted and wait for compaction.
+        self._matrix = np.zeros((0, self.dimension), dtype=np.float32)
+        self._norms = np.zeros(0, dtype=np.float32)
+        self._alive = np.zeros(0, dtype=bool)
+        self._size = 0
+        self._dead = 0
         self.metadata: list[dict] = []
         self.documents: list[str] = []  # Store original document text
         self.chunk_ids: list[str] = []  # Store chunk IDs for retrieval by ID
+        # First live row of each chunk ID, plus any later live rows reusing the ID
+        self._id_to_row: dict[str, int] = {}
+        self._duplicate_rows: dict[str, list[int]] = {}
         self.lock = asyncio.Lock()
-        # --- BM25 structures ---
-        self._bm25_docs: list[list[str]] = []
-        self._bm25_doc_freq: dict[str, int] = {}
-        self._bm25_avgdl: float = 0.0
-        self._bm25_dirty: bool = False
+        # Inverted BM25 index keyed by chunk ID, maintained on ingest/delete.
+        # It has its own lock so keyword and vector searches can overlap;
+        # writers take self.lock first, then _bm25_lock.
+        self._bm25 = BM25Index()
+        self._bm25_lock = asyncio.Lock()
 
     async def add_chunks(self, chunks: list[ChunkData]) -> None:
         """
@@ -80,66 +94,54 @@ class SimpleVectorStore(VectorStore):
         logger.debug(
             f"Searching for similar chunks with vector (dim={len(query_vector)})"
         )
-        if not self.vectors:
+        if self._live_count == 0:
             logger.warning("Vector store is empty, cannot perform search.")
             return []
 
-        query_embedding = np.array(query_vector).reshape(1, -1)
-        if query_embedding.shape[1] != self.dimension:
+        query_embedding = np.asarray(query_vector, dtype=np.float32).reshape(-1)
+        if query_embedding.shape[0] != self.dimension:
             logger.error(
-                f"Query embedding dimension mismatch: Expected {self.dimension}, got {query_embedding.shape[1]}"
+                f"Query embedding dimension mismatch: Expected {self.dimension}, got {query_embedding.shape[0]}"
             )
             return []
 
         async with self.lock:
-            if not self.vectors:  # Re-check after acquiring lock
-                return []
+            top = self._top_k(query_embedding, limit, threshold)
+            results = [
+                SearchResultData(chunk=self._chunk_at(i, score), score=score)
+                for i, score in top
+            ]
 
-            # Calculate cosine similarities
-            vector_matrix = np.array(self.vectors)
-            if vector_matrix.size == 0:
-                return []  # Handle empty store explicitly
-            if vector_matrix.ndim == 1:
-                vector_matrix = vector_matrix.reshape(1, -1)
-            elif vector_matrix.ndim != 2:
-                logger.error(
-                    f"Unexpected vector matrix dimensions: {vector_matrix.ndim}"
-                )
-                return []
+        logger.debug(f"Vector similarity search returned {len(results)} results.")
+        return results
 
-            similarities = cosine_similarity(query_embedding, vector_matrix)[0]
+    async def batch_search_similar_chunks(
+        self,
+        query_vectors: list[list[float]],
+        limit: int = 10,
+        threshold: float | None = None,
+    ) -> list[list[SearchResultData]]:
+        """Searches many query vectors with one matrix-matrix product.
 
-            # Apply threshold if specified
-            if threshold is not None:
-                # Create mask of indices where similarity >= threshold
-                mask = similarities >= threshold
-                # Get indices that meet threshold
-                indices = np.where(mask)[0]
-                # Sort these indices by similarity (descending)
-                top_indices = indices[np.argsort(similarities[indices])[::-1]]
-                # Limit results
-                top_indices = top_indices[:limit]
-            else:
-                # No threshold, just get top k results
-                actual_limit = min(limit, len(similarities))
-                if actual_limit <= 0:
-                    return []
-                top_indices = np.argsort(similarities)[-actual_limit:][::-1]
-
-            results = []
-            for i in top_indices:
-                score = float(similarities[i])
-                chunk_data = ChunkData(
-                    id=self.chunk_ids[i] if i < len(self.chunk_ids) else f"chunk_{i}",
-                    text=self.documents[i],
-                    document_id=self.metadata[i].get("document_id", "unknown"),
-                    metadata=self.metadata[i],
-                    score=score,
-                )
-                search_result = SearchResultData(chunk=chunk_data, score=score)
-                results.append(search_result)
+        Returns one result list per query, in query order.
+        """
+        if self._live_count == 0 or not query_vectors:
+            return [[] for _ in query_vectors]
 
-        logger.debug(f"Vector similarity search returned {len(results)} results.")
+        queries = np.asarray(query_vectors, dtype=np.float32)
+        if queries.ndim != 2 or queries.shape[1] != self.dimension:
+            logger.error(
+                f"Query embedding dimension mismatch: Expected {self.dimension}, got {queries.shape[-1]}"
+            )
+            return [[] for _ in query_vectors]
+
+        async with self.lock:
+            results = [
+                [SearchResultData(chunk=self._chunk_at(i, score), score=score) for i, score in top]
+                for top in self._top_k_many(queries, limit, threshold)
+            ]
+
+        logger.debug(f"Batched similarity search over {len(results)} queries.")
         return results
 
     async def get_chunk_by_id(self, chunk_id: str) -> ChunkData | None:
@@ -155,20 +157,19 @@ class SimpleVectorStore(VectorStore):
         """
         logger.debug(f"Looking for chunk with ID: {chunk_id}")
         async with self.lock:
+            index = self._id_to_row.get(chunk_id)
+            if index is None:
+                logger.debug(f"Chunk with ID {chunk_id} not found")
+                return None
             try:
-                index = self.chunk_ids.index(chunk_id)
+                embedding = self._matrix[index] * self._norms[index]
                 return ChunkData(
                     id=chunk_id,
                     text=self.documents[index],
                     document_id=self.metadata[index].get("document_id", "unknown"),
                     metadata=self.metadata[index],
-                    embedding=self.vectors[index].tolist()
-                    if index < len(self.vectors)
-                    else None,
+                    embedding=embedding.tolist(),
                 )
-            except ValueError:
-                logger.debug(f"Chunk with ID {chunk_id} not found")
-                return None
             except Exception as e:
                 logger.error(f"Error retrieving chunk {chunk_id}: {e}")
                 return None
@@ -188,28 +189,20 @@ class SimpleVectorStore(VectorStore):
         async with self.lock:
             indices_to_remove = []
             for chunk_id in chunk_ids:
-                try:
-                    index = self.chunk_ids.index(chunk_id)
-                    indices_to_remove.append(index)
-                except ValueError:
+                index = self._id_to_row.get(chunk_id)
+                if index is None:
                     logger.debug(f"Chunk with ID {chunk_id} not found for deletion")
+                    continue
+                indices_to_remove.append(index)
 
-            # Sort indices in descending order to avoid index shifting when removing
-            indices_to_remove.sort(reverse=True)
-
-            # Remove from all lists
-            for index in indices_to_remove:
-                if index < len(self.chunk_ids):
-                    self.chunk_ids.pop(index)
-                if index < len(self.vectors):
-                    self.vectors.pop(index)
-                if index < len(self.metadata):
-                    self.metadata.pop(index)
-                if index < len(self.documents):
-                    self.documents.pop(index)
-                if index < len(self._bm25_docs):
-                    self._bm25_docs.pop(index)
-                    self._bm25_dirty = True
+            if indices_to_remove:
+                self._tombstone(indices_to_remove)
+                async with self._bm25_lock:
+                    for chunk_id in chunk_ids:
+                        if self._bm25.remove(chunk_id):
+                            row = self._id_to_row.get(chunk_id)
+                            if row is not None:  # a duplicate row for this ID survives
+                                self._bm25.add(chunk_id, self.documents[row])
 
             logger.info(f"Removed {len(indices_to_remove)} chunks from vector store")
 
@@ -222,7 +215,11 @@ class SimpleVectorStore(VectorStore):
         await self.clear_vector_store()
 
     async def search(
-        self, query_text: str, top_k: int = 5, search_type: str = "vector"
+        self,
+        query_text: str,
+        top_k: int = 5,
+        search_type: str = "vector",
+        query_vector: list[float] | None = None,
     ) -> list[SearchResultData]:
         """
         Performs a search based on the query text and search type.
@@ -231,6 +228,8 @@ class SimpleVectorStore(VectorStore):
             query_text: The search query text
             top_k: Number of results to return
             search_type: Either "vector" or "keyword" to determine search method (default: vector)
+            query_vector: Optional precomputed embedding of query_text; when given the
+                vector path does not call the embedding service at all
 
         Returns:
             List of SearchResultData objects containing chunks and their scores.
@@ -244,22 +243,14 @@ class SimpleVectorStore(VectorStore):
             # Keyword search implementation might need adjustment if it doesn't return scores
             results_with_scores = await self.keyword_search(query_text, k=top_k)
         else:  # Default to vector search
-            # Generate embedding (compat across providers)
-            if hasattr(self.embedding_service, "encode_query"):
-                query_embedding = await self.embedding_service.encode_query(query_text)
-            else:
-                query_embedding = await self.embedding_service.generate_embedding(
-                    query_text
-                )
-            if query_embedding:
-                # Vector search now directly returns List[SearchResultData]
-                # We need to call the specific vector search method which returns List[tuple[ChunkData, float]]
-                # Let's assume self.vector_search returns List[tuple[ChunkData, float]]
-                results_with_scores = await self.vector_search(query_text, k=top_k)
-                # results_with_scores = await self.search_similar_chunks(query_embedding, limit=top_k)
-            else:
+            if query_vector is None:
+                query_vector = await self._embed_query(query_text)
+            if query_vector is None or len(query_vector) == 0:
                 logger.error(f"Failed to generate embedding for query: '{query_text}'")
                 return []
+            results_with_scores = await self.vector_search(
+                query_text, k=top_k, query_vector=query_vector
+            )
 
         # Convert (ChunkData, score) tuples to SearchResultData objects
         search_results = [
@@ -368,86 +359,64 @@ class SimpleVectorStore(VectorStore):
 
         # Update the store under lock
         if final_vectors:  # Proceed only if there's something to add
-            async with self.lock:
-                self.vectors.extend(final_vectors)
-                self.metadata.extend(final_metadata)
-                self.documents.extend(final_documents)
-                self.chunk_ids.extend(final_chunk_ids)
+            await self._store_rows(
+                np.vstack(final_vectors),
+                final_metadata,
+                final_documents,
+                final_chunk_ids,
+            )
             logger.info(
-                f"Finished ingestion. Added {len(final_vectors)} vectors. Total vectors in store: {len(self.vectors)}"
+                f"Finished ingestion. Added {len(final_vectors)} vectors. Total vectors in store: {self._live_count}"
             )
         else:
             logger.warning(
                 "No valid chunks or embeddings found to add after processing."
             )
 
+    async def _store_rows(
+        self,
+        vectors: np.ndarray,
+        metadata: list[dict],
+        documents: list[str],
+        chunk_ids: list[str],
+    ) -> None:
+        """Adds embedded rows to the matrix and keyword index (persistent stores also write them out)."""
+        async with self.lock:
+            indexed = self._append_rows(vectors, metadata, documents, chunk_ids)
+            async with self._bm25_lock:
+                self._bm25.add_many(indexed)
+
     async def vector_search(
-        self, query: str, k: int = 5
+        self, query: str, k: int = 5, query_vector: list[float] | None = None
     ) -> list[tuple[ChunkData, float]]:
-        """Performs vector search using cosine similarity."""
+        """Performs vector search using cosine similarity.
+
+        If ``query_vector`` is given it is used as the query embedding and
+        ``query`` is only used for logging.
+        """
         logger.debug(f"Performing vector search for query: '{query[:50]}...'")
-        if not self.vectors:
+        if self._live_count == 0:
             logger.warning("Vector store is empty, cannot perform search.")
             return []
 
-        # Get query embedding
-        if asyncio.iscoroutinefunction(self.embedding_service.encode):
-            query_embedding_list = await self.embedding_service.encode([query])
-        else:
-            query_embedding_list = await run_in_threadpool(
-                self.embedding_service.encode, [query]
-            )
-
-        if not query_embedding_list or query_embedding_list[0] is None:
+        if query_vector is None:
+            query_vector = await self._embed_query(query)
+        if query_vector is None or len(query_vector) == 0:
             logger.error("Failed to generate embedding for the query.")
             return []
 
-        query_embedding = np.array(query_embedding_list[0]).reshape(1, -1)
-        if query_embedding.shape[1] != self.dimension:
+        query_embedding = np.asarray(query_vector, dtype=np.float32).reshape(-1)
+        if query_embedding.shape[0] != self.dimension:
             logger.error(
-                f"Query embedding dimension mismatch: Expected {self.dimension}, got {query_embedding.shape[1]}"
+                f"Query embedding dimension mismatch: Expected {self.dimension}, got {query_embedding.shape[0]}"
             )
             return []
 
         async with self.lock:
-            if not self.vectors:  # Re-check after acquiring lock
-                return []
-            # Calculate cosine similarities
-            # Ensure vectors is a 2D array
-            vector_matrix = np.array(self.vectors)
-            if vector_matrix.size == 0:
-                return []  # Handle empty store explicitly
-            if vector_matrix.ndim == 1:
-                vector_matrix = vector_matrix.reshape(1, -1)
-            elif vector_matrix.ndim != 2:
-                logger.error(
-                    f"Unexpected vector matrix dimensions: {vector_matrix.ndim}"
-                )
-                return []
-
-            similarities = cosine_similarity(query_embedding, vector_matrix)[0]
-
-            # Get top k results
-            # Ensure k is not greater than the number of vectors
-            actual_k = min(k, len(similarities))
-            if actual_k <= 0:
-                return []
-
-            top_k_indices = np.argsort(similarities)[-actual_k:][::-1]
-
-            results = []
-            for i in top_k_indices:
-                score = similarities[i]
-                # Reconstruct ChunkData (or similar object)
-                # Assuming metadata contains necessary info like document_id, chunk_id
-                chunk_data = ChunkData(
-                    id=self.chunk_ids[i] if i < len(self.chunk_ids) else f"chunk_{i}",
-                    text=self.documents[i],
-                    document_id=self.metadata[i].get("document_id", "unknown"),
-                    metadata=self.metadata[i],
-                    score=float(score),
-                )
-                results.append((chunk_data, float(score)))  # Ensure score is float
+            results = [
+                (self._chunk_at(i, score), score)
+                for i, score in self._top_k(query_embedding, k)
+            ]
 
         logger.debug(f"Vector search returned {len(results)} results.")
         return results
@@ -457,53 +426,16 @@ class SimpleVectorStore(VectorStore):
     ) -> list[tuple[ChunkData, float]]:
         """Performs BM25 keyword search (lowercase tokenization)."""
         logger.debug(f"Performing BM25 keyword search for query: '{query[:50]}...'")
-        tokens = self._tokenize(query)
-        results: list[tuple[int, float]] = []
+        # Score off the event loop so a concurrent vector search can proceed
+        async with self._bm25_lock:
+            hits = await run_in_threadpool(self._bm25.search, query, k)
         async with self.lock:
-            self._ensure_bm25_index()
-            N = max(1, len(self._bm25_docs))
-            # Okapi BM25 params
-            k1 = 1.5
-            b = 0.75
-            for i, doc_tokens in enumerate(self._bm25_docs):
-                if not doc_tokens:
-                    continue
-                score = 0.0
-                dl = len(doc_tokens)
-                # term frequencies for this doc
-                tf: dict[str, int] = {}
-                for t in doc_tokens:
-                    tf[t] = tf.get(t, 0) + 1
-                for q in tokens:
-                    df = self._bm25_doc_freq.get(q, 0)
-                    if df == 0:
-                        continue
-                    idf = max(0.0, ( (N - df + 0.5) / (df + 0.5) ))
-                    # Use log on idf-like ratio to stabilize
-                    import math as _math
-
-                    idf = _math.log(1.0 + idf)
-                    f = tf.get(q, 0)
-                    if f == 0:
-                        continue
-                    denom = f + k1 * (1.0 - b + b * (dl / (self._bm25_avgdl or 1.0)))
-                    score += idf * ((f * (k1 + 1.0)) / denom)
-                if score > 0.0:
-                    results.append((i, float(score)))
-
-            # Sort and take top-k
-            results.sort(key=lambda t: t[1], reverse=True)
-            top = results[: min(k, len(results))]
-            out: list[tuple[ChunkData, float]] = []
-            for i, s in top:
-                chunk_data = ChunkData(
-                    id=self.chunk_ids[i] if i < len(self.chunk_ids) else f"chunk_{i}",
-                    text=self.documents[i],
-                    document_id=self.metadata[i].get("document_id", "unknown"),
-                    metadata=self.metadata[i],
-                    score=s,
-                )
-                out.append((chunk_data, s))
+            # Chunks deleted since scoring are skipped
+            out = [
+                (self._chunk_at(self._id_to_row[chunk_id], score), score)
+                for chunk_id, score in hits
+                if chunk_id in self._id_to_row
+            ]
 
         logger.debug(f"BM25 keyword search returned {len(out)} results.")
         return out
@@ -511,59 +443,237 @@ class SimpleVectorStore(VectorStore):
     async def get_vector_store_size(self) -> int:
         """Returns the number of vectors in the store."""
         async with self.lock:
-            return len(self.vectors)
+            return self._live_count
 
     async def clear_vector_store(self):
         """Clears all data from the vector store."""
         async with self.lock:
-            self.vectors = []
-            self.metadata = []
-            self.documents = []
-            self.chunk_ids = []
-            self._bm25_docs = []
-            self._bm25_doc_freq = {}
-            self._bm25_avgdl = 0.0
-            self._bm25_dirty = False
+            self._reset_rows()
+            async with self._bm25_lock:
+                self._bm25.clear()
         logger.info("SimpleVectorStore cleared.")
 
-    # --- BM25 helpers ---
-    def _tokenize(self, text: str) -> list[str]:
-        # Simple whitespace + lowercase; strip punctuation crudely
-        import re as _re
+    async def _embed_query(self, query: str) -> list[float] | None:
+        """Embeds a query through the shared query-embedding cache."""
+        return await get_query_embedding_cache().get_or_embed(
+            self.embedding_service, query, self._compute_query_embedding
+        )
 
-        text = (text or "").lower()
-        tokens = _re.findall(r"[a-z0-9]+", text)
-        return tokens
+    async def _compute_query_embedding(self, query: str) -> list[float] | None:
+        """Embeds a single query text (compat across providers)."""
+        if hasattr(self.embedding_service, "encode_query"):
+            return await self.embedding_service.encode_query(query)
+        if hasattr(self.embedding_service, "generate_embedding"):
+            return await self.embedding_service.generate_embedding(query)
+        if asyncio.iscoroutinefunction(self.embedding_service.encode):
+            embeddings = await self.embedding_service.encode([query])
+        else:
+            embeddings = await run_in_threadpool(self.embedding_service.encode, [query])
+        return embeddings[0] if embeddings else None
+
+    # --- Matrix helpers ---
+    @property
+    def _live_count(self) -> int:
+        return self._size - self._dead
+
+    def _reset_rows(self) -> None:
+        self._matrix = np.zeros((0, self.dimension), dtype=np.float32)
+        self._norms = np.zeros(0, dtype=np.float32)
+        self._alive = np.zeros(0, dtype=bool)
+        self._size = 0
+        self._dead = 0
+        self.metadata = []
+        self.documents = []
+        self.chunk_ids = []
+        self._id_to_row = {}
+        self._duplicate_rows = {}
+
+    def _append_rows(
+        self,
+        vectors: np.ndarray,
+        metadata: list[dict],
+        documents: list[str],
+        chunk_ids: list[str],
+    ) -> list[tuple[str, str]]:
+        """Normalizes and appends rows, doubling the matrix capacity as needed.
+
+        Returns the (chunk_id, text) pairs that still need keyword indexing.
+        """
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(-1, self.dimension)
+        count = vectors.shape[0]
+        needed = self._size + count
+        if needed > self._matrix.shape[0]:
+            capacity = max(_INITIAL_CAPACITY, self._matrix.shape[0])
+            while capacity < needed:
+                capacity *= 2
+            matrix = np.zeros((capacity, self.dimension), dtype=np.float32)
+            matrix[: self._size] = self._matrix[: self._size]
+            norms = np.zeros(capacity, dtype=np.float32)
+            norms[: self._size] = self._norms[: self._size]
+            alive = np.zeros(capacity, dtype=bool)
+            alive[: self._size] = self._alive[: self._size]
+            self._matrix, self._norms, self._alive = matrix, norms, alive
+
+        norms = np.linalg.norm(vectors, axis=1)
+        safe = np.where(norms > 0.0, norms, 1.0)
+        self._matrix[self._size : needed] = vectors / safe[:, None]
+        self._norms[self._size : needed] = norms
+        self._alive[self._size : needed] = True
+
+        to_index = []
+        for offset, chunk_id in enumerate(chunk_ids):
+            # Keep the first occurrence, matching list.index() semantics
+            row = self._size + offset
+            if self._id_to_row.setdefault(chunk_id, row) == row:
+                to_index.append((chunk_id, documents[offset]))
+            else:
+                self._duplicate_rows.setdefault(chunk_id, []).append(row)
+        self.metadata.extend(metadata)
+        self.documents.extend(documents)
+        self.chunk_ids.extend(chunk_ids)
+        self._size = needed
+        return to_index
+
+    def _tombstone(self, rows: list[int]) -> None:
+        """Marks rows deleted, compacting once too many rows are dead."""
+        for row in rows:
+            if not self._alive[row]:
+                continue
+            self._alive[row] = False
+            self._dead += 1
+            chunk_id = self.chunk_ids[row]
+            spare = self._duplicate_rows.get(chunk_id)
+            if self._id_to_row.get(chunk_id) == row:
+                if spare:
+                    self._id_to_row[chunk_id] = spare.pop(0)
+                else:
+                    del self._id_to_row[chunk_id]
+            elif spare:
+                spare.remove(row)
+            if spare is not None and not spare:
+                del self._duplicate_rows[chunk_id]
+
+        if self._dead > _COMPACTION_RATIO * self._size:
+            self._compact_dead_rows()
+
+    def _compact_dead_rows(self) -> None:
+        if self._dead:
+            self._compact(np.flatnonzero(self._alive[: self._size]))
+
+    def _compact(self, keep: np.ndarray) -> None:
+        """Keeps only the given row indices (ascending), closing any gaps."""
+        count = len(keep)
+        self._matrix[:count] = self._matrix[keep]
+        self._norms[:count] = self._norms[keep]
+        self._matrix[count : self._size] = 0.0
+        self._norms[count : self._size] = 0.0
+        self._alive[:count] = True
+        self._alive[count : self._size] = False
+        self.metadata = [self.metadata[i] for i in keep]
+        self.documents = [self.documents[i] for i in keep]
+        self.chunk_ids = [self.chunk_ids[i] for i in keep]
+        self._size = count
+        self._dead = 0
+
+        # Release memory once the store has shrunk well below its capacity
+        capacity = self._matrix.shape[0]
+        if capacity > _INITIAL_CAPACITY and count < capacity // 4:
+            capacity = max(_INITIAL_CAPACITY, capacity // 2)
+            self._matrix = self._matrix[:capacity].copy()
+            self._norms = self._norms[:capacity].copy()
+            self._alive = self._alive[:capacity].copy()
+
+        self._id_to_row = {}
+        self._duplicate_rows = {}
+        for row, chunk_id in enumerate(self.chunk_ids):
+            if self._id_to_row.setdefault(chunk_id, row) != row:
+                self._duplicate_rows.setdefault(chunk_id, []).append(row)
+
+    def _mask_dead(self, similarities: np.ndarray) -> np.ndarray:
+        """Scores tombstoned rows (the last axis) below any real similarity."""
+        if self._dead:
+            similarities[..., ~self._alive[: self._size]] = -np.inf
+        return similarities
+
+    def _top_k(
+        self, query_embedding: np.ndarray, k: int, threshold: float | None = None
+    ) -> list[tuple[int, float]]:
+        """Returns (row, cosine similarity) pairs for the best k rows, best first."""
+        if self._live_count == 0 or k <= 0:
+            return []
+        norm = float(np.linalg.norm(query_embedding))
+        if norm == 0.0:
+            similarities = np.zeros(self._size, dtype=np.float32)
+        else:
+            similarities = self._matrix[: self._size] @ (query_embedding / norm)
+        similarities = self._mask_dead(similarities)
 
-    def _ensure_bm25_index(self) -> None:
-        if not self._bm25_dirty and self._bm25_docs and self._bm25_doc_freq:
-            return
-        # Rebuild doc list and stats from self.documents
-        self._bm25_docs = [self._tokenize(t) for t in self.documents]
-        df: dict[str, int] = {}
-        total_len = 0
-        for doc in self._bm25_docs:
-            total_len += len(doc)
-            seen: set[str] = set()
-            for tok in doc:
-                if tok in seen:
-                    continue
-                df[tok] = df.get(tok, 0) + 1
-                seen.add(tok)
-        self._bm25_doc_freq = df
-        self._bm25_avgdl = (total_len / max(1, len(self._bm25_docs))) if self._bm25_docs else 0.0
-        self._bm25_dirty = False
+        candidates = None
+        if threshold is not None:
+            candidates = np.flatnonzero(similarities >= threshold)
+            scores = similarities[candidates]
+        else:
+            scores = similarities
+        if scores.size == 0:
+            return []
+
+        k = min(k, scores.size, self._live_count)
+        if k < scores.size:
+            top = np.argpartition(scores, -k)[-k:]
+        else:
+            top = np.arange(scores.size)
+        top = top[np.argsort(scores[top])[::-1]]
+        rows = candidates[top] if candidates is not None else top
+        return [(int(i), float(similarities[i])) for i in rows]
+
+    def _top_k_many(
+        self, queries: np.ndarray, k: int, threshold: float | None = None
+    ) -> list[list[tuple[int, float]]]:
+        """``_top_k`` for a ``(m, dimension)`` query matrix, scored in one product."""
+        if self._live_count == 0 or k <= 0:
+            return [[] for _ in range(len(queries))]
+        norms = np.linalg.norm(queries, axis=1, keepdims=True)
+        norms[norms == 0.0] = 1.0
+        similarities = self._mask_dead((queries / norms) @ self._matrix[: self._size].T)
+
+        k = min(k, self._live_count)
+        if k < self._size:
+            top = np.argpartition(similarities, -k, axis=1)[:, -k:]
+        else:
+            top = np.broadcast_to(np.arange(self._size), (len(queries), self._size))
+        top_scores = np.take_along_axis(similarities, top, axis=1)
+        order = np.argsort(-top_scores, axis=1, kind="stable")
+        top = np.take_along_axis(top, order, axis=1)
+        top_scores = np.take_along_axis(top_scores, order, axis=1)
+
+        out = []
+        for rows, scores in zip(top.tolist(), top_scores.tolist(), strict=True):
+            if threshold is not None:
+                out.append([(i, s) for i, s in zip(rows, scores, strict=True) if s >= threshold])
+            else:
+                out.append(list(zip(rows, scores, strict=True)))
+        return out
+
+    def _chunk_at(self, i: int, score: float) -> ChunkData:
+        return ChunkData(
+            id=self.chunk_ids[i],
+            text=self.documents[i],
+            document_id=self.metadata[i].get("document_id", "unknown"),
+            metadata=self.metadata[i],
+            score=score,
+        )
 
     async def stats(self) -> dict[str, Any]:
         """
         Returns implementation-specific statistics such as vector count.
         Implementation of the VectorStore protocol method.
         """
+        live = np.flatnonzero(self._alive[: self._size])
         return {
-            "vector_count": len(self.vectors),
-            "chunk_count": len(self.chunk_ids),
-            "document_count": len(set(self.documents)),
+            "vector_count": self._live_count,
+            "chunk_count": self._live_count,
+            "document_count": len({self.documents[i] for i in live}),
             "embedding_dimension": self.dimension,
-            "bm25_index_built": not self._bm25_dirty,
-            "bm25_vocabulary_size": len(self._bm25_doc_freq),
+            "bm25_index_built": True,
+            "bm25_vocabulary_size": self._bm25.vocabulary_size,
         }
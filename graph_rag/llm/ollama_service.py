@@ -1,5 +1,7 @@
 """Ollama local LLM service implementation."""
 
+import asyncio
+import hashlib
 import json
 import logging
 from collections.abc import AsyncGenerator
@@ -21,7 +23,9 @@ class OllamaService(LLMService):
         model: str = "llama3.2:3b",
         timeout: float = 120.0,
         temperature: float = 0.3,
-        max_tokens: int | None = None
+        max_tokens: int | None = None,
+        max_connections: int = 16,
+        embed_batch_size: int = 64,
     ):
         """Initialize Ollama service.
 
@@ -31,18 +35,78 @@ class OllamaService(LLMService):
             timeout: Request timeout in seconds
             temperature: Sampling temperature (0.0 to 1.0)
             max_tokens: Maximum tokens in response (None for unlimited)
+            max_connections: Size of the keep-alive connection pool
+            embed_batch_size: Inputs sent per request by embed_texts
         """
         self.base_url = base_url.rstrip("/")
         self.model = model
         self.timeout = timeout
         self.temperature = temperature
         self.max_tokens = max_tokens
+        self.max_connections = max_connections
+        self.embed_batch_size = max(1, embed_batch_size)
+
+        # One pooled session per event loop, created on first use
+        self._session: aiohttp.ClientSession | None = None
+        self._session_loop: asyncio.AbstractEventLoop | None = None
 
         # Track token usage (estimated)
         self._token_usage = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
 
         logger.info(f"Ollama service initialized with model {model} at {base_url}")
 
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared keep-alive session, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            await self._retire_session()
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=self.max_connections,
+                keepalive_timeout=60,
+                ttl_dns_cache=300,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={"Content-Type": "application/json"},
+            )
+            self._session_loop = loop
+        return self._session
+
+    async def _retire_session(self) -> None:
+        """Close a session created on another event loop before replacing it."""
+        session, loop = self._session, self._session_loop
+        self._session = None
+        self._session_loop = None
+        if session is None or session.closed:
+            return
+        if loop is not None and not loop.is_closed():
+            # Its loop is still alive (e.g. in another thread); close it there
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+        else:
+            # Transports died with the loop; this just releases the connector
+            await session.close()
+
+    async def close(self) -> None:
+        """Close the shared HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+
+    async def __aenter__(self) -> "OllamaService":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    @staticmethod
+    def _hash_embedding(text: str) -> list[float]:
+        """Deterministic stand-in embedding used when Ollama cannot embed."""
+        hash_val = int(hashlib.sha256(text.encode("utf-8")).hexdigest(), 16)
+        return [(hash_val + i) % 1000 / 1000.0 for i in range(768)]
+
     def _estimate_tokens(self, text: str) -> int:
         """Rough token estimation (1 token ≈ 4 characters)."""
         return len(text) // 4
@@ -99,33 +163,29 @@ class OllamaService(LLMService):
 
             logger.debug(f"Sending request to Ollama model {self.model}")
 
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout)) as session:
-                async with session.post(
-                    f"{self.base_url}/api/generate",
-                    json=payload,
-                    headers={"Content-Type": "application/json"}
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        raise Exception(f"Ollama API error {response.status}: {error_text}")
+            session = await self._get_session()
+            async with session.post(f"{self.base_url}/api/generate", json=payload) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    raise Exception(f"Ollama API error {response.status}: {error_text}")
 
-                    result = await response.json()
+                result = await response.json()
 
-                    content = result.get("response", "")
-                    if not content:
-                        logger.warning("Ollama returned empty response")
-                        return "I apologize, but I couldn't generate a response. Please try again."
+                content = result.get("response", "")
+                if not content:
+                    logger.warning("Ollama returned empty response")
+                    return "I apologize, but I couldn't generate a response. Please try again."
 
-                    # Update token usage estimates
-                    prompt_tokens = self._estimate_tokens(formatted_prompt)
-                    completion_tokens = self._estimate_tokens(content)
+                # Update token usage estimates
+                prompt_tokens = self._estimate_tokens(formatted_prompt)
+                completion_tokens = self._estimate_tokens(content)
 
-                    self._token_usage["prompt_tokens"] += prompt_tokens
-                    self._token_usage["completion_tokens"] += completion_tokens
-                    self._token_usage["total_tokens"] += prompt_tokens + completion_tokens
+                self._token_usage["prompt_tokens"] += prompt_tokens
+                self._token_usage["completion_tokens"] += completion_tokens
+                self._token_usage["total_tokens"] += prompt_tokens + completion_tokens
 
-                    logger.debug(f"Ollama response generated successfully ({len(content)} chars)")
-                    return content.strip()
+                logger.debug(f"Ollama response generated successfully ({len(content)} chars)")
+                return content.strip()
 
         except Exception as e:
             logger.error(f"Error generating Ollama response: {e}")
@@ -155,32 +215,28 @@ class OllamaService(LLMService):
 
             logger.debug(f"Starting streaming request to Ollama model {self.model}")
 
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout)) as session:
-                async with session.post(
-                    f"{self.base_url}/api/generate",
-                    json=payload,
-                    headers={"Content-Type": "application/json"}
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        yield f"\n[Error: Ollama API error {response.status}: {error_text}]"
-                        return
-
-                    async for line in response.content:
-                        if line:
-                            try:
-                                chunk_data = json.loads(line.decode('utf-8'))
-                                if "response" in chunk_data:
-                                    text_chunk = chunk_data["response"]
-                                    if text_chunk:
-                                        yield text_chunk
-
-                                # Check if this is the final chunk
-                                if chunk_data.get("done", False):
-                                    break
-
-                            except json.JSONDecodeError:
-                                continue  # Skip malformed lines
+            session = await self._get_session()
+            async with session.post(f"{self.base_url}/api/generate", json=payload) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    yield f"\n[Error: Ollama API error {response.status}: {error_text}]"
+                    return
+
+                async for line in response.content:
+                    if line:
+                        try:
+                            chunk_data = json.loads(line.decode('utf-8'))
+                            if "response" in chunk_data:
+                                text_chunk = chunk_data["response"]
+                                if text_chunk:
+                                    yield text_chunk
+
+                            # Check if this is the final chunk
+                            if chunk_data.get("done", False):
+                                break
+
+                        except json.JSONDecodeError:
+                            continue  # Skip malformed lines
 
             logger.debug("Ollama streaming response completed")
 
@@ -251,36 +307,62 @@ Respond with only the JSON, no additional text:"""
                 "prompt": text
             }
 
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout)) as session:
-                async with session.post(
-                    f"{self.base_url}/api/embeddings",
-                    json=payload,
-                    headers={"Content-Type": "application/json"}
-                ) as response:
-                    if response.status != 200:
-                        # Fallback to hash-based embedding if embeddings not supported
-                        logger.warning("Ollama embeddings not available, using hash fallback")
-                        import hashlib
-                        hash_val = int(hashlib.sha256(text.encode("utf-8")).hexdigest(), 16)
-                        embedding = [(hash_val + i) % 1000 / 1000.0 for i in range(768)]
-                        return embedding
+            session = await self._get_session()
+            async with session.post(f"{self.base_url}/api/embeddings", json=payload) as response:
+                if response.status != 200:
+                    # Fallback to hash-based embedding if embeddings not supported
+                    logger.warning("Ollama embeddings not available, using hash fallback")
+                    return self._hash_embedding(text)
 
-                    result = await response.json()
-                    embedding = result.get("embedding", [])
+                result = await response.json()
+                embedding = result.get("embedding", [])
 
-                    if embedding:
-                        logger.debug(f"Generated Ollama embedding with {len(embedding)} dimensions")
-                        return embedding
-                    else:
-                        logger.warning("Ollama returned empty embedding")
-                        return []
+                if embedding:
+                    logger.debug(f"Generated Ollama embedding with {len(embedding)} dimensions")
+                    return embedding
+                else:
+                    logger.warning("Ollama returned empty embedding")
+                    return []
 
         except Exception as e:
             logger.error(f"Error generating Ollama embedding: {e}")
             # Return hash-based fallback
-            import hashlib
-            hash_val = int(hashlib.sha256(text.encode("utf-8")).hexdigest(), 16)
-            return [(hash_val + i) % 1000 / 1000.0 for i in range(768)]
+            return self._hash_embedding(text)
+
+    async def embed_texts(self, texts: list[str]) -> list[list[float]]:
+        """Embed many texts, sending up to ``embed_batch_size`` inputs per request.
+
+        Uses Ollama's batch ``/api/embed`` endpoint; batches are sent
+        concurrently over the pooled session. Servers without that endpoint
+        fall back to one ``embed_text`` call per input.
+        """
+        if not texts:
+            return []
+        batches = [
+            texts[i:i + self.embed_batch_size]
+            for i in range(0, len(texts), self.embed_batch_size)
+        ]
+        results = await asyncio.gather(*(self._embed_batch(batch) for batch in batches))
+        return [embedding for batch in results for embedding in batch]
+
+    async def _embed_batch(self, texts: list[str]) -> list[list[float]]:
+        try:
+            session = await self._get_session()
+            async with session.post(
+                f"{self.base_url}/api/embed", json={"model": self.model, "input": texts}
+            ) as response:
+                if response.status == 200:
+                    embeddings = (await response.json()).get("embeddings", [])
+                    if len(embeddings) == len(texts):
+                        return embeddings
+                    logger.warning(
+                        f"Ollama returned {len(embeddings)} embeddings for {len(texts)} inputs"
+                    )
+                else:
+                    logger.debug(f"Ollama batch embeddings unavailable (status {response.status})")
+        except Exception as e:
+            logger.warning(f"Ollama batch embedding failed, embedding one by one: {e}")
+        return list(await asyncio.gather(*(self.embed_text(text) for text in texts)))
 
     async def get_token_usage(self) -> dict[str, int]:
         """Get current token usage statistics (estimated)."""
@@ -293,23 +375,27 @@ Respond with only the JSON, no additional text:"""
     async def health_check(self) -> bool:
         """Check if Ollama server is accessible."""
         try:
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=5.0)) as session:
-                async with session.get(f"{self.base_url}/api/tags") as response:
-                    return response.status == 200
+            session = await self._get_session()
+            async with session.get(
+                f"{self.base_url}/api/tags", timeout=aiohttp.ClientTimeout(total=5.0)
+            ) as response:
+                return response.status == 200
         except Exception:
             return False
 
     async def list_models(self) -> list[str]:
         """List available models in Ollama."""
         try:
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10.0)) as session:
-                async with session.get(f"{self.base_url}/api/tags") as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        models = [model["name"] for model in result.get("models", [])]
-                        return models
-                    else:
-                        return []
+            session = await self._get_session()
+            async with session.get(
+                f"{self.base_url}/api/tags", timeout=aiohttp.ClientTimeout(total=10.0)
+            ) as response:
+                if response.status == 200:
+                    result = await response.json()
+                    models = [model["name"] for model in result.get("models", [])]
+                    return models
+                else:
+                    return []
         except Exception as e:
             logger.error(f"Error listing Ollama models: {e}")
             return []
@@ -19,6 +19,8 @@ class Chunk:
     embedding: list[float] | None = None
     created_at: datetime | None = None
     updated_at: datetime | None = None
+    # Node-level properties such as the content fingerprint (see domain.models.Node)
+    properties: dict[str, Any] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
         # Normalize text/content so both are populated consistently
@@ -0,0 +1,141 @@
+"""Fixed-memory streaming latency histograms.
+
+``LatencyHistogram`` buckets values on a logarithmic scale, so every quantile
+it reports is within ``relative_accuracy`` of a true sample value, however
+many values were recorded. Bucket ``i`` covers ``(gamma**(i-1), gamma**i]``
+with ``gamma = (1 + a) / (1 - a)``; values are clamped to
+``[min_value, max_value]``, which bounds the number of buckets.
+
+Histograms with the same accuracy merge by adding bucket counts, so
+per-worker snapshots (``snapshot()``) can be combined into one view with
+``merge`` or ``LatencyHistogram.from_snapshot``.
+"""
+
+import math
+import threading
+from typing import Any
+
+DEFAULT_RELATIVE_ACCURACY = 0.01
+DEFAULT_QUANTILES = (0.5, 0.9, 0.95, 0.99)
+
+
+class LatencyHistogram:
+    """Mergeable log-bucketed histogram with bounded relative error."""
+
+    def __init__(
+        self,
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+        min_value: float = 1e-6,
+        max_value: float = 1e7,
+    ):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        if not 0 < min_value < max_value:
+            raise ValueError("min_value must be positive and below max_value")
+        self.relative_accuracy = relative_accuracy
+        self.min_value = min_value
+        self.max_value = max_value
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._buckets: dict[int, int] = {}
+        self._zero_count = 0  # values <= 0
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self._lock = threading.Lock()
+
+    def _bucket(self, value: float) -> int:
+        value = min(max(value, self.min_value), self.max_value)
+        return math.ceil(math.log(value) / self._log_gamma)
+
+    def _bucket_value(self, index: int) -> float:
+        # Midpoint (in relative terms) of (gamma**(i-1), gamma**i]
+        return 2 * self._gamma**index / (self._gamma + 1)
+
+    def record(self, value: float) -> None:
+        """Adds one observation."""
+        with self._lock:
+            if value > 0:
+                index = self._bucket(value)
+                self._buckets[index] = self._buckets.get(index, 0) + 1
+            else:
+                self._zero_count += 1
+            self.count += 1
+            self.total += value
+            self.min = min(self.min, value)
+            self.max = max(self.max, value)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float | None:
+        """Returns the value at quantile ``q`` (0..1), or None when empty."""
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        with self._lock:
+            if self.count == 0:
+                return None
+            rank = q * (self.count - 1)
+            seen = self._zero_count
+            if rank < seen:
+                return self.min
+            for index in sorted(self._buckets):
+                seen += self._buckets[index]
+                if rank < seen:
+                    return min(max(self._bucket_value(index), self.min), self.max)
+            return self.max
+
+    def percentiles(self, quantiles: tuple[float, ...] = DEFAULT_QUANTILES) -> dict[str, float | None]:
+        """Maps ``p50``-style names to quantile values."""
+        return {f"p{q * 100:g}": self.quantile(q) for q in quantiles}
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Adds another histogram's observations into this one."""
+        if not math.isclose(other.relative_accuracy, self.relative_accuracy):
+            raise ValueError("Cannot merge histograms with different relative accuracy")
+        with other._lock:
+            buckets = dict(other._buckets)
+            zero_count, count, total = other._zero_count, other.count, other.total
+            low, high = other.min, other.max
+        with self._lock:
+            for index, n in buckets.items():
+                self._buckets[index] = self._buckets.get(index, 0) + n
+            self._zero_count += zero_count
+            self.count += count
+            self.total += total
+            self.min = min(self.min, low)
+            self.max = max(self.max, high)
+
+    def snapshot(self) -> dict[str, Any]:
+        """JSON-serializable state that can be merged in another process."""
+        with self._lock:
+            return {
+                "relative_accuracy": self.relative_accuracy,
+                "min_value": self.min_value,
+                "max_value": self.max_value,
+                "count": self.count,
+                "total": self.total,
+                "min": self.min if self.count else None,
+                "max": self.max if self.count else None,
+                "zero_count": self._zero_count,
+                "buckets": {str(index): n for index, n in self._buckets.items()},
+            }
+
+    @classmethod
+    def from_snapshot(cls, snapshot: dict[str, Any]) -> "LatencyHistogram":
+        """Rebuilds a histogram from ``snapshot()`` output."""
+        histogram = cls(
+            relative_accuracy=snapshot["relative_accuracy"],
+            min_value=snapshot["min_value"],
+            max_value=snapshot["max_value"],
+        )
+        histogram._buckets = {int(index): n for index, n in snapshot["buckets"].items()}
+        histogram._zero_count = snapshot["zero_count"]
+        histogram.count = snapshot["count"]
+        histogram.total = snapshot["total"]
+        if histogram.count:
+            histogram.min = snapshot["min"]
+            histogram.max = snapshot["max"]
+        return histogram
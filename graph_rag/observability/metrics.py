@@ -230,6 +230,47 @@ class MetricsCollector:
                 metric_type=MetricType.GAUGE,
                 unit="percentage"
             ),
+            MetricDefinition(
+                name="cache_requests_total",
+                description="Cache lookups by result (hit or miss)",
+                metric_type=MetricType.COUNTER,
+                labels=["cache", "result"]
+            ),
+            MetricDefinition(
+                name="cache_evictions_total",
+                description="Cache entries removed by capacity eviction or expiry",
+                metric_type=MetricType.COUNTER,
+                labels=["cache", "reason"]
+            ),
+            MetricDefinition(
+                name="cache_entries",
+                description="Number of entries held by a cache",
+                metric_type=MetricType.GAUGE,
+                labels=["cache"],
+                unit="entries"
+            ),
+            MetricDefinition(
+                name="cache_size_bytes",
+                description="Approximate memory held by cache values",
+                metric_type=MetricType.GAUGE,
+                labels=["cache"],
+                unit="bytes"
+            ),
+            MetricDefinition(
+                name="connection_pool_connections",
+                description="Database connections held by a pool, by state (idle or in_use)",
+                metric_type=MetricType.GAUGE,
+                labels=["pool", "state"],
+                unit="connections"
+            ),
+            MetricDefinition(
+                name="connection_pool_wait_seconds",
+                description="Time spent waiting to check out a pooled connection",
+                metric_type=MetricType.HISTOGRAM,
+                labels=["pool"],
+                buckets=[0.0001, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0],
+                unit="seconds"
+            ),
         ]
 
         for metric_def in core_metrics:
@@ -435,6 +476,36 @@ class MetricsCollector:
             rate = document_count / duration
             self._performance_metrics["ingestion_rate"].append(rate)
 
+    def record_cache_access(self, cache: str, hit: bool):
+        """Record a cache lookup result."""
+        self.increment_counter(
+            "cache_requests_total",
+            labels={"cache": cache, "result": "hit" if hit else "miss"}
+        )
+
+    def record_cache_eviction(self, cache: str, reason: str, count: int = 1):
+        """Record entries removed from a cache ('capacity' or 'expired')."""
+        self.increment_counter(
+            "cache_evictions_total",
+            labels={"cache": cache, "reason": reason},
+            amount=count
+        )
+
+    def update_cache_size(self, cache: str, entries: int, size_bytes: int):
+        """Record the current entry count and approximate byte size of a cache."""
+        self.set_gauge("cache_entries", entries, labels={"cache": cache})
+        self.set_gauge("cache_size_bytes", size_bytes, labels={"cache": cache})
+
+    def record_pool_checkout(self, pool: str, wait_seconds: float, in_use: int, idle: int):
+        """Record a connection pool checkout and the pool's current occupancy."""
+        self.observe_histogram("connection_pool_wait_seconds", wait_seconds, labels={"pool": pool})
+        self.update_pool_size(pool, in_use, idle)
+
+    def update_pool_size(self, pool: str, in_use: int, idle: int):
+        """Record how many pooled connections are in use and idle."""
+        self.set_gauge("connection_pool_connections", in_use, labels={"pool": pool, "state": "in_use"})
+        self.set_gauge("connection_pool_connections", idle, labels={"pool": pool, "state": "idle"})
+
     def update_system_metrics(self):
         """Update system-level metrics."""
         current_time = time.time()
@@ -709,3 +780,33 @@ def record_ingestion(document_count: int, success: bool, duration: float):
     """Record document ingestion metrics."""
     if _global_metrics:
         _global_metrics.record_ingestion(document_count, success, duration)
+
+
+def record_cache_access(cache: str, hit: bool):
+    """Record a cache lookup result."""
+    if _global_metrics:
+        _global_metrics.record_cache_access(cache, hit)
+
+
+def record_cache_eviction(cache: str, reason: str, count: int = 1):
+    """Record entries removed from a cache."""
+    if _global_metrics:
+        _global_metrics.record_cache_eviction(cache, reason, count)
+
+
+def update_cache_size(cache: str, entries: int, size_bytes: int):
+    """Record the current size of a cache."""
+    if _global_metrics:
+        _global_metrics.update_cache_size(cache, entries, size_bytes)
+
+
+def record_pool_checkout(pool: str, wait_seconds: float, in_use: int, idle: int):
+    """Record a connection pool checkout."""
+    if _global_metrics:
+        _global_metrics.record_pool_checkout(pool, wait_seconds, in_use, idle)
+
+
+def update_pool_size(pool: str, in_use: int, idle: int):
+    """Record the current occupancy of a connection pool."""
+    if _global_metrics:
+        _global_metrics.update_pool_size(pool, in_use, idle)
@@ -1,15 +1,18 @@
 """Incremental batch processing service for large document collections."""
 
 import asyncio
+import copy
 import logging
 import time
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable
+from contextlib import aclosing
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from pydantic import BaseModel
 
+from graph_rag.services.embedding_batching import BatchingEmbeddingService
 from graph_rag.services.ingestion import IngestionService
 
 logger = logging.getLogger(__name__)
@@ -22,6 +25,13 @@ class BatchConfig:
     max_retries: int = 3
     retry_delay: float = 1.0
     progress_callback: Callable[[int, int, int, int], None] | None = None
+    # Pipeline stages: reader threads -> concurrent ingest workers -> results
+    read_workers: int = 4
+    ingest_workers: int = 4
+    queue_size: int = 64  # files read ahead of the ingest workers
+    embedding_batch_size: int = 256  # texts per shared cross-file embedding call
+    embedding_batch_window_ms: float = 20.0
+    skip_unchanged: bool = True  # skip documents whose fingerprints match the stored version
 
 
 class BatchProgress(BaseModel):
@@ -43,6 +53,7 @@ class FileProcessingResult(BaseModel):
     success: bool
     document_id: str | None = None
     chunk_count: int = 0
+    skipped: bool = False  # Content unchanged since the last ingestion
     error: str | None = None
     processing_time: float = 0.0
 
@@ -87,7 +98,9 @@ class IncrementalIngestion:
     Service for processing large document collections in manageable batches.
 
     Provides progress tracking, error handling, and recovery capabilities
-    for sustainable processing of thousands of documents.
+    for sustainable processing of thousands of documents. Files are read and
+    ingested concurrently (see ``BatchConfig`` worker settings); batches only
+    group results for progress reporting.
     """
 
     def __init__(
@@ -144,53 +157,67 @@ class IncrementalIngestion:
         total_failed = 0
         failed_file_paths: list[str] = []
 
-        # Process each batch
-        for batch_num, batch_files in enumerate(batches, 1):
-            logger.info(f"Processing batch {batch_num}/{total_batches} ({len(batch_files)} files)")
+        # All files flow through one pipeline; batches are reported in order as they finish
+        collected: list[list[FileProcessingResult | None]] = [
+            [None] * len(batch_files) for batch_files in batches
+        ]
+        remaining = [len(batch_files) for batch_files in batches]
+        next_batch = 0
+        last_batch_done = self._start_time
 
-            batch_start_time = time.monotonic()
-
-            # Process files in the current batch
-            batch_result = await self._process_batch(
-                batch_files=batch_files,
-                batch_number=batch_num,
-                enable_embeddings=enable_embeddings,
-                replace_existing=replace_existing,
-                metadata_parser=metadata_parser,
-            )
+        pipeline = self._pipeline(
+            file_paths=file_paths,
+            enable_embeddings=enable_embeddings,
+            replace_existing=replace_existing,
+            metadata_parser=metadata_parser,
+        )
+        async with aclosing(pipeline):
+            async for index, file_result in pipeline:
+                batch_index, position = divmod(index, self.config.batch_size)
+                collected[batch_index][position] = file_result
+                remaining[batch_index] -= 1
+
+                while next_batch < total_batches and remaining[next_batch] == 0:
+                    batch_num = next_batch + 1
+                    batch_files = batches[next_batch]
+                    batch_result = self._build_batch_result(batch_num, collected[next_batch])
+                    now = time.monotonic()
+                    batch_result.processing_time = now - last_batch_done
+                    last_batch_done = now
+                    next_batch += 1
+                    logger.info(
+                        f"Completed batch {batch_num}/{total_batches} ({len(batch_files)} files)"
+                    )
 
-            batch_processing_time = time.monotonic() - batch_start_time
-            batch_result.processing_time = batch_processing_time
-
-            # Update totals
-            total_successful += batch_result.successful_files
-            total_failed += batch_result.failed_files
-            self._processed_count += len(batch_files)
-
-            # Collect failed file paths
-            failed_file_paths.extend([
-                result.file_path for result in batch_result.file_results
-                if not result.success
-            ])
-
-            batch_results.append(batch_result)
-
-            # Report progress
-            await self._report_progress(
-                batch_num=batch_num,
-                total_batches=total_batches,
-                processed_files=self._processed_count,
-                total_files=len(file_paths),
-                successful_files=total_successful,
-                failed_files=total_failed,
-            )
+                    # Update totals
+                    total_successful += batch_result.successful_files
+                    total_failed += batch_result.failed_files
+                    self._processed_count += len(batch_files)
+
+                    # Collect failed file paths
+                    failed_file_paths.extend([
+                        result.file_path for result in batch_result.file_results
+                        if not result.success
+                    ])
+
+                    batch_results.append(batch_result)
+
+                    # Report progress
+                    await self._report_progress(
+                        batch_num=batch_num,
+                        total_batches=total_batches,
+                        processed_files=self._processed_count,
+                        total_files=len(file_paths),
+                        successful_files=total_successful,
+                        failed_files=total_failed,
+                    )
 
-            # Validate batch before continuing
-            if not self._validate_batch_result(batch_result):
-                logger.warning(f"Batch {batch_num} validation failed, but continuing")
+                    # Validate batch before continuing
+                    if not self._validate_batch_result(batch_result):
+                        logger.warning(f"Batch {batch_num} validation failed, but continuing")
 
-            # Memory cleanup after each batch
-            await self._cleanup_batch_memory()
+                    # Memory cleanup after each batch
+                    await self._cleanup_batch_memory()
 
         total_processing_time = time.monotonic() - self._start_time
 
@@ -227,73 +254,187 @@ class IncrementalIngestion:
         metadata_parser: Callable[[Path], dict[str, Any]] | None = None,
     ) -> BatchResult:
         """Process a single batch of files."""
-        file_results: list[FileProcessingResult] = []
-        successful_count = 0
-        failed_count = 0
-
-        for file_path in batch_files:
-            result = await self._process_single_file(
-                file_path=file_path,
-                enable_embeddings=enable_embeddings,
-                replace_existing=replace_existing,
-                metadata_parser=metadata_parser,
-            )
+        file_results: list[FileProcessingResult | None] = [None] * len(batch_files)
+        pipeline = self._pipeline(
+            file_paths=batch_files,
+            enable_embeddings=enable_embeddings,
+            replace_existing=replace_existing,
+            metadata_parser=metadata_parser,
+        )
+        async with aclosing(pipeline):
+            async for index, result in pipeline:
+                file_results[index] = result
 
-            file_results.append(result)
+        return self._build_batch_result(batch_number, file_results)
 
+    def _build_batch_result(
+        self, batch_number: int, file_results: list[FileProcessingResult]
+    ) -> BatchResult:
+        successful_count = 0
+        failed_count = 0
+        for result in file_results:
             if result.success:
                 successful_count += 1
-                logger.debug(f"Successfully processed: {file_path}")
+                logger.debug(f"Successfully processed: {result.file_path}")
             else:
                 failed_count += 1
-                logger.warning(f"Failed to process: {file_path} - {result.error}")
+                logger.warning(f"Failed to process: {result.file_path} - {result.error}")
 
         return BatchResult(
             batch_number=batch_number,
-            total_files=len(batch_files),
+            total_files=len(file_results),
             successful_files=successful_count,
             failed_files=failed_count,
             file_results=file_results,
             processing_time=0.0,  # Will be set by caller
         )
 
+    def _pipeline_service(self, enable_embeddings: bool) -> IngestionService:
+        """Ingestion service for the ingest workers, sharing embedding calls across files."""
+        embedding_service = getattr(self.ingestion_service, "embedding_service", None)
+        if (
+            not enable_embeddings
+            or embedding_service is None
+            or self.config.ingest_workers < 2
+            or self.config.embedding_batch_size < 2
+        ):
+            return self.ingestion_service
+        service = copy.copy(self.ingestion_service)
+        service.embedding_service = BatchingEmbeddingService(
+            embedding_service,
+            max_batch_size=self.config.embedding_batch_size,
+            window_ms=self.config.embedding_batch_window_ms,
+        )
+        return service
+
+    async def _pipeline(
+        self,
+        file_paths: list[Path],
+        enable_embeddings: bool,
+        replace_existing: bool,
+        metadata_parser: Callable[[Path], dict[str, Any]] | None = None,
+    ) -> AsyncIterator[tuple[int, FileProcessingResult]]:
+        """
+        Yield ``(index, result)`` for each file as soon as it is ingested.
+
+        Reader tasks load files and derive document IDs in threads and feed a
+        bounded queue; ``ingest_workers`` tasks run ``ingest_document`` on
+        different files at once, so one file's chunking and NER overlap with
+        another's embedding and graph writes, and concurrent embedding calls
+        are merged into cross-file batches.
+        """
+        service = self._pipeline_service(enable_embeddings)
+        loaded: asyncio.Queue = asyncio.Queue(maxsize=max(1, self.config.queue_size))
+        results: asyncio.Queue = asyncio.Queue()
+        pending = iter(enumerate(file_paths))
+
+        async def read_worker() -> None:
+            for index, file_path in pending:
+                start_time = time.monotonic()
+                try:
+                    document = await asyncio.to_thread(self._load_file, file_path, metadata_parser)
+                except Exception as e:
+                    # Retried (and reported) by the ingest worker
+                    logger.debug(f"Failed to read {file_path}: {e}")
+                    document = None
+                await loaded.put((index, file_path, document, start_time))
+
+        async def ingest_worker() -> None:
+            while True:
+                index, file_path, document, start_time = await loaded.get()
+                try:
+                    result = await self._process_single_file(
+                        file_path=file_path,
+                        enable_embeddings=enable_embeddings,
+                        replace_existing=replace_existing,
+                        metadata_parser=metadata_parser,
+                        loaded=document,
+                        start_time=start_time,
+                        ingestion_service=service,
+                    )
+                except Exception as e:
+                    result = FileProcessingResult(
+                        file_path=str(file_path),
+                        success=False,
+                        error=str(e),
+                        processing_time=time.monotonic() - start_time,
+                    )
+                await results.put((index, result))
+
+        tasks = [
+            asyncio.create_task(read_worker())
+            for _ in range(max(1, min(self.config.read_workers, len(file_paths))))
+        ] + [
+            asyncio.create_task(ingest_worker())
+            for _ in range(max(1, min(self.config.ingest_workers, len(file_paths))))
+        ]
+        try:
+            for _ in range(len(file_paths)):
+                yield await results.get()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    @staticmethod
+    def _load_file(
+        file_path: Path,
+        metadata_parser: Callable[[Path], dict[str, Any]] | None = None,
+    ) -> tuple[str, str, dict[str, Any]]:
+        """Read a file and derive its document ID; returns (document_id, content, metadata)."""
+        from graph_rag.utils.identity import derive_document_id
+
+        # Extract metadata if parser provided
+        metadata = {}
+        if metadata_parser:
+            try:
+                metadata = metadata_parser(file_path)
+            except Exception as e:
+                logger.warning(f"Failed to parse metadata for {file_path}: {e}")
+
+        # Read file content
+        content = file_path.read_text(encoding='utf-8')
+
+        # Derive document ID
+        document_id, id_source, _ = derive_document_id(file_path, content, metadata)
+
+        # Add id_source to metadata
+        metadata["id_source"] = id_source
+        return document_id, content, metadata
+
     async def _process_single_file(
         self,
         file_path: Path,
         enable_embeddings: bool,
         replace_existing: bool,
         metadata_parser: Callable[[Path], dict[str, Any]] | None = None,
+        loaded: tuple[str, str, dict[str, Any]] | None = None,
+        start_time: float | None = None,
+        ingestion_service: IngestionService | None = None,
     ) -> FileProcessingResult:
-        """Process a single file with retry logic."""
-        start_time = time.monotonic()
+        """Process a single file with retry logic.
+
+        ``loaded`` is the file as already read by the pipeline; it is re-read
+        on retries and when missing.
+        """
+        if start_time is None:
+            start_time = time.monotonic()
+        ingestion_service = ingestion_service or self.ingestion_service
 
         for attempt in range(self.config.max_retries):
             try:
-                # Extract metadata if parser provided
-                metadata = {}
-                if metadata_parser:
-                    try:
-                        metadata = metadata_parser(file_path)
-                    except Exception as e:
-                        logger.warning(f"Failed to parse metadata for {file_path}: {e}")
-
-                # Read file content
-                content = file_path.read_text(encoding='utf-8')
-
-                # Derive document ID
-                from graph_rag.utils.identity import derive_document_id
-                document_id, id_source, _ = derive_document_id(file_path, content, metadata)
-
-                # Add id_source to metadata
-                metadata["id_source"] = id_source
+                if loaded is None or attempt > 0:
+                    loaded = await asyncio.to_thread(self._load_file, file_path, metadata_parser)
+                document_id, content, metadata = loaded
 
                 # Ingest document
-                ingestion_result = await self.ingestion_service.ingest_document(
+                ingestion_result = await ingestion_service.ingest_document(
                     document_id=document_id,
                     content=content,
                     metadata=metadata,
                     generate_embeddings=enable_embeddings,
                     replace_existing=replace_existing,
+                    skip_unchanged=self.config.skip_unchanged,
                 )
 
                 processing_time = time.monotonic() - start_time
@@ -303,6 +444,7 @@ class IncrementalIngestion:
                     success=True,
                     document_id=document_id,
                     chunk_count=ingestion_result.num_chunks,
+                    skipped=getattr(ingestion_result, "skipped", False) is True,
                     processing_time=processing_time,
                 )
 
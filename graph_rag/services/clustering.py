@@ -10,6 +10,7 @@ import numpy as np
 from pydantic import BaseModel
 
 from graph_rag.core.interfaces import SearchResultData
+from graph_rag.services.diversify import jaccard_similarity_matrix
 
 logger = logging.getLogger(__name__)
 
@@ -51,15 +52,33 @@ class ClusterResult(BaseModel):
 class SemanticClusteringService:
     """Service for semantic clustering of search results."""
 
-    def __init__(self, min_cluster_size: int = 2, max_clusters: int = 10):
+    def __init__(
+        self,
+        min_cluster_size: int = 2,
+        max_clusters: int = 10,
+        random_state: int | None = 0,
+        max_iter: int = 100,
+        mini_batch_threshold: int = 1000,
+        batch_size: int = 256,
+    ):
         """Initialize clustering service.
 
         Args:
             min_cluster_size: Minimum number of items per cluster
             max_clusters: Maximum number of clusters to create
+            random_state: Seed for k-means++ initialization and mini-batch
+                sampling (None for non-deterministic runs)
+            max_iter: Maximum number of k-means iterations
+            mini_batch_threshold: Result count above which k-means updates
+                centroids from random mini-batches instead of the full set
+            batch_size: Mini-batch size for large result sets
         """
         self.min_cluster_size = min_cluster_size
         self.max_clusters = max_clusters
+        self.random_state = random_state
+        self.max_iter = max_iter
+        self.mini_batch_threshold = mini_batch_threshold
+        self.batch_size = batch_size
 
     def cluster_results(
         self,
@@ -114,33 +133,34 @@ class SemanticClusteringService:
         results: list[SearchResultData],
         threshold: float
     ) -> ClusterResult:
-        """Cluster based on similarity threshold."""
+        """Cluster based on similarity threshold.
+
+        Each unassigned result (in rank order) seeds a cluster with every
+        other unassigned result at least ``threshold`` similar to it. The
+        similarity matrix is computed once up front.
+        """
+        similarity = self._similarity_matrix(results)
+        available = np.ones(len(results), dtype=bool)
         clusters = []
-        used_indices = set()
+        unclustered: list[int] = []
 
-        for i, result in enumerate(results):
-            if i in used_indices:
+        for i in range(len(results)):
+            if not available[i]:
                 continue
+            available[i] = False
 
-            # Start new cluster with current result
-            cluster = [result]
-            used_indices.add(i)
+            # Start new cluster with current result plus all similar results
+            similar = np.flatnonzero(available & (similarity[i] >= threshold))
+            available[similar] = False
+            members = [i, *similar.tolist()]
 
-            # Find similar results
-            for j, other_result in enumerate(results):
-                if j in used_indices or i == j:
-                    continue
-
-                similarity = self._calculate_similarity(result, other_result)
-                if similarity >= threshold:
-                    cluster.append(other_result)
-                    used_indices.add(j)
-
-            if len(cluster) >= self.min_cluster_size:
-                clusters.append(cluster)
+            if len(members) >= self.min_cluster_size:
+                clusters.append([results[j] for j in members])
+            else:
+                unclustered.extend(members)
 
         # Handle remaining unclustered results
-        remaining = [results[i] for i in range(len(results)) if i not in used_indices]
+        remaining = [results[i] for i in sorted(unclustered)]
         if remaining:
             if len(remaining) >= self.min_cluster_size:
                 clusters.append(remaining)
@@ -170,7 +190,12 @@ class SemanticClusteringService:
         results: list[SearchResultData],
         k: int
     ) -> ClusterResult:
-        """Simple k-means clustering implementation."""
+        """Spherical k-means over normalized embeddings.
+
+        Uses k-means++ seeding and assigns points by the largest dot product
+        with the (unit-length) centroids. Above ``mini_batch_threshold``
+        results, centroids are updated from seeded random mini-batches.
+        """
         # Extract embeddings
         embeddings = []
         valid_results = []
@@ -191,30 +216,15 @@ class SemanticClusteringService:
             )
 
         try:
-            # Convert to numpy arrays
-            X = np.array(embeddings)
-
-            # Initialize centroids randomly
-            n_samples, n_features = X.shape
-            centroids = X[np.random.choice(n_samples, k, replace=False)]
-
-            # K-means iterations
-            max_iters = 100
-            tolerance = 1e-4
-
-            for _ in range(max_iters):
-                # Assign points to closest centroids
-                distances = np.sqrt(((X - centroids[:, np.newaxis])**2).sum(axis=2))
-                labels = np.argmin(distances, axis=0)
-
-                # Update centroids
-                new_centroids = np.array([X[labels == i].mean(axis=0) for i in range(k)])
-
-                # Check convergence
-                if np.allclose(centroids, new_centroids, atol=tolerance):
-                    break
+            X = self._normalize(np.asarray(embeddings, dtype=np.float32))
+            rng = np.random.default_rng(self.random_state)
+            centroids = self._kmeans_plus_plus(X, k, rng)
 
-                centroids = new_centroids
+            if len(X) > self.mini_batch_threshold:
+                centroids = self._mini_batch_kmeans(X, centroids, rng)
+            else:
+                centroids = self._full_batch_kmeans(X, centroids)
+            labels = np.argmax(X @ centroids.T, axis=1)
 
             # Group results by cluster
             clusters = [[] for _ in range(k)]
@@ -241,6 +251,74 @@ class SemanticClusteringService:
             logger.warning(f"K-means clustering failed: {e}, falling back to threshold clustering")
             return self._threshold_clustering(results, 0.7)
 
+    @staticmethod
+    def _normalize(X: np.ndarray) -> np.ndarray:
+        """Scale rows to unit length (zero rows stay zero)."""
+        norms = np.linalg.norm(X, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return X / norms
+
+    @staticmethod
+    def _kmeans_plus_plus(X: np.ndarray, k: int, rng: np.random.Generator) -> np.ndarray:
+        """k-means++ seeding: each new centroid is sampled proportionally to its
+        squared distance from the nearest centroid chosen so far."""
+        n_samples = X.shape[0]
+        sq_norms = np.einsum("ij,ij->i", X, X)
+        chosen = [int(rng.integers(n_samples))]
+        closest = np.maximum(sq_norms - 2 * X @ X[chosen[0]] + sq_norms[chosen[0]], 0.0)
+        for _ in range(1, k):
+            weights = closest.astype(np.float64)
+            total = weights.sum()
+            if total <= 0:
+                # Fewer distinct points than clusters; pick any unused point
+                unused = np.setdiff1d(np.arange(n_samples), chosen)
+                chosen.append(int(rng.choice(unused)))
+            else:
+                chosen.append(int(rng.choice(n_samples, p=weights / total)))
+            distances = np.maximum(sq_norms - 2 * X @ X[chosen[-1]] + sq_norms[chosen[-1]], 0.0)
+            np.minimum(closest, distances, out=closest)
+        return X[chosen].copy()
+
+    def _full_batch_kmeans(self, X: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+        k = centroids.shape[0]
+        labels = None
+        for _ in range(self.max_iter):
+            new_labels = np.argmax(X @ centroids.T, axis=1)
+            if labels is not None and np.array_equal(labels, new_labels):
+                break
+            labels = new_labels
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, X)
+            empty = np.bincount(labels, minlength=k) == 0
+            # Empty clusters keep their previous centroid
+            sums[empty] = centroids[empty]
+            centroids = self._normalize(sums)
+        return centroids
+
+    def _mini_batch_kmeans(
+        self, X: np.ndarray, centroids: np.ndarray, rng: np.random.Generator
+    ) -> np.ndarray:
+        k = centroids.shape[0]
+        counts = np.zeros(k)
+        batch_size = min(self.batch_size, X.shape[0])
+        for _ in range(self.max_iter):
+            batch = X[rng.choice(X.shape[0], batch_size, replace=False)]
+            labels = np.argmax(batch @ centroids.T, axis=1)
+            batch_counts = np.bincount(labels, minlength=k)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, batch)
+            updated = batch_counts > 0
+            counts[updated] += batch_counts[updated]
+            # Per-centroid learning rate 1/count, applied to the batch mean
+            rate = (batch_counts[updated] / counts[updated])[:, None]
+            batch_means = sums[updated] / batch_counts[updated][:, None]
+            previous = centroids.copy()
+            centroids[updated] = (1 - rate) * centroids[updated] + rate * batch_means
+            centroids = self._normalize(centroids)
+            if np.abs(centroids - previous).max() < 1e-4:
+                break
+        return centroids
+
     def _topic_based_clustering(self, results: list[SearchResultData]) -> ClusterResult:
         """Cluster based on topic keywords and document metadata."""
         topic_clusters = defaultdict(list)
@@ -283,6 +361,34 @@ class SemanticClusteringService:
             total_clusters=len(clusters)
         )
 
+    def _similarity_matrix(self, results: list[SearchResultData]) -> np.ndarray:
+        """Pairwise ``_calculate_similarity`` for all results at once.
+
+        Pairs where both results have embeddings of the same dimension use
+        cosine similarity (mismatched dimensions score 0); pairs involving a
+        result without an embedding use Jaccard similarity of the texts.
+        """
+        n = len(results)
+        similarity = np.zeros((n, n), dtype=np.float32)
+        has_embedding = np.array([bool(r.chunk.embedding) for r in results], dtype=bool)
+
+        by_dimension: dict[int, list[int]] = defaultdict(list)
+        for i, result in enumerate(results):
+            if has_embedding[i]:
+                by_dimension[len(result.chunk.embedding)].append(i)
+        for rows in by_dimension.values():
+            E = self._normalize(
+                np.asarray([results[i].chunk.embedding for i in rows], dtype=np.float32)
+            )
+            similarity[np.ix_(rows, rows)] = E @ E.T
+
+        text_pairs = ~(has_embedding[:, None] & has_embedding[None, :])
+        if text_pairs.any():
+            similarity = np.where(
+                text_pairs, jaccard_similarity_matrix([r.chunk.text for r in results]), similarity
+            )
+        return similarity
+
     def _calculate_similarity(
         self,
         result1: SearchResultData,
@@ -422,13 +528,10 @@ class SemanticClusteringService:
         if len(cluster) <= 1:
             return 0.0
 
-        similarities = []
-        for i in range(len(cluster)):
-            for j in range(i + 1, len(cluster)):
-                sim = self._calculate_similarity(cluster[i], cluster[j])
-                similarities.append(sim)
-
-        return sum(similarities) / len(similarities) if similarities else 0.0
+        # Average pairwise similarity over the upper triangle
+        similarity = self._similarity_matrix(cluster)
+        upper = np.triu_indices(len(cluster), k=1)
+        return float(similarity[upper].mean())
 
     def diversify_clusters(
         self,
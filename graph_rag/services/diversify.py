@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import logging
+import re
+
+import numpy as np
+
+from graph_rag.core.interfaces import SearchResultData
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r"\S+")
+
+
+def jaccard_similarity_matrix(texts: list[str | None]) -> np.ndarray:
+    """Pairwise Jaccard similarity of lowercased token sets, from one incidence product."""
+    vocabulary: dict[str, int] = {}
+    rows = [
+        [vocabulary.setdefault(t, len(vocabulary)) for t in set(_TOKEN_RE.findall(text.lower()))]
+        for text in (text or "" for text in texts)
+    ]
+    incidence = np.zeros((len(texts), max(1, len(vocabulary))), dtype=np.float32)
+    for i, columns in enumerate(rows):
+        incidence[i, columns] = 1.0
+    intersection = incidence @ incidence.T
+    sizes = incidence.sum(axis=1)
+    union = sizes[:, None] + sizes[None, :] - intersection
+    union[union == 0.0] = 1.0
+    return intersection / union
+
+
+class MMRDiversifier:
+    """Maximal Marginal Relevance selection over a retrieved candidate pool.
+
+    Pairwise similarity is computed once for the whole pool: cosine over the
+    chunk embeddings when every candidate has one of the same dimension,
+    otherwise Jaccard over lowercased token sets. Greedy selection then keeps
+    a running max-similarity-to-selected vector, so each pick costs one
+    vector update instead of a loop over candidate/selected pairs.
+
+    ``lambda_mult`` trades relevance (1.0) against diversity (0.0).
+    ``candidate_pool_size`` bounds how many of the incoming results (in rank
+    order) are considered; callers over-fetch to at least that many.
+    """
+
+    def __init__(self, lambda_mult: float = 0.5, candidate_pool_size: int | None = None):
+        if not 0.0 <= lambda_mult <= 1.0:
+            raise ValueError("lambda_mult must be between 0 and 1")
+        if candidate_pool_size is not None and candidate_pool_size < 1:
+            raise ValueError("candidate_pool_size must be positive")
+        self.lambda_mult = lambda_mult
+        self.candidate_pool_size = candidate_pool_size
+
+    @staticmethod
+    def _embedding_similarity(items: list[SearchResultData]) -> np.ndarray | None:
+        embeddings = [getattr(it.chunk, "embedding", None) for it in items]
+        if not all(embeddings):
+            return None
+        if len({len(e) for e in embeddings}) != 1:
+            return None
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0.0] = 1.0
+        matrix /= norms
+        return matrix @ matrix.T
+
+    def similarity_matrix(self, items: list[SearchResultData]) -> np.ndarray:
+        """Pairwise similarity of ``items`` (cosine if embedded, else Jaccard)."""
+        similarity = self._embedding_similarity(items)
+        if similarity is None:
+            similarity = jaccard_similarity_matrix([it.chunk.text for it in items])
+        return similarity
+
+    def select(self, relevance: np.ndarray, similarity: np.ndarray, k: int) -> list[int]:
+        """Greedy MMR over precomputed scores; returns picked row indices in order."""
+        n = len(relevance)
+        k = min(k, n)
+        if k <= 0:
+            return []
+        lam = self.lambda_mult
+        first = int(np.argmax(relevance))
+        picked = [first]
+        available = np.ones(n, dtype=bool)
+        available[first] = False
+        max_sim = similarity[first].astype(np.float64, copy=True)
+        weighted_relevance = lam * relevance
+        for _ in range(k - 1):
+            scores = weighted_relevance - (1.0 - lam) * max_sim
+            scores[~available] = -np.inf
+            best = int(np.argmax(scores))
+            picked.append(best)
+            available[best] = False
+            np.maximum(max_sim, similarity[best], out=max_sim)
+        return picked
+
+    def diversify(self, results: list[SearchResultData], k: int) -> list[SearchResultData]:
+        """Returns up to ``k`` results from the candidate pool in MMR order."""
+        pool = results[: self.candidate_pool_size] if self.candidate_pool_size else results
+        if len(pool) <= 2:
+            return pool[:k]
+        try:
+            relevance = np.array(
+                [r.score if r.score is not None else 0.0 for r in pool], dtype=np.float64
+            )
+            picked = self.select(relevance, self.similarity_matrix(pool), k)
+        except Exception as e:
+            logger.warning(f"MMR diversification failed, keeping input order: {e}")
+            return pool[:k]
+        return [pool[i] for i in picked]
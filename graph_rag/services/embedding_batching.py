@@ -0,0 +1,101 @@
+"""Coalesces concurrent ``encode`` calls into shared embedding batches."""
+
+import asyncio
+import logging
+from typing import Any
+
+from graph_rag.core.query_embedding_cache import encode_texts
+
+logger = logging.getLogger(__name__)
+
+
+class BatchingEmbeddingService:
+    """Wraps an embedding service so concurrent ``encode`` calls share model calls.
+
+    Calls that arrive within ``window_ms`` of each other are merged into one
+    ``encode`` on the wrapped service (flushed early once ``max_batch_size``
+    texts are pending) and the embeddings are split back per caller. All
+    other attributes are delegated, so the wrapper can stand in for the
+    service it wraps.
+    """
+
+    def __init__(self, service: Any, max_batch_size: int = 256, window_ms: float = 10.0):
+        self._service = service
+        self.max_batch_size = max(1, max_batch_size)
+        self.window_seconds = max(0.0, window_ms) / 1000.0
+        self._pending: list[tuple[list[str], asyncio.Future]] = []
+        self._pending_texts = 0
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+        self.batches = 0
+        self.requests = 0
+        self.texts = 0
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._service, name)
+
+    @property
+    def wrapped(self) -> Any:
+        return self._service
+
+    async def encode(self, texts: str | list[str]) -> list[float] | list[list[float]]:
+        """Encodes ``texts``, possibly in the same model call as other callers."""
+        single = isinstance(texts, str)
+        batch = [texts] if single else list(texts)
+        if not batch:
+            return []
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((batch, future))
+        self._pending_texts += len(batch)
+        if self._pending_texts >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.window_seconds, self._flush)
+        embeddings = await future
+        return embeddings[0] if single else embeddings
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending, self._pending, self._pending_texts = self._pending, [], 0
+        if not pending:
+            return
+        task = asyncio.get_running_loop().create_task(self._run_batch(pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, pending: list[tuple[list[str], asyncio.Future]]) -> None:
+        texts = [text for batch, _ in pending for text in batch]
+        try:
+            embeddings = await encode_texts(self._service, texts)
+            if len(embeddings) != len(texts):
+                raise ValueError(
+                    f"Embedding service returned {len(embeddings)} embeddings for {len(texts)} texts"
+                )
+        except Exception as e:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        self.batches += 1
+        self.requests += len(pending)
+        self.texts += len(texts)
+        logger.debug(f"Embedded {len(texts)} texts from {len(pending)} callers in one batch")
+        offset = 0
+        for batch, future in pending:
+            if not future.done():
+                future.set_result(list(embeddings[offset : offset + len(batch)]))
+            offset += len(batch)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "batches": self.batches,
+            "requests": self.requests,
+            "texts": self.texts,
+            "avg_texts_per_batch": self.texts / self.batches if self.batches else 0.0,
+            "max_batch_size": self.max_batch_size,
+            "window_ms": self.window_seconds * 1000.0,
+        }
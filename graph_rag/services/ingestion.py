@@ -3,6 +3,7 @@ import logging
 import re
 import time
 import uuid
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 from pydantic import BaseModel
@@ -33,6 +34,7 @@ from graph_rag.core.interfaces import (
     PDFAnalyzer as PDFAnalyzerProtocol,
 )
 from graph_rag.domain.models import Chunk, Document, Relationship
+from graph_rag.utils.identity import content_fingerprint, metadata_fingerprint
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +44,7 @@ class IngestionResult(BaseModel):
 
     document_id: str
     chunk_ids: list[str]
+    skipped: bool = False  # True when the stored version was already up to date
 
     @property
     def num_chunks(self) -> int:
@@ -62,6 +65,7 @@ class IngestionService:
         vector_store: VectorStore,
         image_processor: ImageProcessorProtocol | None = None,
         pdf_analyzer: PDFAnalyzerProtocol | None = None,
+        graph_write_batch_size: int = 500,
     ):
         """
         Initializes the IngestionService.
@@ -74,6 +78,8 @@ class IngestionService:
             vector_store: An instance of VectorStore for storing chunk vectors.
             image_processor: Optional ImageProcessor for OCR text extraction from images.
             pdf_analyzer: Optional PDFAnalyzer for extracting content from PDFs with images.
+            graph_write_batch_size: Rows per UNWIND statement when the graph store
+                supports bulk writes (``add_graph_batch``).
         """
         self.document_processor = document_processor
         self.entity_extractor = entity_extractor
@@ -82,6 +88,7 @@ class IngestionService:
         self.vector_store = vector_store
         self.image_processor = image_processor
         self.pdf_analyzer = pdf_analyzer
+        self.graph_write_batch_size = graph_write_batch_size
         vision_info = ""
         if self.image_processor:
             vision_info += f", image_processor: {type(image_processor).__name__}"
@@ -102,6 +109,8 @@ class IngestionService:
         max_tokens_per_chunk: int | None = None,
         generate_embeddings: bool = True,  # Add flag to control embedding generation
         replace_existing: bool = True,
+        skip_unchanged: bool = True,
+        on_progress: Callable[[str, float], Awaitable[None]] | None = None,
     ) -> IngestionResult:
         """
         Ingest a document: store it, chunk it, generate embeddings, and create relationships.
@@ -112,6 +121,14 @@ class IngestionService:
             metadata: Additional metadata about the document
             max_tokens_per_chunk: Optional max tokens per chunk (defaults to paragraph splitting)
             generate_embeddings: Whether to generate and store embeddings for chunks.
+            replace_existing: Replace the chunks and vectors of a previously ingested
+                version of the document.
+            skip_unchanged: With replace_existing, compare content fingerprints with
+                the stored version: an identical document is skipped entirely, and
+                chunks whose text is unchanged keep their ID, embedding and graph
+                edges. Pass False to force a full re-ingestion.
+            on_progress: Optional async callback receiving (stage, fraction done)
+                as the document moves through the pipeline.
 
         Returns:
             IngestionResult with document and chunk IDs
@@ -149,64 +166,59 @@ class IngestionService:
                     normalized_topics.append(key)
             if normalized_topics:
                 metadata["topics"] = normalized_topics
-        # Optionally replace existing chunks and vectors for idempotent re-ingestion
-        vectors_deleted_attempted = 0
+        # Fingerprints let re-ingestion skip unchanged documents and chunks
+        content_hash = content_fingerprint(content)
+        metadata_hash = metadata_fingerprint(metadata)
+        embeddings_wanted = bool(self.embedding_service and generate_embeddings)
+
+        # With replace_existing, the previous version's chunks are looked up now and
+        # replaced once the new chunks are known
+        existing_chunks: list[Chunk] = []
+        previous_fingerprints: dict[str, Any] = {}
         if replace_existing:
             try:
-                existing_chunks = await self.graph_store.get_chunks_by_document_id(
-                    document_id
+                existing_chunks = list(
+                    await self.graph_store.get_chunks_by_document_id(document_id) or []
                 )
-                if existing_chunks:
-                    old_chunk_ids = [c.id for c in existing_chunks]
-                    vectors_deleted_attempted = len(old_chunk_ids)
-                    logger.info(
-                        "Pre-delete: doc_id=%s id_source=%s existing_chunks=%d",
-                        document_id,
-                        id_source,
-                        len(old_chunk_ids),
-                    )
-                    # Delete chunks in graph by relationship, leaving the Document node
-                    try:
-                        # Use repository method if available; otherwise direct query via execute_query
-                        await self._retry(
-                            lambda: self.graph_store.execute_query(
-                                """
-                                MATCH (d:Document {id: $doc_id})-[:CONTAINS]->(c:Chunk)
-                                DETACH DELETE c
-                                """,
-                                {"doc_id": document_id},
-                            ),
-                            attempts=3,
-                            base_delay=0.2,
-                        )
-                    except Exception:
-                        logger.debug(
-                            "Graph chunk deletion step failed or unsupported; continuing"
-                        )
-                    # Delete from vector store best-effort with retry/backoff
-                    try:
-                        await self._retry(
-                            lambda: self.vector_store.delete_chunks(old_chunk_ids),
-                            attempts=3,
-                            base_delay=0.2,
-                        )
-                        logger.info(
-                            "Vector delete: doc_id=%s id_source=%s deleted_chunks=%d",
-                            document_id,
-                            id_source,
-                            len(old_chunk_ids),
-                        )
-                    except Exception as vs_del_err:
-                        logger.warning(
-                            "Vector delete failed: doc_id=%s id_source=%s error=%s",
-                            document_id,
-                            id_source,
-                            vs_del_err,
-                        )
             except Exception as pre_err:
                 logger.debug(
                     f"Pre-ingestion replace_existing probe failed for {document_id}: {pre_err}"
                 )
+            if existing_chunks and skip_unchanged:
+                previous_fingerprints = await self._stored_fingerprints(document_id)
+            # Skipping or reusing relies on the stored vectors; a restarted in-memory
+            # store or a wiped vector directory needs the document embedded again
+            if (
+                previous_fingerprints
+                and embeddings_wanted
+                and not await self._vectors_present([c.id for c in existing_chunks])
+            ):
+                logger.info(
+                    "Vector store is missing chunks of %s; re-ingesting it fully", document_id
+                )
+                previous_fingerprints = {}
+
+        def reusable(chunk: Chunk) -> bool:
+            return not embeddings_wanted or chunk.embedding is not None
+
+        if (
+            existing_chunks
+            and previous_fingerprints.get("content_hash") == content_hash
+            and previous_fingerprints.get("metadata_hash") == metadata_hash
+            and all(reusable(c) for c in existing_chunks)
+        ):
+            logger.info(
+                "Document %s unchanged (id_source=%s content_hash=%s); skipping re-ingestion",
+                document_id,
+                id_source,
+                content_hash[:12],
+            )
+            await self._report_progress(on_progress, "completed", 1.0)
+            return IngestionResult(
+                document_id=document_id,
+                chunk_ids=[c.id for c in existing_chunks],
+                skipped=True,
+            )
 
         # 0. Enhance content with vision processing if applicable
         enhanced_content, enhanced_metadata = await self._process_vision_content(
@@ -214,7 +226,12 @@ class IngestionService:
         )
 
         # 1. Create and save document using the provided ID
-        document = Document(id=document_id, content=enhanced_content, metadata=enhanced_metadata)
+        document = Document(
+            id=document_id,
+            content=enhanced_content,
+            metadata=enhanced_metadata,
+            properties={"content_hash": content_hash, "metadata_hash": metadata_hash},
+        )
         try:
             # Use the specific add_document method for Document objects
             logger.debug(
@@ -241,6 +258,8 @@ class IngestionService:
             else:
                 handle_ingestion_error(e, document_id, "document_storage")
 
+        await self._report_progress(on_progress, "document_stored", 0.1)
+
         # 2. Split content into chunks
         chunk_objects = await self._split_into_chunks(document, max_tokens_per_chunk)
         logger.info(
@@ -248,22 +267,43 @@ class IngestionService:
             document_id,
             len(chunk_objects),
         )
+        # Keep previous chunks whose text is unchanged (same ID, embedding and graph
+        # edges); only the rest is deleted, embedded, extracted and written
+        reused_ids = self._reuse_unchanged_chunks(
+            chunk_objects,
+            existing_chunks if previous_fingerprints.get("metadata_hash") == metadata_hash else [],
+            reusable,
+        )
+        stale_ids = [c.id for c in existing_chunks if c.id not in reused_ids]
+        vectors_deleted_attempted = len(stale_ids)
+        if stale_ids:
+            await self._delete_stale_chunks(document_id, stale_ids, id_source)
+        changed_chunks = [c for c in chunk_objects if c.id not in reused_ids]
+        if reused_ids:
+            logger.info(
+                "Re-ingesting %s: %d chunks unchanged, %d new or changed, %d removed",
+                document_id,
+                len(reused_ids),
+                len(changed_chunks),
+                len(stale_ids),
+            )
+        await self._report_progress(on_progress, "chunked", 0.2)
 
         # 3. Generate embeddings (if requested)
         vectors_added_expected = 0
-        if self.embedding_service and generate_embeddings:
+        if embeddings_wanted and changed_chunks:
             logger.info(
                 "Generating embeddings for %s: %d chunks",
                 document_id,
-                len(chunk_objects),
+                len(changed_chunks),
             )
-            chunk_texts = [c.text for c in chunk_objects]
+            chunk_texts = [c.text for c in changed_chunks]
             try:
                 # Ensure the call to encode is awaited
                 embeddings = await self.embedding_service.encode(chunk_texts)
                 # Check if the lengths match before assigning embeddings
-                if embeddings and len(embeddings) == len(chunk_objects):
-                    for i, chunk in enumerate(chunk_objects):
+                if embeddings and len(embeddings) == len(changed_chunks):
+                    for i, chunk in enumerate(changed_chunks):
                         chunk.embedding = embeddings[i]
                         # Ensure metadata exists and add document_id to it safely
                         if not hasattr(chunk, "metadata") or chunk.metadata is None:
@@ -272,19 +312,19 @@ class IngestionService:
                     logger.info("Embeddings generated successfully.")
                     # Count how many will be added to vector store
                     vectors_added_expected = sum(
-                        1 for c in chunk_objects if c.embedding is not None
+                        1 for c in changed_chunks if c.embedding is not None
                     )
 
                     # Add chunks to vector store *after* embeddings are assigned (if generated)
                     try:
                         await self._retry(
-                            lambda: self.vector_store.add_chunks(chunk_objects),
+                            lambda: self.vector_store.add_chunks(changed_chunks),
                             attempts=3,
                             base_delay=0.2,
                         )
                         logger.info(
                             "Vector store: added %d chunks for %s",
-                            len(chunk_objects),
+                            len(changed_chunks),
                             document_id,
                         )
                         # Metrics: vectors attempted added
@@ -307,7 +347,7 @@ class IngestionService:
 
                 else:
                     logger.error(
-                        f"Mismatch between number of chunks ({len(chunk_objects)}) and generated embeddings ({len(embeddings) if embeddings else 0}). Skipping embedding assignment."
+                        f"Mismatch between number of chunks ({len(changed_chunks)}) and generated embeddings ({len(embeddings) if embeddings else 0}). Skipping embedding assignment."
                     )
             except AttributeError as ae:
                 logger.error(
@@ -329,127 +369,33 @@ class IngestionService:
                     # For other errors, continue without embeddings but warn user
                     logger.warning(f"Continuing ingestion without embeddings due to error: {e}")
 
-        # 4. Extract entities from chunks and store them
-        await self._extract_and_store_entities(chunk_objects, document_id)
+        await self._report_progress(on_progress, "embedded", 0.5)
 
-        # 5. Save chunks and create relationships
-        chunk_ids = []
+        # 4. Extract entities and topics, then persist chunks and graph structure
         for chunk in chunk_objects:
-            try:
-                # Ensure embedding field exists even if generation failed/skipped
-                if not hasattr(chunk, "embedding"):
-                    chunk.embedding = None
-
-                # --- Debug logging (no stdout noise) ---
-                logger.debug(
-                    "Before save_chunk id=%s embedding_is_none=%s",
-                    chunk.id,
-                    chunk.embedding is None,
-                )
-
-                # Use add_chunk for Chunk objects
-                await self._retry(
-                    lambda c=chunk: self.graph_store.add_chunk(c),
-                    attempts=3,
-                    base_delay=0.2,
-                )
-                # Add the chunk's ID to the list
-                chunk_ids.append(chunk.id)
-
-                # Create relationship: Document CONTAINS Chunk
-                # Relationship needs source/target IDs and type
-                # Use Relationship model (alias for Edge) consistent with add_relationship signature
-                rel = Relationship(
-                    id=str(uuid.uuid4()),
-                    type="CONTAINS",
-                    source_id=document_id,
-                    target_id=chunk.id,  # Use chunk.id
-                )
-                await self._retry(
-                    lambda r=rel: self.graph_store.add_relationship(r),
-                    attempts=3,
-                    base_delay=0.2,
-                )
-            except Exception as e:
-                logger.error(
-                    f"Failed to save chunk {chunk.id} or its relationship for document {document_id}: {e}",
-                    exc_info=True,
-                )
-                # Classify the error
-                error_msg = str(e).lower()
-                if "connection" in error_msg or "memgraph" in error_msg:
-                    raise MemgraphConnectionError(reason=f"Failed to save chunk: {e}") from e
-                else:
-                    # For other errors, continue processing but warn
-                    logger.warning(f"Skipping chunk {chunk.id} due to error: {e}")
+            # Ensure embedding field exists even if generation failed/skipped
+            if not hasattr(chunk, "embedding"):
+                chunk.embedding = None
+        entities, mentions = await self._extract_entities(changed_chunks, document_id)
+        topics_in_meta: list[str] = []
+        if document.metadata and isinstance(document.metadata.get("topics"), list):
+            topics_in_meta = [
+                str(t).strip() for t in document.metadata["topics"] if str(t).strip()
+            ]
+
+        await self._report_progress(on_progress, "entities_extracted", 0.7)
 
-        # 4b. Project topics as nodes and link to document and chunks
-        try:
-            topics_in_meta = []
-            if document.metadata and isinstance(document.metadata.get("topics"), list):
-                topics_in_meta = [
-                    str(t).strip()
-                    for t in document.metadata["topics"]
-                    if str(t).strip()
-                ]
-            if topics_in_meta:
-                # Deduplicate topics
-                seen_topic_ids: set[str] = set()
-                for topic in topics_in_meta:
-                    topic_id = f"topic:{topic.lower()}"
-                    if topic_id in seen_topic_ids:
-                        continue
-                    seen_topic_ids.add(topic_id)
-                    # Create/Upsert topic entity
-                    try:
-                        from graph_rag.domain.models import Entity as DomainEntity
-
-                        await self.graph_store.add_entity(
-                            DomainEntity(
-                                id=topic_id,
-                                name=topic,
-                                type="Topic",
-                                properties={},
-                            )
-                        )
-                    except Exception:
-                        # Continue even if topic add fails
-                        logger.debug("Skipping topic add failure for %s", topic_id)
-
-                    # Link document -> topic
-                    try:
-                        await self.graph_store.add_relationship(
-                            Relationship(
-                                id=str(uuid.uuid4()),
-                                type="HAS_TOPIC",
-                                source_id=document_id,
-                                target_id=topic_id,
-                            )
-                        )
-                    except Exception:
-                        logger.debug(
-                            "Skipping HAS_TOPIC relationship failure for %s", topic_id
-                        )
-
-                    # Link each chunk -> topic (mentions)
-                    for chunk in chunk_objects:
-                        try:
-                            await self.graph_store.add_relationship(
-                                Relationship(
-                                    id=str(uuid.uuid4()),
-                                    type="MENTIONS_TOPIC",
-                                    source_id=chunk.id,
-                                    target_id=topic_id,
-                                )
-                            )
-                        except Exception:
-                            logger.debug(
-                                "Skipping MENTIONS_TOPIC relationship failure for chunk %s -> %s",
-                                chunk.id,
-                                topic_id,
-                            )
-        except Exception as topic_err:
-            logger.debug("Topic projection skipped due to error: %s", topic_err)
+        # 5. Save chunks and create relationships
+        if hasattr(self.graph_store, "add_graph_batch"):
+            stored_ids = await self._store_graph_batch(
+                document_id, changed_chunks, entities, mentions, topics_in_meta
+            )
+        else:
+            stored_ids = await self._store_chunks(document_id, changed_chunks)
+            await self._store_entities(entities, mentions, document_id)
+            await self._store_topics(document_id, changed_chunks, topics_in_meta)
+        stored = reused_ids.union(stored_ids)
+        chunk_ids = [c.id for c in chunk_objects if c.id in stored]
 
         logger.info(
             f"Ingestion complete for document {document_id}. Saved {len(chunk_ids)} chunks."
@@ -463,10 +409,11 @@ class IngestionService:
             pass
         try:
             logger.info(
-                "IngestMetrics doc_id=%s id_source=%s chunks=%d vectors_deleted=%d vectors_added_expected=%d duration_ms=%d",
+                "IngestMetrics doc_id=%s id_source=%s chunks=%d chunks_reused=%d vectors_deleted=%d vectors_added_expected=%d duration_ms=%d",
                 document_id,
                 id_source,
                 len(chunk_ids),
+                len(reused_ids),
                 vectors_deleted_attempted,
                 vectors_added_expected,
                 duration_ms,
@@ -475,12 +422,122 @@ class IngestionService:
             # Never fail on metrics logging
             pass
         try:
-            inc_ingested_chunks(len(chunk_ids))
+            inc_ingested_chunks(len(changed_chunks))
         except Exception:
             pass
+        await self._report_progress(on_progress, "completed", 1.0)
         # 6. Return result
         return IngestionResult(document_id=document_id, chunk_ids=chunk_ids)
 
+    @staticmethod
+    async def _report_progress(
+        on_progress: Callable[[str, float], Awaitable[None]] | None,
+        stage: str,
+        fraction: float,
+    ) -> None:
+        if on_progress is None:
+            return
+        try:
+            await on_progress(stage, fraction)
+        except Exception as e:
+            # Progress reporting must never fail an ingestion
+            logger.debug(f"Progress callback failed at stage {stage}: {e}")
+
+    async def _stored_fingerprints(self, document_id: str) -> dict[str, Any]:
+        """Fingerprints recorded on the stored Document node, if any."""
+        try:
+            document = await self.graph_store.get_document_by_id(document_id)
+        except Exception as e:
+            logger.debug(f"Could not load stored fingerprints for {document_id}: {e}")
+            return {}
+        properties = getattr(document, "properties", None)
+        return properties if isinstance(properties, dict) else {}
+
+    async def _vectors_present(self, chunk_ids: list[str]) -> bool:
+        """Whether the vector store still holds every one of the given chunks."""
+        try:
+            found = await asyncio.gather(
+                *(self.vector_store.get_chunk_by_id(chunk_id) for chunk_id in chunk_ids)
+            )
+        except Exception as e:
+            logger.debug(f"Could not verify stored vectors: {e}")
+            return False
+        return all(chunk is not None for chunk in found)
+
+    @staticmethod
+    def _reuse_unchanged_chunks(
+        chunk_objects: list[Chunk],
+        existing_chunks: list[Chunk],
+        reusable: Callable[[Chunk], bool],
+    ) -> set[str]:
+        """Fingerprint new chunks and give unchanged ones the ID of their stored twin.
+
+        Returns the IDs of the reused stored chunks.
+        """
+        available: dict[str, list[Chunk]] = {}
+        for old in existing_chunks:
+            old_hash = (getattr(old, "properties", None) or {}).get("content_hash")
+            if old_hash and reusable(old):
+                available.setdefault(old_hash, []).append(old)
+
+        reused: set[str] = set()
+        for chunk in chunk_objects:
+            chunk_hash = content_fingerprint(chunk.text)
+            if isinstance(getattr(chunk, "properties", None), dict):
+                chunk.properties["content_hash"] = chunk_hash
+            matches = available.get(chunk_hash)
+            if matches:
+                old = matches.pop()
+                chunk.id = old.id
+                chunk.embedding = old.embedding
+                reused.add(old.id)
+        return reused
+
+    async def _delete_stale_chunks(
+        self, document_id: str, chunk_ids: list[str], id_source: str | None
+    ) -> None:
+        """Best-effort removal of a document's outdated chunks from graph and vector store."""
+        logger.info(
+            "Pre-delete: doc_id=%s id_source=%s existing_chunks=%d",
+            document_id,
+            id_source,
+            len(chunk_ids),
+        )
+        try:
+            await self._retry(
+                lambda: self.graph_store.execute_query(
+                    """
+                    MATCH (d:Document {id: $doc_id})-[:CONTAINS]->(c:Chunk)
+                    WHERE c.id IN $chunk_ids
+                    DETACH DELETE c
+                    """,
+                    {"doc_id": document_id, "chunk_ids": chunk_ids},
+                ),
+                attempts=3,
+                base_delay=0.2,
+            )
+        except Exception:
+            logger.debug("Graph chunk deletion step failed or unsupported; continuing")
+        try:
+            await self._retry(
+                lambda: self.vector_store.delete_chunks(chunk_ids),
+                attempts=3,
+                base_delay=0.2,
+            )
+            logger.info(
+                "Vector delete: doc_id=%s id_source=%s deleted_chunks=%d",
+                document_id,
+                id_source,
+                len(chunk_ids),
+            )
+        except Exception as vs_del_err:
+            logger.warning(
+                "Vector delete failed: doc_id=%s id_source=%s error=%s",
+                document_id,
+                id_source,
+                vs_del_err,
+            )
+
     async def _retry(
         self,
         func: callable,  # returns Awaitable
@@ -721,71 +778,287 @@ class IngestionService:
 
         return enhanced_content, enhanced_metadata
 
-    async def _extract_and_store_entities(self, chunk_objects: list[Chunk], document_id: str) -> None:
-        """Extract entities from chunks and store them in the graph with relationships."""
-        if not self.entity_extractor:
-            logger.debug("No entity extractor configured, skipping entity extraction")
-            return
+    async def _store_graph_batch(
+        self,
+        document_id: str,
+        chunk_objects: list[Chunk],
+        entities: dict[str, ExtractedEntity],
+        mentions: list[tuple[str, str]],
+        topics: list[str],
+    ) -> list[str]:
+        """Write all chunks, entities, topics and edges of a document in one bulk call.
+
+        Falls back to per-item writes if the bulk write fails for a reason
+        other than connectivity.
+        """
+        from graph_rag.domain.models import Entity as DomainEntity
+
+        nodes = [self._to_domain_entity(e) for e in entities.values()]
+        relationships = [
+            Relationship(
+                id=str(uuid.uuid4()), type="MENTIONS", source_id=chunk_id, target_id=entity_id
+            )
+            for entity_id, chunk_id in mentions
+        ]
+        for topic_id, topic in self._topic_ids(topics):
+            nodes.append(DomainEntity(id=topic_id, name=topic, type="Topic", properties={}))
+            relationships.append(
+                Relationship(
+                    id=str(uuid.uuid4()), type="HAS_TOPIC", source_id=document_id, target_id=topic_id
+                )
+            )
+            relationships.extend(
+                Relationship(
+                    id=str(uuid.uuid4()),
+                    type="MENTIONS_TOPIC",
+                    source_id=chunk.id,
+                    target_id=topic_id,
+                )
+                for chunk in chunk_objects
+            )
+
+        try:
+            await self._retry(
+                lambda: self.graph_store.add_graph_batch(
+                    chunk_objects,
+                    nodes,
+                    relationships,
+                    batch_size=self.graph_write_batch_size,
+                ),
+                attempts=3,
+                base_delay=0.2,
+            )
+        except Exception as e:
+            error_msg = str(e).lower()
+            if "connection" in error_msg or "memgraph" in error_msg:
+                raise MemgraphConnectionError(reason=f"Failed to save chunks: {e}") from e
+            logger.warning(
+                f"Bulk graph write failed for document {document_id}, retrying per item: {e}"
+            )
+            chunk_ids = await self._store_chunks(document_id, chunk_objects)
+            await self._store_entities(entities, mentions, document_id)
+            await self._store_topics(document_id, chunk_objects, topics)
+            return chunk_ids
 
         logger.info(
-            f"Starting entity extraction for document {document_id} with {len(chunk_objects)} chunks"
+            f"Bulk stored {len(chunk_objects)} chunks, {len(nodes)} entities and "
+            f"{len(relationships)} relationships for document {document_id}"
         )
+        return [chunk.id for chunk in chunk_objects]
 
-        # Extract entities from all chunks
-        all_entities: dict[str, ExtractedEntity] = {}
-        entity_chunk_mentions: list[tuple[str, str]] = []  # (entity_id, chunk_id) pairs
-
+    async def _store_chunks(self, document_id: str, chunk_objects: list[Chunk]) -> list[str]:
+        """Save chunks and their CONTAINS relationships one at a time."""
+        chunk_ids = []
         for chunk in chunk_objects:
-            if not chunk.text or chunk.text.isspace():
-                continue
-
             try:
-                # Add context for better entity extraction
-                context = {
-                    "chunk_id": chunk.id,
-                    "document_id": document_id,
-                }
-
-                # Extract entities from chunk text
-                extraction_result = await self.entity_extractor.extract_from_text(
-                    chunk.text, context
+                # --- Debug logging (no stdout noise) ---
+                logger.debug(
+                    "Before save_chunk id=%s embedding_is_none=%s",
+                    chunk.id,
+                    chunk.embedding is None,
                 )
 
-                # Collect unique entities and track chunk-entity relationships
-                for extracted_entity in extraction_result.entities:
-                    entity_id = extracted_entity.id
-                    if entity_id not in all_entities:
-                        all_entities[entity_id] = extracted_entity
+                # Use add_chunk for Chunk objects
+                await self._retry(
+                    lambda c=chunk: self.graph_store.add_chunk(c),
+                    attempts=3,
+                    base_delay=0.2,
+                )
+                # Add the chunk's ID to the list
+                chunk_ids.append(chunk.id)
 
-                    # Track that this chunk mentions this entity
-                    entity_chunk_mentions.append((entity_id, chunk.id))
+                # Create relationship: Document CONTAINS Chunk
+                # Relationship needs source/target IDs and type
+                # Use Relationship model (alias for Edge) consistent with add_relationship signature
+                rel = Relationship(
+                    id=str(uuid.uuid4()),
+                    type="CONTAINS",
+                    source_id=document_id,
+                    target_id=chunk.id,  # Use chunk.id
+                )
+                await self._retry(
+                    lambda r=rel: self.graph_store.add_relationship(r),
+                    attempts=3,
+                    base_delay=0.2,
+                )
+            except Exception as e:
+                logger.error(
+                    f"Failed to save chunk {chunk.id} or its relationship for document {document_id}: {e}",
+                    exc_info=True,
+                )
+                # Classify the error
+                error_msg = str(e).lower()
+                if "connection" in error_msg or "memgraph" in error_msg:
+                    raise MemgraphConnectionError(reason=f"Failed to save chunk: {e}") from e
+                else:
+                    # For other errors, continue processing but warn
+                    logger.warning(f"Skipping chunk {chunk.id} due to error: {e}")
+        return chunk_ids
+
+    @staticmethod
+    def _topic_ids(topics: list[str]) -> list[tuple[str, str]]:
+        """(topic_id, topic) pairs, deduplicated case-insensitively."""
+        seen: set[str] = set()
+        pairs = []
+        for topic in topics:
+            topic_id = f"topic:{topic.lower()}"
+            if topic_id not in seen:
+                seen.add(topic_id)
+                pairs.append((topic_id, topic))
+        return pairs
+
+    async def _store_topics(
+        self, document_id: str, chunk_objects: list[Chunk], topics: list[str]
+    ) -> None:
+        """Project topics as nodes and link them to the document and its chunks."""
+        try:
+            for topic_id, topic in self._topic_ids(topics):
+                # Create/Upsert topic entity
+                try:
+                    from graph_rag.domain.models import Entity as DomainEntity
+
+                    await self.graph_store.add_entity(
+                        DomainEntity(
+                            id=topic_id,
+                            name=topic,
+                            type="Topic",
+                            properties={},
+                        )
+                    )
+                except Exception:
+                    # Continue even if topic add fails
+                    logger.debug("Skipping topic add failure for %s", topic_id)
+
+                # Link document -> topic
+                try:
+                    await self.graph_store.add_relationship(
+                        Relationship(
+                            id=str(uuid.uuid4()),
+                            type="HAS_TOPIC",
+                            source_id=document_id,
+                            target_id=topic_id,
+                        )
+                    )
+                except Exception:
+                    logger.debug(
+                        "Skipping HAS_TOPIC relationship failure for %s", topic_id
+                    )
 
+                # Link each chunk -> topic (mentions)
+                for chunk in chunk_objects:
+                    try:
+                        await self.graph_store.add_relationship(
+                            Relationship(
+                                id=str(uuid.uuid4()),
+                                type="MENTIONS_TOPIC",
+                                source_id=chunk.id,
+                                target_id=topic_id,
+                            )
+                        )
+                    except Exception:
+                        logger.debug(
+                            "Skipping MENTIONS_TOPIC relationship failure for chunk %s -> %s",
+                            chunk.id,
+                            topic_id,
+                        )
+        except Exception as topic_err:
+            logger.debug("Topic projection skipped due to error: %s", topic_err)
+
+    async def _extract_entities(
+        self, chunk_objects: list[Chunk], document_id: str
+    ) -> tuple[dict[str, ExtractedEntity], list[tuple[str, str]]]:
+        """Extract unique entities and (entity_id, chunk_id) mention pairs from chunks."""
+        all_entities: dict[str, ExtractedEntity] = {}
+        entity_chunk_mentions: list[tuple[str, str]] = []  # (entity_id, chunk_id) pairs
+        if not self.entity_extractor:
+            logger.debug("No entity extractor configured, skipping entity extraction")
+            return all_entities, entity_chunk_mentions
+
+        logger.info(
+            f"Starting entity extraction for document {document_id} with {len(chunk_objects)} chunks"
+        )
+
+        chunks = [c for c in chunk_objects if c.text and not c.text.isspace()]
+        results = None
+        if hasattr(self.entity_extractor, "extract_batch"):
+            # One streaming NER call for the whole document
+            try:
+                results = await self.entity_extractor.extract_batch(
+                    [chunk.text for chunk in chunks],
+                    [
+                        {"chunk_id": chunk.id, "document_id": document_id}
+                        for chunk in chunks
+                    ],
+                )
             except Exception as e:
                 logger.warning(
-                    f"Entity extraction failed for chunk {chunk.id} in document {document_id}: {e}"
+                    f"Batch entity extraction failed for document {document_id}, "
+                    f"falling back to per-chunk extraction: {e}"
                 )
+
+        if results is None:
+            results = []
+            for chunk in chunks:
+                try:
+                    # Add context for better entity extraction
+                    context = {
+                        "chunk_id": chunk.id,
+                        "document_id": document_id,
+                    }
+                    results.append(
+                        await self.entity_extractor.extract_from_text(chunk.text, context)
+                    )
+                except Exception as e:
+                    logger.warning(
+                        f"Entity extraction failed for chunk {chunk.id} in document {document_id}: {e}"
+                    )
+                    results.append(None)
+
+        for chunk, extraction_result in zip(chunks, results, strict=True):
+            if extraction_result is None:
                 continue
+            # Collect unique entities and track chunk-entity relationships
+            for extracted_entity in extraction_result.entities:
+                entity_id = extracted_entity.id
+                if entity_id not in all_entities:
+                    all_entities[entity_id] = extracted_entity
+
+                # Track that this chunk mentions this entity
+                entity_chunk_mentions.append((entity_id, chunk.id))
 
         if not all_entities:
             logger.info(f"No entities extracted from document {document_id}")
-            return
+        else:
+            logger.info(
+                f"Extracted {len(all_entities)} unique entities from document {document_id}"
+            )
+        return all_entities, entity_chunk_mentions
 
-        logger.info(
-            f"Extracted {len(all_entities)} unique entities from document {document_id}"
+    @staticmethod
+    def _to_domain_entity(extracted_entity: ExtractedEntity):
+        """Convert an ExtractedEntity to a domain Entity."""
+        from graph_rag.domain.models import Entity as DomainEntity
+
+        return DomainEntity(
+            id=extracted_entity.id,
+            name=extracted_entity.name or extracted_entity.text,
+            type=extracted_entity.label,
+            properties=extracted_entity.metadata or {},
         )
 
-        # Store entities in the graph
-        from graph_rag.domain.models import Entity as DomainEntity
+    async def _store_entities(
+        self,
+        all_entities: dict[str, ExtractedEntity],
+        entity_chunk_mentions: list[tuple[str, str]],
+        document_id: str,
+    ) -> None:
+        """Store entities one at a time, then their MENTIONS relationships."""
+        if not all_entities:
+            return
 
         for extracted_entity in all_entities.values():
             try:
-                # Convert ExtractedEntity to domain Entity
-                domain_entity = DomainEntity(
-                    id=extracted_entity.id,
-                    name=extracted_entity.name or extracted_entity.text,
-                    type=extracted_entity.label,
-                    properties=extracted_entity.metadata or {},
-                )
+                domain_entity = self._to_domain_entity(extracted_entity)
 
                 await self._retry(
                     lambda e=domain_entity: self.graph_store.add_entity(e),
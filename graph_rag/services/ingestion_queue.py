@@ -0,0 +1,566 @@
+"""Durable ingestion job queue with a bounded worker pool.
+
+Jobs are rows in a SQLite database, so accepted documents survive restarts
+and several API processes can share one queue: every claim runs in a
+``BEGIN IMMEDIATE`` transaction. Workers pick the tenant with the fewest
+running jobs (oldest queued job breaks ties), so one tenant's bulk upload
+cannot starve the others. A running job holds a lease that its worker
+renews, and only the lease holder can record the job's outcome; jobs whose
+lease expires (crashed process) are queued again until ``max_attempts`` is
+reached. A failed attempt is retried after an exponential backoff. Concurrent
+workers share embedding calls through ``BatchingEmbeddingService``.
+"""
+
+import asyncio
+import copy
+import json
+import logging
+import os
+import socket
+import sqlite3
+import time
+import uuid
+from contextlib import contextmanager
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel
+
+from graph_rag.services.embedding_batching import BatchingEmbeddingService
+from graph_rag.services.ingestion import IngestionService
+
+logger = logging.getLogger(__name__)
+
+
+class IngestionJobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class IngestionJob(BaseModel):
+    """Status of one queued document ingestion."""
+
+    job_id: str
+    tenant_id: str
+    document_id: str
+    status: IngestionJobStatus
+    stage: str | None = None
+    progress: float = 0.0
+    attempts: int = 0
+    chunk_count: int | None = None
+    error: str | None = None
+    created_at: float
+    started_at: float | None = None
+    finished_at: float | None = None
+    available_at: float | None = None  # Earliest retry of a failed attempt
+
+
+class IngestionQueueFullError(Exception):
+    """Raised when a job is submitted while the queue is at its depth limit."""
+
+    def __init__(self, depth: int, max_depth: int):
+        self.depth = depth
+        self.max_depth = max_depth
+        super().__init__(f"Ingestion queue is full ({depth}/{max_depth} jobs pending)")
+
+
+_ACTIVE = (IngestionJobStatus.QUEUED.value, IngestionJobStatus.RUNNING.value)
+
+# Upper bound on the delay before a failed job is retried
+_MAX_RETRY_BACKOFF_SECONDS = 3600.0
+
+
+class IngestionJobStore:
+    """SQLite-backed job table. Methods block; the queue calls them off the event loop."""
+
+    def __init__(
+        self, db_path: str | Path, max_attempts: int = 3, retry_backoff_seconds: float = 5.0
+    ):
+        self.db_path = Path(db_path).expanduser()
+        self.max_attempts = max(1, max_attempts)
+        self.retry_backoff_seconds = max(0.0, retry_backoff_seconds)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._init_db()
+
+    @contextmanager
+    def _connect(self):
+        # Autocommit mode; writes open explicit BEGIN IMMEDIATE transactions
+        conn = sqlite3.connect(str(self.db_path), timeout=30.0, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _transaction(self):
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def _init_db(self) -> None:
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS ingestion_jobs (
+                    job_id TEXT PRIMARY KEY,
+                    tenant_id TEXT NOT NULL,
+                    document_id TEXT NOT NULL,
+                    payload TEXT,  -- JSON, dropped once the job succeeds
+                    status TEXT NOT NULL,
+                    stage TEXT,
+                    progress REAL NOT NULL DEFAULT 0,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    chunk_count INTEGER,
+                    error TEXT,
+                    owner TEXT,
+                    created_at REAL NOT NULL,
+                    started_at REAL,
+                    heartbeat_at REAL,
+                    finished_at REAL,
+                    available_at REAL
+                )
+            """)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(ingestion_jobs)")}
+            if "available_at" not in columns:  # Databases created before retry backoff
+                conn.execute("ALTER TABLE ingestion_jobs ADD COLUMN available_at REAL")
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_ingestion_jobs_status "
+                "ON ingestion_jobs (status, tenant_id, created_at)"
+            )
+
+    @staticmethod
+    def _to_job(row: sqlite3.Row) -> IngestionJob:
+        return IngestionJob(
+            job_id=row["job_id"],
+            tenant_id=row["tenant_id"],
+            document_id=row["document_id"],
+            status=row["status"],
+            stage=row["stage"],
+            progress=row["progress"],
+            attempts=row["attempts"],
+            chunk_count=row["chunk_count"],
+            error=row["error"],
+            created_at=row["created_at"],
+            started_at=row["started_at"],
+            finished_at=row["finished_at"],
+            available_at=row["available_at"],
+        )
+
+    def enqueue(
+        self,
+        job_id: str,
+        tenant_id: str,
+        document_id: str,
+        payload: dict[str, Any],
+        max_depth: int,
+    ) -> IngestionJob:
+        with self._transaction() as conn:
+            depth = conn.execute(
+                "SELECT COUNT(*) FROM ingestion_jobs WHERE status IN (?, ?)", _ACTIVE
+            ).fetchone()[0]
+            if depth >= max_depth:
+                raise IngestionQueueFullError(depth, max_depth)
+            conn.execute(
+                """
+                INSERT INTO ingestion_jobs
+                (job_id, tenant_id, document_id, payload, status, created_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    job_id,
+                    tenant_id,
+                    document_id,
+                    json.dumps(payload),
+                    IngestionJobStatus.QUEUED.value,
+                    time.time(),
+                ),
+            )
+            row = conn.execute(
+                "SELECT * FROM ingestion_jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        return self._to_job(row)
+
+    def claim(self, owner: str, lease_seconds: float) -> tuple[IngestionJob, dict[str, Any]] | None:
+        """Marks the next job (fair across tenants) as running and returns it with its payload."""
+        now = time.time()
+        with self._transaction() as conn:
+            self._expire_leases(conn, now - lease_seconds, now)
+            tenant = conn.execute(
+                """
+                SELECT q.tenant_id FROM ingestion_jobs q
+                WHERE q.status = 'queued' AND COALESCE(q.available_at, 0) <= ?
+                GROUP BY q.tenant_id
+                ORDER BY (
+                    SELECT COUNT(*) FROM ingestion_jobs r
+                    WHERE r.status = 'running' AND r.tenant_id = q.tenant_id
+                ), MIN(q.created_at)
+                LIMIT 1
+                """,
+                (now,),
+            ).fetchone()
+            if tenant is None:
+                return None
+            row = conn.execute(
+                """
+                SELECT job_id FROM ingestion_jobs
+                WHERE status = 'queued' AND tenant_id = ? AND COALESCE(available_at, 0) <= ?
+                ORDER BY created_at, rowid
+                LIMIT 1
+                """,
+                (tenant["tenant_id"], now),
+            ).fetchone()
+            conn.execute(
+                """
+                UPDATE ingestion_jobs
+                SET status = 'running', owner = ?, attempts = attempts + 1,
+                    stage = 'started', progress = 0, started_at = ?, heartbeat_at = ?
+                WHERE job_id = ?
+                """,
+                (owner, now, now, row["job_id"]),
+            )
+            claimed = conn.execute(
+                "SELECT * FROM ingestion_jobs WHERE job_id = ?", (row["job_id"],)
+            ).fetchone()
+        return self._to_job(claimed), json.loads(claimed["payload"])
+
+    def _expire_leases(self, conn: sqlite3.Connection, cutoff: float, now: float) -> None:
+        conn.execute(
+            """
+            UPDATE ingestion_jobs
+            SET status = 'failed', owner = NULL, finished_at = ?,
+                error = COALESCE(error, 'Worker lease expired')
+            WHERE status = 'running' AND heartbeat_at < ? AND attempts >= ?
+            """,
+            (now, cutoff, self.max_attempts),
+        )
+        conn.execute(
+            """
+            UPDATE ingestion_jobs SET status = 'queued', owner = NULL, available_at = NULL
+            WHERE status = 'running' AND heartbeat_at < ?
+            """,
+            (cutoff,),
+        )
+
+    def heartbeat(
+        self,
+        job_id: str,
+        owner: str,
+        stage: str | None = None,
+        progress: float | None = None,
+    ) -> bool:
+        """Renews the lease; False if ``owner`` no longer holds it."""
+        with self._connect() as conn:
+            cursor = conn.execute(
+                """
+                UPDATE ingestion_jobs
+                SET heartbeat_at = ?, stage = COALESCE(?, stage), progress = COALESCE(?, progress)
+                WHERE job_id = ? AND owner = ? AND status = 'running'
+                """,
+                (time.time(), stage, progress, job_id, owner),
+            )
+        return cursor.rowcount > 0
+
+    def complete(self, job_id: str, owner: str, chunk_count: int) -> bool:
+        """Marks the job succeeded; False (nothing recorded) if ``owner`` lost the lease."""
+        with self._connect() as conn:
+            cursor = conn.execute(
+                """
+                UPDATE ingestion_jobs
+                SET status = 'succeeded', stage = 'completed', progress = 1, payload = NULL,
+                    chunk_count = ?, error = NULL, owner = NULL, finished_at = ?
+                WHERE job_id = ? AND owner = ? AND status = 'running'
+                """,
+                (chunk_count, time.time(), job_id, owner),
+            )
+        return cursor.rowcount > 0
+
+    def fail(self, job_id: str, owner: str, error: str) -> IngestionJobStatus | None:
+        """Records a failed attempt; the job is retried after a backoff while attempts remain.
+
+        Returns the job's new status, or None if ``owner`` no longer holds the lease.
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            row = conn.execute(
+                """
+                SELECT attempts FROM ingestion_jobs
+                WHERE job_id = ? AND owner = ? AND status = 'running'
+                """,
+                (job_id, owner),
+            ).fetchone()
+            if row is None:
+                return None
+            retry = row["attempts"] < self.max_attempts
+            status = IngestionJobStatus.QUEUED if retry else IngestionJobStatus.FAILED
+            backoff = min(
+                self.retry_backoff_seconds * 2 ** (row["attempts"] - 1), _MAX_RETRY_BACKOFF_SECONDS
+            )
+            conn.execute(
+                """
+                UPDATE ingestion_jobs
+                SET status = ?, error = ?, owner = NULL, finished_at = ?, available_at = ?
+                WHERE job_id = ?
+                """,
+                (
+                    status.value,
+                    error,
+                    None if retry else now,
+                    now + backoff if retry else None,
+                    job_id,
+                ),
+            )
+        return status
+
+    def release(self, job_id: str, owner: str) -> None:
+        """Returns an interrupted job to the queue without counting the attempt."""
+        with self._connect() as conn:
+            conn.execute(
+                """
+                UPDATE ingestion_jobs
+                SET status = 'queued', owner = NULL, attempts = MAX(attempts - 1, 0)
+                WHERE job_id = ? AND owner = ? AND status = 'running'
+                """,
+                (job_id, owner),
+            )
+
+    def get(self, job_id: str) -> IngestionJob | None:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT * FROM ingestion_jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        return self._to_job(row) if row else None
+
+    def list_jobs(
+        self,
+        tenant_id: str | None = None,
+        status: IngestionJobStatus | None = None,
+        limit: int = 100,
+    ) -> list[IngestionJob]:
+        clauses, params = [], []
+        if tenant_id is not None:
+            clauses.append("tenant_id = ?")
+            params.append(tenant_id)
+        if status is not None:
+            clauses.append("status = ?")
+            params.append(IngestionJobStatus(status).value)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT * FROM ingestion_jobs {where} ORDER BY created_at DESC LIMIT ?",
+                (*params, limit),
+            ).fetchall()
+        return [self._to_job(row) for row in rows]
+
+    def counts(self) -> dict[str, int]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT status, COUNT(*) AS n FROM ingestion_jobs GROUP BY status"
+            ).fetchall()
+        counts = {s.value: 0 for s in IngestionJobStatus}
+        counts.update({row["status"]: row["n"] for row in rows})
+        return counts
+
+
+class IngestionJobQueue:
+    """Runs queued ingestion jobs on a fixed pool of worker tasks."""
+
+    def __init__(
+        self,
+        ingestion_service: IngestionService,
+        db_path: str | Path,
+        workers: int = 2,
+        max_depth: int = 1000,
+        max_attempts: int = 3,
+        lease_seconds: float = 300.0,
+        poll_interval: float = 1.0,
+        retry_after_seconds: int = 5,
+        retry_backoff_seconds: float = 5.0,
+        embedding_batch_size: int = 256,
+        embedding_batch_window_ms: float = 10.0,
+    ):
+        self.store = IngestionJobStore(
+            db_path, max_attempts=max_attempts, retry_backoff_seconds=retry_backoff_seconds
+        )
+        self.workers = max(1, workers)
+        self.max_depth = max(1, max_depth)
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self.retry_after_seconds = retry_after_seconds
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+        # Workers share embedding calls; other users of the service are unaffected
+        self._embedding_batcher: BatchingEmbeddingService | None = None
+        if getattr(ingestion_service, "embedding_service", None) is not None and embedding_batch_size > 1:
+            ingestion_service = copy.copy(ingestion_service)
+            self._embedding_batcher = BatchingEmbeddingService(
+                ingestion_service.embedding_service,
+                max_batch_size=embedding_batch_size,
+                window_ms=embedding_batch_window_ms,
+            )
+            ingestion_service.embedding_service = self._embedding_batcher
+        self.ingestion_service = ingestion_service
+
+        self.running = False
+        self._tasks: list[asyncio.Task] = []
+        self._wakeup = asyncio.Event()
+
+    async def _db(self, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(None, fn, *args)
+
+    async def submit(
+        self,
+        document_id: str,
+        content: str,
+        metadata: dict[str, Any] | None = None,
+        tenant_id: str = "default",
+        generate_embeddings: bool = True,
+        replace_existing: bool = True,
+        skip_unchanged: bool = True,
+    ) -> IngestionJob:
+        """Persists a job; raises ``IngestionQueueFullError`` at the depth limit."""
+        payload = {
+            "content": content,
+            "metadata": metadata or {},
+            "generate_embeddings": generate_embeddings,
+            "replace_existing": replace_existing,
+            "skip_unchanged": skip_unchanged,
+        }
+        job = await self._db(
+            self.store.enqueue, str(uuid.uuid4()), tenant_id, document_id, payload, self.max_depth
+        )
+        self._wakeup.set()
+        return job
+
+    async def get_job(self, job_id: str) -> IngestionJob | None:
+        return await self._db(self.store.get, job_id)
+
+    async def list_jobs(
+        self,
+        tenant_id: str | None = None,
+        status: IngestionJobStatus | None = None,
+        limit: int = 100,
+    ) -> list[IngestionJob]:
+        return await self._db(self.store.list_jobs, tenant_id, status, limit)
+
+    async def stats(self) -> dict[str, Any]:
+        counts = await self._db(self.store.counts)
+        return {
+            "running": self.running,
+            "workers": self.workers,
+            "max_depth": self.max_depth,
+            "depth": counts[IngestionJobStatus.QUEUED.value] + counts[IngestionJobStatus.RUNNING.value],
+            "jobs": counts,
+            "embedding_batching": self._embedding_batcher.stats() if self._embedding_batcher else None,
+        }
+
+    async def start(self) -> None:
+        if self.running:
+            logger.warning("Ingestion queue already running")
+            return
+        self.running = True
+        self._tasks = [asyncio.create_task(self._worker_loop(i)) for i in range(self.workers)]
+        logger.info(f"Started ingestion queue with {self.workers} workers at {self.store.db_path}")
+
+    async def stop(self, timeout: float = 30.0) -> None:
+        """Stops claiming jobs and waits for running ones; unfinished jobs are re-queued."""
+        if not self.running:
+            return
+        self.running = False
+        self._wakeup.set()
+        _, pending = await asyncio.wait(self._tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        if pending:
+            logger.warning(f"Cancelled {len(pending)} ingestion workers on shutdown")
+            await asyncio.gather(*pending, return_exceptions=True)
+        self._tasks = []
+        logger.info("Ingestion queue stopped")
+
+    async def _worker_loop(self, index: int) -> None:
+        while self.running:
+            # Cleared before claiming so a submit() racing with the claim still wakes us
+            self._wakeup.clear()
+            try:
+                claimed = await self._db(self.store.claim, self.owner, self.lease_seconds)
+            except Exception as e:
+                logger.error(f"Ingestion worker {index} failed to claim a job: {e}")
+                claimed = None
+            if claimed is None:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            try:
+                await self._run_job(*claimed)
+            except Exception as e:
+                # e.g. a locked database while recording the outcome; the lease
+                # expires and the job is retried, so the worker keeps going
+                logger.error(
+                    f"Ingestion worker {index} failed to finish job {claimed[0].job_id}: {e}",
+                    exc_info=True,
+                )
+
+    async def _heartbeat(self, job_id: str) -> None:
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            try:
+                if not await self._db(self.store.heartbeat, job_id, self.owner):
+                    logger.warning(f"Lost the lease on ingestion job {job_id}")
+            except Exception as e:
+                logger.warning(f"Heartbeat for ingestion job {job_id} failed: {e}")
+
+    async def _run_job(self, job: IngestionJob, payload: dict[str, Any]) -> None:
+        async def on_progress(stage: str, fraction: float) -> None:
+            await self._db(self.store.heartbeat, job.job_id, self.owner, stage, fraction)
+
+        logger.info(
+            f"Running ingestion job {job.job_id} (tenant={job.tenant_id}, "
+            f"document={job.document_id}, attempt={job.attempts})"
+        )
+        heartbeat = asyncio.create_task(self._heartbeat(job.job_id))
+        try:
+            result = await self.ingestion_service.ingest_document(
+                document_id=job.document_id,
+                content=payload["content"],
+                metadata=payload.get("metadata") or {},
+                generate_embeddings=payload.get("generate_embeddings", True),
+                replace_existing=payload.get("replace_existing", True),
+                skip_unchanged=payload.get("skip_unchanged", True),
+                on_progress=on_progress,
+            )
+        except asyncio.CancelledError:
+            try:
+                await self._db(self.store.release, job.job_id, self.owner)
+            except Exception as e:
+                logger.warning(f"Could not release ingestion job {job.job_id}: {e}")
+            raise
+        except Exception as e:
+            status = await self._db(
+                self.store.fail, job.job_id, self.owner, f"{type(e).__name__}: {e}"
+            )
+            outcome = status.value if status else "lease lost, not recorded"
+            logger.error(
+                f"Ingestion job {job.job_id} failed (attempt {job.attempts}, now {outcome}): {e}",
+                exc_info=True,
+            )
+        else:
+            chunk_ids = getattr(result, "chunk_ids", None)
+            chunk_count = len(chunk_ids) if isinstance(chunk_ids, list) else 0
+            if await self._db(self.store.complete, job.job_id, self.owner, chunk_count):
+                logger.info(f"Ingestion job {job.job_id} succeeded ({chunk_count} chunks)")
+            else:
+                logger.warning(
+                    f"Ingestion job {job.job_id} finished after its lease was lost; result not recorded"
+                )
+        finally:
+            heartbeat.cancel()
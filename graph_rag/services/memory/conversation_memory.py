@@ -62,6 +62,11 @@ class ConversationMemoryBackend(Protocol):
         """List conversation IDs for a user."""
         ...
 
+    # Backends may also implement
+    #   async def append_interaction(conversation_id, interaction, keep_last=None) -> int | None
+    # returning the new interaction count (None if the conversation is unknown);
+    # ConversationMemoryManager then adds interactions without a full load/save.
+
 
 class InMemoryConversationBackend:
     """In-memory conversation storage backend."""
@@ -81,6 +86,22 @@ class InMemoryConversationBackend:
             if session.conversation_id not in user_convs:
                 user_convs.append(session.conversation_id)
 
+    async def append_interaction(
+        self,
+        conversation_id: str,
+        interaction: Interaction,
+        keep_last: int | None = None,
+    ) -> int | None:
+        """Append an interaction, keeping at most ``keep_last`` of them."""
+        async with self._lock:
+            session = self._sessions.get(conversation_id)
+            if session is None:
+                return None
+            session.add_interaction(interaction)
+            if keep_last is not None and len(session.interactions) > keep_last:
+                del session.interactions[:-keep_last]
+            return len(session.interactions)
+
     async def load_session(self, conversation_id: str) -> ConversationSession | None:
         """Load a conversation session from memory."""
         async with self._lock:
@@ -105,33 +126,74 @@ class InMemoryConversationBackend:
 
 
 class FileConversationBackend:
-    """File-based conversation storage backend."""
+    """File-based conversation storage backend.
+
+    Each conversation is an append-only JSON-lines event log: a ``session``
+    header followed by one ``interaction`` event per interaction, so adding
+    an interaction writes one line. ``load_session`` replays the log and
+    rewrites it as a compacted snapshot once superseded events outnumber
+    live ones. Per-user indices are append-only logs as well.
+
+    File I/O runs in the default executor. Writers are serialized per
+    conversation and per user by a fixed set of sharded locks, so
+    unrelated conversations do not wait on each other.
+    """
 
-    def __init__(self, storage_path: str | None = None):
+    def __init__(self, storage_path: str | None = None, lock_shards: int = 64):
         self.storage_path = Path(storage_path) if storage_path else Path("./conversation_memory")
         self.storage_path.mkdir(parents=True, exist_ok=True)
-        self._lock = asyncio.Lock()
+        self._locks = [asyncio.Lock() for _ in range(max(1, lock_shards))]
+        # Interaction counts of sessions seen by this process
+        self._counts: dict[str, int] = {}
+
+    def _lock_for(self, key: str) -> asyncio.Lock:
+        return self._locks[hash(key) % len(self._locks)]
+
+    @staticmethod
+    async def _run_io(func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, func, *args)
 
     def _get_session_file(self, conversation_id: str) -> Path:
-        """Get file path for a conversation session."""
+        """Get file path for a conversation's event log."""
+        return self.storage_path / f"{conversation_id}.jsonl"
+
+    def _get_legacy_session_file(self, conversation_id: str) -> Path:
+        """Get file path of a session snapshot written by older versions."""
         return self.storage_path / f"{conversation_id}.json"
 
     def _get_user_index_file(self, user_id: str) -> Path:
-        """Get file path for user's conversation index."""
+        """Get file path for user's conversation index log."""
+        return self.storage_path / f"user_{user_id}.jsonl"
+
+    def _get_legacy_user_index_file(self, user_id: str) -> Path:
         return self.storage_path / f"user_{user_id}.json"
 
+    @staticmethod
+    def _serialize_interaction(interaction: Interaction) -> dict:
+        return {
+            "question": interaction.question,
+            "answer": interaction.answer,
+            "timestamp": interaction.timestamp.isoformat(),
+            "metadata": interaction.metadata
+        }
+
+    @staticmethod
+    def _deserialize_interaction(data: dict) -> Interaction:
+        return Interaction(
+            question=data["question"],
+            answer=data["answer"],
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            metadata=data.get("metadata", {})
+        )
+
     def _serialize_session(self, session: ConversationSession) -> dict:
         """Convert session to JSON-serializable dict."""
         return {
             "conversation_id": session.conversation_id,
             "user_id": session.user_id,
             "interactions": [
-                {
-                    "question": interaction.question,
-                    "answer": interaction.answer,
-                    "timestamp": interaction.timestamp.isoformat(),
-                    "metadata": interaction.metadata
-                }
+                self._serialize_interaction(interaction)
                 for interaction in session.interactions
             ],
             "summary": session.summary,
@@ -142,120 +204,195 @@ class FileConversationBackend:
 
     def _deserialize_session(self, data: dict) -> ConversationSession:
         """Convert dict to ConversationSession."""
-        interactions = [
-            Interaction(
-                question=i["question"],
-                answer=i["answer"],
-                timestamp=datetime.fromisoformat(i["timestamp"]),
-                metadata=i.get("metadata", {})
-            )
-            for i in data["interactions"]
-        ]
-
         return ConversationSession(
             conversation_id=data["conversation_id"],
             user_id=data["user_id"],
-            interactions=interactions,
+            interactions=[self._deserialize_interaction(i) for i in data.get("interactions", [])],
             summary=data.get("summary"),
             created_at=datetime.fromisoformat(data["created_at"]),
             updated_at=datetime.fromisoformat(data["updated_at"]),
             metadata=data.get("metadata", {})
         )
 
-    async def save_session(self, session: ConversationSession) -> None:
-        """Save a conversation session to file."""
-        async with self._lock:
-            try:
-                session_file = self._get_session_file(session.conversation_id)
-                session_data = self._serialize_session(session)
+    # --- blocking file operations (run in the executor) ---
 
-                # Write session data
-                with open(session_file, 'w', encoding='utf-8') as f:
-                    json.dump(session_data, f, indent=2, ensure_ascii=False)
-
-                # Update user index
-                user_index_file = self._get_user_index_file(session.user_id)
-                user_conversations = []
-
-                if user_index_file.exists():
+    def _write_snapshot(self, session: ConversationSession) -> None:
+        """Atomically replace the event log with a compacted one."""
+        header = self._serialize_session(session)
+        interactions = header.pop("interactions")
+        lines = [json.dumps({"event": "session", **header}, ensure_ascii=False)]
+        lines.extend(
+            json.dumps({"event": "interaction", **i}, ensure_ascii=False) for i in interactions
+        )
+        session_file = self._get_session_file(session.conversation_id)
+        tmp_file = session_file.with_suffix(".jsonl.tmp")
+        tmp_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        tmp_file.replace(session_file)
+        self._get_legacy_session_file(session.conversation_id).unlink(missing_ok=True)
+
+    def _append_event(self, conversation_id: str, event: dict) -> bool:
+        session_file = self._get_session_file(conversation_id)
+        if not session_file.exists():
+            return False
+        with open(session_file, "a", encoding="utf-8") as f:
+            f.write(json.dumps(event, ensure_ascii=False) + "\n")
+        return True
+
+    def _read_session(self, conversation_id: str) -> ConversationSession | None:
+        """Replay the event log, compacting it when it carries dead events."""
+        session_file = self._get_session_file(conversation_id)
+        if not session_file.exists():
+            legacy_file = self._get_legacy_session_file(conversation_id)
+            if not legacy_file.exists():
+                return None
+            with open(legacy_file, encoding="utf-8") as f:
+                session = self._deserialize_session(json.load(f))
+            self._write_snapshot(session)
+            return session
+
+        session: ConversationSession | None = None
+        events = 0
+        with open(session_file, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    event = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Skipping corrupt event in {session_file}")
+                    continue
+                events += 1
+                if event.get("event") == "session":
+                    event.setdefault("interactions", [])
+                    session = self._deserialize_session(event)
+                elif event.get("event") == "interaction" and session is not None:
+                    interaction = self._deserialize_interaction(event)
+                    session.interactions.append(interaction)
+                    session.updated_at = max(session.updated_at, interaction.timestamp)
+                    keep = event.get("keep")
+                    if keep is not None and len(session.interactions) > keep:
+                        del session.interactions[:-keep]
+
+        if session is not None and events > 2 * (len(session.interactions) + 1):
+            self._write_snapshot(session)
+        return session
+
+    def _read_user_index(self, user_id: str) -> list[str]:
+        conversations: dict[str, None] = {}
+        legacy_file = self._get_legacy_user_index_file(user_id)
+        if legacy_file.exists():
+            try:
+                with open(legacy_file, encoding="utf-8") as f:
+                    conversations.update(dict.fromkeys(json.load(f)))
+            except (OSError, json.JSONDecodeError):
+                pass
+        index_file = self._get_user_index_file(user_id)
+        if index_file.exists():
+            with open(index_file, encoding="utf-8") as f:
+                for line in f:
                     try:
-                        with open(user_index_file, encoding='utf-8') as f:
-                            user_conversations = json.load(f)
-                    except (OSError, json.JSONDecodeError):
-                        user_conversations = []
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if entry.get("op") == "add":
+                        conversations[entry["conversation_id"]] = None
+                    else:
+                        conversations.pop(entry.get("conversation_id"), None)
+        return list(conversations)
 
-                if session.conversation_id not in user_conversations:
-                    user_conversations.append(session.conversation_id)
+    def _append_user_index(self, user_id: str, op: str, conversation_id: str) -> None:
+        with open(self._get_user_index_file(user_id), "a", encoding="utf-8") as f:
+            f.write(json.dumps({"op": op, "conversation_id": conversation_id}) + "\n")
 
-                with open(user_index_file, 'w', encoding='utf-8') as f:
-                    json.dump(user_conversations, f)
+    # --- backend interface ---
 
-            except Exception as e:
-                logger.error(f"Error saving conversation session {session.conversation_id}: {e}")
-                raise
-
-    async def load_session(self, conversation_id: str) -> ConversationSession | None:
-        """Load a conversation session from file."""
-        async with self._lock:
-            try:
-                session_file = self._get_session_file(conversation_id)
-                if not session_file.exists():
+    async def save_session(self, session: ConversationSession) -> None:
+        """Save a conversation session as a compacted event log."""
+        try:
+            async with self._lock_for(session.conversation_id):
+                is_new = not await self._run_io(
+                    self._get_session_file(session.conversation_id).exists
+                )
+                await self._run_io(self._write_snapshot, session)
+                self._counts[session.conversation_id] = len(session.interactions)
+
+            if is_new:
+                async with self._lock_for(session.user_id):
+                    await self._run_io(
+                        self._append_user_index, session.user_id, "add", session.conversation_id
+                    )
+        except Exception as e:
+            logger.error(f"Error saving conversation session {session.conversation_id}: {e}")
+            raise
+
+    async def append_interaction(
+        self,
+        conversation_id: str,
+        interaction: Interaction,
+        keep_last: int | None = None,
+    ) -> int | None:
+        """Append one interaction to the conversation's log.
+
+        With ``keep_last`` only that many most recent interactions are kept
+        when the log is replayed. Returns the resulting number of
+        interactions, or None if the conversation does not exist.
+        """
+        async with self._lock_for(conversation_id):
+            count = self._counts.get(conversation_id)
+            if count is None:
+                session = await self._run_io(self._read_session, conversation_id)
+                if session is None:
                     return None
+                count = len(session.interactions)
 
-                with open(session_file, encoding='utf-8') as f:
-                    session_data = json.load(f)
+            event = {"event": "interaction", **self._serialize_interaction(interaction)}
+            if keep_last is not None:
+                event["keep"] = keep_last
+            if not await self._run_io(self._append_event, conversation_id, event):
+                self._counts.pop(conversation_id, None)
+                return None
 
-                return self._deserialize_session(session_data)
+            count += 1
+            if keep_last is not None:
+                count = min(count, keep_last)
+            self._counts[conversation_id] = count
+            return count
 
+    async def load_session(self, conversation_id: str) -> ConversationSession | None:
+        """Load a conversation session by replaying its event log."""
+        async with self._lock_for(conversation_id):
+            try:
+                session = await self._run_io(self._read_session, conversation_id)
             except Exception as e:
                 logger.error(f"Error loading conversation session {conversation_id}: {e}")
                 return None
+            if session is not None:
+                self._counts[conversation_id] = len(session.interactions)
+            return session
 
     async def delete_session(self, conversation_id: str) -> bool:
-        """Delete a conversation session file."""
-        async with self._lock:
-            try:
-                session_file = self._get_session_file(conversation_id)
-                if not session_file.exists():
+        """Delete a conversation session's log."""
+        try:
+            async with self._lock_for(conversation_id):
+                session = await self._run_io(self._read_session, conversation_id)
+                if session is None:
                     return False
+                await self._run_io(self._get_session_file(conversation_id).unlink)
+                self._counts.pop(conversation_id, None)
 
-                # Load session to get user_id for index cleanup
-                session = await self.load_session(conversation_id)
-                if session:
-                    # Remove from user index
-                    user_index_file = self._get_user_index_file(session.user_id)
-                    if user_index_file.exists():
-                        try:
-                            with open(user_index_file, encoding='utf-8') as f:
-                                user_conversations = json.load(f)
-
-                            if conversation_id in user_conversations:
-                                user_conversations.remove(conversation_id)
-
-                            with open(user_index_file, 'w', encoding='utf-8') as f:
-                                json.dump(user_conversations, f)
-                        except (OSError, json.JSONDecodeError):
-                            pass
-
-                # Delete session file
-                session_file.unlink()
-                return True
+            async with self._lock_for(session.user_id):
+                await self._run_io(
+                    self._append_user_index, session.user_id, "remove", conversation_id
+                )
+            return True
 
-            except Exception as e:
-                logger.error(f"Error deleting conversation session {conversation_id}: {e}")
-                return False
+        except Exception as e:
+            logger.error(f"Error deleting conversation session {conversation_id}: {e}")
+            return False
 
     async def list_user_conversations(self, user_id: str) -> list[str]:
         """List conversation IDs for a user."""
-        async with self._lock:
+        async with self._lock_for(user_id):
             try:
-                user_index_file = self._get_user_index_file(user_id)
-                if not user_index_file.exists():
-                    return []
-
-                with open(user_index_file, encoding='utf-8') as f:
-                    return json.load(f)
-
+                return await self._run_io(self._read_user_index, user_id)
             except Exception as e:
                 logger.error(f"Error listing conversations for user {user_id}: {e}")
                 return []
@@ -318,10 +455,6 @@ class ConversationMemoryManager:
             answer: Assistant answer
             metadata: Optional interaction metadata
         """
-        session = await self.backend.load_session(conversation_id)
-        if not session:
-            raise ValueError(f"Conversation {conversation_id} not found")
-
         interaction = Interaction(
             question=question,
             answer=answer,
@@ -329,6 +462,26 @@ class ConversationMemoryManager:
             metadata=metadata or {}
         )
 
+        append_interaction = getattr(self.backend, "append_interaction", None)
+        if append_interaction is not None:
+            # Truncation is applied by the backend; summarization needs the
+            # older interactions, so it falls back to a load/save cycle
+            keep_last = None if self.enable_summarization else self.max_interactions_per_conversation
+            count = await append_interaction(conversation_id, interaction, keep_last)
+            if count is None:
+                raise ValueError(f"Conversation {conversation_id} not found")
+            if count > self.max_interactions_per_conversation:
+                session = await self.backend.load_session(conversation_id)
+                if session is not None:
+                    await self._handle_memory_limits(session)
+                    await self.backend.save_session(session)
+            logger.debug(f"Added interaction to conversation {conversation_id}")
+            return
+
+        session = await self.backend.load_session(conversation_id)
+        if not session:
+            raise ValueError(f"Conversation {conversation_id} not found")
+
         session.add_interaction(interaction)
 
         # Handle memory limits
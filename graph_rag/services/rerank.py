@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
 import math
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 
 from graph_rag.core.interfaces import SearchResultData
@@ -10,13 +15,29 @@ logger = logging.getLogger(__name__)
 
 
 class CrossEncoderReranker:
-    """Lightweight reranker wrapper.
+    """Resident cross-encoder reranker.
 
-    If cross-encoder model is unavailable, acts as a no-op returning the top-k input.
+    The model is loaded once, on first use, and inference runs on a small
+    dedicated thread pool. (query, passage) pairs from concurrent ``rerank``
+    calls are micro-batched: pairs queued within ``max_wait_ms`` of each other
+    (up to ``max_batch_size``) are scored in one ``predict`` call. Scores are
+    cached by query and chunk so repeated queries skip inference entirely.
+
+    If the cross-encoder model is unavailable, acts as a no-op returning the top-k input.
     """
 
-    def __init__(self, model_name: str | None = None):
+    def __init__(
+        self,
+        model_name: str | None = None,
+        max_batch_size: int = 64,
+        max_wait_ms: float = 5.0,
+        max_workers: int = 1,
+        cache_size: int = 10_000,
+    ):
         self.model_name = model_name or "cross-encoder/ms-marco-MiniLM-L-6-v2"
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000.0
+        self.cache_size = cache_size
         self._available = False
         try:  # optional dependency
             from sentence_transformers import CrossEncoder  # noqa: F401
@@ -24,6 +45,135 @@ class CrossEncoderReranker:
             self._available = True
         except Exception:
             self._available = False
+        self._model = None
+        self._model_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, max_workers), thread_name_prefix="rerank"
+        )
+        self._scores: OrderedDict[tuple[str, str, int], float] = OrderedDict()
+        # Pairs waiting for the next batch: (pair, cache key, future)
+        self._pending: list[tuple[tuple[str, str], tuple[str, str, int], asyncio.Future]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        # Running batches, referenced so they are not garbage-collected mid-flight
+        self._batch_tasks: set[asyncio.Task] = set()
+
+    def _load_model(self):
+        from sentence_transformers import CrossEncoder
+
+        return CrossEncoder(self.model_name)
+
+    def _get_model(self):
+        if self._model is None:
+            with self._model_lock:
+                if self._model is None:
+                    logger.info(f"Loading cross-encoder model {self.model_name}")
+                    self._model = self._load_model()
+        return self._model
+
+    def _predict(self, pairs: list[tuple[str, str]]) -> list[float]:
+        scores = self._get_model().predict(pairs)
+        return [float(s) for s in scores]
+
+    @staticmethod
+    def _cache_key(query_digest: str, item: SearchResultData) -> tuple[str, str, int]:
+        # Text hash guards against chunk ids reused for re-ingested content
+        return (query_digest, item.chunk.id, hash(item.chunk.text))
+
+    def _remember(self, key: tuple[str, str, int], score: float) -> None:
+        if self.cache_size <= 0:
+            return
+        self._scores[key] = score
+        self._scores.move_to_end(key)
+        while len(self._scores) > self.cache_size:
+            self._scores.popitem(last=False)
+
+    def _enqueue(
+        self, pair: tuple[str, str], key: tuple[str, str, int]
+    ) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Pending work from another (finished) loop can never complete
+            self._pending = []
+            self._flush_handle = None
+            self._batch_tasks = set()
+            self._loop = loop
+        future = loop.create_future()
+        self._pending.append((pair, key, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_wait, self._flush)
+        return future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        while self._pending:
+            batch = self._pending[: self.max_batch_size]
+            self._pending = self._pending[self.max_batch_size :]
+            task = asyncio.ensure_future(self._run_batch(batch))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+
+    async def _run_batch(self, batch) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            scores = await loop.run_in_executor(
+                self._executor, self._predict, [pair for pair, _, _ in batch]
+            )
+            for (_, key, future), score in zip(batch, scores, strict=True):
+                self._remember(key, score)
+                if not future.done():
+                    future.set_result(score)
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            # Cancelled or interrupted: never leave a caller waiting
+            for _, _, future in batch:
+                future.cancel()
+
+    async def score(self, query: str, items: list[SearchResultData]) -> list[float]:
+        """Cross-encoder relevance of each item to ``query`` (cached or batched)."""
+        query_digest = hashlib.sha1(query.encode("utf-8")).hexdigest()
+        scores: list[float | None] = []
+        waiting: list[tuple[int, asyncio.Future]] = []
+        for i, item in enumerate(items):
+            key = self._cache_key(query_digest, item)
+            cached = self._scores.get(key)
+            if cached is not None:
+                self._scores.move_to_end(key)
+                scores.append(cached)
+            else:
+                scores.append(None)
+                waiting.append((i, self._enqueue((query, item.chunk.text), key)))
+        if waiting:
+            results = await asyncio.gather(*(f for _, f in waiting))
+            for (i, _), value in zip(waiting, results, strict=True):
+                scores[i] = value
+        return scores  # type: ignore[return-value]
+
+    @staticmethod
+    def _apply_scores(
+        items: list[SearchResultData], scores: list[float], k: int
+    ) -> list[SearchResultData]:
+        # Attach scores and sort
+        rescored: list[SearchResultData] = []
+        for it, s in zip(items, scores, strict=False):
+            try:
+                it.score = float(s)  # type: ignore[attr-defined]
+                if hasattr(it, "chunk") and hasattr(it.chunk, "metadata"):
+                    meta = it.chunk.metadata or {}
+                    meta["score_rerank"] = float(s)
+                    it.chunk.metadata = meta
+            except Exception:
+                pass
+            rescored.append(it)
+        rescored.sort(key=lambda x: getattr(x, "score", 0.0), reverse=True)
+        return rescored[:k]
 
     async def rerank(
         self, query: str, items: list[SearchResultData], k: int
@@ -34,29 +184,52 @@ class CrossEncoderReranker:
             # Best effort: return as-is
             return items[:k]
         try:
-            from sentence_transformers import CrossEncoder
-
-            model = CrossEncoder(self.model_name)
-            pairs = [(query, it.chunk.text) for it in items]
-            scores = model.predict(pairs)
-            # Attach scores and sort
-            rescored: list[SearchResultData] = []
-            for it, s in zip(items, scores, strict=False):
-                try:
-                    it.score = float(s)  # type: ignore[attr-defined]
-                    if hasattr(it, "chunk") and hasattr(it.chunk, "metadata"):
-                        meta = it.chunk.metadata or {}
-                        meta["score_rerank"] = float(s)
-                        it.chunk.metadata = meta
-                except Exception:
-                    pass
-                rescored.append(it)
-            rescored.sort(key=lambda x: getattr(x, "score", 0.0), reverse=True)
-            return rescored[:k]
-        except Exception:
+            scores = await self.score(query, items)
+            return self._apply_scores(items, scores, k)
+        except Exception as e:
+            logger.warning(f"Cross-encoder rerank failed, keeping input order: {e}")
             # Fallback
             return items[:k]
 
+    def rerank_sync(
+        self, query: str, items: list[SearchResultData], k: int
+    ) -> list[SearchResultData]:
+        """Blocking rerank for synchronous callers (no batching across requests)."""
+        if not items:
+            return []
+        if not self._available:
+            return items[:k]
+        try:
+            scores = self._predict([(query, it.chunk.text) for it in items])
+            return self._apply_scores(items, scores, k)
+        except Exception as e:
+            logger.warning(f"Cross-encoder rerank failed, keeping input order: {e}")
+            return items[:k]
+
+    def close(self) -> None:
+        """Stop the inference threads."""
+        self._executor.shutdown(wait=False)
+
+
+_shared_reranker: CrossEncoderReranker | None = None
+
+
+def get_cross_encoder_reranker() -> CrossEncoderReranker:
+    """Process-wide reranker, so the model is loaded once for all engines."""
+    global _shared_reranker
+    if _shared_reranker is None:
+        from graph_rag.config import get_settings
+
+        settings = get_settings()
+        _shared_reranker = CrossEncoderReranker(
+            model_name=settings.reranker_model_name,
+            max_batch_size=settings.reranker_max_batch_size,
+            max_wait_ms=settings.reranker_max_wait_ms,
+            max_workers=settings.reranker_workers,
+            cache_size=settings.reranker_cache_size,
+        )
+    return _shared_reranker
+
 
 class ReRankingStrategy(Enum):
     """Available re-ranking strategies."""
@@ -72,7 +245,7 @@ class ReRankingService:
 
     def __init__(self):
         """Initialize the re-ranking service."""
-        self.cross_encoder = CrossEncoderReranker()
+        self.cross_encoder = get_cross_encoder_reranker()
 
     def rerank(
         self,
@@ -94,9 +267,8 @@ class ReRankingService:
             return results
 
         if strategy == ReRankingStrategy.CROSS_ENCODER:
-            # Use existing cross-encoder implementation
-            import asyncio
-            return asyncio.run(self.cross_encoder.rerank(query, results, len(results)))
+            # Synchronous callers cannot await the batched path; score directly
+            return self.cross_encoder.rerank_sync(query, results, len(results))
         elif strategy == ReRankingStrategy.SEMANTIC_SIMILARITY:
             return self._semantic_rerank(query, results)
         elif strategy == ReRankingStrategy.BM25_SCORING:
@@ -260,4 +432,6 @@ class ReRankingService:
         except ValueError:
             logger.warning(f"Unknown strategy {strategy}, using semantic_similarity")
 
+        if strategy_enum == ReRankingStrategy.CROSS_ENCODER and results:
+            return await self.cross_encoder.rerank(query, results, len(results))
         return self.rerank(query, results, strategy_enum)
@@ -19,6 +19,7 @@ from graph_rag.core.interfaces import (
     SearchResultData,
     VectorStore,
 )
+from graph_rag.core.query_embedding_cache import get_query_embedding_cache
 from graph_rag.domain.models import Chunk
 
 logger = logging.getLogger(__name__)
@@ -187,7 +188,9 @@ class SearchService:
         """
         try:
             # 1. Generate embedding for the query
-            query_vector = await self.embedding_service.generate_embedding(query)
+            query_vector = await get_query_embedding_cache().get_or_embed(
+                self.embedding_service, query, self.embedding_service.generate_embedding
+            )
             if not isinstance(query_vector, list):
                 # Handle potential errors during encoding if needed, though encode raises
                 logger.warning("Failed to generate query embedding, falling back to keyword search")
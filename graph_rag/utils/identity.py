@@ -1,4 +1,5 @@
 import hashlib
+import json
 import re
 from pathlib import Path
 from typing import Any
@@ -19,6 +20,17 @@ def _hash_content(content: str) -> str:
     return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
 
 
+def content_fingerprint(text: str) -> str:
+    """SHA-256 of ``text`` exactly as given (no normalization)."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def metadata_fingerprint(metadata: dict[str, Any] | None) -> str:
+    """SHA-256 of ``metadata`` serialized as canonical (key-sorted) JSON."""
+    canonical = json.dumps(metadata or {}, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
 def _hash_path(path: Path) -> str:
     try:
         abs_lower = str(path.resolve()).lower()
@@ -0,0 +1,84 @@
+"""Tests for the SimpleCache LRU/TTL cache and the @cached decorator."""
+
+import pytest
+
+from graph_rag.api import performance
+from graph_rag.api.performance import SimpleCache, cached
+
+
+def test_simple_cache_evicts_least_recently_used():
+    cache = SimpleCache(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" is now least recently used
+
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_simple_cache_expires_entries(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(performance.time, "monotonic", lambda: now[0])
+    cache = SimpleCache(default_ttl=10.0, sweep_interval=0.0)
+    cache.set("short", "x", ttl=1.0)
+    cache.set("long", "y")
+
+    now[0] += 5.0
+
+    assert cache.get("short") is None
+    assert cache.get("long") == "y"
+    stats = cache.stats()
+    assert stats["size"] == 1
+    assert stats["expirations"] == 1
+
+
+def test_simple_cache_tracks_hit_rate():
+    cache = SimpleCache()
+    assert cache.stats()["hit_rate"] == 0.0
+
+    cache.set("k", "v")
+    cache.get("k")
+    cache.get("k")
+    cache.get("missing")
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"]) == (2, 1)
+    assert stats["hit_rate"] == pytest.approx(2 / 3)
+
+
+def test_simple_cache_namespaces_are_isolated():
+    cache = SimpleCache()
+    cache.set("k", "search", namespace="search")
+    cache.set("k", "graph", namespace="graph")
+
+    cache.clear("search")
+
+    assert cache.get("k", namespace="search") is None
+    assert cache.get("k", namespace="graph") == "graph"
+    namespaces = cache.stats()["namespaces"]
+    assert namespaces["graph"] == {"hits": 1, "misses": 0, "size": 1}
+    assert namespaces["search"] == {"hits": 0, "misses": 1, "size": 0}
+
+
+@pytest.mark.asyncio
+async def test_cached_decorator_uses_namespace():
+    cache = SimpleCache()
+    calls = []
+
+    @cached(ttl=60.0, cache_instance=cache, namespace="double")
+    async def double(x: int) -> int:
+        calls.append(x)
+        return 2 * x
+
+    assert await double(2) == 4
+    assert await double(2) == 4
+    assert calls == [2]
+    assert cache.stats()["namespaces"]["double"]["hits"] == 1
+
+    cache.clear("double")
+    assert await double(2) == 4
+    assert calls == [2, 2]
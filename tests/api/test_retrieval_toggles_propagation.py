@@ -59,6 +59,7 @@ async def test_ask_request_all_retrieval_toggles_propagate():
         search_type="vector",
         blend_vector_weight=0.7,
         blend_keyword_weight=0.3,
+        hybrid_fusion="rrf",
         no_answer_min_score=0.5,
         rerank=True,
         mmr_lambda=0.6,
@@ -90,6 +91,7 @@ async def test_ask_request_all_retrieval_toggles_propagate():
         "search_type",
         "blend_vector_weight",
         "blend_keyword_weight",
+        "hybrid_fusion",
         "no_answer_min_score",
         "rerank",
         "mmr_lambda",
@@ -101,6 +103,7 @@ async def test_ask_request_all_retrieval_toggles_propagate():
     assert captured_config["search_type"] == "vector"
     assert captured_config["blend_vector_weight"] == 0.7
     assert captured_config["blend_keyword_weight"] == 0.3
+    assert captured_config["hybrid_fusion"] == "rrf"
     assert captured_config["no_answer_min_score"] == 0.5
     assert captured_config["rerank"] is True
     assert captured_config["mmr_lambda"] == 0.6
@@ -0,0 +1,142 @@
+"""Router-level tests for /search/batch on a minimal app with the engine overridden."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import FastAPI, status
+from fastapi.testclient import TestClient
+
+from graph_rag.api.dependencies import get_graph_rag_engine
+from graph_rag.api.routers.core_business_operations import (
+    create_core_business_operations_router,
+)
+from graph_rag.core.interfaces import ChunkData, SearchResultData
+
+
+def _hit(chunk_id: str, score: float = 0.5) -> SearchResultData:
+    return SearchResultData(
+        chunk=ChunkData(id=chunk_id, text=f"text {chunk_id}", document_id="doc-1"),
+        score=score,
+    )
+
+
+@pytest.fixture
+def engine():
+    engine = MagicMock()
+    engine.batch_search = AsyncMock(
+        side_effect=lambda queries, config: [
+            [_hit(f"{q}-{i}") for i in range(config["k"])] for q in queries
+        ]
+    )
+    engine.answer_query = AsyncMock(side_effect=lambda query, config, **_: f"answer to {query}")
+    return engine
+
+
+@pytest.fixture
+def client(engine):
+    app = FastAPI()
+    app.include_router(create_core_business_operations_router(), prefix="/api/v1")
+    app.dependency_overrides[get_graph_rag_engine] = lambda: engine
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.mark.unit
+def test_batch_search_groups_queries_by_type_and_trims_to_each_limit(client, engine):
+    payload = {
+        "queries": [
+            {"query": "a", "search_type": "vector", "limit": 2},
+            {"query": "b", "search_type": "keyword", "limit": 1},
+            {"query": "c", "search_type": "vector", "limit": 3},
+        ]
+    }
+
+    response = client.post("/api/v1/search/batch", json=payload)
+
+    assert response.status_code == status.HTTP_200_OK, response.text
+    body = response.json()
+    assert [r["query"] for r in body] == ["a", "b", "c"]
+    assert [r["search_type"] for r in body] == ["vector", "keyword", "vector"]
+    assert [[hit["chunk"]["id"] for hit in r["results"]] for r in body] == [
+        ["a-0", "a-1"],
+        ["b-0"],
+        ["c-0", "c-1", "c-2"],
+    ]
+    assert [r["total_results"] for r in body] == [2, 1, 3]
+    assert all(r["status_code"] == 200 and r["error"] is None for r in body)
+    assert all(r["llm_response"] is None for r in body)
+    assert body[0]["results"][0]["chunk"]["document_id"] == "doc-1"
+
+    # One retrieval per search type, at the largest limit of its queries
+    calls = sorted(
+        (c.kwargs["config"]["search_type"], c.args[0], c.kwargs["config"]["k"])
+        for c in engine.batch_search.await_args_list
+    )
+    assert calls == [("keyword", ["b"], 1), ("vector", ["a", "c"], 3)]
+    engine.answer_query.assert_not_awaited()
+
+
+@pytest.mark.unit
+def test_batch_search_generates_answers_from_retrieved_chunks(client, engine):
+    payload = {
+        "queries": [{"query": "a", "limit": 1}, {"query": "b", "limit": 2}],
+        "generate_answers": True,
+        "answer_concurrency": 1,
+    }
+
+    response = client.post("/api/v1/search/batch", json=payload)
+
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert [r["llm_response"] for r in response.json()] == ["answer to a", "answer to b"]
+    reused = {
+        c.args[0]: [hit.chunk.id for hit in c.kwargs["_retrieved_chunks_data"]]
+        for c in engine.answer_query.await_args_list
+    }
+    assert reused == {"a": ["a-0"], "b": ["b-0", "b-1"]}
+
+
+@pytest.mark.unit
+def test_batch_search_reports_per_query_failures_with_multi_status(client, engine):
+    async def answer(query, config, **_):
+        if query == "c":
+            raise RuntimeError("llm down")
+        return f"answer to {query}"
+
+    async def batch_search(queries, config):
+        if config["search_type"] == "keyword":
+            raise ValueError("index missing")
+        return [[_hit(f"{q}-0", score=0.25)] for q in queries]
+
+    engine.batch_search.side_effect = batch_search
+    engine.answer_query.side_effect = answer
+    payload = {
+        "queries": [
+            {"query": "a", "search_type": "vector"},
+            {"query": "b", "search_type": "keyword"},
+            {"query": "c", "search_type": "vector"},
+        ],
+        "generate_answers": True,
+    }
+
+    response = client.post("/api/v1/search/batch", json=payload)
+
+    assert response.status_code == status.HTTP_207_MULTI_STATUS
+    ok, failed_search, failed_answer = response.json()
+    assert ok["status_code"] == 200 and ok["llm_response"] == "answer to a"
+    assert ok["results"][0]["score"] == 0.25
+    assert failed_search["status_code"] == 500
+    assert failed_search["error"] == {"message": "index missing", "type": "ValueError"}
+    assert failed_search["results"] == [] and failed_search["llm_response"] is None
+    assert failed_answer["status_code"] == 500
+    assert failed_answer["error"]["type"] == "RuntimeError"
+    assert failed_answer["results"][0]["chunk"]["id"] == "c-0"
+    # No answer is attempted for a query whose retrieval failed
+    assert sorted(c.args[0] for c in engine.answer_query.await_args_list) == ["a", "c"]
+
+
+@pytest.mark.unit
+def test_batch_search_rejects_empty_and_invalid_queries(client, engine):
+    assert client.post("/api/v1/search/batch", json={"queries": []}).status_code == 422
+    invalid = {"queries": [{"query": "a", "search_type": "graph"}]}
+    assert client.post("/api/v1/search/batch", json=invalid).status_code == 422
+    engine.batch_search.assert_not_awaited()
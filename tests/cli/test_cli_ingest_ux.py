@@ -164,3 +164,21 @@ def test_ingest_json_directory_success(tmp_path: Path):
         assert isinstance(arr, list) and len(arr) == 2
         ids = {item["document_id"] for item in arr}
         assert ids == {"a-id", "b-id"}
+
+
+def test_ingest_force_disables_unchanged_skip(tmp_path: Path):
+    file_path = tmp_path / "note.md"
+    file_path.write_text("Body", encoding="utf-8")
+
+    runner = CliRunner()
+    with patch(
+        "graph_rag.cli.commands.ingest.process_and_store_document",
+        new_callable=AsyncMock,
+    ) as mock_process:
+        mock_process.return_value = {"document_id": "note", "num_chunks": 1}
+        assert runner.invoke(app, ["ingest", str(file_path), "--json"]).exit_code == 0
+        assert mock_process.call_args.kwargs["skip_unchanged"] is True
+
+        result = runner.invoke(app, ["ingest", str(file_path), "--json", "--force"])
+        assert result.exit_code == 0
+        assert mock_process.call_args.kwargs["skip_unchanged"] is False
@@ -88,6 +88,19 @@ def test_settings_load_defaults(monkeypatch):
     assert settings.vector_store_type == "simple"
 
 
+def test_ingestion_queue_is_opt_in_and_lives_in_the_data_dir(monkeypatch, tmp_path):
+    """Test the ingestion queue defaults: disabled, with its DB next to the vector store."""
+    for var in ("SYNAPSE_INGESTION_QUEUE_ENABLED", "SYNAPSE_INGESTION_QUEUE_PATH"):
+        monkeypatch.delenv(var, raising=False)
+
+    settings = Settings(_env_file=None, vector_store_path=str(tmp_path / "data" / "vectors"))
+    assert settings.ingestion_queue_enabled is False
+    assert settings.get_ingestion_queue_path() == str(tmp_path / "data" / "ingestion_jobs.sqlite3")
+
+    explicit = Settings(_env_file=None, ingestion_queue_path=str(tmp_path / "jobs.db"))
+    assert explicit.get_ingestion_queue_path() == str(tmp_path / "jobs.db")
+
+
 def test_settings_load_from_env_vars(monkeypatch):
     """Test loading settings from prefixed environment variables."""
     # Set prefixed environment variables
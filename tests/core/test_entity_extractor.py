@@ -1,3 +1,4 @@
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -30,6 +31,8 @@ def mock_spacy_doc(mock_spacy_entity):
 def mock_spacy_nlp(mock_spacy_doc):
     nlp = MagicMock()
     nlp.return_value = mock_spacy_doc
+    # nlp.pipe streams the same Docs that nlp(text) would produce
+    nlp.pipe.side_effect = lambda texts, **kwargs: (nlp(text) for text in texts)
     return nlp
 
 
@@ -153,6 +156,93 @@ async def test_spacy_extract_empty_text(mock_spacy_nlp):
         mock_spacy_nlp.assert_not_called()  # Correct assertion
 
 
+def _make_ent(text: str, label: str) -> MagicMock:
+    ent = MagicMock()
+    ent.text = text
+    ent.label_ = label
+    return ent
+
+
+@pytest.fixture
+def pipe_extractor(monkeypatch):
+    """SpacyEntityExtractor over a fake pipeline that records nlp.pipe calls."""
+    monkeypatch.setenv("SYNAPSE_ENABLE_ENTITY_CACHE", "true")
+    docs_by_text = {
+        "Apple Inc. hired Tim Cook.": [
+            _make_ent("Apple Inc.", "ORG"),
+            _make_ent("Tim Cook", "PERSON"),
+        ],
+        "Cupertino is sunny.": [_make_ent("Cupertino", "GPE")],
+    }
+    nlp = MagicMock()
+    nlp.pipe_names = ["tok2vec", "tagger", "parser", "attribute_ruler", "lemmatizer", "ner"]
+    nlp.pipe_calls = []
+
+    def pipe(texts, **kwargs):
+        texts = list(texts)
+        nlp.pipe_calls.append((texts, kwargs, threading.current_thread()))
+        for text in texts:
+            doc = MagicMock()
+            doc.ents = docs_by_text.get(text, [])
+            yield doc
+
+    nlp.pipe.side_effect = pipe
+    spacy = MagicMock()
+    spacy.load.return_value = nlp
+    with patch.dict("sys.modules", {"spacy": spacy}):
+        extractor = SpacyEntityExtractor(batch_size=8, n_process=2)
+    yield extractor
+    extractor.close()
+
+
+@pytest.mark.asyncio
+async def test_extract_batch_streams_texts_through_one_pipe_call(pipe_extractor):
+    texts = ["Apple Inc. hired Tim Cook.", "  ", "Cupertino is sunny.", "Apple Inc. hired Tim Cook."]
+    contexts = [{"chunk_id": f"c{i}"} for i in range(len(texts))]
+
+    results = await pipe_extractor.extract_batch(texts, contexts)
+
+    calls = pipe_extractor.nlp.pipe_calls
+    assert len(calls) == 1
+    piped_texts, kwargs, thread = calls[0]
+    # Blank texts are skipped and duplicates are processed once
+    assert piped_texts == ["Apple Inc. hired Tim Cook.", "Cupertino is sunny."]
+    assert kwargs["batch_size"] == 8
+    assert kwargs["n_process"] == 2
+    assert kwargs["disable"] == ["tagger", "parser", "attribute_ruler", "lemmatizer"]
+    assert thread is not threading.main_thread()
+
+    assert [[e.id for e in r.entities] for r in results] == [
+        ["ORG:apple_inc", "PERSON:tim_cook"],
+        [],
+        ["GPE:cupertino"],
+        ["ORG:apple_inc", "PERSON:tim_cook"],
+    ]
+    assert results[0].entities[0].metadata == {"chunk_id": "c0"}
+    assert results[3].entities[0].metadata == {"chunk_id": "c3"}
+
+
+@pytest.mark.asyncio
+async def test_extract_batch_uses_cache_for_known_texts(pipe_extractor):
+    await pipe_extractor.extract_batch(["Cupertino is sunny."])
+    results = await pipe_extractor.extract_batch(
+        ["Cupertino is sunny.", "Apple Inc. hired Tim Cook."]
+    )
+
+    second_call_texts = pipe_extractor.nlp.pipe_calls[1][0]
+    assert second_call_texts == ["Apple Inc. hired Tim Cook."]
+    assert [e.id for e in results[0].entities] == ["GPE:cupertino"]
+
+
+@pytest.mark.asyncio
+async def test_extract_batch_returns_empty_results_when_pipe_fails(pipe_extractor):
+    pipe_extractor.nlp.pipe.side_effect = RuntimeError("model crashed")
+
+    results = await pipe_extractor.extract_batch(["Cupertino is sunny.", "other"])
+
+    assert [r.entities for r in results] == [[], []]
+
+
 # TODO: Add tests for relationship extraction if a different model/library is used
 
 
@@ -886,6 +886,122 @@ async def test_retrieve_context_vector_only(
     rag_engine._llm_service.generate_response.assert_not_awaited()
 
 
+@pytest.mark.asyncio
+async def test_retrieve_context_mmr_overfetches_and_diversifies(
+    rag_engine: SimpleGraphRAGEngine,
+    mock_vector_store: AsyncMock,
+):
+    """MMR fetches a larger candidate pool and skips near-duplicate chunks."""
+    query = "alpha project"
+    mock_vector_store.search.return_value = [
+        SearchResultData(
+            chunk=ChunkData(id="c1", text="alpha", document_id="d1", embedding=[1.0, 0.0]),
+            score=0.95,
+        ),
+        SearchResultData(
+            chunk=ChunkData(id="c2", text="alpha again", document_id="d1", embedding=[0.99, 0.01]),
+            score=0.94,
+        ),
+        SearchResultData(
+            chunk=ChunkData(id="c3", text="beta", document_id="d2", embedding=[0.0, 1.0]),
+            score=0.8,
+        ),
+    ]
+
+    results, _ = await rag_engine._retrieve_and_build_context(
+        query,
+        config={
+            "k": 2,
+            "include_graph": False,
+            "extract_relationships": False,
+            "mmr_lambda": 0.5,
+            "mmr_candidates": 6,
+        },
+    )
+
+    mock_vector_store.search.assert_awaited_once_with(query, top_k=6, search_type="vector")
+    assert [r.chunk.id for r in results] == ["c1", "c3"]
+
+
+@pytest.mark.asyncio
+async def test_retrieve_context_mmr_trims_small_pools_to_k(
+    rag_engine: SimpleGraphRAGEngine,
+    mock_vector_store: AsyncMock,
+):
+    """A candidate pool too small to diversify is still cut to k results."""
+    mock_vector_store.search.return_value = [
+        SearchResultData(chunk=ChunkData(id="c1", text="alpha", document_id="d1"), score=0.9),
+        SearchResultData(chunk=ChunkData(id="c2", text="beta", document_id="d1"), score=0.8),
+    ]
+
+    results, _ = await rag_engine._retrieve_and_build_context(
+        "alpha",
+        config={"k": 1, "include_graph": False, "extract_relationships": False, "mmr_lambda": 0.5},
+    )
+
+    mock_vector_store.search.assert_awaited_once_with("alpha", top_k=4, search_type="vector")
+    assert [r.chunk.id for r in results] == ["c1"]
+
+
+@pytest.mark.asyncio
+async def test_batch_search_embeds_once_and_matches_single_queries(
+    mock_graph_repository: AsyncMock,
+    mock_entity_extractor: AsyncMock,
+    mock_llm_service: AsyncMock,
+    monkeypatch,
+):
+    """batch_search embeds all queries in one encode call and ranks like search()."""
+    from graph_rag.core import query_embedding_cache
+    from graph_rag.infrastructure.vector_stores.simple_vector_store import SimpleVectorStore
+
+    monkeypatch.setattr(
+        query_embedding_cache, "_shared_cache", query_embedding_cache.QueryEmbeddingCache()
+    )
+    axes = {"alpha": [1.0, 0.0, 0.0], "beta": [0.0, 1.0, 0.0], "gamma": [0.0, 0.0, 1.0]}
+
+    class KeywordAxisEmbedding:
+        model_name = "axis"
+
+        def __init__(self):
+            self.encode_calls: list[list[str]] = []
+
+        async def encode(self, texts):
+            self.encode_calls.append(list(texts))
+            return [axes[t.split()[0]] for t in texts]
+
+        async def encode_query(self, text):
+            return axes[text.split()[0]]
+
+        def get_embedding_dimension(self):
+            return 3
+
+    service = KeywordAxisEmbedding()
+    store = SimpleVectorStore(service)
+    await store.add_chunks(
+        [
+            ChunkData(id=f"c{i}", text=f"text {i}", document_id="d", embedding=embedding)
+            for i, embedding in enumerate(
+                [[1.0, 0.1, 0.0], [0.1, 1.0, 0.0], [0.0, 0.2, 1.0], [0.9, 0.0, 0.3]]
+            )
+        ]
+    )
+    engine = SimpleGraphRAGEngine(
+        graph_store=mock_graph_repository,
+        vector_store=store,
+        entity_extractor=mock_entity_extractor,
+        llm_service=mock_llm_service,
+    )
+    queries = ["alpha query", "beta query", "gamma query", "alpha query"]
+
+    batched = await engine.batch_search(queries, config={"k": 2, "search_type": "vector"})
+
+    assert service.encode_calls == [["alpha query", "beta query", "gamma query"]]
+    for query, hits in zip(queries, batched, strict=True):
+        single = await store.search(query, top_k=2, search_type="vector")
+        assert [h.chunk.id for h in hits] == [h.chunk.id for h in single]
+        assert [h.score for h in hits] == pytest.approx([h.score for h in single])
+
+
 @pytest.mark.asyncio
 async def test_answer_query_vector_only(
     rag_engine: SimpleGraphRAGEngine,  # Use correct fixture name
@@ -1288,10 +1404,10 @@ async def test_query_search_type_hybrid_blending(
     # Assert
     assert result.answer == "Hybrid search answer"
 
-    # Should call both vector and keyword search
+    # Should call both vector and keyword search, each over-fetching 3x k by default
     assert mock_vector_store.search.call_count == 2
-    mock_vector_store.search.assert_any_call(query_text, top_k=3, search_type="vector")
-    mock_vector_store.search.assert_any_call(query_text, top_k=3, search_type="keyword")
+    mock_vector_store.search.assert_any_call(query_text, top_k=9, search_type="vector")
+    mock_vector_store.search.assert_any_call(query_text, top_k=9, search_type="keyword")
 
     # Results should be blended (exact blending logic will be tested in implementation)
     assert len(result.relevant_chunks) >= 1
@@ -35,7 +35,8 @@ def mock_graph_store():
 def mock_embedding_service():
     """Mock embedding service."""
     mock = AsyncMock()
-    mock.get_embedding_dimension.return_value = 384
+    # get_embedding_dimension is synchronous on EmbeddingService
+    mock.get_embedding_dimension = Mock(return_value=384)
     mock.encode = AsyncMock(return_value=[[0.1] * 384])
     mock.generate_embedding = AsyncMock(return_value=[0.1] * 384)
     return mock
@@ -627,8 +628,8 @@ async def test_persistence_integration(tmp_path, mock_embedding_service):
     await vector_store.add_chunks(test_chunks)
 
     # Verify storage files were created
-    assert (storage_path / "vectors.pkl").exists()
-    assert (storage_path / "metadata.json").exists()
+    assert (storage_path / "manifest.json").exists()
+    assert not (storage_path / "vectors.pkl").exists()
 
     # Test loading in new instance
     new_vector_store = SharedPersistentVectorStore(
@@ -0,0 +1,109 @@
+"""Tests for the shared query embedding cache."""
+
+import numpy as np
+import pytest
+
+from graph_rag.core import query_embedding_cache
+from graph_rag.core.interfaces import ChunkData
+from graph_rag.core.query_embedding_cache import QueryEmbeddingCache
+from graph_rag.infrastructure.vector_stores.simple_vector_store import SimpleVectorStore
+
+
+class CountingEmbeddingService:
+    def __init__(self, model_name: str = "test-model"):
+        self.model_name = model_name
+        self.query_calls: list[str] = []
+
+    async def encode(self, texts: list[str]) -> list[list[float]]:
+        return [[1.0, 0.0, 0.0] for _ in texts]
+
+    async def encode_query(self, text: str) -> list[float]:
+        self.query_calls.append(text)
+        return [1.0, 0.0, 0.0]
+
+    def get_embedding_dimension(self) -> int:
+        return 3
+
+
+@pytest.mark.asyncio
+async def test_get_or_embed_normalizes_text_and_tracks_hit_rate():
+    cache = QueryEmbeddingCache(maxsize=8)
+    service = CountingEmbeddingService()
+
+    first = await cache.get_or_embed(service, "Remote Work", service.encode_query)
+    second = await cache.get_or_embed(service, "  remote   work ", service.encode_query)
+
+    assert first == second == [1.0, 0.0, 0.0]
+    assert service.query_calls == ["Remote Work"]
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (1, 1, 1)
+    assert stats["hit_rate"] == pytest.approx(0.5)
+
+
+@pytest.mark.asyncio
+async def test_entries_are_keyed_by_model_and_evicted_lru():
+    cache = QueryEmbeddingCache(maxsize=2)
+    small, large = CountingEmbeddingService("small"), CountingEmbeddingService("large")
+
+    await cache.get_or_embed(small, "q", small.encode_query)
+    await cache.get_or_embed(large, "q", large.encode_query)
+    await cache.get_or_embed(small, "q", small.encode_query)  # refreshes ("small", "q")
+    await cache.get_or_embed(small, "other", small.encode_query)
+
+    assert large.query_calls == ["q"]
+    assert small.query_calls == ["q", "other"]
+    assert cache.get("large", "q") is None
+    stored = cache.get("small", "q")
+    assert stored.dtype == np.float32 and not stored.flags.writeable
+    assert cache.stats()["evictions"] == 1
+
+
+@pytest.mark.asyncio
+async def test_services_without_model_name_are_not_cached():
+    cache = QueryEmbeddingCache()
+    service = CountingEmbeddingService()
+    service.model_name = None
+
+    await cache.get_or_embed(service, "q", service.encode_query)
+    await cache.get_or_embed(service, "q", service.encode_query)
+
+    assert service.query_calls == ["q", "q"]
+    assert cache.stats()["size"] == 0
+
+
+@pytest.mark.asyncio
+async def test_vector_store_searches_share_query_embeddings(monkeypatch):
+    shared = QueryEmbeddingCache()
+    monkeypatch.setattr(query_embedding_cache, "_shared_cache", shared)
+    service = CountingEmbeddingService()
+    store = SimpleVectorStore(embedding_service=service)
+    await store.add_chunks(
+        [ChunkData(id="c1", text="remote work", document_id="d1", embedding=[1.0, 0.0, 0.0])]
+    )
+
+    for _ in range(3):
+        results = await store.search("remote work", top_k=1)
+        assert [r.chunk.id for r in results] == ["c1"]
+
+    assert service.query_calls == ["remote work"]
+    assert shared.stats()["hits"] == 2
+
+
+@pytest.mark.asyncio
+async def test_get_or_embed_many_encodes_only_distinct_misses():
+    cache = QueryEmbeddingCache()
+    service = CountingEmbeddingService()
+    await cache.get_or_embed(service, "cached", service.encode_query)
+    batches: list[list[str]] = []
+
+    async def embed_many(texts):
+        batches.append(texts)
+        return [[0.0, 1.0, 0.0] for _ in texts]
+
+    out = await cache.get_or_embed_many(
+        service, ["Cached", "new", "NEW ", "other"], embed_many
+    )
+
+    assert batches == [["new", "other"]]
+    assert out == [[1.0, 0.0, 0.0]] + [[0.0, 1.0, 0.0]] * 3
+    assert cache.stats()["size"] == 3
@@ -128,3 +128,54 @@ async def test_hybrid_blending_and_dedupe():
     ids = [c.chunk.id for c in chunks]
     assert "A" in ids and "C" in ids
     assert ids.count("A") == 1
+
+
+@pytest.mark.asyncio
+async def test_hybrid_rrf_fusion_ranks_by_reciprocal_rank():
+    # BM25 scores are on a much larger scale than cosine; RRF ignores scale
+    vec = [_sr("A", "alpha", 0.9), _sr("B", "bravo", 0.8), _sr("C", "charlie", 0.1)]
+    kw = [_sr("C", "charlie", 42.0), _sr("B", "bravo", 12.0)]
+    vs = _StubVectorStore(vec, kw)
+    engine = SimpleGraphRAGEngine(
+        graph_store=_StubGraphRepo(), vector_store=vs, entity_extractor=_StubEntityExtractor()
+    )
+
+    chunks, _ = await engine._retrieve_and_build_context(
+        "q",
+        config={"k": 3, "include_graph": False, "search_type": "hybrid", "hybrid_fusion": "rrf"},
+    )
+    ids = [c.chunk.id for c in chunks]
+    # C: 1/63 + 1/61 > B: 1/62 + 1/62 > A: 1/61
+    assert ids == ["C", "B", "A"]
+    assert chunks[0].chunk.metadata["fusion"] == "rrf"
+    assert chunks[0].chunk.metadata["score_keyword"] == 42.0
+
+
+@pytest.mark.asyncio
+async def test_hybrid_legs_run_concurrently_and_over_fetch():
+    import asyncio
+
+    class _SlowStore(_StubVectorStore):
+        def __init__(self, *args):
+            super().__init__(*args)
+            self.in_flight = 0
+            self.max_in_flight = 0
+            self.top_ks = []
+
+        async def search(self, query_text: str, top_k: int = 5, search_type: str = "vector"):
+            self.top_ks.append(top_k)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(0.01)
+            self.in_flight -= 1
+            return await super().search(query_text, top_k, search_type)
+
+    vs = _SlowStore([_sr("A", "alpha", 0.9)], [_sr("B", "bravo", 3.0)])
+    engine = SimpleGraphRAGEngine(
+        graph_store=_StubGraphRepo(), vector_store=vs, entity_extractor=_StubEntityExtractor()
+    )
+    await engine._retrieve_and_build_context(
+        "q", config={"k": 2, "include_graph": False, "search_type": "hybrid", "hybrid_fetch_k": 8}
+    )
+    assert vs.max_in_flight == 2
+    assert vs.top_ks == [8, 8]
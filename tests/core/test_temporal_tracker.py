@@ -0,0 +1,157 @@
+"""Tests for indexed idea matching and persistence in TemporalTracker."""
+
+import pytest
+
+from graph_rag.core.concept_extractor import ConceptualEntity
+from graph_rag.core.temporal_tracker import ConceptEmbeddingIndex, TemporalTracker
+
+
+class FakeEmbeddingService:
+    """Maps known texts to fixed vectors; everything else is orthogonal noise."""
+
+    def __init__(self, vectors: dict[str, list[float]]):
+        self.vectors = vectors
+        self.calls: list[str] = []
+
+    async def generate_embedding(self, text: str) -> list[float]:
+        self.calls.append(text)
+        return self.vectors.get(text, [0.0, 0.0, 1.0])
+
+    def get_embedding_dimension(self) -> int:
+        return 3
+
+
+def _concept(concept_id: str, name: str, text: str | None = None) -> ConceptualEntity:
+    return ConceptualEntity(id=concept_id, name=name, text=text or name)
+
+
+def _metadata(content_id: str, platform: str = "notion", timestamp: str = "2024-01-01T00:00:00Z"):
+    return {"content_id": content_id, "platform": platform, "timestamp": timestamp}
+
+
+def test_embedding_index_returns_best_match_first():
+    index = ConceptEmbeddingIndex(dimension=2)
+    index.add([1.0, 0.0])
+    index.add([0.0, 2.0])
+
+    results = index.search([0.1, 1.0], k=2)
+
+    assert [row for row, _ in results] == [1, 0]
+    assert results[0][1] == pytest.approx(1.0 / (1.01**0.5), rel=1e-5)
+
+
+@pytest.mark.asyncio
+async def test_track_concept_matches_by_name_and_shared_words():
+    tracker = TemporalTracker()
+
+    first = await tracker.track_concept(_concept("c1", "Remote Work"), _metadata("n1"))
+    same_name = await tracker.track_concept(
+        _concept("c2", "remote work"), _metadata("l1", "linkedin", "2024-02-01T00:00:00Z")
+    )
+    unrelated = await tracker.track_concept(_concept("c3", "Pricing Strategy"), _metadata("n2"))
+
+    assert same_name == first
+    assert unrelated != first
+    evolution = tracker.idea_evolutions[first]
+    assert evolution.concept_versions[1].predecessor_id == "c1"
+    assert evolution.concept_versions[0].successor_ids == ["c2"]
+
+
+@pytest.mark.asyncio
+async def test_track_concept_matches_semantically_similar_concepts():
+    embeddings = FakeEmbeddingService(
+        {
+            "Distributed teams": [1.0, 0.1, 0.0],
+            "Async collaboration": [0.95, 0.15, 0.0],
+        }
+    )
+    tracker = TemporalTracker(embedding_service=embeddings, similarity_threshold=0.9)
+
+    first = await tracker.track_concept(_concept("c1", "Distributed teams"), _metadata("n1"))
+    similar = await tracker.track_concept(_concept("c2", "Async collaboration"), _metadata("n2"))
+    unrelated = await tracker.track_concept(_concept("c3", "Quarterly pricing"), _metadata("n3"))
+
+    assert similar == first
+    assert unrelated != first
+    assert embeddings.calls == ["Distributed teams", "Async collaboration", "Quarterly pricing"]
+
+
+@pytest.mark.asyncio
+async def test_tracker_restores_evolutions_from_storage(tmp_path):
+    embeddings = FakeEmbeddingService({"Distributed teams": [1.0, 0.0, 0.0]})
+    tracker = TemporalTracker(embedding_service=embeddings, storage_path=tmp_path)
+    evolution_id = await tracker.track_concept(
+        _concept("c1", "Distributed teams"), _metadata("n1")
+    )
+    await tracker.track_concept(
+        _concept("c2", "distributed teams"), _metadata("l1", "linkedin", "2024-03-01T00:00:00Z")
+    )
+    # Simulate a crash in the middle of an append
+    with (tmp_path / "versions.jsonl").open("a") as f:
+        f.write('{"evolution_id": "partial"')
+
+    restored = TemporalTracker(
+        embedding_service=FakeEmbeddingService({"Team topologies": [0.99, 0.05, 0.0]}),
+        storage_path=tmp_path,
+    )
+
+    assert list(restored.idea_evolutions) == [evolution_id]
+    evolution = restored.idea_evolutions[evolution_id]
+    assert [v.concept.id for v in evolution.concept_versions] == ["c1", "c2"]
+    assert evolution.cross_platform_links == {"notion": ["c1"], "linkedin": ["c2"]}
+    assert evolution.concept_versions[0].successor_ids == ["c2"]
+    assert restored.concept_to_evolution["c2"] == evolution_id
+    assert (tmp_path / "versions.jsonl").read_text().endswith("}\n")
+
+    # The restored embedding index is used for new lookups
+    matched = await restored.track_concept(_concept("c3", "Team topologies"), _metadata("n3"))
+    assert matched == evolution_id
+
+
+@pytest.mark.asyncio
+async def test_distinctive_words_rank_lexical_candidates_first():
+    tracker = TemporalTracker()
+    for i in range(20):
+        await tracker.track_concept(
+            _concept(f"c{i}", f"The Topic{i}", f"the notes of topic{i}"), _metadata(f"n{i}")
+        )
+    compared: list[str] = []
+    original = tracker._concepts_are_similar
+    tracker._concepts_are_similar = lambda a, b: compared.append(b.id) or original(a, b)
+
+    evolution_id = await tracker.track_concept(
+        _concept("new", "Topic7 of the", "a history of topic7"), _metadata("n-new")
+    )
+
+    assert evolution_id == tracker.concept_to_evolution["c7"]
+    assert compared == ["c7"]
+
+
+@pytest.mark.asyncio
+async def test_text_overlap_matches_concepts_with_different_names():
+    tracker = TemporalTracker()
+    text = "orchestrates containers across a cluster of machines"
+    first = await tracker.track_concept(_concept("c1", "Kubernetes", text), _metadata("n1"))
+    for i in range(3):
+        await tracker.track_concept(
+            _concept(f"o{i}", f"Other {i}", f"unrelated notes {i}"), _metadata(f"o{i}")
+        )
+
+    matched = await tracker.track_concept(
+        _concept("c2", "Container platform", text), _metadata("n2")
+    )
+
+    assert matched == first
+
+
+@pytest.mark.asyncio
+async def test_common_words_still_yield_candidates(monkeypatch):
+    monkeypatch.setattr("graph_rag.core.temporal_tracker._MAX_POSTING_ROWS", 2)
+    tracker = TemporalTracker()
+    for i in range(4):
+        await tracker.track_concept(_concept(f"c{i}", f"graph database v{i}"), _metadata(f"n{i}"))
+
+    # Only words shared by more versions than the cap link the new concept
+    matched = await tracker.track_concept(_concept("new", "graph database"), _metadata("n"))
+
+    assert matched == tracker.concept_to_evolution["c0"]
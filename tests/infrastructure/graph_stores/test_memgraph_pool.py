@@ -0,0 +1,178 @@
+"""Unit tests for the Memgraph connection pool (no database required)."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+try:
+    import mgclient  # type: ignore
+except Exception:
+    pytest.skip("mgclient not available; skipping Memgraph pool tests", allow_module_level=True)
+
+from graph_rag.domain.models import Chunk, Entity, Relationship
+from graph_rag.infrastructure.graph_stores import memgraph_pool
+from graph_rag.infrastructure.graph_stores.memgraph_pool import (
+    ConnectionPool,
+    PoolTimeoutError,
+)
+from graph_rag.infrastructure.graph_stores.memgraph_store import MemgraphGraphRepository
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.description = None
+        self._rows = []
+
+    def execute(self, query, params):
+        self.conn.executed.append((query, params))
+        if self.conn.fail:
+            raise mgclient.DatabaseError("boom")
+        with self.conn.lock:
+            self.conn.active += 1
+            FakeConnection.peak = max(FakeConnection.peak, FakeConnection.total_active())
+        time.sleep(0.05)
+        with self.conn.lock:
+            self.conn.active -= 1
+        self.description = [type("Col", (), {"name": "x"})()]
+        self._rows = [(1,)]
+
+    def fetchall(self):
+        return self._rows
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    instances: list["FakeConnection"] = []
+    peak = 0
+    lock = threading.Lock()
+
+    def __init__(self):
+        self.active = 0
+        self.closed = False
+        self.fail = False
+        self.executed = []
+        self.commits = 0
+        self.status = mgclient.CONN_STATUS_READY
+        FakeConnection.instances.append(self)
+
+    @classmethod
+    def total_active(cls):
+        return sum(c.active for c in cls.instances)
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def _reset_fakes():
+    FakeConnection.instances = []
+    FakeConnection.peak = 0
+
+
+def test_pool_reuses_connections_and_bounds_size():
+    pool = ConnectionPool(FakeConnection, max_size=2)
+    a = pool.acquire()
+    b = pool.acquire()
+    with pytest.raises(PoolTimeoutError):
+        pool.acquire(timeout=0.01)
+    pool.release(a)
+    assert pool.acquire(timeout=0.01) is a
+    stats = pool.stats()
+    assert stats["created"] == 2
+    assert stats["in_use"] == 2
+    pool.release(a)
+    pool.release(b, discard=True)
+    assert b.connection.closed
+    assert pool.stats()["idle"] == 1
+
+
+def test_pool_recycles_expired_and_unhealthy_connections():
+    now = [100.0]
+    checks = []
+
+    def health_check(conn):
+        checks.append(conn)
+        raise ConnectionError("gone")
+
+    with patch.object(memgraph_pool.time, "monotonic", lambda: now[0]):
+        pool = ConnectionPool(
+            FakeConnection, max_size=1, max_lifetime=60, health_check_after=5,
+            health_check=health_check,
+        )
+        first = pool.acquire()
+        pool.release(first)
+        now[0] += 10  # idle past the health check threshold
+        second = pool.acquire()
+        assert checks == [first.connection]
+        assert second is not first and first.connection.closed
+
+        now[0] += 100  # past max lifetime; closed on checkin
+        pool.release(second)
+        assert second.connection.closed
+        assert pool.stats()["idle"] == 0
+
+
+@pytest.mark.asyncio
+async def test_repository_runs_queries_in_parallel_on_pooled_connections():
+    repo = MemgraphGraphRepository()
+    repo.config.pool_size = 4
+    with patch.object(MemgraphGraphRepository, "_get_connection", lambda self: FakeConnection()):
+        results = await asyncio.gather(*(repo.execute_query("RETURN 1 AS x") for _ in range(8)))
+        assert results == [[{"x": 1}]] * 8
+        assert FakeConnection.peak > 1
+        assert len(FakeConnection.instances) <= 4
+
+        for conn in FakeConnection.instances:
+            conn.fail = True
+            conn.status = mgclient.CONN_STATUS_BAD
+        with pytest.raises(mgclient.DatabaseError):
+            await repo.execute_query("RETURN 1 AS x")
+        # The broken connection is discarded rather than returned to the pool
+        assert sum(c.closed for c in FakeConnection.instances) == 1
+        assert repo.pool_stats()["discarded"] == 1
+        await repo.close()
+    assert all(c.closed for c in FakeConnection.instances)
+
+
+@pytest.mark.asyncio
+async def test_add_graph_batch_writes_grouped_unwind_statements_in_one_transaction():
+    repo = MemgraphGraphRepository()
+    chunks = [Chunk(id=f"c{i}", text=f"t{i}", document_id="d1") for i in range(5)]
+    entities = [
+        Entity(id="e1", name="Ada", type="PERSON"),
+        Entity(id="e2", name="Babbage", type="PERSON"),
+        Entity(id="e3", name="London", type="GPE"),
+    ]
+    rels = [
+        Relationship(id=f"r{i}", type="MENTIONS", source_id=f"c{i}", target_id="e1")
+        for i in range(5)
+    ] + [Relationship(id="t1", type="HAS_TOPIC", source_id="d1", target_id="topic:x")]
+
+    with patch.object(MemgraphGraphRepository, "_get_connection", lambda self: FakeConnection()):
+        await repo.add_graph_batch(chunks, entities, rels, batch_size=2)
+        await repo.close()
+
+    conn = FakeConnection.instances[0]
+    assert len(FakeConnection.instances) == 1
+    assert conn.commits == 1
+    queries = [q for q, _ in conn.executed]
+    assert all("UNWIND $rows" in q for q in queries)
+    # 3 chunk batches, PERSON x1 + GPE x1, MENTIONS x3 + HAS_TOPIC x1
+    assert len(queries) == 9
+    assert "MERGE (d)-[:CONTAINS]->(c)" in queries[0]
+    assert [len(p["rows"]) for _, p in conn.executed] == [2, 2, 1, 2, 1, 2, 2, 1, 1]
@@ -0,0 +1,62 @@
+import math
+import random
+from collections import Counter
+
+import pytest
+
+from graph_rag.infrastructure.vector_stores.bm25_index import BM25Index, tokenize
+
+
+def _brute_force(docs: dict[str, str], query: str, k1: float = 1.5, b: float = 0.75):
+    toks = {key: tokenize(text) for key, text in docs.items()}
+    n = len(toks)
+    avgdl = sum(len(t) for t in toks.values()) / n
+    df = Counter(t for doc in toks.values() for t in set(doc))
+    scores = {}
+    for key, doc in toks.items():
+        tf = Counter(doc)
+        score = 0.0
+        for q in tokenize(query):
+            if not df.get(q) or not tf.get(q):
+                continue
+            idf = math.log(1.0 + max(0.0, (n - df[q] + 0.5) / (df[q] + 0.5)))
+            f = tf[q]
+            score += idf * (f * (k1 + 1.0)) / (f + k1 * (1.0 - b + b * len(doc) / avgdl))
+        if score > 0.0:
+            scores[key] = score
+    return scores
+
+
+def test_pruned_search_matches_exhaustive_scoring():
+    rng = random.Random(7)
+    vocab = [f"w{i}" for i in range(60)]
+    docs = {
+        f"d{i}": " ".join(rng.choices(vocab, k=rng.randint(3, 40))) for i in range(400)
+    }
+    index = BM25Index()
+    index.add_many(docs.items())
+
+    for query in ["w1 w2 w3", "w5 w5 w40", "w0 w59 w30 w31 w7"]:
+        expected = _brute_force(docs, query)
+        got = index.search(query, k=10)
+        best = sorted(expected.values(), reverse=True)[:10]
+        assert [s for _, s in got] == pytest.approx(best)
+        for key, score in got:
+            assert expected[key] == pytest.approx(score)
+
+
+def test_add_replace_and_remove_update_statistics():
+    index = BM25Index()
+    index.add("a", "alpha beta")
+    index.add("b", "beta gamma gamma")
+    assert len(index) == 2
+    assert index.avgdl == pytest.approx(2.5)
+
+    index.add("a", "delta")  # replaces previous text
+    assert [k for k, _ in index.search("alpha")] == []
+    assert [k for k, _ in index.search("delta")] == ["a"]
+
+    assert index.remove("b") is True
+    assert index.remove("b") is False
+    assert index.search("gamma") == []
+    assert index.vocabulary_size == 1
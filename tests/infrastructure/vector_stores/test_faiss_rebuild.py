@@ -1,6 +1,8 @@
+import asyncio
 import json
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 # Skip this test module if FAISS is not installed (optional dependency)
@@ -21,19 +23,102 @@ def test_faiss_rebuild_after_delete(tmp_path: Path, dim: int):
         ChunkData(id="c2", text="b", document_id="d1", embedding=[0.0] * (dim - 1) + [1.0]),
     ]
     # Normalize: handled by store; we just provide raw
-    import asyncio
-
     asyncio.run(vs.add_chunks(chunks))
 
-    # Ensure meta has embeddings persisted
-    meta = json.loads((store_path / "meta.json").read_text())
-    assert meta.get("version") == 2
-    assert any(r.get("embedding") for r in meta.get("rows", []))
+    # Ensure raw embeddings are persisted in the segment files
+    manifest = json.loads((store_path / "manifest.json").read_text())
+    assert manifest.get("version") == 3
+    assert manifest["rows"] == 2
+    stored = np.fromfile(store_path / "embeddings.0.f32", dtype=np.float32).reshape(2, dim)
+    assert stored[0].tolist() == [1.0] * dim
 
     # Delete one chunk and make sure rebuild happens without error
     asyncio.run(vs.delete_chunks(["c1"]))
+    asyncio.run(vs.rebuild_index())
 
     # Reload store and ensure only one row remains
     vs2 = FaissVectorStore(path=str(store_path), embedding_dimension=dim)
-    assert len(vs2._rows) == 1
-    assert vs2._rows[0]["chunk_id"] == "c2"
+    assert asyncio.run(vs2.get_vector_store_size()) == 1
+    assert vs2._ids == ["c2"]
+    results = asyncio.run(vs2.search_similar_chunks([1.0] * dim, limit=5))
+    assert [r.chunk.id for r in results] == ["c2"]
+    assert results[0].chunk.text == "b"
+
+
+def _chunk(i: int, dim: int) -> ChunkData:
+    emb = [0.0] * dim
+    emb[i % dim] = 1.0
+    return ChunkData(
+        id=f"c{i}", text=f"text {i}", document_id="d", embedding=emb, metadata={"i": i}
+    )
+
+
+def test_faiss_adds_append_only_and_reload_from_segments(tmp_path: Path):
+    dim = 4
+    path = tmp_path / "faiss"
+    vs = FaissVectorStore(path=str(path), embedding_dimension=dim)
+    asyncio.run(vs.add_chunks([_chunk(i, dim) for i in range(3)]))
+    records_size = (path / "records.0.jsonl").stat().st_size
+    asyncio.run(vs.add_chunks([_chunk(3, dim)]))
+
+    # The second batch appends; earlier bytes are untouched
+    assert (path / "embeddings.0.f32").stat().st_size == 4 * dim * 4
+    assert (path / "records.0.jsonl").read_bytes()[:records_size] == (
+        path / "records.0.jsonl"
+    ).read_bytes()[:records_size]
+    assert not (path / "meta.json").exists()
+
+    # Simulate a torn append that never reached the manifest
+    with open(path / "embeddings.0.f32", "ab") as f:
+        f.write(b"\x00" * 7)
+    with open(path / "ids.0.jsonl", "a") as f:
+        f.write('"ghost"\n')
+
+    vs2 = FaissVectorStore(path=str(path), embedding_dimension=dim)
+    assert asyncio.run(vs2.get_vector_store_size()) == 4
+    chunk = asyncio.run(vs2.get_chunk_by_id("c2"))
+    assert chunk.text == "text 2" and chunk.metadata == {"i": 2}
+    top = asyncio.run(vs2.search_similar_chunks([0.0, 0.0, 0.0, 1.0], limit=1))
+    assert top[0].chunk.id == "c3"
+
+
+def test_faiss_tombstones_duplicates_and_compacts(tmp_path: Path):
+    dim = 4
+    path = tmp_path / "faiss"
+    vs = FaissVectorStore(path=str(path), embedding_dimension=dim, compaction_ratio=0.5)
+    asyncio.run(vs.add_chunks([_chunk(i, dim) for i in range(4)]))
+    # Re-adding an id replaces the previous row
+    replacement = _chunk(0, dim)
+    replacement.text = "new text 0"
+    asyncio.run(vs.add_chunks([replacement]))
+    results = asyncio.run(vs.search_similar_chunks([1.0, 0.0, 0.0, 0.0], limit=5))
+    assert [r.chunk.text for r in results if r.chunk.id == "c0"] == ["new text 0"]
+
+    asyncio.run(vs.delete_chunks(["c1"]))
+    assert (asyncio.run(vs.stats()))["segment_generation"] == 0
+    asyncio.run(vs.delete_chunks(["c2"]))  # 3 of 5 rows dead -> compaction
+    stats = asyncio.run(vs.stats())
+    assert stats["segment_generation"] == 1
+    assert stats["rows"] == stats["vectors"] == 2
+    assert not (path / "embeddings.0.f32").exists()
+
+    vs2 = FaissVectorStore(path=str(path), embedding_dimension=dim)
+    assert sorted(vs2._row_by_chunk_id) == ["c0", "c3"]
+    assert asyncio.run(vs2.get_chunk_by_id("c0")).text == "new text 0"
+
+
+def test_faiss_migrates_legacy_meta_json(tmp_path: Path):
+    dim = 4
+    path = tmp_path / "faiss"
+    path.mkdir()
+    rows = [
+        {"chunk_id": "a", "document_id": "d", "text": "old a", "metadata": {}, "embedding": [1.0, 0, 0, 0]},
+        {"chunk_id": "b", "document_id": "d", "text": "old b", "metadata": {}, "embedding": [0, 1.0, 0, 0]},
+    ]
+    (path / "meta.json").write_text(json.dumps({"version": 2, "rows": rows}))
+
+    vs = FaissVectorStore(path=str(path), embedding_dimension=dim)
+    assert not (path / "meta.json").exists()
+    assert (path / "manifest.json").exists()
+    results = asyncio.run(vs.search_similar_chunks([0, 1.0, 0, 0], limit=1))
+    assert results[0].chunk.id == "b" and results[0].chunk.text == "old b"
@@ -0,0 +1,104 @@
+import json
+import pickle
+
+import pytest
+
+from graph_rag.core.interfaces import ChunkData
+from graph_rag.infrastructure.vector_stores.shared_persistent_vector_store import (
+    SharedPersistentVectorStore,
+)
+
+
+class DummyEmbedding:
+    def get_embedding_dimension(self):
+        return 4
+
+    async def encode(self, texts):
+        return [[1.0, 0.0, 0.0, 0.0] for _ in texts]
+
+
+def _chunk(i: int, embedding: list[float] | None = None) -> ChunkData:
+    return ChunkData(
+        id=f"c{i}",
+        text=f"text {i}",
+        document_id="d",
+        metadata={"document_id": "d"},
+        embedding=embedding or [1.0, float(i), 0.0, 0.0],
+    )
+
+
+@pytest.mark.asyncio
+async def test_second_instance_picks_up_appends_and_deletes(tmp_path):
+    writer = SharedPersistentVectorStore(DummyEmbedding(), tmp_path)
+    reader = SharedPersistentVectorStore(DummyEmbedding(), tmp_path)
+
+    await writer.add_chunks([_chunk(0), _chunk(1)])
+    assert await reader.get_vector_store_size() == 2
+
+    await writer.add_chunks([_chunk(2)])
+    await writer.delete_chunks(["c0"])
+
+    assert await reader.get_vector_store_size() == 2
+    assert await reader.get_chunk_by_id("c0") is None
+    chunk = await reader.get_chunk_by_id("c2")
+    assert chunk.text == "text 2" and chunk.document_id == "d"
+    hits = await reader.keyword_search("text", k=5)
+    assert {c.id for c, _ in hits} == {"c1", "c2"}
+
+
+@pytest.mark.asyncio
+async def test_writes_from_both_instances_are_merged(tmp_path):
+    a = SharedPersistentVectorStore(DummyEmbedding(), tmp_path)
+    b = SharedPersistentVectorStore(DummyEmbedding(), tmp_path)
+
+    await a.add_chunks([_chunk(0)])
+    await b.add_chunks([_chunk(1)])
+    await a.add_chunks([_chunk(2)])
+
+    fresh = SharedPersistentVectorStore(DummyEmbedding(), tmp_path)
+    for store in (a, b, fresh):
+        assert await store.get_vector_store_size() == 3
+
+
+@pytest.mark.asyncio
+async def test_compaction_drops_tombstones_and_readers_reload(tmp_path):
+    writer = SharedPersistentVectorStore(DummyEmbedding(), tmp_path, compaction_ratio=0.25)
+    reader = SharedPersistentVectorStore(DummyEmbedding(), tmp_path)
+    await writer.add_chunks([_chunk(i) for i in range(8)])
+    assert await reader.get_vector_store_size() == 8
+
+    await writer.delete_chunks(["c0", "c1", "c2"])
+    await writer._compaction_task
+
+    stats = await writer.stats()
+    assert stats["segment_generation"] == 1
+    assert stats["segment_rows"] == 5 and stats["tombstoned_rows"] == 0
+    assert await reader.get_vector_store_size() == 5
+    results = await reader.search_similar_chunks([1.0, 7.0, 0.0, 0.0], limit=1)
+    assert results[0].chunk.id == "c7"
+
+    await writer.add_chunks([_chunk(9)])
+    assert await reader.get_chunk_by_id("c9") is not None
+
+
+@pytest.mark.asyncio
+async def test_migrates_legacy_pickle_store(tmp_path):
+    with open(tmp_path / "vectors.pkl", "wb") as f:
+        pickle.dump(
+            {
+                "vectors": [[1.0, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0]],
+                "documents": ["alpha", "beta"],
+                "chunk_ids": ["a", "b"],
+            },
+            f,
+        )
+    (tmp_path / "metadata.json").write_text(
+        json.dumps([{"document_id": "d1"}, {"document_id": "d2"}])
+    )
+
+    store = SharedPersistentVectorStore(DummyEmbedding(), tmp_path)
+
+    chunk = await store.get_chunk_by_id("b")
+    assert chunk.text == "beta" and chunk.document_id == "d2"
+    assert (tmp_path / "manifest.json").exists()
+    assert not (tmp_path / "vectors.pkl").exists()
@@ -44,3 +44,16 @@ async def test_bm25_respects_deletion():
     await vs.delete_chunks(["x"])
     res = await vs.keyword_search("alpha", k=5)
     assert len(res) == 0
+
+
+@pytest.mark.asyncio
+async def test_bm25_sees_chunks_ingested_after_first_query():
+    vs = SimpleVectorStore(DummyEmbedding())
+    from graph_rag.core.interfaces import ChunkData
+
+    await vs.add_chunks([ChunkData(id="p", text="alpha", document_id="dp")])
+    assert [r[0].id for r in await vs.keyword_search("alpha")] == ["p"]
+
+    await vs.add_chunks([ChunkData(id="q", text="omega", document_id="dq")])
+    res = await vs.keyword_search("omega", k=5)
+    assert [r[0].id for r in res] == ["q"]
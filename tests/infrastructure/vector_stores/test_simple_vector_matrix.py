@@ -0,0 +1,156 @@
+import numpy as np
+import pytest
+
+from graph_rag.core.interfaces import ChunkData
+from graph_rag.infrastructure.vector_stores.simple_vector_store import SimpleVectorStore
+
+
+class DummyEmbedding:
+    def get_embedding_dimension(self):
+        return 4
+
+    async def encode(self, texts):
+        return [[1.0, 0.0, 0.0, 0.0] for _ in texts]
+
+
+def _chunk(i: int, embedding: list[float]) -> ChunkData:
+    return ChunkData(id=f"c{i}", text=f"text {i}", document_id="d", embedding=embedding)
+
+
+@pytest.mark.asyncio
+async def test_matrix_grows_past_initial_capacity_and_ranks_correctly():
+    vs = SimpleVectorStore(DummyEmbedding())
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(2500, 4))
+    await vs.add_chunks([_chunk(i, v.tolist()) for i, v in enumerate(vectors)])
+
+    assert await vs.get_vector_store_size() == 2500
+
+    query = vectors[42]
+    results = await vs.search_similar_chunks(query.tolist(), limit=5)
+    normed = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    expected = np.argsort(normed @ (query / np.linalg.norm(query)))[::-1][:5]
+    assert [r.chunk.id for r in results] == [f"c{i}" for i in expected]
+    assert results[0].chunk.id == "c42"
+    assert results[0].score == pytest.approx(1.0, abs=1e-5)
+
+
+@pytest.mark.asyncio
+async def test_threshold_filters_and_limits():
+    vs = SimpleVectorStore(DummyEmbedding())
+    await vs.add_chunks(
+        [
+            _chunk(0, [1.0, 0.0, 0.0, 0.0]),
+            _chunk(1, [1.0, 1.0, 0.0, 0.0]),
+            _chunk(2, [0.0, 1.0, 0.0, 0.0]),
+        ]
+    )
+    results = await vs.search_similar_chunks([1.0, 0.0, 0.0, 0.0], limit=5, threshold=0.5)
+    assert [r.chunk.id for r in results] == ["c0", "c1"]
+
+
+@pytest.mark.asyncio
+async def test_delete_compacts_rows_and_keeps_lookup_consistent():
+    vs = SimpleVectorStore(DummyEmbedding())
+    await vs.add_chunks(
+        [
+            _chunk(0, [2.0, 0.0, 0.0, 0.0]),
+            _chunk(1, [0.0, 3.0, 0.0, 0.0]),
+            _chunk(2, [0.0, 0.0, 4.0, 0.0]),
+        ]
+    )
+    await vs.delete_chunks(["c0", "missing"])
+
+    assert await vs.get_vector_store_size() == 2
+    assert await vs.get_chunk_by_id("c0") is None
+    chunk = await vs.get_chunk_by_id("c2")
+    # Raw (un-normalized) embedding is preserved
+    assert chunk.embedding == pytest.approx([0.0, 0.0, 4.0, 0.0])
+
+    results = await vs.search_similar_chunks([0.0, 1.0, 0.0, 0.0], limit=1)
+    assert results[0].chunk.id == "c1"
+
+
+class CountingEmbedding(DummyEmbedding):
+    def __init__(self):
+        self.calls = 0
+
+    async def encode(self, texts):
+        self.calls += 1
+        return await super().encode(texts)
+
+    async def encode_query(self, text):
+        self.calls += 1
+        return [1.0, 0.0, 0.0, 0.0]
+
+
+@pytest.mark.asyncio
+async def test_vector_search_embeds_query_once_and_accepts_precomputed_vector():
+    emb = CountingEmbedding()
+    vs = SimpleVectorStore(emb)
+    await vs.add_chunks([_chunk(0, [1.0, 0.0, 0.0, 0.0]), _chunk(1, [0.0, 1.0, 0.0, 0.0])])
+
+    emb.calls = 0
+    results = await vs.search("anything", top_k=1, search_type="vector")
+    assert results[0].chunk.id == "c0"
+    assert emb.calls == 1
+
+    emb.calls = 0
+    results = await vs.search(
+        "anything", top_k=1, search_type="vector", query_vector=[0.0, 1.0, 0.0, 0.0]
+    )
+    assert results[0].chunk.id == "c1"
+    assert emb.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_batch_search_matches_single_query_search():
+    vs = SimpleVectorStore(DummyEmbedding())
+    rng = np.random.default_rng(1)
+    vectors = rng.normal(size=(300, 4))
+    await vs.add_chunks([_chunk(i, v.tolist()) for i, v in enumerate(vectors)])
+    queries = rng.normal(size=(6, 4)).tolist()
+
+    batched = await vs.batch_search_similar_chunks(queries, limit=5, threshold=0.5)
+
+    assert len(batched) == len(queries)
+    for query, results in zip(queries, batched, strict=True):
+        single = await vs.search_similar_chunks(query, limit=5, threshold=0.5)
+        assert [r.chunk.id for r in results] == [r.chunk.id for r in single]
+        assert [r.score for r in results] == pytest.approx([r.score for r in single])
+
+
+@pytest.mark.asyncio
+async def test_delete_tombstones_rows_until_compaction_threshold():
+    vs = SimpleVectorStore(DummyEmbedding())
+    await vs.add_chunks([_chunk(i, [1.0, float(i), 0.0, 0.0]) for i in range(10)])
+
+    await vs.delete_chunks(["c9"])
+    # A single delete only masks the row
+    assert vs._size == 10 and vs._dead == 1
+    assert await vs.get_vector_store_size() == 9
+    results = await vs.search_similar_chunks([0.0, 1.0, 0.0, 0.0], limit=10)
+    assert [r.chunk.id for r in results][:2] == ["c8", "c7"]
+    assert "c9" not in {r.chunk.id for r in results}
+    batched = await vs.batch_search_similar_chunks([[0.0, 1.0, 0.0, 0.0]], limit=10)
+    assert [r.chunk.id for r in batched[0]] == [r.chunk.id for r in results]
+
+    await vs.delete_chunks(["c0", "c1", "c2"])
+    # Past the dead-row threshold the matrix is compacted
+    assert vs._size == 6 and vs._dead == 0
+    assert (await vs.get_chunk_by_id("c8")).embedding == pytest.approx([1.0, 8.0, 0.0, 0.0])
+
+
+@pytest.mark.asyncio
+async def test_deleting_a_duplicated_id_keeps_the_later_row():
+    vs = SimpleVectorStore(DummyEmbedding())
+    await vs.add_chunks([_chunk(0, [1.0, 0.0, 0.0, 0.0]), _chunk(1, [0.0, 1.0, 0.0, 0.0])])
+    await vs.add_chunks([_chunk(0, [0.0, 0.0, 1.0, 0.0])])
+
+    await vs.delete_chunks(["c0"])
+
+    chunk = await vs.get_chunk_by_id("c0")
+    assert chunk.embedding == pytest.approx([0.0, 0.0, 1.0, 0.0])
+    await vs.delete_chunks(["c0"])
+    assert await vs.get_chunk_by_id("c0") is None
+    assert await vs.get_vector_store_size() == 1
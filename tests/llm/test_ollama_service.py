@@ -1,7 +1,10 @@
 """Tests for Ollama LLM service implementation."""
 
+import asyncio
 import json
-from unittest.mock import AsyncMock, patch
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -11,6 +14,12 @@ from graph_rag.llm.ollama_service import OllamaService
 class TestOllamaService:
     """Test suite for OllamaService."""
 
+    @pytest.fixture(autouse=True)
+    def mock_connector(self):
+        """Avoid opening a real connection pool in unit tests."""
+        with patch('aiohttp.TCPConnector') as connector_class:
+            yield connector_class
+
     @pytest.fixture
     def ollama_service(self):
         """Create Ollama service with default settings."""
@@ -113,14 +122,13 @@ class TestOllamaService:
         }
 
         with patch('aiohttp.ClientSession') as mock_session_class:
-            mock_session = AsyncMock()
+            mock_session = MagicMock()
             mock_response = AsyncMock()
             mock_response.status = 200
             mock_response.json.return_value = mock_response_data
 
             mock_session.post.return_value.__aenter__.return_value = mock_response
-            mock_session_class.return_value.__aenter__.return_value = mock_session
-            mock_session_class.return_value.__aexit__.return_value = None
+            mock_session_class.return_value = mock_session
 
             result = await ollama_service.generate_response("Test prompt")
 
@@ -136,14 +144,13 @@ class TestOllamaService:
         }
 
         with patch('aiohttp.ClientSession') as mock_session_class:
-            mock_session = AsyncMock()
+            mock_session = MagicMock()
             mock_response = AsyncMock()
             mock_response.status = 200
             mock_response.json.return_value = mock_response_data
 
             mock_session.post.return_value.__aenter__.return_value = mock_response
-            mock_session_class.return_value.__aenter__.return_value = mock_session
-            mock_session_class.return_value.__aexit__.return_value = None
+            mock_session_class.return_value = mock_session
 
             result = await ollama_service.generate_response("Test prompt")
 
@@ -153,14 +160,13 @@ class TestOllamaService:
     async def test_generate_response_api_error(self, ollama_service):
         """Test handling of API errors."""
         with patch('aiohttp.ClientSession') as mock_session_class:
-            mock_session = AsyncMock()
+            mock_session = MagicMock()
             mock_response = AsyncMock()
             mock_response.status = 500
             mock_response.text.return_value = "Internal Server Error"
 
             mock_session.post.return_value.__aenter__.return_value = mock_response
-            mock_session_class.return_value.__aenter__.return_value = mock_session
-            mock_session_class.return_value.__aexit__.return_value = None
+            mock_session_class.return_value = mock_session
 
             result = await ollama_service.generate_response("Test prompt")
 
@@ -175,14 +181,13 @@ class TestOllamaService:
         }
 
         with patch('aiohttp.ClientSession') as mock_session_class:
-            mock_session = AsyncMock()
+            mock_session = MagicMock()
             mock_response = AsyncMock()
             mock_response.status = 200
             mock_response.json.return_value = mock_response_data
 
             mock_session.post.return_value.__aenter__.return_value = mock_response
-            mock_session_class.return_value.__aenter__.return_value = mock_session
-            mock_session_class.return_value.__aexit__.return_value = None
+            mock_session_class.return_value = mock_session
 
             await custom_ollama_service.generate_response("Test prompt")
 
@@ -201,7 +206,7 @@ class TestOllamaService:
         ]
 
         with patch('aiohttp.ClientSession') as mock_session_class:
-            mock_session = AsyncMock()
+            mock_session = MagicMock()
             mock_response = AsyncMock()
             mock_response.status = 200
 
@@ -211,8 +216,7 @@ class TestOllamaService:
 
             mock_response.content = mock_content()
             mock_session.post.return_value.__aenter__.return_value = mock_response
-            mock_session_class.return_value.__aenter__.return_value = mock_session
-            mock_session_class.return_value.__aexit__.return_value = None
+            mock_session_class.return_value = mock_session
 
             result_parts = []
             async for part in ollama_service.generate_response_stream("Test prompt"):
@@ -224,14 +228,13 @@ class TestOllamaService:
     async def test_generate_response_stream_api_error(self, ollama_service):
         """Test streaming response with API error."""
         with patch('aiohttp.ClientSession') as mock_session_class:
-            mock_session = AsyncMock()
+            mock_session = MagicMock()
             mock_response = AsyncMock()
             mock_response.status = 404
             mock_response.text.return_value = "Model not found"
 
             mock_session.post.return_value.__aenter__.return_value = mock_response
-            mock_session_class.return_value.__aenter__.return_value = mock_session
-            mock_session_class.return_value.__aexit__.return_value = None
+            mock_session_class.return_value = mock_session
 
             result_parts = []
             async for part in ollama_service.generate_response_stream("Test prompt"):
@@ -250,7 +253,7 @@ class TestOllamaService:
         ]
 
         with patch('aiohttp.ClientSession') as mock_session_class:
-            mock_session = AsyncMock()
+            mock_session = MagicMock()
             mock_response = AsyncMock()
             mock_response.status = 200
 
@@ -260,8 +263,7 @@ class TestOllamaService:
 
             mock_response.content = mock_content()
             mock_session.post.return_value.__aenter__.return_value = mock_response
-            mock_session_class.return_value.__aenter__.return_value = mock_session
-            mock_session_class.return_value.__aexit__.return_value = None
+            mock_session_class.return_value = mock_session
 
             result_parts = []
             async for part in ollama_service.generate_response_stream("Test prompt"):
@@ -289,14 +291,13 @@ class TestOllamaService:
         }
 
         with patch('aiohttp.ClientSession') as mock_session_class:
-            mock_session = AsyncMock()
+            mock_session = MagicMock()
             mock_response = AsyncMock()
             mock_response.status = 200
             mock_response.json.return_value = mock_response_data
 
             mock_session.post.return_value.__aenter__.return_value = mock_response
-            mock_session_class.return_value.__aenter__.return_value = mock_session
-            mock_session_class.return_value.__aexit__.return_value = None
+            mock_session_class.return_value = mock_session
 
             entities, relationships = await ollama_service.extract_entities_relationships("John works at Acme")
 
@@ -316,14 +317,13 @@ class TestOllamaService:
         }
 
         with patch('aiohttp.ClientSession') as mock_session_class:
-            mock_session = AsyncMock()
+            mock_session = MagicMock()
             mock_response = AsyncMock()
             mock_response.status = 200
             mock_response.json.return_value = mock_response_data
 
             mock_session.post.return_value.__aenter__.return_value = mock_response
-            mock_session_class.return_value.__aenter__.return_value = mock_session
-            mock_session_class.return_value.__aexit__.return_value = None
+            mock_session_class.return_value = mock_session
 
             entities, relationships = await ollama_service.extract_entities_relationships("Test text")
 
@@ -338,14 +338,13 @@ class TestOllamaService:
         }
 
         with patch('aiohttp.ClientSession') as mock_session_class:
-            mock_session = AsyncMock()
+            mock_session = MagicMock()
             mock_response = AsyncMock()
             mock_response.status = 200
             mock_response.json.return_value = mock_response_data
 
             mock_session.post.return_value.__aenter__.return_value = mock_response
-            mock_session_class.return_value.__aenter__.return_value = mock_session
-            mock_session_class.return_value.__aexit__.return_value = None
+            mock_session_class.return_value = mock_session
 
             result = await ollama_service.embed_text("Test text")
 
@@ -355,13 +354,12 @@ class TestOllamaService:
     async def test_embed_text_fallback_on_api_error(self, ollama_service):
         """Test text embedding fallback when API returns error."""
         with patch('aiohttp.ClientSession') as mock_session_class:
-            mock_session = AsyncMock()
+            mock_session = MagicMock()
             mock_response = AsyncMock()
             mock_response.status = 404  # Embeddings not supported
 
             mock_session.post.return_value.__aenter__.return_value = mock_response
-            mock_session_class.return_value.__aenter__.return_value = mock_session
-            mock_session_class.return_value.__aexit__.return_value = None
+            mock_session_class.return_value = mock_session
 
             result = await ollama_service.embed_text("Test text")
 
@@ -415,32 +413,31 @@ class TestOllamaService:
     async def test_health_check_success(self, ollama_service):
         """Test successful health check."""
         with patch('aiohttp.ClientSession') as mock_session_class:
-            mock_session = AsyncMock()
+            mock_session = MagicMock()
             mock_response = AsyncMock()
             mock_response.status = 200
 
-            # Mock the context manager for both session and response
+            # Mock the context manager for the response
             mock_session.get.return_value.__aenter__.return_value = mock_response
             mock_session.get.return_value.__aexit__.return_value = None
-            mock_session_class.return_value.__aenter__.return_value = mock_session
-            mock_session_class.return_value.__aexit__.return_value = None
+            mock_session_class.return_value = mock_session
 
             result = await ollama_service.health_check()
 
             assert result is True
-            mock_session.get.assert_called_once_with("http://localhost:11434/api/tags")
+            mock_session.get.assert_called_once()
+            assert mock_session.get.call_args[0][0] == "http://localhost:11434/api/tags"
 
     @pytest.mark.asyncio
     async def test_health_check_failure(self, ollama_service):
         """Test health check failure."""
         with patch('aiohttp.ClientSession') as mock_session_class:
-            mock_session = AsyncMock()
+            mock_session = MagicMock()
             mock_response = AsyncMock()
             mock_response.status = 503
 
             mock_session.get.return_value.__aenter__.return_value = mock_response
-            mock_session_class.return_value.__aenter__.return_value = mock_session
-            mock_session_class.return_value.__aexit__.return_value = None
+            mock_session_class.return_value = mock_session
 
             result = await ollama_service.health_check()
 
@@ -466,16 +463,15 @@ class TestOllamaService:
         }
 
         with patch('aiohttp.ClientSession') as mock_session_class:
-            mock_session = AsyncMock()
+            mock_session = MagicMock()
             mock_response = AsyncMock()
             mock_response.status = 200
             mock_response.json.return_value = mock_response_data
 
-            # Mock the context manager for both session and response
+            # Mock the context manager for the response
             mock_session.get.return_value.__aenter__.return_value = mock_response
             mock_session.get.return_value.__aexit__.return_value = None
-            mock_session_class.return_value.__aenter__.return_value = mock_session
-            mock_session_class.return_value.__aexit__.return_value = None
+            mock_session_class.return_value = mock_session
 
             models = await ollama_service.list_models()
 
@@ -485,15 +481,14 @@ class TestOllamaService:
     async def test_list_models_api_error(self, ollama_service):
         """Test model listing with API error."""
         with patch('aiohttp.ClientSession') as mock_session_class:
-            mock_session = AsyncMock()
+            mock_session = MagicMock()
             mock_response = AsyncMock()
             mock_response.status = 500
 
-            # Mock the context manager for both session and response
+            # Mock the context manager for the response
             mock_session.get.return_value.__aenter__.return_value = mock_response
             mock_session.get.return_value.__aexit__.return_value = None
-            mock_session_class.return_value.__aenter__.return_value = mock_session
-            mock_session_class.return_value.__aexit__.return_value = None
+            mock_session_class.return_value = mock_session
 
             models = await ollama_service.list_models()
 
@@ -506,3 +501,120 @@ class TestOllamaService:
             models = await ollama_service.list_models()
 
             assert models == []
+
+    @pytest.mark.asyncio
+    async def test_session_is_reused_across_calls(self, ollama_service):
+        """Test that one pooled session serves every request until closed."""
+        with patch('aiohttp.ClientSession') as mock_session_class:
+            mock_session = MagicMock()
+            mock_session.closed = False
+            mock_session.close = AsyncMock()
+            mock_response = AsyncMock()
+            mock_response.status = 200
+            mock_response.json.return_value = {"embedding": [0.1]}
+            mock_session.post.return_value.__aenter__.return_value = mock_response
+            mock_session.get.return_value.__aenter__.return_value = mock_response
+            mock_session_class.return_value = mock_session
+
+            await ollama_service.embed_text("one")
+            await ollama_service.embed_text("two")
+            await ollama_service.health_check()
+
+            mock_session_class.assert_called_once()
+            assert mock_session.post.call_count == 2
+
+            await ollama_service.close()
+            mock_session.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_embed_texts_batches_inputs(self):
+        """Test that embed_texts sends up to embed_batch_size inputs per request."""
+        service = OllamaService(embed_batch_size=2)
+
+        with patch('aiohttp.ClientSession') as mock_session_class:
+            mock_session = MagicMock()
+            mock_session.closed = False
+
+            def post(url, json):
+                response = AsyncMock()
+                response.status = 200
+                response.json.return_value = {
+                    "embeddings": [[float(len(text))] for text in json["input"]]
+                }
+                context = MagicMock()
+                context.__aenter__.return_value = response
+                return context
+
+            mock_session.post.side_effect = post
+            mock_session_class.return_value = mock_session
+
+            result = await service.embed_texts(["a", "bb", "ccc"])
+
+            assert result == [[1.0], [2.0], [3.0]]
+            urls = [call[0][0] for call in mock_session.post.call_args_list]
+            assert urls == ["http://localhost:11434/api/embed"] * 2
+            inputs = [call[1]["json"]["input"] for call in mock_session.post.call_args_list]
+            assert inputs == [["a", "bb"], ["ccc"]]
+
+    @pytest.mark.asyncio
+    async def test_embed_texts_falls_back_to_single_requests(self, ollama_service):
+        """Test that servers without /api/embed are served one text at a time."""
+        with patch('aiohttp.ClientSession') as mock_session_class:
+            mock_session = MagicMock()
+            mock_session.closed = False
+
+            def post(url, json):
+                response = AsyncMock()
+                if url.endswith("/api/embed"):
+                    response.status = 404
+                else:
+                    response.status = 200
+                    response.json.return_value = {"embedding": [float(len(json["prompt"]))]}
+                context = MagicMock()
+                context.__aenter__.return_value = response
+                return context
+
+            mock_session.post.side_effect = post
+            mock_session_class.return_value = mock_session
+
+            result = await ollama_service.embed_texts(["a", "bb"])
+
+            assert result == [[1.0], [2.0]]
+
+    def test_session_from_finished_loop_is_closed_when_replaced(self, ollama_service):
+        """Test that moving to a new event loop closes the old loop's session."""
+        with patch('aiohttp.ClientSession') as mock_session_class:
+            sessions = [MagicMock(closed=False, close=AsyncMock()) for _ in range(2)]
+            mock_session_class.side_effect = sessions
+
+            first = asyncio.run(ollama_service._get_session())
+            second = asyncio.run(ollama_service._get_session())
+
+            assert (first, second) == tuple(sessions)
+            first.close.assert_awaited_once()
+            second.close.assert_not_awaited()
+
+    def test_session_on_live_loop_is_closed_on_that_loop(self, ollama_service):
+        """Test that a session whose loop still runs elsewhere is closed there."""
+        other_loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=other_loop.run_forever, daemon=True)
+        thread.start()
+        try:
+            with patch('aiohttp.ClientSession') as mock_session_class:
+                closed_on = []
+                first = MagicMock(closed=False)
+                first.close = AsyncMock(side_effect=lambda: closed_on.append(asyncio.get_running_loop()))
+                mock_session_class.side_effect = [first, MagicMock(closed=False)]
+
+                asyncio.run_coroutine_threadsafe(ollama_service._get_session(), other_loop).result(5)
+                asyncio.run(ollama_service._get_session())
+
+                for _ in range(100):
+                    if closed_on:
+                        break
+                    time.sleep(0.01)
+                assert closed_on == [other_loop]
+        finally:
+            other_loop.call_soon_threadsafe(other_loop.stop)
+            thread.join(5)
+            other_loop.close()
@@ -172,3 +172,289 @@ async def test_concurrent_cache_access_thread_safe():
     first_result = results[0]
     for result in results[1:]:
         assert result == first_result
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_evicts_least_recently_used_entries():
+    """Test that the memory cache stays within its entry bound using LRU order."""
+    from graph_rag.infrastructure.cache.memory_cache import MemoryCache
+
+    cache = MemoryCache(max_entries=2)
+    await cache.set("a", 1)
+    await cache.set("b", 2)
+    assert await cache.get("a") == 1  # "a" is now most recently used
+    await cache.set("c", 3)
+
+    assert await cache.get("b") is None
+    assert await cache.get("a") == 1
+    assert await cache.get("c") == 3
+    stats = cache.stats()
+    assert stats["entries"] == 2
+    assert stats["evictions"] == 1
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_enforces_byte_budget():
+    """Test that large values push out older entries and oversized values are rejected."""
+    from graph_rag.infrastructure.cache.memory_cache import MemoryCache
+
+    cache = MemoryCache(max_bytes=30_000)
+    await cache.set("a", "x" * 12_000)
+    await cache.set("b", "y" * 12_000)
+    await cache.set("c", "z" * 12_000)
+    assert await cache.get("a") is None
+    assert cache.stats()["size_bytes"] <= 30_000
+
+    await cache.set("huge", "h" * 100_000)
+    assert await cache.get("huge") is None
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_expires_lazily_without_timers():
+    """Test TTL expiry on read and via the periodic sweep, with no loop timers."""
+    from graph_rag.infrastructure.cache import memory_cache as mc
+
+    now = [1000.0]
+    with patch.object(mc.time, "monotonic", lambda: now[0]):
+        cache = mc.MemoryCache(sweep_interval=0.0)
+        await cache.set("short", "v", ttl=5)
+        await cache.set("forever", "w")
+        assert await cache.get("short") == "v"
+
+        now[0] += 10
+        await cache.set("other", "x", ttl=60)  # sweep runs here
+        assert "short" not in cache._cache
+        assert await cache.get("short") is None
+        assert await cache.get("forever") == "w"
+        assert cache.stats()["expirations"] == 1
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_exports_metrics():
+    """Test that hits, misses and evictions reach the metrics collector."""
+    from graph_rag.infrastructure.cache.memory_cache import MemoryCache
+    from graph_rag.observability import metrics
+
+    collector = metrics.MetricsCollector(enable_prometheus=False, enable_alerts=False)
+    with patch.object(metrics, "_global_metrics", collector):
+        cache = MemoryCache(max_entries=1, name="test")
+        await cache.set("a", 1)
+        await cache.get("a")
+        await cache.get("missing")
+        await cache.set("b", 2)
+
+    results = [m.labels["result"] for m in collector._metric_history["cache_requests_total"]]
+    assert results == ["hit", "miss"]
+    evictions = collector._metric_history["cache_evictions_total"]
+    assert [(m.labels["reason"], m.value) for m in evictions] == [("capacity", 1)]
+
+
+@pytest.mark.asyncio
+async def test_query_cache_coalesces_concurrent_misses():
+    """Test that concurrent misses for one key share a single computation."""
+    from graph_rag.infrastructure.cache.query_cache import QueryCache
+
+    cache = QueryCache()
+    calls = 0
+
+    async def slow_query():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return {"rows": [1, 2, 3]}
+
+    results = await asyncio.gather(
+        *(cache.get_or_compute("hot", slow_query) for _ in range(20))
+    )
+    assert calls == 1
+    assert all(r == {"rows": [1, 2, 3]} for r in results)
+
+    async def failing_query():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise RuntimeError("backend down")
+
+    calls = 0
+    outcomes = await asyncio.gather(
+        *(cache.get_or_compute("broken", failing_query) for _ in range(5)),
+        return_exceptions=True,
+    )
+    assert calls == 1
+    assert all(isinstance(o, RuntimeError) for o in outcomes)
+    # Failures are not cached
+    with pytest.raises(RuntimeError):
+        await cache.get_or_compute("broken", failing_query)
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_query_cache_serves_stale_while_revalidating():
+    """Test that expired results are served while one background refresh runs."""
+    from graph_rag.infrastructure.cache import query_cache as qc
+
+    now = [1000.0]
+    version = 0
+
+    async def compute():
+        nonlocal version
+        version += 1
+        return version
+
+    with patch.object(qc.time, "time", lambda: now[0]):
+        cache = qc.QueryCache(stale_ttl=60)
+        assert await cache.get_or_compute("k", compute, ttl=10) == 1
+
+        now[0] += 20  # past ttl, within the stale window
+        stale = await asyncio.gather(
+            *(cache.get_or_compute("k", compute, ttl=10) for _ in range(5))
+        )
+        assert stale == [1] * 5
+        await asyncio.sleep(0)  # let the background refresh finish
+        assert version == 2
+        assert await cache.get_or_compute("k", compute, ttl=10) == 2
+
+
+@pytest.mark.asyncio
+async def test_query_cache_negative_results():
+    """Test that None results are cached only when negative caching is enabled."""
+    from graph_rag.infrastructure.cache.query_cache import QueryCache
+
+    calls = 0
+
+    async def lookup_missing():
+        nonlocal calls
+        calls += 1
+        return None
+
+    cache = QueryCache()
+    assert await cache.get_or_compute("absent", lookup_missing) is None
+    assert await cache.get_or_compute("absent", lookup_missing) is None
+    assert calls == 2
+
+    calls = 0
+    cache = QueryCache(negative_ttl=30)
+    assert await cache.get_or_compute("absent", lookup_missing) is None
+    assert await cache.get_or_compute("absent", lookup_missing) is None
+    assert calls == 1
+
+
+class _DictCache:
+    """Minimal non-memory backend exposing only the CacheService interface."""
+
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ttl=None):
+        self.data[key] = value
+
+    async def delete(self, key):
+        self.data.pop(key, None)
+
+    async def clear(self):
+        self.data.clear()
+
+
+@pytest.mark.asyncio
+async def test_cache_manager_tag_invalidation_works_for_any_backend():
+    """Test that tagged entries are invalidated by document and node on any backend."""
+    from graph_rag.infrastructure.cache.cache_manager import (
+        CacheManager,
+        document_tag,
+        node_tag,
+    )
+
+    backend = _DictCache()
+    manager = CacheManager(backend)
+    await manager.set("graph:q1", "r1", tags=[document_tag("doc1"), node_tag("n1")])
+    await manager.set("graph:q2", "r2", tags=[document_tag("doc2")])
+    await manager.set("graph_search:n1:2:", "r3")
+    await manager.set("embedding:abc", [0.1])
+
+    await manager.invalidate_for_node("n1")
+    assert await manager.get("graph:q1") is None
+    assert await manager.get("graph_search:n1:2:") is None
+    assert await manager.get("graph:q2") == "r2"
+
+    await manager.invalidate_for_document("doc2")
+    assert await manager.get("graph:q2") is None
+    assert await manager.get("embedding:abc") == [0.1]
+    assert set(backend.data) == {"embedding:abc"}
+
+
+@pytest.mark.asyncio
+async def test_cache_manager_namespace_generations():
+    """Test that bumping a namespace hides its entries without touching others."""
+    from graph_rag.infrastructure.cache.cache_manager import CacheManager
+
+    manager = CacheManager()
+    await manager.set("search:python", ["a"])
+    await manager.set("graph:q", "g")
+
+    await manager.invalidate_for_document("doc1")  # search results depend on the corpus
+    assert await manager.get("search:python") is None
+    assert await manager.get("graph:q") == "g"
+
+    await manager.set("search:python", ["b"])
+    assert await manager.get("search:python") == ["b"]
+
+
+@pytest.mark.asyncio
+async def test_document_invalidation_drops_untagged_graph_and_embedding_keys():
+    """Test that untagged graph/embedding entries naming the document are still invalidated."""
+    from graph_rag.infrastructure.cache.cache_manager import CacheManager
+
+    backend = _DictCache()
+    manager = CacheManager(backend)
+    await manager.set("graph:doc1:neighbors", "g")
+    await manager.set("embedding:doc1:chunk-0", [0.1])
+    await manager.set("graph:doc2:neighbors", "other")
+
+    await manager.invalidate_for_document("doc1")
+
+    assert await manager.get("graph:doc1:neighbors") is None
+    assert await manager.get("embedding:doc1:chunk-0") is None
+    assert await manager.get("graph:doc2:neighbors") == "other"
+    assert set(backend.data) == {"graph:doc2:neighbors"}
+
+
+@pytest.mark.asyncio
+async def test_node_invalidation_drops_untagged_graph_keys():
+    """Test that untagged graph entries naming the node are invalidated with it."""
+    from graph_rag.infrastructure.cache.cache_manager import CacheManager
+
+    manager = CacheManager(_DictCache())
+    await manager.set("graph:entity:node42", "n")
+    await manager.set("graph:entity:node7", "other")
+    await manager.set("embedding:node42", [0.1])
+
+    await manager.invalidate_for_node("node42")
+
+    assert await manager.get("graph:entity:node42") is None
+    assert await manager.get("graph:entity:node7") == "other"
+    assert await manager.get("embedding:node42") == [0.1]
+
+
+@pytest.mark.asyncio
+async def test_cache_manager_key_index_stays_bounded():
+    """Test that orphaned and overflowing keys are not tracked forever."""
+    from graph_rag.infrastructure.cache.cache_manager import CacheManager
+
+    backend = _DictCache()
+    manager = CacheManager(backend, max_tracked_keys=3)
+    await manager.set("emb:x", [0.1])
+    manager.bump_namespace("emb")
+    assert "emb:x" not in manager._key_index
+    assert await manager.get("emb:x") is None
+
+    for i in range(5):
+        await manager.set(f"graph:q{i}", i)  # no TTL
+
+    assert list(manager._key_index) == ["graph:q2", "graph:q3", "graph:q4"]
+    # Keys dropped from the index are dropped from the backend too
+    assert await manager.get("graph:q0") is None
+    assert await manager.get("graph:q4") == 4
+    assert set(manager._untagged["graph"]) == {"graph:q2", "graph:q3", "graph:q4"}
@@ -0,0 +1,81 @@
+"""Tests for streaming latency histograms and the monitors built on them."""
+
+import random
+
+import pytest
+
+from graph_rag.api.performance import PerformanceMonitor
+from graph_rag.api.performance_optimization import AdvancedPerformanceMonitor
+from graph_rag.observability.histogram import LatencyHistogram
+
+
+def _exact_quantile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+def test_histogram_quantiles_within_relative_accuracy():
+    rng = random.Random(7)
+    values = [rng.lognormvariate(3, 1) for _ in range(20_000)]
+    histogram = LatencyHistogram(relative_accuracy=0.01)
+    for value in values:
+        histogram.record(value)
+
+    for q in (0.5, 0.9, 0.99):
+        assert histogram.quantile(q) == pytest.approx(_exact_quantile(values, q), rel=0.02)
+    assert histogram.count == len(values)
+    assert histogram.mean == pytest.approx(sum(values) / len(values))
+    # Memory depends on the value range, not on the number of observations
+    assert len(histogram.snapshot()["buckets"]) < 1000
+
+
+def test_histogram_snapshots_merge_across_workers():
+    rng = random.Random(11)
+    values = [rng.expovariate(1 / 40) for _ in range(10_000)]
+    workers = [LatencyHistogram(), LatencyHistogram()]
+    for i, value in enumerate(values):
+        workers[i % 2].record(value)
+
+    merged = LatencyHistogram.from_snapshot(workers[0].snapshot())
+    merged.merge(LatencyHistogram.from_snapshot(workers[1].snapshot()))
+
+    assert merged.count == len(values)
+    assert merged.min == min(values)
+    assert merged.max == max(values)
+    assert merged.quantile(0.95) == pytest.approx(_exact_quantile(values, 0.95), rel=0.02)
+
+
+def test_histogram_rejects_mismatched_accuracy():
+    with pytest.raises(ValueError):
+        LatencyHistogram(relative_accuracy=0.01).merge(LatencyHistogram(relative_accuracy=0.05))
+
+
+def test_performance_monitor_percentiles_cover_all_calls():
+    monitor = PerformanceMonitor()
+    # 1000 fast calls followed by 100 slow ones; a last-100 window would only see the slow ones
+    for _ in range(1000):
+        monitor.record_execution("search", 0.01)
+    for _ in range(100):
+        monitor.record_execution("search", 1.0)
+
+    stats = monitor.get_stats("search")
+
+    assert stats["total_calls"] == 1100
+    assert stats["p50_duration"] == pytest.approx(0.01, rel=0.02)
+    assert stats["p99_duration"] == pytest.approx(1.0, rel=0.02)
+
+
+def test_advanced_monitor_merges_worker_snapshots():
+    local, remote = AdvancedPerformanceMonitor(), AdvancedPerformanceMonitor()
+    for duration in (10.0, 20.0, 30.0):
+        local.operation_stats["vector"].record(duration)
+    for duration in (40.0, 50.0):
+        remote.operation_stats["vector"].record(duration)
+
+    local.merge_histogram_snapshots(remote.get_histogram_snapshots())
+    profile = local.get_performance_profile("vector")
+
+    assert profile.total_operations == 5
+    assert profile.avg_duration_ms == pytest.approx(30.0)
+    assert profile.max_duration_ms == 50.0
+    assert profile.p50_duration_ms == pytest.approx(30.0, rel=0.02)
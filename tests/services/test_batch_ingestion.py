@@ -1,5 +1,6 @@
 """Tests for batch ingestion service."""
 
+import asyncio
 import tempfile
 from pathlib import Path
 from unittest.mock import AsyncMock
@@ -544,6 +545,63 @@ Content with metadata""")
         # but we can verify the result was successful which means metadata was handled
         assert result.successful_files == 1
 
+    @pytest.mark.asyncio
+    async def test_files_are_ingested_concurrently(self, mock_ingestion_service, sample_files):
+        """Ingest workers overlap documents while batches are still reported in order."""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def slow_ingest(*args, **kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.02)
+            in_flight -= 1
+            return IngestionResult(document_id=kwargs["document_id"], chunk_ids=["c"])
+
+        mock_ingestion_service.ingest_document = slow_ingest
+        config = BatchConfig(batch_size=2, ingest_workers=3)
+        service = IncrementalIngestion(mock_ingestion_service, config)
+
+        result = await service.process_files(file_paths=sample_files)
+
+        assert max_in_flight == 3
+        assert [b.batch_number for b in result.batch_results] == [1, 2, 3]
+        ordered = [r.file_path for b in result.batch_results for r in b.file_results]
+        assert ordered == [str(p) for p in sample_files]
+
+    @pytest.mark.asyncio
+    async def test_embedding_calls_are_shared_across_files(self, sample_files):
+        """Concurrent documents share embedding calls without touching the caller's service."""
+
+        class RecordingEmbedding:
+            def __init__(self):
+                self.calls = []
+
+            async def encode(self, texts):
+                self.calls.append(list(texts))
+                return [[0.0] for _ in texts]
+
+        class EmbeddingIngestion:
+            def __init__(self, embedding_service):
+                self.embedding_service = embedding_service
+
+            async def ingest_document(self, document_id, content, **kwargs):
+                await self.embedding_service.encode([content, content])
+                return IngestionResult(document_id=document_id, chunk_ids=["a", "b"])
+
+        embedding = RecordingEmbedding()
+        ingestion_service = EmbeddingIngestion(embedding)
+        config = BatchConfig(ingest_workers=5, embedding_batch_window_ms=50)
+        service = IncrementalIngestion(ingestion_service, config)
+
+        result = await service.process_files(file_paths=sample_files, enable_embeddings=True)
+
+        assert result.successful_files == 5
+        assert sum(len(call) for call in embedding.calls) == 10
+        assert len(embedding.calls) < 5
+        assert ingestion_service.embedding_service is embedding
+
 
 @pytest.mark.integration
 class TestBatchIngestionIntegration:
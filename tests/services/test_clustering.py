@@ -401,3 +401,86 @@ async def test_clustering_integration_with_search():
     assert result.cluster_count is not None
     assert result.cluster_count >= 1
     assert len(result.results) > 0
+
+
+def _blob_results(n_per_blob: int, seed: int = 0) -> list[SearchResultData]:
+    """Results whose embeddings form three well-separated directions."""
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    centers = np.eye(3) * 5
+    results = []
+    for blob, center in enumerate(centers):
+        for i in range(n_per_blob):
+            results.append(
+                SearchResultData(
+                    chunk=ChunkData(
+                        id=f"b{blob}_{i}",
+                        document_id=f"doc{blob}",
+                        text=f"blob {blob} item {i}",
+                        embedding=(center + rng.normal(0, 0.3, 3)).tolist(),
+                    ),
+                    score=1.0 - i / (n_per_blob + 1),
+                )
+            )
+    return results
+
+
+def _cluster_ids(result: ClusterResult) -> list[set[str]]:
+    return sorted(({r.chunk.id for r in cluster} for cluster in result.clusters), key=min)
+
+
+def test_kmeans_is_deterministic_and_recovers_blobs():
+    results = _blob_results(20)
+    first = SemanticClusteringService(random_state=42).cluster_results(
+        results, strategy=ClusteringStrategy.KMEANS, target_clusters=3
+    )
+    second = SemanticClusteringService(random_state=42).cluster_results(
+        results, strategy=ClusteringStrategy.KMEANS, target_clusters=3
+    )
+
+    assert _cluster_ids(first) == _cluster_ids(second)
+    assert first.total_clusters == 3
+    for cluster in first.clusters:
+        assert len({r.chunk.document_id for r in cluster}) == 1
+
+
+def test_kmeans_mini_batch_mode_for_large_result_sets():
+    results = _blob_results(200)
+    service = SemanticClusteringService(random_state=1, mini_batch_threshold=100, batch_size=64)
+
+    result = service.cluster_results(results, strategy=ClusteringStrategy.KMEANS, target_clusters=3)
+
+    assert result.total_clusters == 3
+    assert sum(len(cluster) for cluster in result.clusters) == len(results)
+    for cluster in result.clusters:
+        assert len({r.chunk.document_id for r in cluster}) == 1
+
+
+def test_similarity_matrix_matches_pairwise_similarity(clustering_service, sample_search_results):
+    results = sample_search_results + [
+        SearchResultData(
+            chunk=ChunkData(id="plain", document_id="doc4", text="machine learning for data"),
+            score=0.5,
+        )
+    ]
+
+    matrix = clustering_service._similarity_matrix(results)
+
+    for i, a in enumerate(results):
+        for j, b in enumerate(results):
+            if i != j:
+                assert matrix[i, j] == pytest.approx(
+                    clustering_service._calculate_similarity(a, b), abs=1e-6
+                )
+
+
+def test_threshold_clustering_keeps_results_from_undersized_clusters():
+    service = SemanticClusteringService(min_cluster_size=2)
+    results = _blob_results(3)[:4]  # three from blob 0, one from blob 1
+
+    result = service.cluster_results(
+        results, strategy=ClusteringStrategy.SIMILARITY_THRESHOLD, similarity_threshold=0.9
+    )
+
+    assert sum(len(cluster) for cluster in result.clusters) == len(results)
@@ -9,6 +9,7 @@ from graph_rag.services.memory.context_manager import ContextManager
 from graph_rag.services.memory.conversation_memory import (
     ConversationMemoryManager,
     ConversationSession,
+    FileConversationBackend,
     Interaction,
 )
 
@@ -148,6 +149,72 @@ class TestConversationMemoryManager:
         assert "AI" in session.summary or "Artificial Intelligence" in session.summary
 
 
+class TestFileConversationBackend:
+    """Test the append-only file conversation backend."""
+
+    @pytest.fixture
+    def memory_manager(self, tmp_path):
+        """Create a ConversationMemoryManager backed by files in tmp_path."""
+        return ConversationMemoryManager(
+            backend=FileConversationBackend(str(tmp_path)),
+            max_interactions_per_conversation=3,
+        )
+
+    @pytest.mark.asyncio
+    async def test_add_interaction_appends_one_line(self, memory_manager, tmp_path):
+        """Test that each interaction is a single appended log line."""
+        conversation_id = await memory_manager.start_conversation("user123")
+        log_file = tmp_path / f"{conversation_id}.jsonl"
+        header = log_file.read_text()
+
+        await memory_manager.add_interaction(conversation_id, "What is GraphRAG?", "A graph RAG.")
+
+        content = log_file.read_text()
+        assert content.startswith(header)
+        assert content[len(header):].count("\n") == 1
+
+    @pytest.mark.asyncio
+    async def test_session_survives_restart_with_truncation(self, memory_manager, tmp_path):
+        """Test that a new backend replays the log, applying the memory limit."""
+        conversation_id = await memory_manager.start_conversation("user123")
+        for i in range(5):
+            await memory_manager.add_interaction(conversation_id, f"Question {i}", f"Answer {i}")
+
+        restarted = ConversationMemoryManager(backend=FileConversationBackend(str(tmp_path)))
+        history = await restarted.get_conversation_history(conversation_id)
+
+        assert [i.question for i in history] == ["Question 2", "Question 3", "Question 4"]
+        assert await restarted.list_user_conversations("user123") == [conversation_id]
+
+    @pytest.mark.asyncio
+    async def test_load_compacts_log(self, tmp_path):
+        """Test that loading rewrites a log dominated by truncated events."""
+        backend = FileConversationBackend(str(tmp_path))
+        manager = ConversationMemoryManager(backend=backend, max_interactions_per_conversation=2)
+        conversation_id = await manager.start_conversation("user123")
+        for i in range(10):
+            await manager.add_interaction(conversation_id, f"Question {i}", f"Answer {i}")
+
+        session = await FileConversationBackend(str(tmp_path)).load_session(conversation_id)
+
+        assert [i.question for i in session.interactions] == ["Question 8", "Question 9"]
+        log_lines = (tmp_path / f"{conversation_id}.jsonl").read_text().splitlines()
+        assert len(log_lines) == 3  # session header + 2 interactions
+
+    @pytest.mark.asyncio
+    async def test_delete_removes_from_user_index(self, memory_manager):
+        """Test that deleted conversations disappear from the user index."""
+        first = await memory_manager.start_conversation("user123")
+        second = await memory_manager.start_conversation("user123")
+
+        assert await memory_manager.delete_conversation(first) is True
+
+        assert await memory_manager.list_user_conversations("user123") == [second]
+        assert await memory_manager.get_conversation_session(first) is None
+        with pytest.raises(ValueError):
+            await memory_manager.add_interaction(first, "Question", "Answer")
+
+
 class TestContextManager:
     """Test context management capabilities."""
 
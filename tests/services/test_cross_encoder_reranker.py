@@ -0,0 +1,101 @@
+import asyncio
+import threading
+
+import pytest
+
+from graph_rag.core.interfaces import ChunkData, SearchResultData
+from graph_rag.services.rerank import (
+    CrossEncoderReranker,
+    ReRankingService,
+    ReRankingStrategy,
+)
+
+
+class FakeCrossEncoder:
+    """Scores a passage by how many query words it contains."""
+
+    def __init__(self):
+        self.batches: list[int] = []
+
+    def predict(self, pairs):
+        self.batches.append(len(pairs))
+        return [sum(w in p.split() for w in q.split()) for q, p in pairs]
+
+
+def _results(*texts: str) -> list[SearchResultData]:
+    return [
+        SearchResultData(
+            chunk=ChunkData(id=f"c{i}", text=t, document_id="d", metadata={}), score=0.0
+        )
+        for i, t in enumerate(texts)
+    ]
+
+
+@pytest.fixture
+def reranker():
+    model = FakeCrossEncoder()
+    loads = []
+    rr = CrossEncoderReranker(max_batch_size=16, max_wait_ms=20)
+    rr._available = True
+    rr._load_model = lambda: loads.append(1) or model
+    rr.model, rr.loads = model, loads
+    yield rr
+    rr.close()
+
+
+@pytest.mark.asyncio
+async def test_rerank_orders_by_cross_encoder_and_loads_model_once(reranker):
+    for _ in range(3):
+        out = await reranker.rerank("red apple", _results("blue sky", "red apple pie", "red car"), k=2)
+        assert [r.chunk.id for r in out] == ["c1", "c2"]
+        assert out[0].chunk.metadata["score_rerank"] == 2.0
+    assert reranker.loads == [1]
+    # The second and third calls are served from the score cache
+    assert reranker.model.batches == [3]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_reranks_share_one_forward_pass(reranker):
+    queries = [f"term{i} shared" for i in range(4)]
+    outs = await asyncio.gather(
+        *(reranker.rerank(q, _results(f"term{i} x", "shared y"), k=1) for i, q in enumerate(queries))
+    )
+    assert [o[0].chunk.id for o in outs] == ["c0"] * 4
+    assert reranker.model.batches == [8]
+
+
+@pytest.mark.asyncio
+async def test_batch_size_cap_splits_batches(reranker):
+    reranker.max_batch_size = 3
+    await reranker.rerank("a", _results("a", "b", "c", "d", "e"), k=5)
+    assert sorted(reranker.model.batches) == [2, 3]
+
+
+@pytest.mark.asyncio
+async def test_reranking_service_cross_encoder_works_inside_running_loop(reranker):
+    service = ReRankingService()
+    service.cross_encoder = reranker
+    sync_out = service.rerank("red", _results("blue", "red"), ReRankingStrategy.CROSS_ENCODER)
+    assert sync_out[0].chunk.id == "c1"
+    async_out = await service.rerank_results("red", _results("red", "blue"), "cross_encoder")
+    assert async_out[0].chunk.id == "c0"
+
+
+@pytest.mark.asyncio
+async def test_cancelled_batch_does_not_leave_callers_waiting(reranker):
+    release = threading.Event()
+    reranker._predict = lambda pairs: release.wait(5) and [0.0] * len(pairs)
+
+    score = asyncio.ensure_future(reranker.score("q", _results("a", "b")))
+    while not reranker._batch_tasks:
+        await asyncio.sleep(0.01)
+    for task in list(reranker._batch_tasks):
+        task.cancel()
+
+    try:
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(score, timeout=1)
+    finally:
+        release.set()
+    await asyncio.sleep(0)
+    assert not reranker._batch_tasks
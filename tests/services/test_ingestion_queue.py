@@ -0,0 +1,248 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from graph_rag.services.embedding_batching import BatchingEmbeddingService
+from graph_rag.services.ingestion import IngestionResult
+from graph_rag.services.ingestion_queue import (
+    IngestionJobQueue,
+    IngestionJobStatus,
+    IngestionJobStore,
+    IngestionQueueFullError,
+)
+
+
+class CountingEmbedding:
+    model_name = "counting"
+
+    def __init__(self):
+        self.calls: list[list[str]] = []
+
+    async def encode(self, texts):
+        self.calls.append(list(texts))
+        return [[float(len(t)), 1.0] for t in texts]
+
+
+def _ingestion_service(ingest=None) -> MagicMock:
+    service = MagicMock()
+    service.embedding_service = None
+    service.ingest_document = AsyncMock(
+        side_effect=ingest
+        or (lambda document_id, **_: IngestionResult(document_id=document_id, chunk_ids=["c1", "c2"]))
+    )
+    return service
+
+
+async def _wait_for(queue: IngestionJobQueue, job_id: str, status: IngestionJobStatus):
+    for _ in range(200):
+        job = await queue.get_job(job_id)
+        if job.status == status:
+            return job
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"job {job_id} stuck in {job.status}")
+
+
+def _payload(content: str = "text") -> dict:
+    return {"content": content, "metadata": {}}
+
+
+def test_claim_alternates_between_tenants(tmp_path):
+    store = IngestionJobStore(tmp_path / "jobs.db")
+    for i in range(3):
+        store.enqueue(f"a{i}", "bulk", f"doc-a{i}", _payload(), max_depth=100)
+    store.enqueue("b0", "small", "doc-b0", _payload(), max_depth=100)
+
+    first, _ = store.claim("w", lease_seconds=60)
+    second, _ = store.claim("w", lease_seconds=60)
+
+    assert first.job_id == "a0"
+    assert second.job_id == "b0"
+    assert store.claim("w", lease_seconds=60)[0].job_id == "a1"
+
+
+def test_enqueue_rejects_when_queue_is_full(tmp_path):
+    store = IngestionJobStore(tmp_path / "jobs.db")
+    store.enqueue("j0", "t", "d0", _payload(), max_depth=2)
+    store.enqueue("j1", "t", "d1", _payload(), max_depth=2)
+
+    with pytest.raises(IngestionQueueFullError):
+        store.enqueue("j2", "t", "d2", _payload(), max_depth=2)
+
+    job, _ = store.claim("w", lease_seconds=60)
+    store.complete(job.job_id, "w", chunk_count=1)
+    store.enqueue("j2", "t", "d2", _payload(), max_depth=2)
+
+
+def test_expired_lease_is_requeued_until_attempts_run_out(tmp_path):
+    store = IngestionJobStore(tmp_path / "jobs.db", max_attempts=2)
+    store.enqueue("j", "t", "d", _payload("body"), max_depth=10)
+
+    job, payload = store.claim("crashed", lease_seconds=60)
+    assert payload["content"] == "body"
+    # Another process sees the lease as expired and takes the job over
+    retried, _ = IngestionJobStore(tmp_path / "jobs.db", max_attempts=2).claim("w2", lease_seconds=0)
+    assert retried.job_id == "j" and retried.attempts == 2
+
+    assert store.claim("w3", lease_seconds=0) is None
+    failed = store.get("j")
+    assert failed.status == IngestionJobStatus.FAILED
+    assert failed.error == "Worker lease expired"
+
+
+def test_failed_attempt_is_retried_after_exponential_backoff(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("graph_rag.services.ingestion_queue.time.time", lambda: now[0])
+    store = IngestionJobStore(tmp_path / "jobs.db", max_attempts=3, retry_backoff_seconds=10)
+    store.enqueue("j", "t", "d", _payload(), max_depth=10)
+
+    job, _ = store.claim("w", lease_seconds=60)
+    assert store.fail(job.job_id, "w", "boom") == IngestionJobStatus.QUEUED
+    assert store.get("j").available_at == 1010.0
+    assert store.claim("w", lease_seconds=60) is None
+
+    now[0] = 1010.0
+    job, _ = store.claim("w", lease_seconds=60)
+    store.fail(job.job_id, "w", "boom")
+    # The delay doubles with each attempt
+    assert store.get("j").available_at == 1030.0
+
+    now[0] = 1030.0
+    job, _ = store.claim("w", lease_seconds=60)
+    assert store.fail(job.job_id, "w", "boom") == IngestionJobStatus.FAILED
+    assert store.get("j").available_at is None
+
+
+def test_only_the_lease_holder_records_the_outcome(tmp_path):
+    store = IngestionJobStore(tmp_path / "jobs.db", max_attempts=3)
+    store.enqueue("j", "t", "d", _payload(), max_depth=10)
+    store.claim("stale", lease_seconds=60)
+    # The lease expires and another worker takes the job over
+    job, _ = store.claim("current", lease_seconds=0)
+
+    assert not store.heartbeat(job.job_id, "stale")
+    assert not store.complete(job.job_id, "stale", chunk_count=1)
+    assert store.fail(job.job_id, "stale", "late failure") is None
+    assert store.get("j").status == IngestionJobStatus.RUNNING
+
+    assert store.complete(job.job_id, "current", chunk_count=2)
+    done = store.get("j")
+    assert done.status == IngestionJobStatus.SUCCEEDED and done.chunk_count == 2
+
+
+@pytest.mark.asyncio
+async def test_queue_runs_job_and_records_progress(tmp_path):
+    async def ingest(document_id, on_progress, **_):
+        await on_progress("embedded", 0.5)
+        return IngestionResult(document_id=document_id, chunk_ids=["c1", "c2"])
+
+    service = _ingestion_service(ingest)
+    queue = IngestionJobQueue(service, tmp_path / "jobs.db", workers=1, poll_interval=0.05)
+    await queue.start()
+    try:
+        job = await queue.submit(
+            document_id="doc-1", content="hello", tenant_id="t1", skip_unchanged=False
+        )
+        assert job.status == IngestionJobStatus.QUEUED
+        done = await _wait_for(queue, job.job_id, IngestionJobStatus.SUCCEEDED)
+    finally:
+        await queue.stop()
+
+    assert done.chunk_count == 2 and done.progress == 1.0
+    kwargs = service.ingest_document.await_args.kwargs
+    assert kwargs["document_id"] == "doc-1" and kwargs["content"] == "hello"
+    assert kwargs["skip_unchanged"] is False
+    assert (await queue.stats())["jobs"]["succeeded"] == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_job_is_retried_then_marked_failed(tmp_path):
+    service = _ingestion_service(AsyncMock(side_effect=RuntimeError("graph down")))
+    queue = IngestionJobQueue(
+        service,
+        tmp_path / "jobs.db",
+        workers=1,
+        max_attempts=2,
+        poll_interval=0.05,
+        retry_backoff_seconds=0,
+    )
+    await queue.start()
+    try:
+        job = await queue.submit(document_id="doc-1", content="hello")
+        failed = await _wait_for(queue, job.job_id, IngestionJobStatus.FAILED)
+    finally:
+        await queue.stop()
+
+    assert failed.attempts == 2
+    assert "graph down" in failed.error
+    assert service.ingest_document.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_worker_survives_a_failure_to_record_the_outcome(tmp_path):
+    service = _ingestion_service()
+    queue = IngestionJobQueue(service, tmp_path / "jobs.db", workers=1, poll_interval=0.05)
+    complete = queue.store.complete
+    calls = []
+
+    def flaky_complete(*args):
+        calls.append(args[0])
+        if len(calls) == 1:
+            raise RuntimeError("database is locked")
+        return complete(*args)
+
+    queue.store.complete = flaky_complete
+    await queue.start()
+    try:
+        first = await queue.submit(document_id="doc-1", content="hello")
+        second = await queue.submit(document_id="doc-2", content="world")
+        await _wait_for(queue, second.job_id, IngestionJobStatus.SUCCEEDED)
+    finally:
+        await queue.stop()
+
+    assert calls == [first.job_id, second.job_id]
+    # The unrecorded job keeps its lease and is retried once that expires
+    assert (await queue.get_job(first.job_id)).status == IngestionJobStatus.RUNNING
+
+
+@pytest.mark.asyncio
+async def test_workers_share_embedding_batches(tmp_path):
+    embedding = CountingEmbedding()
+    service = _ingestion_service()
+    service.embedding_service = embedding
+
+    async def ingest(document_id, **_):
+        await queue.ingestion_service.embedding_service.encode([f"{document_id} a", f"{document_id} b"])
+        return IngestionResult(document_id=document_id, chunk_ids=["c"])
+
+    service.ingest_document = AsyncMock(side_effect=ingest)
+    queue = IngestionJobQueue(
+        service, tmp_path / "jobs.db", workers=3, poll_interval=0.05, embedding_batch_window_ms=50
+    )
+    # The caller's service keeps its own embedding service
+    assert service.embedding_service is embedding
+    assert isinstance(queue.ingestion_service.embedding_service, BatchingEmbeddingService)
+
+    jobs = [await queue.submit(document_id=f"d{i}", content="x") for i in range(3)]
+    await queue.start()
+    try:
+        for job in jobs:
+            await _wait_for(queue, job.job_id, IngestionJobStatus.SUCCEEDED)
+    finally:
+        await queue.stop()
+
+    assert sum(len(call) for call in embedding.calls) == 6
+    assert len(embedding.calls) < 3
+
+
+@pytest.mark.asyncio
+async def test_batching_embedding_service_splits_results_per_caller():
+    embedding = CountingEmbedding()
+    batcher = BatchingEmbeddingService(embedding, max_batch_size=100, window_ms=20)
+
+    single, many = await asyncio.gather(batcher.encode("abc"), batcher.encode(["a", "abcd"]))
+
+    assert single == [3.0, 1.0]
+    assert many == [[1.0, 1.0], [4.0, 1.0]]
+    assert embedding.calls == [["abc", "a", "abcd"]]
+    assert batcher.model_name == "counting"
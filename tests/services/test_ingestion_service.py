@@ -10,6 +10,8 @@ from graph_rag.core.interfaces import (
     DocumentProcessor,
     EmbeddingService,
     EntityExtractor,
+    ExtractedEntity,
+    ExtractionResult,
     GraphRepository,
     VectorStore,
 )
@@ -667,3 +669,241 @@ async def test_ingest_document_with_embeddings(
         added_chunk = call_item.args[0]
         assert hasattr(added_chunk, "embedding")
         assert added_chunk.embedding is not None
+
+
+@pytest.mark.asyncio
+async def test_ingest_document_uses_bulk_graph_write_when_available(
+    mock_embedding_service, mock_vector_store
+):
+    """Graph stores exposing add_graph_batch get one bulk write instead of per-item calls."""
+
+    class BulkGraphStore:
+        def __init__(self):
+            self.batches = []
+            self.add_chunk = AsyncMock()
+            self.add_relationship = AsyncMock()
+            self.add_entity = AsyncMock()
+
+        async def get_chunks_by_document_id(self, document_id):
+            return []
+
+        async def add_document(self, document):
+            return None
+
+        async def add_graph_batch(self, chunks, entities, relationships, batch_size=500):
+            self.batches.append((chunks, entities, relationships, batch_size))
+
+    store = BulkGraphStore()
+    service = IngestionService(
+        document_processor=AsyncMock(spec=DocumentProcessor),
+        entity_extractor=None,
+        graph_store=store,
+        embedding_service=mock_embedding_service,
+        vector_store=mock_vector_store,
+        graph_write_batch_size=50,
+    )
+    result = await service.ingest_document(
+        document_id="doc-bulk",
+        content="First paragraph.\n\nSecond paragraph.",
+        metadata={"topics": ["Python", "python", "AI"]},
+    )
+
+    assert len(store.batches) == 1
+    chunks, entities, relationships, batch_size = store.batches[0]
+    assert batch_size == 50
+    assert result.chunk_ids == [c.id for c in chunks]
+    assert {e.id for e in entities} == {"topic:python", "topic:ai"}
+    rel_types = [r.type for r in relationships]
+    assert rel_types.count("HAS_TOPIC") == 2
+    assert rel_types.count("MENTIONS_TOPIC") == 2 * len(chunks)
+    store.add_chunk.assert_not_awaited()
+    store.add_relationship.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_ingest_document_extracts_entities_in_one_batch(
+    mock_embedding_service, mock_vector_store, mock_graph_repository
+):
+    """Extractors exposing extract_batch get every chunk of a document in one call."""
+
+    class BatchExtractor:
+        def __init__(self):
+            self.calls = []
+            self.extract_from_text = AsyncMock()
+
+        async def extract_batch(self, texts, contexts=None):
+            self.calls.append((list(texts), list(contexts)))
+            return [
+                ExtractionResult(
+                    entities=[ExtractedEntity(id="ORG:acme", label="ORG", text="Acme")],
+                    relationships=[],
+                )
+                for _ in texts
+            ]
+
+    extractor = BatchExtractor()
+    document_processor = AsyncMock(spec=DocumentProcessor)
+    document_processor.chunk_document.return_value = [
+        Chunk(id="ner-0", text="Acme ships rockets.", document_id="doc-ner"),
+        Chunk(id="ner-1", text="   ", document_id="doc-ner"),
+        Chunk(id="ner-2", text="Acme also ships anvils.", document_id="doc-ner"),
+    ]
+    service = IngestionService(
+        document_processor=document_processor,
+        entity_extractor=extractor,
+        graph_store=mock_graph_repository,
+        embedding_service=mock_embedding_service,
+        vector_store=mock_vector_store,
+    )
+    result = await service.ingest_document(
+        document_id="doc-ner",
+        content="Acme ships rockets.\n\nAcme also ships anvils.",
+        metadata={},
+    )
+
+    assert len(extractor.calls) == 1
+    texts, contexts = extractor.calls[0]
+    # Blank chunks are not sent to the extractor
+    assert texts == ["Acme ships rockets.", "Acme also ships anvils."]
+    assert [c["chunk_id"] for c in contexts] == ["ner-0", "ner-2"]
+    assert all(c["document_id"] == "doc-ner" for c in contexts)
+    assert len(result.chunk_ids) == 3
+    extractor.extract_from_text.assert_not_awaited()
+    mock_graph_repository.add_entity.assert_awaited_once()
+
+
+class FingerprintGraphStore:
+    """In-memory graph store keeping document and chunk fingerprints like Memgraph does."""
+
+    def __init__(self):
+        self.documents: dict[str, Document] = {}
+        self.chunks: dict[str, Chunk] = {}
+        self.written_chunk_ids: list[str] = []
+        self.deleted_chunk_ids: list[str] = []
+
+    async def add_document(self, document):
+        self.documents[document.id] = document.model_copy(deep=True)
+
+    async def get_document_by_id(self, document_id):
+        return self.documents.get(document_id)
+
+    async def get_chunks_by_document_id(self, document_id):
+        return [
+            c.model_copy(deep=True) for c in self.chunks.values() if c.document_id == document_id
+        ]
+
+    async def add_graph_batch(self, chunks, entities, relationships, batch_size=500):
+        for chunk in chunks:
+            self.written_chunk_ids.append(chunk.id)
+            self.chunks[chunk.id] = Chunk(
+                id=chunk.id,
+                text=chunk.text,
+                document_id=chunk.document_id,
+                embedding=chunk.embedding,
+                properties=dict(chunk.properties),
+            )
+
+    async def execute_query(self, query, params):
+        for chunk_id in params.get("chunk_ids", []):
+            self.deleted_chunk_ids.append(chunk_id)
+            self.chunks.pop(chunk_id, None)
+        return []
+
+
+@pytest.fixture
+def fingerprint_service(mock_embedding_service, mock_vector_store):
+    from graph_rag.infrastructure.document_processor.simple_processor import (
+        SimpleDocumentProcessor,
+    )
+
+    store = FingerprintGraphStore()
+    service = IngestionService(
+        document_processor=SimpleDocumentProcessor(chunk_strategy="paragraph"),
+        entity_extractor=None,
+        graph_store=store,
+        embedding_service=mock_embedding_service,
+        vector_store=mock_vector_store,
+    )
+    return service, store
+
+
+@pytest.mark.asyncio
+async def test_reingest_unchanged_document_is_skipped(
+    fingerprint_service, mock_embedding_service, mock_vector_store
+):
+    service, store = fingerprint_service
+    content = "Alpha paragraph.\n\nBeta paragraph."
+    first = await service.ingest_document("doc-1", content, {"source": "vault"})
+    assert store.documents["doc-1"].properties["content_hash"]
+    assert all(c.properties["content_hash"] for c in store.chunks.values())
+    mock_embedding_service.encode.reset_mock()
+    mock_vector_store.add_chunks.reset_mock()
+
+    second = await service.ingest_document("doc-1", content, {"source": "vault"})
+
+    assert second.skipped is True
+    assert sorted(second.chunk_ids) == sorted(first.chunk_ids)
+    mock_embedding_service.encode.assert_not_awaited()
+    mock_vector_store.add_chunks.assert_not_awaited()
+    mock_vector_store.delete_chunks.assert_not_awaited()
+    assert store.deleted_chunk_ids == []
+
+    # Changed metadata is not "unchanged"
+    third = await service.ingest_document("doc-1", content, {"source": "other"})
+    assert third.skipped is False
+
+
+@pytest.mark.asyncio
+async def test_reingest_is_full_when_vector_store_lost_the_chunks(
+    fingerprint_service, mock_embedding_service, mock_vector_store
+):
+    service, store = fingerprint_service
+    content = "Alpha paragraph.\n\nBeta paragraph."
+    first = await service.ingest_document("doc-1", content, {"source": "vault"})
+    # e.g. an in-memory vector store after a restart
+    mock_vector_store.get_chunk_by_id = AsyncMock(return_value=None)
+    mock_embedding_service.encode.reset_mock()
+    mock_vector_store.add_chunks.reset_mock()
+
+    second = await service.ingest_document("doc-1", content, {"source": "vault"})
+
+    assert second.skipped is False
+    assert not set(second.chunk_ids) & set(first.chunk_ids)
+    assert len(mock_embedding_service.encode.await_args.args[0]) == 2
+    added = mock_vector_store.add_chunks.await_args.args[0]
+    assert [c.id for c in added] == second.chunk_ids
+
+
+@pytest.mark.asyncio
+async def test_reingest_changed_document_only_rewrites_changed_chunks(
+    fingerprint_service, mock_embedding_service, mock_vector_store
+):
+    service, store = fingerprint_service
+    first = await service.ingest_document(
+        "doc-1", "Alpha paragraph.\n\nBeta paragraph.", {"source": "vault"}
+    )
+    alpha_id, beta_id = first.chunk_ids
+    mock_embedding_service.encode.reset_mock()
+    store.written_chunk_ids.clear()
+
+    second = await service.ingest_document(
+        "doc-1", "Alpha paragraph.\n\nGamma paragraph.", {"source": "vault"}
+    )
+
+    assert second.skipped is False
+    assert second.chunk_ids[0] == alpha_id
+    assert second.chunk_ids[1] != beta_id
+    mock_embedding_service.encode.assert_awaited_once_with(["Gamma paragraph."])
+    assert store.written_chunk_ids == [second.chunk_ids[1]]
+    assert store.deleted_chunk_ids == [beta_id]
+    mock_vector_store.delete_chunks.assert_awaited_once_with([beta_id])
+    assert set(store.chunks) == set(second.chunk_ids)
+
+    # skip_unchanged=False forces a full re-ingestion
+    mock_embedding_service.encode.reset_mock()
+    forced = await service.ingest_document(
+        "doc-1", "Alpha paragraph.\n\nGamma paragraph.", {"source": "vault"}, skip_unchanged=False
+    )
+    assert forced.skipped is False
+    assert alpha_id not in forced.chunk_ids
+    assert len(mock_embedding_service.encode.await_args.args[0]) == 2
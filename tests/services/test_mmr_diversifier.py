@@ -0,0 +1,87 @@
+import random
+
+import numpy as np
+import pytest
+
+from graph_rag.core.interfaces import ChunkData, SearchResultData
+from graph_rag.services.diversify import MMRDiversifier
+
+
+def _result(i: int, score: float, text: str = "", embedding=None) -> SearchResultData:
+    return SearchResultData(
+        chunk=ChunkData(id=f"c{i}", text=text, document_id="d", embedding=embedding),
+        score=score,
+    )
+
+
+def _reference_mmr(results: list[SearchResultData], k: int, lam: float) -> list[str]:
+    """Pairwise greedy MMR, as the engine used to compute it."""
+
+    def sim(a, b):
+        va, vb = np.array(a.chunk.embedding), np.array(b.chunk.embedding)
+        return float(va.dot(vb) / (np.linalg.norm(va) * np.linalg.norm(vb)))
+
+    candidates, selected = list(results), []
+    while candidates and len(selected) < k:
+        if not selected:
+            best = max(candidates, key=lambda r: r.score)
+        else:
+            best = max(
+                candidates,
+                key=lambda c: lam * c.score - (1 - lam) * max(sim(c, s) for s in selected),
+            )
+        selected.append(best)
+        candidates.remove(best)
+    return [r.chunk.id for r in selected]
+
+
+def test_matches_pairwise_greedy_mmr():
+    rng = random.Random(3)
+    results = [
+        _result(i, rng.random(), embedding=[rng.gauss(0, 1) for _ in range(16)])
+        for i in range(60)
+    ]
+
+    picked = MMRDiversifier(lambda_mult=0.6).diversify(results, 10)
+
+    assert [r.chunk.id for r in picked] == _reference_mmr(results, 10, 0.6)
+
+
+def test_skips_near_duplicates():
+    results = [
+        _result(0, 0.95, embedding=[1.0, 0.0]),
+        _result(1, 0.94, embedding=[0.99, 0.01]),
+        _result(2, 0.80, embedding=[0.0, 1.0]),
+    ]
+
+    picked = MMRDiversifier(lambda_mult=0.5).diversify(results, 2)
+
+    assert [r.chunk.id for r in picked] == ["c0", "c2"]
+
+
+def test_falls_back_to_token_overlap_without_embeddings():
+    results = [
+        _result(0, 0.9, "graph databases store nodes"),
+        _result(1, 0.89, "Graph databases store nodes and edges"),
+        _result(2, 0.7, "pricing strategy for consultants"),
+    ]
+
+    picked = MMRDiversifier(lambda_mult=0.5).diversify(results, 2)
+
+    assert [r.chunk.id for r in picked] == ["c0", "c2"]
+
+
+def test_candidate_pool_size_limits_considered_results():
+    results = [_result(i, 1.0 - i / 10, embedding=[1.0, float(i)]) for i in range(8)]
+
+    picked = MMRDiversifier(lambda_mult=0.3, candidate_pool_size=4).diversify(results, 3)
+
+    assert len(picked) == 3
+    assert {r.chunk.id for r in picked} <= {"c0", "c1", "c2", "c3"}
+
+
+def test_rejects_invalid_parameters():
+    with pytest.raises(ValueError):
+        MMRDiversifier(lambda_mult=1.5)
+    with pytest.raises(ValueError):
+        MMRDiversifier(candidate_pool_size=0)